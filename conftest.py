@@ -10,9 +10,13 @@ import pytest
 from _pytest.fixtures import FixtureRequest
 from _pytest.tmpdir import TempPathFactory, _mk_tmp
 
-import demisto_sdk.commands.common.tools as tools
 from demisto_sdk.__main__ import register_commands
-from demisto_sdk.commands.common.constants import DEMISTO_SDK_LOG_NO_COLORS
+from demisto_sdk.commands.common.constants import (
+    DEMISTO_SDK_GRAPH_PARSER_CACHE,
+    DEMISTO_SDK_LOG_NO_COLORS,
+    DEMISTO_SDK_VALIDATE_CACHE,
+)
+from demisto_sdk.commands.common.parsed_file_cache import parsed_file_cache
 from demisto_sdk.commands.content_graph.interface.graph import ContentGraphInterface
 from TestSuite.integration import Integration
 from TestSuite.json_based import JSONBased
@@ -173,9 +177,25 @@ def disable_log_colors():
     os.environ[DEMISTO_SDK_LOG_NO_COLORS] = "1"
 
 
+@pytest.fixture(scope="session", autouse=True)
+def disable_parser_cache():
+    """
+    Tests should not read or write the local parser cache, tests that use the cache pass it explicitly.
+    """
+    os.environ[DEMISTO_SDK_GRAPH_PARSER_CACHE] = "false"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def disable_validate_cache():
+    """
+    Tests should not read or write the local validate cache, tests that use the cache pass it explicitly.
+    """
+    os.environ[DEMISTO_SDK_VALIDATE_CACHE] = "false"
+
+
 @pytest.fixture(autouse=True)
 def clear_cache():
-    tools.get_file.cache_clear()
+    parsed_file_cache.clear()
 
 
 @pytest.fixture(scope="session", autouse=True)
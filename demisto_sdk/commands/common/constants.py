@@ -71,6 +71,21 @@ DEMISTO_SDK_NEO4J_DATABASE_HTTP = "DEMISTO_SDK_NEO4J_DATABASE_HTTP"
 DEMISTO_SDK_NEO4J_DATABASE_URL = "DEMISTO_SDK_NEO4J_DATABASE_URL"
 DEMISTO_SDK_NEO4J_USERNAME = "DEMISTO_SDK_NEO4J_USERNAME"
 DEMISTO_SDK_NEO4J_PASSWORD = "DEMISTO_SDK_NEO4J_PASSWORD"
+DEMISTO_SDK_GRAPH_NODES_CHUNK_SIZE = "DEMISTO_SDK_GRAPH_NODES_CHUNK_SIZE"
+DEMISTO_SDK_GRAPH_RELATIONSHIPS_CHUNK_SIZE = (
+    "DEMISTO_SDK_GRAPH_RELATIONSHIPS_CHUNK_SIZE"
+)
+DEMISTO_SDK_GRAPH_BACKEND = "DEMISTO_SDK_GRAPH_BACKEND"
+# Content graph parser cache
+DEMISTO_SDK_GRAPH_PARSER_CACHE = "DEMISTO_SDK_GRAPH_PARSER_CACHE"
+DEMISTO_SDK_GRAPH_PARSER_CACHE_DIR = "DEMISTO_SDK_GRAPH_PARSER_CACHE_DIR"
+DEMISTO_SDK_GRAPH_PARSER_CACHE_SIZE = "DEMISTO_SDK_GRAPH_PARSER_CACHE_SIZE"
+# Validate result cache
+DEMISTO_SDK_VALIDATE_CACHE = "DEMISTO_SDK_VALIDATE_CACHE"
+DEMISTO_SDK_VALIDATE_CACHE_DIR = "DEMISTO_SDK_VALIDATE_CACHE_DIR"
+DEMISTO_SDK_VALIDATE_CACHE_SIZE = "DEMISTO_SDK_VALIDATE_CACHE_SIZE"
+# Parsed files cache
+DEMISTO_SDK_FILE_CACHE_SIZE = "DEMISTO_SDK_FILE_CACHE_SIZE"
 # --- Environment Variables ---
 
 
@@ -4,6 +4,7 @@ from typing import Any, Union
 from demisto_sdk.commands.common.files.errors import FileWriteError
 from demisto_sdk.commands.common.files.file import File
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.parsed_file_cache import parsed_file_cache
 
 
 class BinaryFile(File):
@@ -24,6 +25,7 @@ class BinaryFile(File):
 
         try:
             output_path.write_bytes(data)
+            parsed_file_cache.invalidate(output_path)
         except Exception as e:
             logger.error(f"Could not write {output_path} as {cls.__name__} file")
             raise FileWriteError(output_path, exc=e)
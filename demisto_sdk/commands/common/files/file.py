@@ -35,6 +35,7 @@ from demisto_sdk.commands.common.git_content_config import (
 from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.handlers.xsoar_handler import XSOAR_Handler
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.parsed_file_cache import parsed_file_cache
 from demisto_sdk.commands.common.tools import (
     NoInternetConnectionException,
     is_sdk_defined_working_offline,
@@ -199,7 +200,6 @@ class File(ABC):
         return instance
 
     @classmethod
-    @lru_cache
     def read_from_local_path(
         cls,
         path: Union[Path, str],
@@ -208,22 +208,19 @@ class File(ABC):
         clear_cache: bool = False,
     ) -> Any:
         """
-        Reads a file from a local path in the file system.
+        Reads a file from a local path in the file system, the parsed file is kept in the shared parsed file cache.
 
         Args:
             path: the path of the file
             encoding: any custom encoding if needed
             handler: whether a custom handler is required, if not takes the default.
-            clear_cache: whether to clear cache
+            clear_cache: whether to read the file again, rather than from the cache
 
         Returns:
             Any: the file content in the desired format
         """
         path = Path(path)
 
-        if clear_cache:
-            cls.read_from_local_path.cache_clear()
-
         if not path.is_absolute():
             logger.debug(f"path {path} is not absolute path")
             try:
@@ -240,10 +237,15 @@ class File(ABC):
                 if not path.exists():
                     raise FileNotFoundError(f"File {path} does not exist")
 
-        return (
-            cls._from_path(path)
+        if clear_cache:
+            parsed_file_cache.invalidate(path)
+
+        return parsed_file_cache.get_local(
+            path,
+            ("read_from_local_path", cls, encoding, handler),
+            lambda: cls._from_path(path)
             .as_path(path, encoding=encoding, handler=handler)
-            .__read_local_file()
+            .__read_local_file(),
         )
 
     def __read_local_file(self):
@@ -256,7 +258,6 @@ class File(ABC):
             raise LocalFileReadError(self.path, exc=error.original_exc) from error
 
     @classmethod
-    @lru_cache
     def read_from_git_path(
         cls,
         path: Union[str, Path],
@@ -267,7 +268,7 @@ class File(ABC):
         clear_cache: bool = False,
     ) -> Any:
         """
-        Reads a file from a specific git sha/branch.
+        Reads a file from a specific git sha/branch, the parsed file is kept in the shared parsed file cache.
 
         Args:
             path: the path to the file
@@ -275,16 +276,31 @@ class File(ABC):
             encoding: any custom encoding if needed
             from_remote: whether it should be taken from remote branch/sha or local branch/sha
             handler: whether a custom handler is required, if not takes the default.
-            clear_cache: whether to clear cache
+            clear_cache: whether to read the file again, rather than from the cache
 
         Returns:
             Any: the file content in the desired format
         """
         path = Path(path)
+        key = ("read_from_git_path", cls, path, tag, encoding, from_remote, handler)
 
         if clear_cache:
-            cls.read_from_git_path.cache_clear()
+            parsed_file_cache.discard(key)
+
+        return parsed_file_cache.get(
+            key,
+            lambda: cls.__read_from_git_path(path, tag, encoding, from_remote, handler),
+        )
 
+    @classmethod
+    def __read_from_git_path(
+        cls,
+        path: Path,
+        tag: str,
+        encoding: Optional[str],
+        from_remote: bool,
+        handler: Optional[XSOAR_Handler],
+    ) -> Any:
         git_util = GitUtil.from_content_path()
         if not git_util.is_file_exist_in_commit_or_branch(
             path, commit_or_branch=tag, from_remote=from_remote
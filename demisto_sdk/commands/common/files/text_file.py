@@ -11,6 +11,7 @@ from demisto_sdk.commands.common.files.errors import (
 )
 from demisto_sdk.commands.common.files.file import File
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.parsed_file_cache import parsed_file_cache
 
 
 class TextFile(File):
@@ -109,6 +110,7 @@ class TextFile(File):
                 path.unlink()  # deletes the file
                 logger.debug(f"rewriting {path} as unicode file")
                 self._do_write(data, path=path, **kwargs)  # recreates the file
+        parsed_file_cache.invalidate(path)
 
     def _do_write(self, data: Any, path: Path, **kwargs) -> None:
         path.write_text(data=data, encoding=self.encoding)
@@ -0,0 +1,100 @@
+from collections.abc import Mapping, Sequence
+from copy import deepcopy
+from typing import Any, Dict, Iterator, List, Union
+
+
+class FrozenDict(Mapping):
+    """A read-only view of a parsed dict, which does not copy it. Nested dicts and lists are returned as views as well.
+
+    Use `thaw` to get a mutable copy of the dict when it needs to be changed.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Dict):
+        self._data = data
+
+    def __getitem__(self, key: Any) -> Any:
+        return freeze(self._data[key])
+
+    def __iter__(self) -> Iterator:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __eq__(self, other: object) -> bool:
+        return self._data == (
+            other._data if isinstance(other, (FrozenDict, FrozenList)) else other
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._data!r})"
+
+    def thaw(self) -> Dict:
+        return deepcopy(self._data)
+
+
+class FrozenList(Sequence):
+    """A read-only view of a parsed list, which does not copy it. Nested dicts and lists are returned as views as well.
+
+    Use `thaw` to get a mutable copy of the list when it needs to be changed.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: List):
+        self._data = data
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return FrozenList(self._data[index])
+        return freeze(self._data[index])
+
+    def __iter__(self) -> Iterator:
+        return map(freeze, self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other: object) -> bool:
+        return self._data == (
+            other._data if isinstance(other, (FrozenDict, FrozenList)) else other
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._data!r})"
+
+    def thaw(self) -> List:
+        return deepcopy(self._data)
+
+
+def freeze(value: Any) -> Any:
+    """Returns a read-only view of a parsed dict or list, other values are returned as is.
+
+    Args:
+        value: A parsed value, usually a loaded YAML/JSON file.
+    """
+    if isinstance(value, dict):
+        return FrozenDict(value)
+    if isinstance(value, list):
+        return FrozenList(value)
+    return value
+
+
+def thaw(value: Union[FrozenDict, FrozenList, Any]) -> Any:
+    """Returns a mutable copy of a parsed value, the explicit copy before changing a shared (cached) parsed file.
+
+    Args:
+        value: A read-only view, or a parsed value.
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value.thaw()
+    return deepcopy(value)
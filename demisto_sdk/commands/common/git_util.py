@@ -1,8 +1,22 @@
+import atexit
 import os
 import re
+import subprocess
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Sequence, Set, Tuple, Union
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import click
 import gitdb
@@ -12,7 +26,7 @@ from git import (
 )
 from git.diff import Lit_change_type
 from git.exc import GitError
-from git.objects import Blob, Commit
+from git.objects import Commit
 from git.remote import Remote
 
 from demisto_sdk.commands.common.constants import (
@@ -43,9 +57,255 @@ class GitFileNotFoundError(FileNotFoundError):
         )
 
 
+class ChangeEntry(NamedTuple):
+    """A change listed by `git diff --name-status`. Both paths of a change which is not a rename are the same."""
+
+    status: str
+    score: int
+    a_path: Path
+    b_path: Path
+
+    def is_change_type(self, change_type: str) -> bool:
+        """Whether the change is of the given type, the same as `DiffIndex.iter_change_type` of GitPython."""
+        if change_type == "M":
+            # the content of a file which was not renamed as is was modified as well
+            return self.status in ("M", "T") or (
+                self.status in ("R", "C") and self.score < 100
+            )
+        return self.status == change_type
+
+
+def parse_name_status(output: str) -> List[ChangeEntry]:
+    """Parses the output of `git diff --name-status -z`.
+
+    Args:
+        output (str): The output of the command.
+
+    Returns:
+        List[ChangeEntry]: The changes.
+    """
+    fields = output.split("\x00")
+    changes = []
+    position = 0
+    while position < len(fields) and fields[position]:
+        status = fields[position]
+        change_type, score = status[0], int(status[1:] or 100)
+        if change_type in ("R", "C"):
+            a_path, b_path = fields[position + 1], fields[position + 2]
+            position += 3
+        else:
+            a_path = b_path = fields[position + 1]
+            position += 2
+        changes.append(ChangeEntry(change_type, score, Path(a_path), Path(b_path)))
+    return changes
+
+
+class ChangeSet(NamedTuple):
+    """The changes of the current branch against a previous version, see `GitUtil.get_change_set`."""
+
+    # The changes from the previous version to the current commit
+    committed: List[ChangeEntry]
+    # The changes from the current commit to the index
+    staged: List[ChangeEntry]
+    # The files changed on the current branch, since it diverged from the previous version
+    branch_changed_files: Set[Path]
+    # The status of every file changed on the current branch, without detecting renames
+    branch_statuses: Dict[Path, str]
+
+    def committed_of(self, change_type: str) -> List[ChangeEntry]:
+        return [
+            change for change in self.committed if change.is_change_type(change_type)
+        ]
+
+    def staged_of(self, change_type: str) -> List[ChangeEntry]:
+        return [change for change in self.staged if change.is_change_type(change_type)]
+
+
+# The maximal total size in bytes of the git objects a blob reader keeps in memory
+BLOB_CACHE_MAX_SIZE = 128 * 1024 * 1024
+# The approximate memory of a cached git object, besides its content
+_BLOB_CACHE_ENTRY_OVERHEAD = 200
+
+
+def _is_readable_git_path(path: str) -> bool:
+    # git cat-file cannot read paths with new lines, and exits on paths outside the repository
+    return "\n" not in path and not path.startswith(("/", "../")) and path != ".."
+
+
+class GitObject(NamedTuple):
+    """An object read from git, its type is blob for files and tree for directories."""
+
+    type: str
+    content: bytes
+
+
+class GitBlobReader:
+    """Reads files (and directories) of commits through a long-lived `git cat-file --batch` process of a repository,
+    which resolves any number of (commit sha, path) pairs in a single stream, instead of a git call per file.
+
+    The read objects are kept in an LRU cache bounded by their total size, including the ones which were not found.
+    Only full commit shas are read, so the cached objects never go stale.
+    """
+
+    def __init__(
+        self,
+        working_dir: Union[str, Path],
+        max_cache_size: int = BLOB_CACHE_MAX_SIZE,
+        git_dir_id: Optional[int] = None,
+    ):
+        self.working_dir = str(working_dir)
+        self.git_dir_id = git_dir_id
+        self.max_cache_size = max_cache_size
+        self._cache: OrderedDict[Tuple[str, str], Optional[GitObject]] = OrderedDict()
+        self._cache_size = 0
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def read(self, commit_sha: str, path: Union[Path, str]) -> Optional[GitObject]:
+        """Reads a file or a directory of a commit.
+
+        Args:
+            commit_sha: The full sha of the commit.
+            path: The path from the repository root.
+
+        Returns:
+            Optional[GitObject]: The object, or None if the path does not exist in the commit.
+        """
+        return self.read_many([(commit_sha, path)])[(commit_sha, Path(path).as_posix())]
+
+    def read_many(
+        self, objects: Iterable[Tuple[str, Union[Path, str]]]
+    ) -> Dict[Tuple[str, str], Optional[GitObject]]:
+        """Reads files and directories of commits, the ones which are not cached in a single round trip to git.
+
+        Args:
+            objects: The full commit shas and the paths from the repository root.
+
+        Returns:
+            Dict[Tuple[str, str], Optional[GitObject]]: The objects by their commit sha and posix path,
+                None for the ones which do not exist.
+        """
+        keys = list(
+            dict.fromkeys(
+                (commit_sha, Path(path).as_posix()) for commit_sha, path in objects
+            )
+        )
+        read_objects: Dict[Tuple[str, str], Optional[GitObject]] = {}
+        with self._lock:
+            keys_to_read = []
+            for key in keys:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    read_objects[key] = self._cache[key]
+                elif not _is_readable_git_path(key[1]):
+                    read_objects[key] = None
+                else:
+                    keys_to_read.append(key)
+            if not keys_to_read:
+                return read_objects
+            process = self._get_process()
+            request = "".join(
+                f"{commit_sha}:{path}\n" for commit_sha, path in keys_to_read
+            ).encode()
+            # git writes the objects while reading the request, so a long request is written from another thread,
+            # otherwise both sides could block on full pipes
+            writer = threading.Thread(
+                target=self._write_request, args=(process, request), daemon=True
+            )
+            writer.start()
+            try:
+                for key in keys_to_read:
+                    read_objects[key] = git_object = self._read_object(process)
+                    self._add_to_cache(key, git_object)
+            except Exception:
+                self._stop_process()
+                raise
+            finally:
+                writer.join()
+        return read_objects
+
+    def _get_process(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=self.working_dir,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._process
+
+    @staticmethod
+    def _write_request(process: subprocess.Popen, request: bytes) -> None:
+        try:
+            process.stdin.write(request)  # type: ignore[union-attr]
+            process.stdin.flush()  # type: ignore[union-attr]
+        except (BrokenPipeError, ValueError):
+            # the process exited, which the reading side reports
+            pass
+
+    @staticmethod
+    def _read_object(process: subprocess.Popen) -> Optional[GitObject]:
+        header = process.stdout.readline()  # type: ignore[union-attr]
+        if not header.endswith(b"\n"):
+            raise GitError(f"git cat-file exited with code {process.poll()}")
+        header = header[:-1]
+        if header.endswith((b" missing", b" ambiguous")):
+            return None
+        _, object_type, size = header.rsplit(b" ", 2)
+        content = process.stdout.read(int(size) + 1)  # type: ignore[union-attr]
+        if len(content) != int(size) + 1:
+            raise GitError(f"git cat-file exited with code {process.poll()}")
+        return GitObject(object_type.decode(), content[:-1])
+
+    def _add_to_cache(
+        self, key: Tuple[str, str], git_object: Optional[GitObject]
+    ) -> None:
+        size = _BLOB_CACHE_ENTRY_OVERHEAD + (
+            len(git_object.content) if git_object else 0
+        )
+        if size > self.max_cache_size:
+            return
+        self._cache[key] = git_object
+        self._cache_size += size
+        while self._cache_size > self.max_cache_size:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_size -= _BLOB_CACHE_ENTRY_OVERHEAD + (
+                len(evicted.content) if evicted else 0
+            )
+
+    def _stop_process(self) -> None:
+        if (process := self._process) is None:
+            return
+        self._process = None
+        try:
+            process.stdin.close()  # type: ignore[union-attr]
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        process.stdout.close()  # type: ignore[union-attr]
+
+    def close(self) -> None:
+        """Stops the git process. The cached objects are kept, and the process is started again when needed."""
+        with self._lock:
+            self._stop_process()
+
+    def after_fork_in_child(self) -> None:
+        # the pipes of the git process are shared with the parent process, so a forked process starts its own
+        self._process = None
+        self._lock = threading.Lock()
+
+
 class GitUtil:
     # in order to use Repo class/static methods
     REPO_CLS = Repo
+    # contents of files from other commits/branches which were read in advance, by their git file path
+    _prefetched_files: Dict[str, str] = {}
+    # the computed change sets, by the repository, the previous version and the current commit and index state
+    _change_sets: Dict[Tuple, ChangeSet] = {}
+    # the readers of files from other commits, by the repository working directory
+    _blob_readers: Dict[str, GitBlobReader] = {}
 
     def __init__(
         self,
@@ -182,6 +442,27 @@ class GitUtil:
             ).splitlines()
         )
 
+    @property
+    def blob_reader(self) -> GitBlobReader:
+        """The reader of files from other commits of the repository, shared by all the instances of the repository."""
+        working_dir = str(self.repo.working_dir)
+        # a repository which was recreated in the same directory is read by a new reader
+        git_dir_id = os.stat(self.repo.git_dir).st_ino
+        reader = GitUtil._blob_readers.get(working_dir)
+        if reader is None or reader.git_dir_id != git_dir_id:
+            if reader is not None:
+                reader.close()
+            reader = GitUtil._blob_readers[working_dir] = GitBlobReader(
+                working_dir, git_dir_id=git_dir_id
+            )
+        return reader
+
+    @staticmethod
+    def close_blob_readers() -> None:
+        for reader in GitUtil._blob_readers.values():
+            reader.close()
+        GitUtil._blob_readers.clear()
+
     def read_file_content(
         self, path: Union[Path, str], commit_or_branch: str, from_remote: bool = True
     ) -> bytes:
@@ -192,13 +473,11 @@ class GitUtil:
             else str(path)
         )
 
-        try:
-            blob: Blob = commit.tree / path
-        except KeyError:
+        if (git_object := self.blob_reader.read(commit.hexsha, path)) is None:
             raise GitFileNotFoundError(
                 commit_or_branch, path=path, from_remote=from_remote
             )
-        return blob.data_stream.read()
+        return git_object.content
 
     def is_file_exist_in_commit_or_branch(
         self, path: Union[Path, str], commit_or_branch: str, from_remote: bool = True
@@ -211,10 +490,8 @@ class GitUtil:
 
         path = str(self.path_from_git_root(path))
 
-        try:
-            return commit.tree[path].path == path
-        except KeyError:
-            return False
+        # the file is usually read right after, and then it is taken from the reader cache
+        return self.blob_reader.read(commit.hexsha, path) is not None
 
     def list_files_in_dir(
         self,
@@ -280,7 +557,6 @@ class GitUtil:
             Set: A set of Paths to the modified files.
         """
         remote, branch = self.handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
 
         # when checking branch against itself only return the last commit.
         last_commit = self._only_last_commit(prev_ver, requested_status="M")
@@ -290,6 +566,8 @@ class GitUtil:
             )
             return last_commit
 
+        change_set = self.get_change_set(prev_ver)
+
         # get all renamed files - some of these can be identified as modified by git,
         # but we want to identify them as renamed - so will remove them from the returned files.
         renamed = {
@@ -313,28 +591,13 @@ class GitUtil:
         if not staged_only:
             # get all committed files identified as modified which are changed from prev_ver.
             # this can result in extra files identified which were not touched on this branch.
-            if remote:
-                committed = {
-                    Path(os.path.join(item.a_path))
-                    for item in self.repo.remote(name=remote)
-                    .refs[branch]
-                    .commit.diff(current_branch_or_hash)
-                    .iter_change_type("M")
-                }.union(untrue_rename_committed)
-
-            # if remote does not exist we are checking against the commit sha1
-            else:
-                committed = {
-                    Path(os.path.join(item.a_path))  # type: ignore
-                    for item in self.repo.commit(rev=branch)
-                    .diff(current_branch_or_hash)
-                    .iter_change_type("M")
-                }.union(untrue_rename_committed)
+            committed = {
+                change.a_path for change in change_set.committed_of("M")
+            }.union(untrue_rename_committed)
 
             # identify all files that were touched on this branch regardless of status
             # intersect these with all the committed files to identify the committed modified files.
-            all_branch_changed_files = self._get_all_changed_files(prev_ver)
-            committed = committed.intersection(all_branch_changed_files)
+            committed = committed.intersection(change_set.branch_changed_files)
 
         # remove the renamed and deleted files from the committed
         committed = committed - renamed - deleted
@@ -351,33 +614,16 @@ class GitUtil:
             untracked = self._get_untracked_files("M")
 
         # get all the files that are staged on the branch and identified as modified.
-        staged = {
-            Path(os.path.join(item.a_path))  # type: ignore
-            for item in self.repo.head.commit.diff().iter_change_type("M")
-        }.union(untracked).union(untrue_rename_staged)
+        staged = {change.a_path for change in change_set.staged_of("M")}.union(
+            untracked
+        ).union(untrue_rename_staged)
 
         # If a file is Added in regards to prev_ver
         # and is then modified locally after being committed - it is identified as modified
         # but we want to identify the file as Added (its actual status against prev_ver) -
         # so will remove it from the staged modified files.
         # also remove the deleted and renamed files as well.
-        if remote:
-            committed_added = {
-                Path(os.path.join(item.a_path))
-                for item in self.repo.remote(name=remote)
-                .refs[branch]
-                .commit.diff(current_branch_or_hash)
-                .iter_change_type("A")
-            }
-
-        # if remote does not exist we are checking against the commit sha1
-        else:
-            committed_added = {
-                Path(os.path.join(item.a_path))  # type: ignore
-                for item in self.repo.commit(rev=branch)
-                .diff(current_branch_or_hash)
-                .iter_change_type("A")
-            }
+        committed_added = {change.a_path for change in change_set.committed_of("A")}
 
         staged = staged - committed_added - renamed - deleted
 
@@ -412,7 +658,6 @@ class GitUtil:
             Set: A set of Paths to the added files.
         """
         remote, branch = self.handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
 
         # when checking branch against itself only return the last commit.
         last_commit = self._only_last_commit(prev_ver, requested_status="A")
@@ -422,6 +667,7 @@ class GitUtil:
             )
             return last_commit
 
+        change_set = self.get_change_set(prev_ver)
         deleted = self.deleted_files(prev_ver, committed_only, staged_only)
 
         # handle a case where a file is wrongly recognized as renamed (not 100% score) and is actually of added status
@@ -434,28 +680,13 @@ class GitUtil:
 
         # get all committed files identified as added which are changed from prev_ver.
         # this can result in extra files identified which were not touched on this branch.
-        if remote:
-            committed = {
-                Path(os.path.join(item.a_path))
-                for item in self.repo.remote(name=remote)
-                .refs[branch]
-                .commit.diff(current_branch_or_hash)
-                .iter_change_type("A")
-            }.union(untrue_rename_committed)
-
-        # if remote does not exist we are checking against the commit sha1
-        else:
-            committed = {
-                Path(os.path.join(item.a_path))  # type: ignore
-                for item in self.repo.commit(rev=branch)
-                .diff(current_branch_or_hash)
-                .iter_change_type("A")
-            }.union(untrue_rename_committed)
+        committed = {change.a_path for change in change_set.committed_of("A")}.union(
+            untrue_rename_committed
+        )
 
         # identify all files that were touched on this branch regardless of status
         # intersect these with all the committed files to identify the committed added files.
-        all_branch_changed_files = self._get_all_changed_files(prev_ver)
-        committed = committed.intersection(all_branch_changed_files)
+        committed = committed.intersection(change_set.branch_changed_files)
 
         # remove deleted files
         committed = committed - deleted
@@ -476,10 +707,9 @@ class GitUtil:
             untracked_modified = self._get_untracked_files("M")
 
         # get all the files that are staged on the branch and identified as added.
-        staged = {
-            Path(os.path.join(item.a_path))  # type: ignore
-            for item in self.repo.head.commit.diff().iter_change_type("A")
-        }.union(untrue_rename_staged)
+        staged = {change.a_path for change in change_set.staged_of("A")}.union(
+            untrue_rename_staged
+        )
 
         # If a file is Added in regards to prev_ver
         # and is then modified locally after being committed - it is identified as modified
@@ -487,8 +717,7 @@ class GitUtil:
         # so will added it from the staged added files.
         # same goes to untracked files - can be identified as modified but are actually added against prev_ver
         committed_added_locally_modified = {
-            Path(os.path.join(item.a_path))  # type: ignore
-            for item in self.repo.head.commit.diff().iter_change_type("M")
+            change.a_path for change in change_set.staged_of("M")
         }.intersection(committed)
         untracked = untracked_added.union(untracked_modified.intersection(committed))
 
@@ -525,41 +754,22 @@ class GitUtil:
         Returns:
             Set: A set of Paths to the deleted files.
         """
-        remote, branch = self.handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
-
         # when checking branch against itself only return the last commit.
         last_commit = self._only_last_commit(prev_ver, requested_status="D")
         if last_commit:
             return last_commit
 
+        change_set = self.get_change_set(prev_ver)
         committed = set()
 
         if not staged_only:
             # get all committed files identified as added which are changed from prev_ver.
             # this can result in extra files identified which were not touched on this branch.
-            if remote:
-                committed = {
-                    Path(os.path.join(item.a_path))
-                    for item in self.repo.remote(name=remote)
-                    .refs[branch]
-                    .commit.diff(current_branch_or_hash)
-                    .iter_change_type("D")
-                }
-
-            # if remote does not exist we are checking against the commit sha1
-            else:
-                committed = {
-                    Path(os.path.join(item.a_path))  # type: ignore
-                    for item in self.repo.commit(rev=branch)
-                    .diff(current_branch_or_hash)
-                    .iter_change_type("D")
-                }
+            committed = {change.a_path for change in change_set.committed_of("D")}
 
             # identify all files that were touched on this branch regardless of status
             # intersect these with all the committed files to identify the committed added files.
-            all_branch_changed_files = self._get_all_changed_files(prev_ver)
-            committed = committed.intersection(all_branch_changed_files)
+            committed = committed.intersection(change_set.branch_changed_files)
 
         if committed_only:
             return committed
@@ -570,10 +780,9 @@ class GitUtil:
             untracked = self._get_untracked_files("D")
 
         # get all the files that are staged on the branch and identified as added.
-        staged = {
-            Path(os.path.join(item.a_path))  # type: ignore
-            for item in self.repo.head.commit.diff().iter_change_type("D")
-        }.union(untracked)
+        staged = {change.a_path for change in change_set.staged_of("D")}.union(
+            untracked
+        )
 
         if staged_only:
             return staged
@@ -601,9 +810,6 @@ class GitUtil:
             Set: A set of Tuples of Paths to the renamed files -
             first element being the old file path and the second is the new.
         """
-        remote, branch = self.handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
-
         # when checking branch against itself only return the last commit.
         last_commit = self._only_last_commit(prev_ver, requested_status="R")
         if last_commit:
@@ -612,40 +818,26 @@ class GitUtil:
             )
             return last_commit
 
+        change_set = self.get_change_set(prev_ver)
         deleted = self.deleted_files(prev_ver, committed_only, staged_only)
         committed = set()
 
         if not staged_only:
             # get all committed files identified as renamed which are changed from prev_ver and are with 100% score.
             # this can result in extra files identified which were not touched on this branch.
-            if remote:
-                committed = {
-                    (Path(item.a_path), Path(item.b_path))
-                    for item in self.repo.remote(name=remote)
-                    .refs[branch]
-                    .commit.diff(current_branch_or_hash)
-                    .iter_change_type("R")
-                    if item.score == 100
-                }
-
-            # if remote does not exist we are checking against the commit sha1
-            else:
-                committed = {
-                    (Path(item.a_path), Path(item.b_path))  # type: ignore
-                    for item in self.repo.commit(rev=branch)
-                    .diff(current_branch_or_hash)
-                    .iter_change_type("R")
-                    if item.score == 100
-                }
+            committed = {
+                (change.a_path, change.b_path)
+                for change in change_set.committed_of("R")
+                if change.score == 100
+            }
 
             # identify all files that were touched on this branch regardless of status
             # intersect these with all the committed files to identify the committed added files.
-            all_branch_changed_files = self._get_all_changed_files(prev_ver)
             committed = {
                 tuple_item
                 for tuple_item in committed
                 if (
-                    tuple_item[1] in all_branch_changed_files
+                    tuple_item[1] in change_set.branch_changed_files
                     and tuple_item[1] not in deleted
                 )
             }
@@ -667,9 +859,9 @@ class GitUtil:
 
         # get all the files that are staged on the branch and identified as renamed and are with 100% score.
         staged = {
-            (Path(item.a_path), Path(item.b_path))  # type: ignore
-            for item in self.repo.head.commit.diff().iter_change_type("R")
-            if item.score == 100
+            (change.a_path, change.b_path)
+            for change in change_set.staged_of("R")
+            if change.score == 100
         }.union(untracked)
 
         if staged_only:
@@ -751,29 +943,88 @@ class GitUtil:
         Returns:
             Set[Path]: of Paths to files changed in the current branch.
         """
+        return set(self.get_change_set(prev_ver).branch_changed_files)
 
-        self.fetch()
+    def get_change_set(self, prev_ver: Optional[str] = None) -> ChangeSet:
+        """Get the changes of the current branch against prev_ver, which all the changed files are classified by.
+
+        The changes are listed by a single `git diff --name-status` for each comparison: from prev_ver to the current commit,
+        from the merge base of prev_ver to the current commit, and from the current commit to the index.
+        The change set is computed once for every previous version, current commit and index state.
+
+        Args:
+            prev_ver (str): The base branch against which the comparison is made.
+
+        Returns:
+            ChangeSet: The changes.
+        """
         remote, branch = self.handle_prev_ver(prev_ver)
-        current_hash = self.get_current_commit_hash()
+        return self._get_change_set(remote, branch)
 
-        if remote:
-            return {
-                Path(os.path.join(item))
-                for item in self.repo.git.diff(
-                    "--name-only", f"{remote}/{branch}...{current_hash}"
-                ).split("\n")
-                if item
-            }
+    def _get_change_set_key(self, prev_rev: str) -> Tuple:
+        try:
+            prev_hash = self.repo.rev_parse(prev_rev).hexsha
+        except Exception:
+            prev_hash = prev_rev
+        try:
+            index_stat = (Path(self.repo.git_dir) / "index").stat()
+            index_state: Optional[Tuple[int, int]] = (
+                index_stat.st_mtime_ns,
+                index_stat.st_size,
+            )
+        except FileNotFoundError:
+            index_state = None
+        return (
+            str(self.repo.working_dir),
+            prev_hash,
+            self.get_current_commit_hash(),
+            index_state,
+        )
 
+    def _get_change_set(self, remote: Optional[str], branch: str) -> ChangeSet:
         # if remote does not exist we are checking against the commit sha1
-        else:
-            return {
-                Path(os.path.join(item))
-                for item in self.repo.git.diff(
-                    "--name-only", f"{branch}...{current_hash}"
-                ).split("\n")
-                if item
-            }
+        prev_rev = f"{remote}/{branch}" if remote else branch
+        if change_set := GitUtil._change_sets.get(self._get_change_set_key(prev_rev)):
+            return change_set
+
+        self.fetch()
+        current_hash = self.get_current_commit_hash()
+        committed = parse_name_status(
+            self.repo.git.diff("--name-status", "-z", "-M", prev_rev, current_hash)
+        )
+        branch_changes = parse_name_status(
+            self.repo.git.diff(
+                "--name-status", "-z", "-M", f"{prev_rev}...{current_hash}"
+            )
+        )
+        staged = parse_name_status(
+            self.repo.git.diff("--cached", "--name-status", "-z", "-M", current_hash)
+        )
+
+        branch_statuses: Dict[Path, str] = {}
+        for change in branch_changes:
+            if change.status == "R":
+                # without detecting renames, a renamed file is deleted and added
+                branch_statuses[change.a_path] = "D"
+                branch_statuses[change.b_path] = "A"
+            elif change.status == "C":
+                branch_statuses[change.b_path] = "A"
+            else:
+                branch_statuses[change.a_path] = change.status
+
+        change_set = ChangeSet(
+            committed=committed,
+            staged=staged,
+            branch_changed_files={change.b_path for change in branch_changes},
+            branch_statuses=branch_statuses,
+        )
+        # the key after fetching, which may have updated the remote branch
+        GitUtil._change_sets[self._get_change_set_key(prev_rev)] = change_set
+        return change_set
+
+    @staticmethod
+    def clear_change_sets() -> None:
+        GitUtil._change_sets.clear()
 
     def _only_last_commit(
         self, prev_ver: str, requested_status: Lit_change_type
@@ -936,44 +1187,15 @@ class GitUtil:
         Returns:
             Set: of Paths to non 100% renamed files which are of a given status.
         """
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
-
-        if staged_only:
-            return {
-                Path(item.b_path)  # type: ignore
-                for item in self.repo.head.commit.diff().iter_change_type("R")
-                if item.score < 100  # type: ignore
-                and self._check_file_status(
-                    file_path=str(item.b_path), remote=remote, branch=branch
-                )
-                == status
-            }
-
-        if remote:
-            return {
-                Path(item.b_path)
-                for item in self.repo.remote(name=remote)
-                .refs[branch]
-                .commit.diff(current_branch_or_hash)
-                .iter_change_type("R")
-                if item.score < 100
-                and self._check_file_status(
-                    file_path=str(item.b_path), remote=remote, branch=branch
-                )
-                == status
-            }
-
-        # if remote does not exist we are checking against the commit sha1
+        change_set = self._get_change_set(remote, branch)
+        changes = change_set.staged if staged_only else change_set.committed
         return {
-            Path(item.b_path)  # type: ignore
-            for item in self.repo.commit(rev=branch)
-            .diff(current_branch_or_hash)
-            .iter_change_type("R")
-            if item.score < 100  # type: ignore
-            and self._check_file_status(
-                file_path=str(item.b_path), remote=remote, branch=branch
-            )
-            == status
+            change.b_path
+            for change in changes
+            if change.status == "R"
+            and change.score < 100
+            # the status of the file itself on the branch (see `_check_file_status`)
+            and change_set.branch_statuses.get(change.b_path) == status
         }
 
     def _check_file_status(
@@ -1023,9 +1245,82 @@ class GitUtil:
         Returns:
             The fetched file content.
         """
+        if (file_content := self._prefetched_files.get(git_file_path)) is not None:
+            return file_content
+        if (
+            file_content := self.read_files_content_batch([git_file_path]).get(
+                git_file_path
+            )
+        ) is not None:
+            try:
+                # the same as the output of git show, which drops the trailing new line
+                return file_content.decode("utf-8").removesuffix("\n")
+            except UnicodeDecodeError:
+                pass
         file_content = self.repo.git.show(git_file_path)
         return file_content
 
+    def read_files_content_batch(
+        self, git_file_paths: Sequence[str]
+    ) -> Dict[str, bytes]:
+        """Read the content of many files from other commits/branches with the blob reader, in a single round trip.
+
+        Args:
+            git_file_paths: The git file paths. For example origin/master:README.md
+
+        Returns:
+            The content of every file which was found, by its git file path (directories are skipped).
+        """
+        commit_shas: Dict[str, Optional[str]] = {}
+        objects: Dict[str, Tuple[str, str]] = {}
+        for git_file_path in git_file_paths:
+            commit_or_branch, _, path = git_file_path.partition(":")
+            if commit_or_branch not in commit_shas:
+                try:
+                    commit_shas[commit_or_branch] = self.repo.commit(
+                        commit_or_branch
+                    ).hexsha
+                except Exception:
+                    logger.debug(f"Could not find {commit_or_branch} in git")
+                    commit_shas[commit_or_branch] = None
+            if commit_sha := commit_shas[commit_or_branch]:
+                objects[git_file_path] = (commit_sha, path)
+        if not objects:
+            return {}
+        git_objects = self.blob_reader.read_many(objects.values())
+        files_content: Dict[str, bytes] = {}
+        for git_file_path, (commit_sha, path) in objects.items():
+            git_object = git_objects[(commit_sha, Path(path).as_posix())]
+            if git_object is None:
+                logger.debug(f"Could not find {git_file_path} in git")
+            elif git_object.type == "blob":
+                files_content[git_file_path] = git_object.content
+        return files_content
+
+    def prefetch_local_remote_files(self, git_file_paths: Iterable[str]) -> None:
+        """Read files from other commits/branches in advance, in a single git call,
+        so getting their content later with `get_local_remote_file_content` does not call git for each of them.
+
+        Args:
+            git_file_paths: The git file paths. For example origin/master:README.md
+        """
+        for git_file_path, file_content in self.read_files_content_batch(
+            list(dict.fromkeys(git_file_paths))
+        ).items():
+            try:
+                # the same as the output of git show, which drops the trailing new line
+                GitUtil._prefetched_files[git_file_path] = file_content.decode(
+                    "utf-8"
+                ).removesuffix("\n")
+            except UnicodeDecodeError:
+                logger.debug(
+                    f"Could not decode {git_file_path}, it will be read when needed"
+                )
+
+    @staticmethod
+    def clear_prefetched_files() -> None:
+        GitUtil._prefetched_files.clear()
+
     def get_local_remote_file_path(
         self, full_file_path: str, tag: str, from_remote: bool = True
     ) -> str:
@@ -1194,3 +1489,13 @@ class GitUtil:
             logger.debug(f"Staged file '{file_path}'")
         else:
             logger.error(f"File '{file_path}' doesn't exist. Not adding.")
+
+
+def _reset_blob_readers_after_fork() -> None:
+    for reader in GitUtil._blob_readers.values():
+        reader.after_fork_in_child()
+
+
+atexit.register(GitUtil.close_blob_readers)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_blob_readers_after_fork)
@@ -0,0 +1,126 @@
+"""A benchmark of loading the YAML files of a content repository.
+
+Loads every YAML file under the given path (usually the Packs folder of a content repository) in every given mode:
+    - rt: the round-trip ruamel handler (DEFAULT_YAML_HANDLER), used when the loaded data is written back.
+    - safe: the safe ruamel handler.
+    - fast: the libyaml handler (DEFAULT_YAML_SAFE_HANDLER), used for read-only loads.
+and reports the wall time, files per second and MB per second of every mode, and the speedup of every mode over rt.
+The data loaded by the fast mode is compared to the data loaded by the safe mode, and the files which differ are listed.
+The measurements are written as JSON.
+
+Usage:
+    python demisto_sdk/commands/common/handlers/benchmarks/yaml_benchmark.py [PATH] [--modes rt safe fast] [--rounds N]
+        [--output PATH]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from demisto_sdk.commands.common.handlers import (
+    DEFAULT_YAML_HANDLER,
+    DEFAULT_YAML_SAFE_HANDLER,
+    JSON_Handler,
+    XSOAR_Handler,
+    YAML_Handler,
+)
+
+json = JSON_Handler()
+
+MODES: Dict[str, XSOAR_Handler] = {
+    "rt": DEFAULT_YAML_HANDLER,
+    "safe": YAML_Handler(typ="safe"),
+    "fast": DEFAULT_YAML_SAFE_HANDLER,
+}
+DEFAULT_PATH = Path(__file__).parents[4] / "tests" / "test_files"
+
+
+def read_files(path: Path) -> Dict[Path, str]:
+    """Returns the content of the YAML files under the path, which are read once so only the loading is measured."""
+    files = sorted(
+        file
+        for pattern in ("*.yml", "*.yaml")
+        for file in (path.rglob(pattern) if path.is_dir() else [path])
+        if file.is_file()
+    )
+    return {file: file.read_text(encoding="utf-8", errors="replace") for file in files}
+
+
+def load_all(handler: XSOAR_Handler, contents: Dict[Path, str]) -> Dict[Path, Any]:
+    """Loads every file, the files which cannot be loaded are loaded as their error type."""
+    loaded: Dict[Path, Any] = {}
+    for file, content in contents.items():
+        try:
+            loaded[file] = handler.load(content)
+        except Exception as e:
+            loaded[file] = type(e)
+    return loaded
+
+
+def run(path: Path, modes: List[str], rounds: int) -> Dict[str, Any]:
+    contents = read_files(path)
+    size_mb = sum(len(content.encode()) for content in contents.values()) / 2**20
+    results: Dict[str, Any] = {
+        "path": str(path),
+        "files": len(contents),
+        "size_mb": round(size_mb, 3),
+        "modes": {},
+    }
+    loaded: Dict[str, Dict[Path, Any]] = {}
+    for mode in modes:
+        times = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            loaded[mode] = load_all(MODES[mode], contents)
+            times.append(time.perf_counter() - start)
+        best = min(times)
+        results["modes"][mode] = {
+            "seconds": round(best, 3),
+            "files_per_second": round(len(contents) / best, 1) if best else None,
+            "mb_per_second": round(size_mb / best, 2) if best else None,
+        }
+    if "rt" in results["modes"]:
+        rt_seconds = results["modes"]["rt"]["seconds"]
+        for mode_results in results["modes"].values():
+            mode_results["speedup"] = (
+                round(rt_seconds / mode_results["seconds"], 2)
+                if mode_results["seconds"]
+                else None
+            )
+    if "safe" in loaded and "fast" in loaded:
+        results["fast_differs_from_safe"] = [
+            str(file)
+            for file in contents
+            if loaded["fast"][file] != loaded["safe"][file]
+        ]
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "path",
+        nargs="?",
+        type=Path,
+        default=DEFAULT_PATH,
+        help="A folder of YAML files, e.g. the Packs folder of a content repository",
+    )
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    parser.add_argument(
+        "--rounds", type=int, default=3, help="The best round of every mode is reported"
+    )
+    parser.add_argument("--output", type=Path, help="The path of the JSON results")
+    args = parser.parse_args()
+
+    results = run(args.path, args.modes, args.rounds)
+    output = json.dumps(results, indent=4)
+    if args.output:
+        args.output.write_text(output)
+    print(output)  # noqa: T201
+    return 1 if results.get("fast_differs_from_safe") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
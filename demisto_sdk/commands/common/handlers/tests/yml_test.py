@@ -1,7 +1,14 @@
 from io import StringIO
 
+import pytest
 from ruamel.yaml import YAML  # noqa: TID251
+from ruamel.yaml.constructor import (  # noqa: TID251
+    ConstructorError,
+    DuplicateKeyError,
+)
 
+from demisto_sdk.commands.common.handlers.yaml import libyaml_handler
+from demisto_sdk.commands.common.handlers.yaml.libyaml_handler import LIBYAML_Handler
 from demisto_sdk.commands.common.handlers.yaml.ruamel_handler import RUAMEL_Handler
 
 
@@ -38,3 +45,56 @@ class TestYAMLHandler:
 
         assert yaml_dump.yaml.indent.call_count == 1
         yaml_dump.yaml.indent.assert_called_with(sequence=4)
+
+
+class TestLibYAMLHandler:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "a: yes\nb: on\nc: True\nd: ~\ne: null",
+            "a: 0777\nb: 012\nc: 08\nd: 0o17\ne: 0x1F\nf: -0b101\ng: 1_000\nh: 1:20",
+            "a: 1e3\nb: +.5\nc: -.5e+3\nd: .inf\ne: 1.",
+            "a: 2020-01-01\nb: 2001-12-14t21:59:43.10-05:00\nc: 0001-01-01T00:00:00Z",
+            "base: &base {x: 1}\nitem:\n  <<: *base\n  y: [1, '2', !!str 3]",
+        ],
+    )
+    def test_load_as_ruamel(self, text: str):
+        """
+        Given:
+            - YAML scalars which are resolved differently in YAML 1.1 (the PyYAML default) and YAML 1.2 (ruamel).
+        When:
+            - Loading them with the libyaml handler and the safe ruamel handler.
+        Then:
+            - Ensure the same values, of the same types, are loaded.
+        """
+
+        def typed(value):
+            if isinstance(value, dict):
+                return {key: typed(item) for key, item in value.items()}
+            if isinstance(value, list):
+                return [typed(item) for item in value]
+            return type(value), value
+
+        assert typed(LIBYAML_Handler().load(StringIO(text))) == typed(
+            RUAMEL_Handler(typ="safe").load(text)
+        )
+
+    @pytest.mark.parametrize("libyaml_available", [True, False])
+    def test_load_errors(self, mocker, libyaml_available: bool):
+        """
+        Given:
+            - A YAML with a duplicate key, and a YAML with a `=` value.
+        When:
+            - Loading them with the libyaml handler, with and without libyaml.
+        Then:
+            - Ensure the errors of the safe ruamel handler are raised.
+        """
+        if not libyaml_available:
+            mocker.patch.object(libyaml_handler, "CSafeLoader", None)
+        handler = LIBYAML_Handler()
+
+        with pytest.raises(DuplicateKeyError):
+            handler.load("a: 1\nb: 2\na: 3")
+        with pytest.raises(ConstructorError, match="value"):
+            handler.load("simple: =")
+        assert handler.load("a: [1]") == {"a": [1]}
@@ -0,0 +1,155 @@
+import re
+from typing import IO, Any, Union
+
+from ruamel.yaml.constructor import SafeConstructor  # noqa:TID251 - this is a handler
+from ruamel.yaml.util import create_timestamp  # noqa:TID251 - this is a handler
+from yaml import MappingNode, ScalarNode, YAMLError
+from yaml.constructor import ConstructorError
+
+from demisto_sdk.commands.common.handlers.xsoar_handler import XSOAR_Handler
+from demisto_sdk.commands.common.handlers.yaml.ruamel_handler import RUAMEL_Handler
+
+try:
+    from yaml import CSafeLoader
+except ImportError:  # PyYAML was built without libyaml
+    CSafeLoader = None  # type: ignore[assignment,misc]
+
+# The implicit resolvers of YAML 1.2, which ruamel uses, by their first characters.
+# The resolvers of YAML 1.1 (the PyYAML default) differ, e.g. yes/no/on/off are booleans and 0777 is an octal number.
+YAML_1_2_IMPLICIT_RESOLVERS = (
+    (
+        "tag:yaml.org,2002:bool",
+        r"^(?:true|True|TRUE|false|False|FALSE)$",
+        "tTfF",
+    ),
+    (
+        "tag:yaml.org,2002:float",
+        r"""^(?:
+         [-+]?(?:[0-9][0-9_]*)\.[0-9_]*(?:[eE][-+]?[0-9]+)?
+        |[-+]?(?:[0-9][0-9_]*)(?:[eE][-+]?[0-9]+)
+        |[-+]?\.[0-9_]+(?:[eE][-+][0-9]+)?
+        |[-+]?\.(?:inf|Inf|INF)
+        |\.(?:nan|NaN|NAN))$""",
+        "-+0123456789.",
+    ),
+    (
+        "tag:yaml.org,2002:int",
+        r"""^(?:[-+]?0b[0-1_]+
+        |[-+]?0o?[0-7_]+
+        |[-+]?[0-9_]+
+        |[-+]?0x[0-9a-fA-F_]+)$""",
+        "-+0123456789",
+    ),
+    ("tag:yaml.org,2002:merge", r"^(?:<<)$", "<"),
+    (
+        "tag:yaml.org,2002:null",
+        r"""^(?: ~
+        |null|Null|NULL
+        | )$""",
+        ["~", "n", "N", ""],
+    ),
+    (
+        "tag:yaml.org,2002:timestamp",
+        r"""^(?:[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]
+        |[0-9][0-9][0-9][0-9] -[0-9][0-9]? -[0-9][0-9]?
+        (?:[Tt]|[ \t]+)[0-9][0-9]?
+        :[0-9][0-9] :[0-9][0-9] (?:\.[0-9]*)?
+        (?:[ \t]*(?:Z|[-+][0-9][0-9]?(?::[0-9][0-9])?))?)$""",
+        "0123456789",
+    ),
+    ("tag:yaml.org,2002:value", r"^(?:=)$", "="),
+    ("tag:yaml.org,2002:yaml", r"^(?:!|&|\*)$", "!&*"),
+)
+
+if CSafeLoader is not None:
+
+    class YAML12SafeLoader(CSafeLoader):
+        """The libyaml safe loader of PyYAML, which resolves scalars the same as the safe loader of ruamel (YAML 1.2)
+        and does not allow duplicate keys."""
+
+        yaml_implicit_resolvers: dict = {}
+
+        def construct_mapping(self, node, deep=False):
+            if isinstance(node, MappingNode):
+                keys = set()
+                for key_node, _ in node.value:
+                    if (
+                        not isinstance(key_node, ScalarNode)
+                        or key_node.tag == "tag:yaml.org,2002:merge"
+                    ):
+                        continue
+                    key = (key_node.tag, key_node.value)
+                    if key in keys:
+                        raise ConstructorError(
+                            "while constructing a mapping",
+                            node.start_mark,
+                            f"found duplicate key {key_node.value!r}",
+                            key_node.start_mark,
+                        )
+                    keys.add(key)
+            return super().construct_mapping(node, deep=deep)
+
+        def construct_yaml_int(self, node) -> int:
+            # in YAML 1.2, a leading zero is not an octal number, and there are no sexagesimal numbers
+            value = self.construct_scalar(node).replace("_", "")
+            sign = -1 if value[0] == "-" else 1
+            value = value.lstrip("+-")
+            for prefix, base in (("0b", 2), ("0x", 16), ("0o", 8)):
+                if value.startswith(prefix):
+                    return sign * int(value[2:], base)
+            return sign * int(value)
+
+        def construct_yaml_timestamp(self, node):
+            # like ruamel, a timestamp with a time zone is converted to a naive UTC datetime
+            match = SafeConstructor.timestamp_regexp.match(self.construct_scalar(node))
+            if match is None:
+                raise ConstructorError(
+                    None,
+                    None,
+                    f"failed to construct timestamp from {node.value!r}",
+                    node.start_mark,
+                )
+            return create_timestamp(**match.groupdict())
+
+    for tag, regexp, first in YAML_1_2_IMPLICIT_RESOLVERS:
+        YAML12SafeLoader.add_implicit_resolver(tag, re.compile(regexp, re.X), first)
+    YAML12SafeLoader.add_constructor(
+        "tag:yaml.org,2002:int", YAML12SafeLoader.construct_yaml_int
+    )
+    YAML12SafeLoader.add_constructor(
+        "tag:yaml.org,2002:timestamp", YAML12SafeLoader.construct_yaml_timestamp
+    )
+
+
+class LIBYAML_Handler(XSOAR_Handler):
+    """
+    XSOAR wrapper for loading yaml with libyaml, for loads which do not need round-trip fidelity (the loaded data is not
+    written back with its comments and formatting). Dumping is done by the safe ruamel handler.
+    Loads the same data as the safe ruamel handler, which is used when libyaml is not available or the file cannot be
+    loaded by libyaml, so the errors are the same as well.
+    """
+
+    def __init__(self, **kwargs):
+        self._ruamel_handler = RUAMEL_Handler(typ="safe", **kwargs)
+
+    def load(self, stream: Union[IO[str], str]) -> Any:
+        text = stream if isinstance(stream, str) else stream.read()
+        if CSafeLoader is not None:
+            loader = YAML12SafeLoader(text)
+            try:
+                return loader.get_single_data()
+            except YAMLError:
+                pass
+            finally:
+                loader.dispose()
+        return self._ruamel_handler.load(text)
+
+    def dump(self, data, stream, indent=None, sort_keys=False, **kwargs):
+        self._ruamel_handler.dump(
+            data, stream, indent=indent, sort_keys=sort_keys, **kwargs
+        )
+
+    def dumps(self, data, indent=None, sort_keys=False, **kwargs):
+        return self._ruamel_handler.dumps(
+            data, indent=indent, sort_keys=sort_keys, **kwargs
+        )
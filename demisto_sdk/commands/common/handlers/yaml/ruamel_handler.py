@@ -1,3 +1,4 @@
+import threading
 from io import StringIO
 
 from ruamel.yaml import YAML  # noqa:TID251 - this is the handler
@@ -5,6 +6,10 @@ from ruamel.yaml import YAML  # noqa:TID251 - this is the handler
 from demisto_sdk.commands.common.handlers.handlers_utils import order_dict
 from demisto_sdk.commands.common.handlers.xsoar_handler import XSOAR_Handler
 
+# The configured ruamel instances of the current thread, by their configuration.
+# Kept out of the handlers, so the handlers can be pickled (sent to other processes).
+_yaml_instances = threading.local()
+
 
 class RUAMEL_Handler(XSOAR_Handler):
     """
@@ -37,12 +42,30 @@ class RUAMEL_Handler(XSOAR_Handler):
 
     @property
     def yaml(self) -> YAML:
-        """Creating an instance of ruamel for each command. Best practice by ruamel"""
-        yaml = YAML(typ=self._typ)
-        yaml.allow_duplicate_keys = self._allow_duplicate_keys
-        yaml.preserve_quotes = self._preserve_quotes
-        yaml.width = self._width
-        yaml.allow_unicode = self._allow_unicode
+        return self._get_yaml()
+
+    def _get_yaml(self, indent: int = 0) -> YAML:
+        """
+        Returns the ruamel instance of this configuration (and sequence indent).
+        Creating and configuring an instance is costly compared to loading a small file, so the instances are reused.
+        A ruamel instance is not thread safe, so each thread has its own instances.
+        """
+        key = (
+            self._typ,
+            self._allow_duplicate_keys,
+            self._preserve_quotes,
+            self._width,
+            self._allow_unicode,
+            indent,
+        )
+        instances = _yaml_instances.__dict__.setdefault("instances", {})
+        if (yaml := instances.get(key)) is None:
+            yaml = YAML(typ=self._typ)
+            yaml.allow_duplicate_keys = self._allow_duplicate_keys
+            yaml.preserve_quotes = self._preserve_quotes
+            yaml.width = self._width
+            yaml.allow_unicode = self._allow_unicode
+            instances[key] = yaml
         return yaml
 
     def load(self, stream):
@@ -51,8 +74,8 @@ class RUAMEL_Handler(XSOAR_Handler):
     def dump(self, data, stream, indent=None, sort_keys=False, **kwargs):
         if sort_keys:
             data = order_dict(data)
-        yaml = self.yaml
         indent = indent if indent is not None else self.indent
+        yaml = self._get_yaml(indent or 0)
         if indent:
             yaml.indent(sequence=indent)
         yaml.dump(data, stream)
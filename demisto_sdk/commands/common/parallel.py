@@ -0,0 +1,75 @@
+import itertools
+import multiprocessing
+from math import ceil
+from multiprocessing.pool import Pool
+from typing import Any, Callable, Dict, List, Sequence, Tuple, TypeVar
+
+from demisto_sdk.commands.common.cpu_count import cpu_count
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Every worker gets a few chunks of items, so the work is balanced while the pickling overhead is amortized
+CHUNKS_PER_WORKER = 4
+
+# The function and items of every running `parallel_map` call, which the worker processes inherit when they are forked
+_maps: Dict[int, Tuple[Callable[[Any], Any], Sequence[Any]]] = {}
+_map_ids = itertools.count()
+
+
+def get_fork_workers(items_count: int, threshold: int) -> int:
+    """Returns the number of worker processes to fork for processing items, or 0 if they should be processed
+    in this process: when there are less items than the threshold, when there is a single CPU,
+    or when processes can not be forked on this platform.
+
+    Args:
+        items_count (int): The number of items to process.
+        threshold (int): The minimal number of items to fork worker processes for.
+
+    Returns:
+        int: The number of worker processes.
+    """
+    if items_count < threshold or "fork" not in multiprocessing.get_all_start_methods():
+        return 0
+    workers = cpu_count()
+    return workers if workers > 1 else 0
+
+
+def fork_pool(workers: int) -> Pool:
+    """Returns a pool of forked worker processes, which inherit the state of this process."""
+    return multiprocessing.get_context("fork").Pool(processes=workers)
+
+
+def _call_in_worker(map_id: int, index: int) -> Any:
+    func, items = _maps[map_id]
+    return func(items[index])
+
+
+def parallel_map(func: Callable[[T], R], items: Sequence[T], threshold: int) -> List[R]:
+    """Applies a function to every item, in forked worker processes when there are enough items (see `get_fork_workers`).
+
+    The workers inherit the function and the items, so only the results are pickled.
+    The function does not have to be picklable, e.g., it may be a lambda.
+
+    Args:
+        func (Callable[[T], R]): The function to apply.
+        items (Sequence[T]): The items.
+        threshold (int): The minimal number of items to fork worker processes for.
+
+    Returns:
+        List[R]: The results, in the order of the items.
+    """
+    workers = get_fork_workers(len(items), threshold)
+    if not workers:
+        return [func(item) for item in items]
+    map_id = next(_map_ids)
+    _maps[map_id] = (func, items)
+    try:
+        with fork_pool(workers) as pool:
+            return pool.starmap(
+                _call_in_worker,
+                ((map_id, index) for index in range(len(items))),
+                chunksize=ceil(len(items) / (workers * CHUNKS_PER_WORKER)),
+            )
+    finally:
+        del _maps[map_id]
@@ -0,0 +1,183 @@
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, Set, Tuple
+
+from demisto_sdk.commands.common.constants import DEMISTO_SDK_FILE_CACHE_SIZE
+from demisto_sdk.commands.common.logger import logger
+
+DEFAULT_FILE_CACHE_SIZE_MB = 512
+
+# The approximate memory of a parsed value, besides the strings it holds
+_OBJECT_OVERHEAD = 64
+_CONTAINER_ITEM_OVERHEAD = 8
+
+
+class ParsedFileCacheStats(NamedTuple):
+    entries: int
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    invalidations: int
+
+
+def estimate_size(value: Any) -> int:
+    """Returns the approximate memory in bytes of a parsed file (dicts, lists and scalars)."""
+    size = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        size += _OBJECT_OVERHEAD
+        if isinstance(item, (str, bytes)):
+            size += len(item)
+        elif isinstance(item, dict):
+            size += _CONTAINER_ITEM_OVERHEAD * len(item)
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set)):
+            size += _CONTAINER_ITEM_OVERHEAD * len(item)
+            stack.extend(item)
+    return size
+
+
+class ParsedFileCache:
+    """An in-memory cache of parsed files, shared by `tools.get_file` and the `File` readers.
+
+    Local files are keyed by their path, modification time, size and inode (besides the arguments they were parsed with),
+    so a file which changed on disk is parsed again, and writing a file through `write_dict` or `File.write`
+    invalidates all its entries. Files of git commits/branches are keyed by the arguments they were read with.
+
+    The cache is bounded by the approximate memory of the parsed files, and the least recently used entries are evicted
+    first. The memory budget in MB can be configured by the DEMISTO_SDK_FILE_CACHE_SIZE environment variable.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        self.max_size = max_size if max_size is not None else self._get_max_size()
+        # the parsed files, their approximate memory and the path of the local files
+        self._entries: OrderedDict[Hashable, Tuple[Any, int, Optional[Path]]] = (
+            OrderedDict()
+        )
+        # the keys of the local files entries, by the file path
+        self._keys_by_path: Dict[Path, Set[Hashable]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _get_max_size() -> int:
+        if env_var := os.getenv(DEMISTO_SDK_FILE_CACHE_SIZE):
+            try:
+                return int(env_var) * 1024 * 1024
+            except (TypeError, ValueError):
+                logger.warning(
+                    f"non-integer file cache size value ({env_var}). Defaulting to {DEFAULT_FILE_CACHE_SIZE_MB}MB."
+                )
+        return DEFAULT_FILE_CACHE_SIZE_MB * 1024 * 1024
+
+    def get_local(
+        self, path: Path, arguments: Hashable, load: Callable[[], Any]
+    ) -> Any:
+        """Returns a parsed local file, parsing it if it is not cached or changed since it was cached.
+
+        Args:
+            path: The path of the file.
+            arguments: The arguments the file is parsed with.
+            load: Parses the file.
+        """
+        path = Path(os.path.abspath(path))
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # the loader reports the missing file
+            return load()
+        key = (path, arguments, stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        return self._get(key, load, path)
+
+    def get(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """Returns a parsed file which is not a local file, loading it if it is not cached.
+
+        Args:
+            key: The key of the file, the arguments it is read with.
+            load: Reads and parses the file.
+        """
+        return self._get(key, load)
+
+    def _get(
+        self, key: Hashable, load: Callable[[], Any], path: Optional[Path] = None
+    ) -> Any:
+        with self._lock:
+            if (entry := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        # loaded outside the lock, as parsing a file can take a while
+        value = load()
+        size = estimate_size(value)
+        if size > self.max_size:
+            return value
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, path)
+            self._size += size
+            if path is not None:
+                self._keys_by_path.setdefault(path, set()).add(key)
+            while self._size > self.max_size:
+                self._remove(next(iter(self._entries)))
+        return value
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, path = self._entries.pop(key)
+        self._size -= size
+        if path is not None and (keys := self._keys_by_path.get(path)):
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_path[path]
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def invalidate(self, path: Path) -> int:
+        """Removes all the entries of a local file, called when the file is written.
+
+        Args:
+            path: The path of the file.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        path = Path(os.path.abspath(path))
+        with self._lock:
+            keys = list(self._keys_by_path.get(path, ()))
+            for key in keys:
+                self._remove(key)
+            if keys:
+                self.invalidations += 1
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_path.clear()
+            self._size = 0
+
+    def stats(self) -> ParsedFileCacheStats:
+        with self._lock:
+            return ParsedFileCacheStats(
+                entries=len(self._entries),
+                size=self._size,
+                max_size=self.max_size,
+                hits=self.hits,
+                misses=self.misses,
+                invalidations=self.invalidations,
+            )
+
+
+parsed_file_cache = ParsedFileCache()
@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import pytest
+
+from demisto_sdk.commands.common.frozen_document import (
+    FrozenDict,
+    FrozenList,
+    freeze,
+    thaw,
+)
+from demisto_sdk.commands.common.tools import get_file
+
+
+def test_frozen_views():
+    """
+    Given:
+        - A parsed dict with a nested dict and list.
+    When:
+        - Freezing it, reading it through the view and trying to change it.
+        - Thawing the view and changing the copy.
+    Then:
+        - Make sure the nested values are read-only views as well, equal to the parsed values.
+        - Make sure the view cannot be changed, and changing the thawed copy does not change the parsed dict.
+    """
+    data = {"name": "test", "script": {"commands": [{"name": "command"}]}}
+    frozen = freeze(data)
+
+    assert isinstance(frozen, FrozenDict)
+    assert isinstance(frozen["script"]["commands"], FrozenList)
+    assert frozen == data
+    assert frozen["script"]["commands"][0].get("name") == "command"
+    assert [command["name"] for command in frozen["script"]["commands"]] == ["command"]
+    with pytest.raises(TypeError):
+        frozen["name"] = "changed"  # type: ignore[index]
+    with pytest.raises(AttributeError):
+        frozen["script"]["commands"].append({})
+
+    thawed = thaw(frozen)
+    thawed["script"]["commands"].append({"name": "another"})
+    assert len(data["script"]["commands"]) == 1
+    assert frozen != thawed
+
+
+def test_get_file_read_only(tmp_path: Path):
+    """
+    Given:
+        - A json file.
+    When:
+        - Reading it twice with read_only.
+    Then:
+        - Make sure both reads are views of the same cached dict, rather than copies of it.
+    """
+    path = tmp_path / "file.json"
+    path.write_text('{"a": {"b": [1, 2]}}')
+
+    first = get_file(path, read_only=True)
+    second = get_file(path, read_only=True)
+
+    assert first == {"a": {"b": [1, 2]}}
+    assert first._data is second._data is get_file(path)
@@ -1,7 +1,8 @@
 import stat
 from pathlib import Path
 
-from git import Blob
+import pytest
+from git import Blob, Git
 
 from TestSuite.repo import Repo
 
@@ -144,3 +145,165 @@ def test_git_util_with_repo():
     git_util = GitUtil(repo)
     assert git_util.repo is not None
     assert git_util.repo.working_dir == repo.working_dir
+
+
+def test_read_files_content_batch(mocker, git_repo: Repo):
+    """
+    Given
+        - A git repo with a committed file and a directory, in the origin/master branch.
+
+    When
+        - Reading the file, the directory and a file which does not exist in a single batch.
+        - Prefetching the file and getting its content.
+
+    Then
+        - Ensure only the content of the existing file is returned, as is.
+        - Ensure the prefetched content is returned without calling git, the same as git show returns it.
+    """
+    from demisto_sdk.commands.common.git_util import GitUtil
+
+    git_repo.make_dir("NewDir")
+    git_repo.make_file("NewDir/file name.txt", "lorem ipsum\n")
+    git_repo.git_util.commit_files("added a file")
+    git_repo.git_util.repo.git.update_ref("refs/remotes/origin/master", "HEAD")
+    file_path = "origin/master:NewDir/file name.txt"
+
+    assert git_repo.git_util.read_files_content_batch(
+        [file_path, "origin/master:NewDir", "origin/master:missing.txt"]
+    ) == {file_path: b"lorem ipsum\n"}
+
+    expected_content = git_repo.git_util.get_local_remote_file_content(file_path)
+    git_repo.git_util.prefetch_local_remote_files([file_path])
+    try:
+        show = mocker.patch.object(Git, "show", create=True)
+        assert (
+            git_repo.git_util.get_local_remote_file_content(file_path)
+            == expected_content
+        )
+        show.assert_not_called()
+    finally:
+        GitUtil.clear_prefetched_files()
+
+
+def test_blob_reader(mocker, git_repo: Repo):
+    """
+    Given
+        - A git repo with two commits, each with a different version of a file.
+
+    When
+        - Checking whether the file exists and reading it from both commits, twice.
+        - Reading many files with a blob reader whose cache fits a single file.
+
+    Then
+        - Ensure every version is read from its commit, and a missing file is not found.
+        - Ensure the second time is served from the cache, without a git process.
+        - Ensure the least recently used files are evicted from the bounded cache.
+    """
+    from demisto_sdk.commands.common.git_util import (
+        GitBlobReader,
+        GitFileNotFoundError,
+        GitUtil,
+    )
+
+    git_util = git_repo.git_util
+    git_repo.make_file("file.txt", "first\n")
+    git_util.commit_files("first")
+    first_commit = git_util.get_current_commit_hash()
+    git_repo.make_file("file.txt", "second\n")
+    git_util.commit_files("second")
+    second_commit = git_util.get_current_commit_hash()
+
+    file_path = Path(git_repo.path) / "file.txt"
+    missing_file_path = Path(git_repo.path) / "missing.txt"
+    GitUtil.close_blob_readers()
+    try:
+        for _ in range(2):
+            for commit, content in (
+                (first_commit, b"first\n"),
+                (second_commit, b"second\n"),
+            ):
+                assert git_util.is_file_exist_in_commit_or_branch(
+                    file_path, commit, from_remote=False
+                )
+                assert (
+                    git_util.read_file_content(file_path, commit, from_remote=False)
+                    == content
+                )
+            assert not git_util.is_file_exist_in_commit_or_branch(
+                missing_file_path, first_commit, from_remote=False
+            )
+            with pytest.raises(GitFileNotFoundError):
+                git_util.read_file_content(
+                    missing_file_path, first_commit, from_remote=False
+                )
+            get_process = mocker.patch.object(GitBlobReader, "_get_process")
+        get_process.assert_not_called()
+        mocker.stopall()
+
+        reader = GitBlobReader(git_util.repo.working_dir, max_cache_size=250)
+        try:
+            objects = reader.read_many(
+                [(first_commit, "file.txt"), (second_commit, "file.txt")]
+            )
+            assert objects[(first_commit, "file.txt")].content == b"first\n"
+            assert objects[(second_commit, "file.txt")] == ("blob", b"second\n")
+            assert list(reader._cache) == [(second_commit, "file.txt")]
+        finally:
+            reader.close()
+    finally:
+        GitUtil.close_blob_readers()
+
+
+def test_change_set(mocker, git_repo: Repo):
+    """
+    Given
+        - A git repo with a base commit, and a commit and staged changes on top of it
+          which modify, add, delete and rename files.
+
+    When
+        - Getting the modified, added, deleted and renamed files against the base commit, twice.
+
+    Then
+        - Ensure every file is classified by its status against the base commit.
+        - Ensure the second time is served from the change set, without calling git diff.
+    """
+    from demisto_sdk.commands.common.git_util import GitUtil
+
+    for name in ("modified", "deleted", "renamed", "staged_modified", "staged_deleted"):
+        git_repo.make_file(f"{name}.txt", f"{name}\n")
+    git_util = git_repo.git_util
+    git_util.commit_files("base")
+    base_commit = git_util.get_current_commit_hash()
+
+    git_repo.make_file("modified.txt", "changed\n")
+    git_repo.make_file("added.txt", "added\n")
+    git_util.repo.git.rm("deleted.txt")
+    git_util.repo.git.mv("renamed.txt", "new_name.txt")
+    git_util.commit_files("changes")
+    git_repo.make_file("staged_modified.txt", "changed\n")
+    git_repo.make_file("staged_added.txt", "added\n")
+    git_util.repo.git.rm("staged_deleted.txt")
+    git_util.repo.git.add("staged_modified.txt", "staged_added.txt")
+
+    GitUtil.clear_change_sets()
+    try:
+        for _ in range(2):
+            assert git_util.modified_files(prev_ver=base_commit) == {
+                Path("modified.txt"),
+                Path("staged_modified.txt"),
+            }
+            assert git_util.added_files(prev_ver=base_commit) == {
+                Path("added.txt"),
+                Path("staged_added.txt"),
+            }
+            assert git_util.deleted_files(prev_ver=base_commit) == {
+                Path("deleted.txt"),
+                Path("staged_deleted.txt"),
+            }
+            assert git_util.renamed_files(prev_ver=base_commit) == {
+                (Path("renamed.txt"), Path("new_name.txt"))
+            }
+            diff = mocker.patch.object(Git, "diff", create=True)
+        diff.assert_not_called()
+    finally:
+        GitUtil.clear_change_sets()
@@ -0,0 +1,39 @@
+import os
+
+import pytest
+
+from demisto_sdk.commands.common import parallel
+from demisto_sdk.commands.common.parallel import get_fork_workers, parallel_map
+
+
+@pytest.mark.parametrize(
+    "items_count, cpus, expected_workers",
+    [
+        (10, 4, 4),
+        (9, 4, 0),
+        (10, 1, 0),
+    ],
+)
+def test_get_fork_workers(mocker, items_count: int, cpus: int, expected_workers: int):
+    mocker.patch.object(parallel, "cpu_count", return_value=cpus)
+    assert get_fork_workers(items_count, threshold=10) == expected_workers
+
+
+@pytest.mark.parametrize("threshold", [1, 100])
+def test_parallel_map(mocker, threshold: int):
+    """
+    Given:
+        - A function which is not picklable, and items.
+    When:
+        - Mapping the items in worker processes, and in this process.
+    Then:
+        - Make sure the results are in the order of the items, and the workers are forked only from the threshold.
+    """
+    mocker.patch.object(parallel, "cpu_count", return_value=2)
+    items = list(range(10))
+
+    results = parallel_map(lambda item: (item * 2, os.getpid()), items, threshold)
+
+    assert [result for result, _ in results] == [item * 2 for item in items]
+    assert (os.getpid() not in {pid for _, pid in results}) == (threshold == 1)
+    assert not parallel._maps
@@ -0,0 +1,74 @@
+import os
+from pathlib import Path
+
+from demisto_sdk.commands.common.files import JsonFile
+from demisto_sdk.commands.common.parsed_file_cache import (
+    ParsedFileCache,
+    estimate_size,
+    parsed_file_cache,
+)
+from demisto_sdk.commands.common.tools import get_file, write_dict
+
+
+def test_get_file_is_cached_until_written(tmp_path: Path):
+    """
+    Given:
+        - A json file.
+    When:
+        - Reading it twice with get_file and once with JsonFile.
+        - Writing it with write_dict and reading it again.
+        - Changing it on disk without going through the SDK and reading it again.
+    Then:
+        - Make sure the second get_file read is served from the cache.
+        - Make sure writing the file invalidates its entries, and the new content is read.
+        - Make sure a file which changed on disk is parsed again.
+    """
+    path = tmp_path / "file.json"
+    path.write_text('{"a": 1}')
+    initial_stats = parsed_file_cache.stats()
+
+    assert get_file(path) == {"a": 1}
+    assert get_file(str(path)) == {"a": 1}
+    assert JsonFile.read_from_local_path(path) == {"a": 1}
+    stats = parsed_file_cache.stats()
+    assert stats.hits - initial_stats.hits == 1
+    assert stats.misses - initial_stats.misses == 2
+    assert stats.entries == 2
+
+    write_dict(path, {"a": 2})
+    assert parsed_file_cache.stats().entries == 0
+    assert get_file(path) == JsonFile.read_from_local_path(path) == {"a": 2}
+
+    path.write_text('{"a": 30}')
+    assert get_file(path) == {"a": 30}
+    assert parsed_file_cache.stats().invalidations - initial_stats.invalidations == 1
+
+
+def test_evict_least_recently_used(tmp_path: Path):
+    """
+    Given:
+        - A parsed file cache with a memory budget which fits two of three files.
+    When:
+        - Loading the three files, after using the first one again.
+    Then:
+        - Make sure only the least recently used file is evicted.
+    """
+    paths = []
+    for name in ("first", "second", "third"):
+        path = tmp_path / name
+        path.write_text(name)
+        paths.append(path)
+    cache = ParsedFileCache(max_size=2 * estimate_size({"name": "second"}))
+
+    def load(path: Path):
+        return {"name": path.read_text()}
+
+    cache.get_local(paths[0], "load", lambda: load(paths[0]))
+    cache.get_local(paths[1], "load", lambda: load(paths[1]))
+    cache.get_local(paths[0], "load", lambda: load(paths[0]))
+    cache.get_local(paths[2], "load", lambda: load(paths[2]))
+
+    assert cache.stats().entries == 2
+    assert cache.invalidate(Path(os.path.relpath(paths[0]))) == 1
+    assert cache.invalidate(paths[1]) == 0
+    assert cache.invalidate(paths[2]) == 1
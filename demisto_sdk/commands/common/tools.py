@@ -131,16 +131,20 @@ from demisto_sdk.commands.common.constants import (
     urljoin,
 )
 from demisto_sdk.commands.common.cpu_count import cpu_count
+from demisto_sdk.commands.common.frozen_document import freeze
 from demisto_sdk.commands.common.git_content_config import GitContentConfig, GitProvider
 from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON5_HANDLER as json5
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.handlers import DEFAULT_YAML_HANDLER as yaml
+from demisto_sdk.commands.common.handlers import (
+    DEFAULT_YAML_SAFE_HANDLER as yaml_safe_load,
+)
 from demisto_sdk.commands.common.handlers import (
     XSOAR_Handler,
-    YAML_Handler,
 )
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.parsed_file_cache import parsed_file_cache
 from demisto_sdk.commands.common.string_to_bool import (
     # all files, except for the logger setup, import from tools, so we import it here (makes more sense than having all other files import from string_to_bool.py)
     # See the comment in string_to_bool's implementation
@@ -151,10 +155,11 @@ DEMISTO_SDK_REPO = "demisto/demisto-sdk"
 if TYPE_CHECKING:
     from demisto_sdk.commands.content_graph.interface import ContentGraphInterface
 
-yaml_safe_load = YAML_Handler(typ="safe")
-
 urllib3.disable_warnings()
 
+# a `simple: =` value is loaded as the yaml 'value' tag, which is quoted before loading
+SIMPLE_EQUALS_VALUE_REGEX = re.compile(r"(simple: \s*\n*)(=)(\s*\n)")
+
 GRAPH_SUPPORTED_FILE_TYPES = ["yml", "json"]
 
 
@@ -633,6 +638,41 @@ def get_remote_file(
     )
 
 
+def prefetch_remote_files(
+    file_paths: Iterable[Union[str, Path]], tag: str = DEMISTO_GIT_PRIMARY_BRANCH
+) -> None:
+    """
+    Reads the given files of a branch/commit from the local repository in a single git call,
+    so getting them later with `get_remote_file` (or `get_file` with a git sha) does not call git for each of them.
+
+    Args:
+        file_paths: The paths of the files, absolute or relative to the content path.
+        tag: The branch name or commit sha.
+    """
+    if is_sdk_defined_working_offline():
+        return
+    if not tag:
+        tag = DEMISTO_GIT_PRIMARY_BRANCH
+    tag = tag.replace(f"{DEMISTO_GIT_UPSTREAM}/", "").replace("demisto/", "")
+    content_path = get_content_path()
+    try:
+        repo_git_util = GitUtil()
+        git_file_paths = []
+        for file_path in map(Path, file_paths):
+            if file_path.is_absolute():
+                if not file_path.is_relative_to(content_path):
+                    continue
+                file_path = file_path.relative_to(content_path)
+            git_file_paths.append(
+                repo_git_util.get_local_remote_file_path(str(file_path), tag)
+            )
+        repo_git_util.prefetch_local_remote_files(git_file_paths)
+    except Exception as e:
+        logger.debug(
+            f"Could not prefetch the files of {tag}, they will be read when needed: {e}"
+        )
+
+
 def filter_files_on_pack(pack: str, file_paths_list="") -> set:
     """
     filter_files_changes_on_pack.
@@ -853,7 +893,6 @@ def safe_write_unicode(
         _write()  # recreates the file
 
 
-@lru_cache
 def get_file(
     file_path: str | Path,
     clear_cache: bool = False,
@@ -861,27 +900,57 @@ def get_file(
     keep_order: bool = False,
     raise_on_error: bool = False,
     git_sha: Optional[str] = None,
+    read_only: bool = False,
 ):
     """
     Get file contents.
     if raise_on_error = False, this function will return empty dict
+    The parsed files are kept in the shared parsed file cache, clear_cache parses the file again.
+    With read_only, a read-only view of the cached file is returned, without copying it,
+    use `thaw` on it to get a mutable copy.
     """
-    if clear_cache:
-        get_file.cache_clear()
     file_path = Path(file_path)  # type: ignore[arg-type]
+    if read_only:
+        return freeze(
+            get_file(
+                file_path,
+                clear_cache=clear_cache,
+                return_content=return_content,
+                keep_order=keep_order,
+                raise_on_error=raise_on_error,
+                git_sha=git_sha,
+            )
+        )
     if git_sha:
         if file_path.is_absolute():
             file_path = file_path.relative_to(get_content_path())
-        return get_remote_file(
-            str(file_path), tag=git_sha, return_content=return_content
+        key = ("get_file", str(file_path), git_sha, return_content)
+        if clear_cache:
+            parsed_file_cache.discard(key)
+        return parsed_file_cache.get(
+            key,
+            lambda: get_remote_file(
+                str(file_path), tag=git_sha, return_content=return_content
+            ),
         )
 
-    type_of_file = file_path.suffix.lower()
-
     if not file_path.exists():
         file_path = Path(get_content_path()) / file_path  # type: ignore[arg-type]
     if not file_path.exists():
         raise FileNotFoundError(file_path)
+    if clear_cache:
+        parsed_file_cache.invalidate(file_path)
+    return parsed_file_cache.get_local(
+        file_path,
+        ("get_file", return_content, keep_order, raise_on_error),
+        lambda: _parse_file(file_path, return_content, keep_order, raise_on_error),
+    )
+
+
+def _parse_file(
+    file_path: Path, return_content: bool, keep_order: bool, raise_on_error: bool
+):
+    type_of_file = file_path.suffix.lower()
     try:
         file_content = safe_read_unicode(file_path.read_bytes())
         if return_content:
@@ -892,9 +961,9 @@ def get_file(
         return {}
     try:
         if type_of_file.lstrip(".") in {"yml", "yaml"}:
-            replaced = StringIO(
-                re.sub(r"(simple: \s*\n*)(=)(\s*\n)", r'\1"\2"\3', file_content)
-            )
+            if "simple:" in file_content:
+                file_content = SIMPLE_EQUALS_VALUE_REGEX.sub(r'\1"\2"\3', file_content)
+            replaced = StringIO(file_content)
             return yaml.load(replaced) if keep_order else yaml_safe_load.load(replaced)
         elif type_of_file.lstrip(".") in {"svg"}:
             return ET.fromstring(file_content)
@@ -946,18 +1015,26 @@ def get_yaml(
     cache_clear=False,
     keep_order: bool = False,
     git_sha: Optional[str] = None,
+    read_only: bool = False,
 ):
-    if cache_clear:
-        get_file.cache_clear()
     return get_file(
-        file_path, clear_cache=cache_clear, keep_order=keep_order, git_sha=git_sha
+        file_path,
+        clear_cache=cache_clear,
+        keep_order=keep_order,
+        git_sha=git_sha,
+        read_only=read_only,
     )
 
 
-def get_json(file_path: str | Path, cache_clear=False, git_sha: Optional[str] = None):
-    if cache_clear:
-        get_file.cache_clear()
-    return get_file(file_path, clear_cache=cache_clear, git_sha=git_sha)
+def get_json(
+    file_path: str | Path,
+    cache_clear=False,
+    git_sha: Optional[str] = None,
+    read_only: bool = False,
+):
+    return get_file(
+        file_path, clear_cache=cache_clear, git_sha=git_sha, read_only=read_only
+    )
 
 
 def get_script_or_integration_id(file_path):
@@ -1596,6 +1673,7 @@ def get_dict_from_file(
     clear_cache: bool = False,
     keep_order: bool = True,
     git_sha: Optional[str] = None,
+    read_only: bool = False,
 ) -> Tuple[Dict, Union[str, None]]:
     """
     Get a dict representing the file
@@ -1603,6 +1681,7 @@ def get_dict_from_file(
     Arguments:
         path - a path to the file
         raises_error - Whether to raise a FileNotFound error if `path` is not a valid file.
+        read_only - Whether to return a read-only view of the cached file, see `get_file`.
 
     Returns:
         dict representation of the file or of the first item if the file contents are a list with a single dictionary,
@@ -1617,15 +1696,15 @@ def get_dict_from_file(
                         cache_clear=clear_cache,
                         keep_order=keep_order,
                         git_sha=git_sha,
+                        read_only=read_only,
                     ),
                     "yml",
                 )
             elif path.endswith(".json"):
                 res = get_json(path, cache_clear=clear_cache, git_sha=git_sha)
                 if isinstance(res, list) and len(res) == 1 and isinstance(res[0], dict):
-                    return res[0], "json"
-                else:
-                    return res, "json"
+                    res = res[0]
+                return (freeze(res) if read_only else res), "json"
             elif path.endswith(".py"):
                 return {}, "py"
             elif path.endswith(".xif"):
@@ -2939,6 +3018,7 @@ def write_dict(
         lambda f: handler.dump(data, f, indent, sort_keys, **kwargs),  # type: ignore[union-attr]
         path,
     )
+    parsed_file_cache.invalidate(path)
 
 
 def to_kebab_case(s: str):
@@ -0,0 +1,83 @@
+"""A micro-benchmark of merging content item relationships into the graph relationships.
+
+Compares merging with a validation of every merged relationship (the behavior before the trusted
+`Relationships.update` path) against the trusted path, on the relationships of a parsed repository.
+
+Usage:
+    python demisto_sdk/commands/content_graph/benchmarks/relationships_benchmark.py [--content-path PATH] [--rounds N]
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
+from demisto_sdk.commands.content_graph.common import Relationships
+from demisto_sdk.commands.content_graph.parsers.repository import RepositoryParser
+
+
+def merge_with_validation(items_relationships: List[Relationships]) -> Relationships:
+    result = Relationships()
+    for relationships in items_relationships:
+        for relationship, data in relationships.items():
+            result.add_batch(relationship, data, validate=True)
+    return result
+
+
+def merge_trusted(items_relationships: List[Relationships]) -> Relationships:
+    result = Relationships()
+    for relationships in items_relationships:
+        result.update(relationships)
+    return result
+
+
+def measure(
+    func: Callable[[List[Relationships]], Relationships],
+    items_relationships: List[Relationships],
+    rounds: int,
+) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func(items_relationships)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--content-path", type=Path, default=CONTENT_PATH)
+    arg_parser.add_argument("--rounds", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    repository_parser = RepositoryParser(args.content_path)
+    repository_parser.parse()
+    items_relationships = [
+        content_item.relationships
+        for pack in repository_parser.packs
+        for content_items in pack.content_items.iter_lists()
+        for content_item in content_items
+    ]
+    count = sum(
+        len(data)
+        for relationships in items_relationships
+        for data in relationships.values()
+    )
+    assert merge_with_validation(items_relationships) == merge_trusted(
+        items_relationships
+    )
+
+    validated = measure(merge_with_validation, items_relationships, args.rounds)
+    trusted = measure(merge_trusted, items_relationships, args.rounds)
+    print(  # noqa: T201
+        f"Merged {count} relationships of {len(items_relationships)} content items "
+        f"(best of {args.rounds} rounds)\n"
+        f"with validation: {validated:.4f}s\n"
+        f"trusted:         {trusted:.4f}s\n"
+        f"speedup:         x{validated / trusted:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
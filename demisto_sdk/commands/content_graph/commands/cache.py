@@ -0,0 +1,36 @@
+import typer
+
+from demisto_sdk.commands.content_graph.parser_cache import ParserCache
+
+cache_cmd_group = typer.Typer(
+    name="cache",
+    no_args_is_help=True,
+    context_settings={"help_option_names": ["-h", "--help"]},
+    help="Manage the local content parser cache.",
+)
+
+
+def _to_mb(size: int) -> str:
+    return f"{size / (1024 * 1024):.2f}MB"
+
+
+@cache_cmd_group.command("stats")
+def stats() -> None:
+    """
+    Shows the location, number of entries and size of the local content parser cache.
+    """
+    cache_stats = ParserCache().stats()
+    typer.echo(f"Path: {cache_stats.path}")
+    typer.echo(f"Entries: {cache_stats.entries}")
+    typer.echo(
+        f"Size: {_to_mb(cache_stats.size)} (max: {_to_mb(cache_stats.max_size)})"
+    )
+
+
+@cache_cmd_group.command("clear")
+def clear() -> None:
+    """
+    Removes all the entries of the local content parser cache.
+    """
+    removed = ParserCache().clear()
+    typer.echo(f"Removed {removed} entries from the parser cache.")
@@ -350,26 +350,46 @@ class Relationship(BaseModel):
 
 
 class Relationships(dict):
+    """A collection of relationships data by their type.
+
+    Every relationship is validated once, when it is added by `add` or `add_batch`.
+    Merging another `Relationships` object with `update` is a trusted path, which only extends the lists
+    with the already validated items, without validating or copying them again.
+    """
+
     def add(self, relationship: RelationshipType, **kwargs):
-        if relationship not in self.keys():
-            self.__setitem__(relationship, [])
-        self.__getitem__(relationship).append(
+        self.setdefault(relationship, []).append(
             Relationship.parse_obj(kwargs).dict(exclude_none=True)
         )
 
-    def add_batch(self, relationship: RelationshipType, data: List[Dict[str, Any]]):
-        if relationship not in self.keys():
-            self.__setitem__(relationship, [])
-        data = [Relationship.parse_obj(item).dict(exclude_none=True) for item in data]
-        self.__getitem__(relationship).extend(data)
+    def add_batch(
+        self,
+        relationship: RelationshipType,
+        data: List[Dict[str, Any]],
+        validate: bool = True,
+    ):
+        """Adds a batch of relationships data of a single type.
+
+        Args:
+            relationship (RelationshipType): The relationship type.
+            data (List[Dict[str, Any]]): The relationships data.
+            validate (bool): Whether to validate the data. Set to False only for data which was already validated.
+        """
+        if validate:
+            data = [
+                Relationship.parse_obj(item).dict(exclude_none=True) for item in data
+            ]
+        self.setdefault(relationship, []).extend(data)
 
     def update(self, other: "Relationships") -> None:  # type: ignore
+        # the data of another Relationships object was validated when it was added
+        validate = not isinstance(other, Relationships)
         for relationship, parsed_data in other.items():
             if relationship not in RelationshipType or not isinstance(
                 parsed_data, list
             ):
                 raise TypeError
-            self.add_batch(relationship, parsed_data)
+            self.add_batch(relationship, parsed_data, validate=validate)
 
 
 class Nodes(dict):
@@ -1,27 +1,50 @@
-import gc
-from typing import Optional, Tuple
+import pickle
+import tempfile
+from pathlib import Path
+from typing import IO, Iterator, List, Optional, Tuple
 
-from demisto_sdk.commands.content_graph.common import Nodes, Relationships
+from demisto_sdk.commands.common.constants import PACKS_FOLDER
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.content_graph.common import ContentType, Nodes, Relationships
 from demisto_sdk.commands.content_graph.interface.graph import ContentGraphInterface
+from demisto_sdk.commands.content_graph.objects.base_content import (
+    CONTENT_TYPE_TO_MODEL,
+)
+from demisto_sdk.commands.content_graph.objects.pack import Pack
 from demisto_sdk.commands.content_graph.objects.repository import (
     ContentDTO,
 )
+from demisto_sdk.commands.content_graph.parse_manifest import (
+    ContentItemEntry,
+    GraphDiff,
+    PackDiff,
+    ParseManifest,
+    build_pack_entries,
+    content_item_entry,
+    hash_path,
+    manifest_key,
+)
+from demisto_sdk.commands.content_graph.parsers.content_item import (
+    ContentItemParser,
+    NotAContentItemException,
+)
+from demisto_sdk.commands.content_graph.parsers.pack import PackParser
+from demisto_sdk.commands.content_graph.parsers.repository import RepositoryParser
 
 PACKS_PER_BATCH = 600
 
 
 class ContentGraphBuilder:
     def __init__(self, content_graph: ContentGraphInterface) -> None:
-        """Given a graph DB interface:
-        1. Creates a repository model
-        2. Collects all nodes and relationships from the model
+        """Given a graph DB interface, creates the graph by streaming batches of packs:
+        1. Creates a repository model of the batch
+        2. Collects the nodes and relationships of the batch from the model
+        3. Writes the nodes of the batch, and spools its relationships until all nodes are written
 
         Args:
             content_graph (ContentGraphInterface): The interface to create the graph with.
         """
         self.content_graph = content_graph
-        self.nodes: Nodes = Nodes()
-        self.relationships: Relationships = Relationships()
 
     def update_graph(
         self,
@@ -34,43 +57,245 @@ class ContentGraphBuilder:
         """
         if not packs_to_update:
             return
-        self._parse_and_model_content(packs_to_update)
-        self._create_or_update_graph()
+        packs_to_parse = self._update_packs_incrementally(packs_to_update)
+        if not packs_to_parse:
+            return
+        self._create_or_update_graph(packs_to_parse)
 
     def init_database(self) -> None:
         self.content_graph.clean_graph()
         self.content_graph.create_indexes_and_constraints()
 
-    def _parse_and_model_content(
+    def _get_pack_batches(
         self, packs_to_parse: Optional[Tuple[str, ...]] = None
-    ) -> None:
-        content_dto: ContentDTO = self._create_content_dto(packs_to_parse)
-        self._collect_nodes_and_relationships_from_model(content_dto)
+    ) -> List[Optional[Tuple[str, ...]]]:
+        """Splits the packs to parse into batches of `PACKS_PER_BATCH` packs.
+
+        Args:
+            packs_to_parse (Optional[Tuple[str, ...]]): The packs to parse. If not provided, parses all packs.
+
+        Returns:
+            List[Optional[Tuple[str, ...]]]: The batches. A repository which fits in a single batch is returned as is.
+        """
+        pack_ids = packs_to_parse or tuple(
+            pack_path.name
+            for pack_path in RepositoryParser(
+                Path(self.content_graph.repo_path)
+            ).iter_packs()
+        )
+        if len(pack_ids) <= PACKS_PER_BATCH:
+            return [packs_to_parse]
+        return [
+            pack_ids[i : i + PACKS_PER_BATCH]
+            for i in range(0, len(pack_ids), PACKS_PER_BATCH)
+        ]
+
+    def _create_content_dtos(
+        self, packs_to_parse: Optional[Tuple[str, ...]] = None
+    ) -> Iterator[ContentDTO]:
+        """Lazily parses the repository in batches, and yields a repository model per batch.
+        The next batch is parsed only once the previous one was consumed, so at most a single batch is held in memory.
+
+        Args:
+            packs_to_parse (Optional[Tuple[str, ...]]): The packs to parse. If not provided, parses all packs.
+        """
+        batches = self._get_pack_batches(packs_to_parse)
+        for i, batch in enumerate(batches, start=1):
+            if len(batches) > 1:
+                logger.info(f"Parsing batch {i}/{len(batches)} of packs...")
+            yield self._create_content_dto(batch)
 
     def _create_content_dto(self, packs: Optional[Tuple[str, ...]]) -> ContentDTO:
         """Parses the repository, then creates and returns a repository model.
+        Only a model of the whole repository is cached, so batches are released once they are written.
 
         Args:
-            path (Path): The repository path.
-            packs_to_parse (Optional[List[str]]): A list of packs to parse. If not provided, parses all packs.
+            packs (Optional[Tuple[str, ...]]): A list of packs to parse. If not provided, parses all packs.
         """
-        return ContentDTO.from_path(packs_to_parse=packs)
+        return ContentDTO.from_path(packs_to_parse=packs, use_cache=packs is None)
 
     def _collect_nodes_and_relationships_from_model(
         self, content_dto: ContentDTO
-    ) -> None:
+    ) -> Tuple[Nodes, Relationships]:
+        """Collects the nodes and relationships of a repository model, and records its packs in the parse manifest.
+
+        Args:
+            content_dto (ContentDTO): The repository model.
+
+        Returns:
+            Tuple[Nodes, Relationships]: The nodes and relationships of the model.
+        """
+        nodes = Nodes()
+        relationships = Relationships()
+        parse_manifest = self._get_parse_manifest()
         for pack in content_dto.packs:
-            self.nodes.update(pack.to_nodes())
-            self.relationships.update(pack.relationships)
+            pack_nodes = pack.to_nodes()
+            nodes.update(pack_nodes)
+            relationships.update(pack.relationships)
+            if not pack.path.is_dir():
+                # the model was not parsed from the disk, so there is nothing to compare with later
+                continue
+            parse_manifest.set_pack(
+                pack.path,
+                build_pack_entries(
+                    pack.path,
+                    [
+                        node
+                        for content_type, nodes_data in pack_nodes.items()
+                        if content_type != ContentType.PACK
+                        for node in nodes_data
+                    ],
+                    pack.relationships,
+                ),
+            )
+        return nodes, relationships
+
+    def _get_parse_manifest(self) -> ParseManifest:
+        """Returns the parse manifest of the graph, or a new one if it is missing or was created by another parser version."""
+        parser_hash = self.content_graph._get_latest_content_parser_hash()
+        parse_manifest = self.content_graph.parse_manifest
+        if not parse_manifest or not parse_manifest.is_compatible(parser_hash):
+            parse_manifest = ParseManifest(parser_hash)
+            self.content_graph.parse_manifest = parse_manifest
+        return parse_manifest
+
+    def _update_packs_incrementally(
+        self, packs_to_update: Tuple[str, ...]
+    ) -> Tuple[str, ...]:
+        """Applies content item level changes to the graph, according to the parse manifest.
+        Only the content items whose content hash has changed are parsed, and only the nodes and
+        relationships which differ from the manifest are written to the graph.
+
+        Args:
+            packs_to_update (Tuple[str, ...]): The packs to update.
+
+        Returns:
+            Tuple[str, ...]: The packs which could not be updated incrementally and should be fully parsed.
+        """
+        parse_manifest = self.content_graph.parse_manifest
+        if not parse_manifest or not parse_manifest.is_compatible(
+            self.content_graph._get_latest_content_parser_hash()
+        ):
+            logger.debug("No compatible parse manifest, parsing the packs fully.")
+            return packs_to_update
+
+        packs_to_parse: List[str] = []
+        graph_diff = GraphDiff()
+        for pack_id in packs_to_update:
+            pack_path = Path(self.content_graph.repo_path) / PACKS_FOLDER / pack_id
+            if not pack_path.is_dir() or not (
+                pack_diff := parse_manifest.diff_pack(pack_path)
+            ):
+                packs_to_parse.append(pack_id)
+                continue
+            if pack_diff.is_empty:
+                logger.debug(f"Pack {pack_id} has not changed since the last parse.")
+                continue
+            self._add_pack_diff(parse_manifest, pack_diff, graph_diff)
+
+        if not graph_diff.is_empty:
+            logger.info("Updating the changed content items in the graph...")
+            self.content_graph.update_content_items(graph_diff)
+            self.content_graph.remove_non_repo_items()
+        return tuple(packs_to_parse)
+
+    def _add_pack_diff(
+        self, parse_manifest: ParseManifest, pack_diff: PackDiff, graph_diff: GraphDiff
+    ) -> None:
+        """Parses the changed content items of a pack and adds the graph changes to `graph_diff`.
+
+        Args:
+            parse_manifest (ParseManifest): The parse manifest, updated in place.
+            pack_diff (PackDiff): The content item level changes of the pack.
+            graph_diff (GraphDiff): The graph changes to update.
+        """
+        pack_path = pack_diff.pack_path
+        pack_id = pack_path.name
+        pack_parser = PackParser(pack_path, metadata_only=True)
+        pack = Pack.from_orm(pack_parser)
+        items = dict(parse_manifest.packs[pack_id].items)
+        if pack_diff.pack_files_changed:
+            graph_diff.nodes_to_update.append(
+                {"key": manifest_key(pack_path, pack_path), "node": pack.to_dict()}
+            )
+
+        for key in pack_diff.removed:
+            if items.pop(key).node_id:
+                graph_diff.keys_to_remove.append(key)
+
+        for path in pack_diff.changed + pack_diff.added:
+            key = manifest_key(path, pack_path)
+            old_entry: Optional[ContentItemEntry] = items.get(key)
+            try:
+                parser = ContentItemParser.from_path(
+                    path, pack_parser.marketplaces, pack_parser.supportedModules
+                )
+            except NotAContentItemException:
+                logger.debug(f"Skipping {path} - not a content item")
+                if old_entry and old_entry.node_id:
+                    graph_diff.keys_to_remove.append(key)
+                items[key] = ContentItemEntry(hash=hash_path(path))
+                continue
+            parser.add_to_pack(pack_id)
+            content_item = CONTENT_TYPE_TO_MODEL[parser.content_type].from_orm(parser)
+            content_item.pack = pack  # type: ignore[attr-defined]
+            node = content_item.to_dict()
+            new_entry = content_item_entry(path, node, parser.relationships)
+            items[key] = new_entry
+
+            if not old_entry or old_entry.node_id != new_entry.node_id:
+                if old_entry and old_entry.node_id:
+                    graph_diff.keys_to_remove.append(key)
+                graph_diff.nodes_to_create.add(**node)
+                graph_diff.relationships.update(parser.relationships)
+                continue
+            if old_entry.node_digest != new_entry.node_digest:
+                graph_diff.nodes_to_update.append({"key": key, "node": node})
+            if old_entry.relationships_digest != new_entry.relationships_digest:
+                graph_diff.keys_to_reset_relationships.append(key)
+                graph_diff.relationships.update(parser.relationships)
+
+        parse_manifest.set_pack(pack_path, items)
 
     def create_graph(self) -> None:
-        self._parse_and_model_content()
+        self.content_graph.parse_manifest = None
         self._create_or_update_graph()
 
-    def _create_or_update_graph(self) -> None:
-        """Runs DB queries using the collected nodes and relationships to create or update the content graph."""
-        self.content_graph.create_nodes(self.nodes)
-        gc.collect()
-        self.content_graph.create_relationships(self.relationships)
-        gc.collect()
+    def _create_or_update_graph(
+        self, packs_to_parse: Optional[Tuple[str, ...]] = None
+    ) -> None:
+        """Parses the packs in batches and writes them to the content graph.
+
+        The nodes of every batch are written as soon as the batch is parsed, and the batch is released before the next one
+        is parsed. Relationships may target nodes of any batch, so they are spooled to a temporary file and written
+        batch by batch only after all the nodes are created.
+
+        Args:
+            packs_to_parse (Optional[Tuple[str, ...]]): The packs to parse. If not provided, parses all packs.
+        """
+        with tempfile.TemporaryFile() as relationships_file:
+            for content_dto in self._create_content_dtos(packs_to_parse):
+                nodes, relationships = self._collect_nodes_and_relationships_from_model(
+                    content_dto
+                )
+                del content_dto
+                self.content_graph.create_nodes(nodes)
+                del nodes
+                pickle.dump(
+                    relationships, relationships_file, protocol=pickle.HIGHEST_PROTOCOL
+                )
+                del relationships
+
+            relationships_file.seek(0)
+            for relationships in self._load_relationships(relationships_file):
+                self.content_graph.create_relationships(relationships)
         self.content_graph.remove_non_repo_items()
+
+    @staticmethod
+    def _load_relationships(relationships_file: IO[bytes]) -> Iterator[Relationships]:
+        """Yields the relationships batches spooled to the file, one batch at a time."""
+        while True:
+            try:
+                yield pickle.load(relationships_file)
+            except EOFError:
+                return
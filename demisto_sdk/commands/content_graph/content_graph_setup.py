@@ -1,5 +1,6 @@
 import typer
 
+from demisto_sdk.commands.content_graph.commands.cache import cache_cmd_group
 from demisto_sdk.commands.content_graph.commands.create import create
 from demisto_sdk.commands.content_graph.commands.get_dependencies import (
     get_dependencies,
@@ -19,6 +20,7 @@ graph_cmd_group.command("create", no_args_is_help=False)(create)
 graph_cmd_group.command("update", no_args_is_help=False)(update)
 graph_cmd_group.command("get-relationships", no_args_is_help=True)(get_relationships)
 graph_cmd_group.command("get-dependencies", no_args_is_help=True)(get_dependencies)
+graph_cmd_group.add_typer(cache_cmd_group, name="cache")
 
 if __name__ == "__main__":
     graph_cmd_group()
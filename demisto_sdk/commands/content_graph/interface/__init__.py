@@ -1,5 +1,16 @@
-from demisto_sdk.commands.content_graph.interface.neo4j.neo4j_graph import (
-    Neo4jContentGraphInterface as ContentGraphInterface,
-)
+import os
+
+from demisto_sdk.commands.common.constants import DEMISTO_SDK_GRAPH_BACKEND
+
+# The content graph backend is Neo4j by default.
+# Set DEMISTO_SDK_GRAPH_BACKEND to `memory` to use an in-process graph, which requires neither Neo4j nor Docker.
+if os.getenv(DEMISTO_SDK_GRAPH_BACKEND, "").lower() == "memory":
+    from demisto_sdk.commands.content_graph.interface.memory.memory_graph import (
+        MemoryContentGraphInterface as ContentGraphInterface,
+    )
+else:
+    from demisto_sdk.commands.content_graph.interface.neo4j.neo4j_graph import (  # type: ignore[assignment]
+        Neo4jContentGraphInterface as ContentGraphInterface,
+    )
 
 __all__ = ["ContentGraphInterface"]
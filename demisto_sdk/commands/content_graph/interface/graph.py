@@ -1,28 +1,44 @@
 import shutil
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+from tempfile import NamedTemporaryFile
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
 
 from demisto_sdk.commands.common.constants import MarketplaceVersions
 from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
 from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import (
+    download_content_graph,
     get_file,
     sha1_dir,
     write_dict,
 )
-from demisto_sdk.commands.content_graph.common import ContentType, RelationshipType
+from demisto_sdk.commands.content_graph.common import (
+    ContentType,
+    Neo4jRelationshipResult,
+    RelationshipType,
+)
+from demisto_sdk.commands.content_graph.interface.neo4j.import_utils import (
+    Neo4jImportHandler,
+)
 from demisto_sdk.commands.content_graph.objects.base_content import (
     BaseContent,
     BaseNode,
 )
 from demisto_sdk.commands.content_graph.objects.content_item import ContentItem
+from demisto_sdk.commands.content_graph.objects.integration import Integration
 from demisto_sdk.commands.content_graph.objects.integration_script import (
     IntegrationScript,
 )
 from demisto_sdk.commands.content_graph.objects.pack import Pack
+from demisto_sdk.commands.content_graph.objects.relationship import RelationshipData
 from demisto_sdk.commands.content_graph.objects.repository import ContentDTO
+from demisto_sdk.commands.content_graph.parse_manifest import GraphDiff, ParseManifest
+
+
+class UnsupportedQueryError(NotImplementedError):
+    """Raised when running a query on a content graph interface which does not support queries."""
 
 
 class DeprecatedItemUsage(NamedTuple):
@@ -35,6 +51,12 @@ class ContentGraphInterface(ABC):
     METADATA_FILE_NAME = "metadata.json"
     DEPENDS_ON_FILE_NAME = "depends_on.json"
     _depends_on = None
+    parse_manifest: Optional[ParseManifest] = None
+    # whether `run_single_query` can run Cypher queries on the graph
+    supports_queries = True
+    _import_handler: Neo4jImportHandler
+    # the content models of the graph nodes which were searched, by their element ids
+    _id_to_obj: Dict[str, BaseNode]
 
     @property
     @abstractmethod
@@ -98,6 +120,15 @@ class ContentGraphInterface(ABC):
                 sort_keys=True,
             )
 
+    def dump_parse_manifest(self) -> None:
+        """Adds the parse manifest to the graph import dir, so it is exported together with the graph."""
+        if self.parse_manifest:
+            self.parse_manifest.dump(self.import_path)
+
+    def load_parse_manifest(self) -> None:
+        """Loads the parse manifest of the imported graph, if exists."""
+        self.parse_manifest = ParseManifest.load(self.import_path)
+
     def _get_latest_content_parser_hash(self) -> Optional[str]:
         parsers_path = Path(__file__).parent.parent / "parsers"
         parsers_sha1 = sha1_dir(parsers_path)
@@ -115,6 +146,215 @@ class ContentGraphInterface(ABC):
     def zip_import_dir(self, output_file: Path) -> None:
         shutil.make_archive(str(output_file), "zip", self.import_path)
 
+    @abstractmethod
+    def _add_nodes_to_mapping(self, nodes: Iterable[Any]) -> None:
+        """Parses the given graph nodes to content models, and adds them to the mapping of their element ids.
+
+        Args:
+            nodes (Iterable[Any]): The graph nodes to add.
+        """
+        pass
+
+    @abstractmethod
+    def _query_nodes(
+        self,
+        marketplace: Optional[MarketplaceVersions],
+        content_type: ContentType,
+        ids_list: Optional[Iterable[int]],
+        **properties,
+    ) -> List[Any]:
+        """Returns the graph nodes matching the search filters (see `search`)."""
+        pass
+
+    @abstractmethod
+    def _query_relationships(
+        self,
+        node_ids: Iterable[str],
+        marketplace: Optional[MarketplaceVersions],
+    ) -> Dict[str, Neo4jRelationshipResult]:
+        """Returns the relationships of the graph nodes with the given element ids, by their element ids."""
+        pass
+
+    @abstractmethod
+    def _query_all_level_relationships(
+        self,
+        node_ids: Iterable[str],
+        relationship_type: RelationshipType,
+        marketplace: Optional[MarketplaceVersions],
+    ) -> Dict[str, Neo4jRelationshipResult]:
+        """Returns the all level relationships of the given type of the graph nodes with the given element ids,
+        by their element ids."""
+        pass
+
+    @abstractmethod
+    def _import_graph_files(
+        self,
+        snapshot_paths: List[Path],
+        graphml_filenames: List[str],
+        merge_content_items: bool,
+    ) -> None:
+        """Imports the graph files of the import dir to the graph, and merges the duplicate commands.
+
+        Args:
+            snapshot_paths (List[Path]): The snapshot files to import.
+            graphml_filenames (List[str]): The GraphML files of the import dir to import.
+            merge_content_items (bool): Whether to merge the duplicate content items (of different repositories).
+        """
+        pass
+
+    def _add_relationships_to_objects(
+        self,
+        result: Dict[str, Neo4jRelationshipResult],
+        marketplace: Optional[MarketplaceVersions] = None,
+    ):
+        """This adds relationships to given object
+
+        Args:
+            result (Dict[str, Neo4jRelationshipResult]): Result from the graph query
+        """
+        content_item_nodes: Set[str] = set()
+        packs: List[Pack] = []
+        nodes_to = []
+        for res in result.values():
+            nodes_to.extend(res.nodes_to)
+        self._add_nodes_to_mapping(nodes_to)
+        for id, res in result.items():
+            obj = self._id_to_obj[id]
+            self._add_relationships(obj, res.relationships, res.nodes_to)
+            if isinstance(obj, Pack) and not obj.content_items:
+                packs.append(obj)
+                content_item_nodes.update(
+                    node.element_id
+                    for node, rel in zip(res.nodes_to, res.relationships)
+                    if rel.type == RelationshipType.IN_PACK
+                )
+
+            if isinstance(obj, Integration) and not obj.commands:
+                obj.set_commands()  # type: ignore[union-attr]
+
+        if content_item_nodes:
+            content_items_result = self._query_relationships(
+                content_item_nodes, marketplace
+            )
+            self._add_relationships_to_objects(content_items_result, marketplace)
+
+        # we need to set content items only after they are fully loaded
+        for pack in packs:
+            pack.set_content_items()
+
+    def _add_relationships(
+        self,
+        obj: BaseNode,
+        relationships: List[Any],
+        nodes_to: List[Any],
+    ) -> None:
+        """
+        Adds relationship to content object
+
+        Args:
+            obj (BaseNode): Object to add relationship to
+            relationships (List[Any]): The list of relationships from the source
+            nodes_to (List[Any]): The list of nodes of the target
+        """
+        for node_to, rel in zip(nodes_to, relationships):
+            if not rel.start_node or not rel.end_node:
+                raise ValueError("Relationships must have start and end nodes")
+            obj.add_relationship(
+                RelationshipType(rel.type),
+                RelationshipData(
+                    relationship_type=rel.type,
+                    source_id=rel.start_node.element_id,
+                    target_id=rel.end_node.element_id,
+                    content_item_to=self._id_to_obj[node_to.element_id],
+                    is_direct=True,
+                    **rel,
+                ),
+            )
+
+    def _add_all_level_relationships(
+        self,
+        node_ids: Iterable[str],
+        relationship_type: RelationshipType,
+        marketplace: MarketplaceVersions = None,
+    ):
+        """Helper method to add all level dependencies
+
+        Args:
+            node_ids (Iterable[str]): The element ids of the nodes to add the relationships to
+            relationship_type (RelationshipType): The relationship type to follow
+            marketplace (MarketplaceVersions): Marketplace version to check for dependencies
+        """
+        relationships = self._query_all_level_relationships(
+            node_ids, relationship_type, marketplace
+        )
+        nodes_to = []
+        for content_item_relationship in relationships.values():
+            nodes_to.extend(content_item_relationship.nodes_to)
+        self._add_nodes_to_mapping(nodes_to)
+
+        for content_item_id, content_item_relationship in relationships.items():
+            obj = self._id_to_obj[content_item_id]
+            for node in content_item_relationship.nodes_to:
+                target = self._id_to_obj[node.element_id]
+                source_id = content_item_id
+                target_id = node.element_id
+                if relationship_type == RelationshipType.IMPORTS:
+                    # the import relationship is from the integration to the content item
+                    source_id = node.element_id
+                    target_id = content_item_id
+                obj.add_relationship(
+                    relationship_type,
+                    RelationshipData(
+                        relationship_type=relationship_type,
+                        source_id=source_id,
+                        target_id=target_id,
+                        content_item_to=target,
+                        mandatorily=True,
+                        is_direct=False,
+                    ),
+                )
+
+    def _search(
+        self,
+        marketplace: MarketplaceVersions = None,
+        content_type: ContentType = ContentType.BASE_NODE,
+        ids_list: Optional[Iterable[int]] = None,
+        all_level_dependencies: bool = False,
+        all_level_imports: bool = False,
+        **properties,
+    ) -> List[BaseNode]:
+        """
+        This is the implementation for the search function.
+
+        """
+        results = self._query_nodes(marketplace, content_type, ids_list, **properties)
+        self._add_nodes_to_mapping(results)
+
+        nodes_without_relationships = {
+            result.element_id
+            for result in results
+            if not self._id_to_obj[result.element_id].relationships_data
+        }
+
+        relationships = self._query_relationships(
+            nodes_without_relationships, marketplace
+        )
+        self._add_relationships_to_objects(relationships, marketplace)
+
+        pack_nodes = {
+            result.element_id
+            for result in results
+            if isinstance(self._id_to_obj[result.element_id], Pack)
+        }
+        nodes = {result.element_id for result in results}
+        if all_level_imports:
+            self._add_all_level_relationships(nodes, RelationshipType.IMPORTS)
+        if all_level_dependencies and pack_nodes and marketplace:
+            self._add_all_level_relationships(
+                pack_nodes, RelationshipType.DEPENDS_ON, marketplace
+            )
+        return [self._id_to_obj[result.element_id] for result in results]
+
     @abstractmethod
     def get_schema(self) -> dict:
         pass
@@ -134,17 +374,71 @@ class ContentGraphInterface(ABC):
         pass
 
     @abstractmethod
-    def remove_non_repo_items(self) -> None:
+    def update_content_items(self, graph_diff: GraphDiff) -> None:
+        """Applies content item level changes to the graph, without recreating their packs."""
         pass
 
     @abstractmethod
+    def remove_non_repo_items(self) -> None:
+        pass
+
     def import_graph(
         self,
         imported_path: Optional[Path] = None,
         download: bool = False,
         fail_on_error: bool = False,
     ) -> bool:
-        pass
+        """Imports the graph snapshot files (and GraphML files of graphs exported in the older format), by:
+        1. Extracting the graph files to the import dir (or downloading them from the bucket)
+        2. Importing the graph files and merging duplicate nodes (commands/content items), see `_import_graph_files`
+        3. Loading the parse manifest of the imported graph
+
+        Args:
+            imported_path (Path): The path to import the graph from.
+            download (bool): Wheter download the graph from bucket or not.
+            fail_on_error (bool): Whether to raise exception on error or not.
+
+        Returns:
+            bool: Whether the import was successful or not
+        """
+        if imported_path:
+            logger.info(f"Importing graph from {imported_path}")
+            self.clean_import_dir()
+
+        if download:
+            logger.info("Importing graph from bucket")
+            self.clean_import_dir()
+            try:
+                with NamedTemporaryFile() as temp_file:
+                    official_content_graph = download_content_graph(
+                        Path(temp_file.name),
+                    )
+                    self.move_to_import_dir(official_content_graph)
+            except Exception:
+                logger.error("Failed to download content graph from bucket")
+                if fail_on_error:
+                    raise
+                return False
+
+        logger.info("Importing graph from snapshot files...")
+        self._import_handler.extract_files_from_path(imported_path)
+        snapshot_paths = self._import_handler.get_snapshot_paths()
+        graphml_filenames = self._import_handler.get_graphml_filenames()
+        sources_count = len(snapshot_paths) + len(graphml_filenames)
+        if not sources_count:
+            # no graph files found in the import dir, nothing to import
+            return False
+        self._import_graph_files(
+            snapshot_paths, graphml_filenames, merge_content_items=sources_count > 1
+        )
+        if sources_count > 1:
+            # the parse manifest describes a single repository
+            self.parse_manifest = None
+        else:
+            self.load_parse_manifest()
+        has_infra_graph_been_changed = self._has_infra_graph_been_changed()
+        self._id_to_obj = {}
+        return not has_infra_graph_been_changed
 
     @abstractmethod
     def export_graph(
@@ -155,6 +449,11 @@ class ContentGraphInterface(ABC):
     ) -> None:
         pass
 
+    def prefetch_validations(self) -> None:
+        """Loads the graph the validation queries run on at once, before running several of them.
+        Interfaces which do not query a database have nothing to prefetch.
+        """
+
     @abstractmethod
     def get_unknown_content_uses(self, file_paths: List[str]) -> List[BaseNode]:
         pass
@@ -224,13 +523,13 @@ class ContentGraphInterface(ABC):
     ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         pass
 
-    @abstractmethod
     def search(
         self,
         marketplace: Union[MarketplaceVersions, str] = None,
         content_type: ContentType = ContentType.BASE_NODE,
         ids_list: Optional[Iterable[int]] = None,
         all_level_dependencies: bool = False,
+        all_level_imports: bool = False,
         **properties,
     ) -> List[BaseNode]:
         """
@@ -241,6 +540,7 @@ class ContentGraphInterface(ABC):
             content_type (ContentType]): The content_type to filter. Defaults to ContentType.BASE_NODE.
             ids_list (Optional[Iterable[int]], optional): A list of unique IDs to filter. Defaults to None.
             all_level_dependencies (bool, optional): Whether to return all level dependencies. Defaults to False.
+            all_level_imports (bool, optional): Whether to return all level imports. Defaults to False.
             **properties: A key, value filter for the search. For example: `search(object_id="QRadar")`.
 
         Returns:
@@ -250,7 +550,17 @@ class ContentGraphInterface(ABC):
             raise ValueError(
                 "Cannot search for all level dependencies without a marketplace"
             )
-        return []
+        if isinstance(marketplace, str):
+            marketplace = MarketplaceVersions(marketplace)
+
+        return self._search(
+            marketplace,
+            content_type,
+            ids_list,
+            all_level_dependencies,
+            all_level_imports,
+            **properties,
+        )
 
     def from_path(
         self, path: Path, marketplace: Optional[MarketplaceVersions] = None
@@ -304,6 +614,9 @@ class ContentGraphInterface(ABC):
 
     @abstractmethod
     def run_single_query(self, query: str, **kwargs) -> Any:
+        """Runs a Cypher query on the graph and returns its records.
+        Interfaces which do not support queries (see `supports_queries`) raise an `UnsupportedQueryError`.
+        """
         pass
 
     @abstractmethod
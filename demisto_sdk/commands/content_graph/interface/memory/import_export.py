@@ -0,0 +1,280 @@
+import xml.etree.ElementTree as ET
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from demisto_sdk.commands.common.handlers import JSON_Handler
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.content_graph.common import ContentType
+from demisto_sdk.commands.content_graph.interface.memory.store import (
+    GraphStore,
+    Node,
+)
+from demisto_sdk.commands.content_graph.snapshot import read_snapshots, write_snapshot
+
+json = JSON_Handler()
+
+# The GraphML files are read and written in the format of `apoc.export.graphml.all` with `useTypes: true`,
+# so graphs exported by one graph backend can be imported by the other.
+# GraphML was the export format before the snapshot format, and is still exported next to the snapshot,
+# for SDK versions which only import GraphML files.
+XML_NAMESPACE = "http://graphml.graphdrawing.org/xmlns"
+GRAPHML_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    f'<graphml xmlns="{XML_NAMESPACE}" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+    f'xsi:schemaLocation="{XML_NAMESPACE} {XML_NAMESPACE}/1.0/graphml.xsd">\n'
+)
+LABELS_KEY = "labels"
+EDGE_LABEL_KEY = "label"
+
+
+def _graphml_type(value: Any) -> str:
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "long"
+    if isinstance(value, float):
+        return "double"
+    return "string"
+
+
+def _graphml_value(value: Any) -> str:
+    if isinstance(value, list):
+        return json.dumps([_json_value(v) for v in value])
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(_json_value(value))
+
+
+def _json_value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def _from_graphml_value(value: Optional[str], attr_type: str, attr_list: bool) -> Any:
+    if attr_list:
+        return [
+            _from_graphml_value(
+                v if isinstance(v, str) else json.dumps(v), attr_type, False
+            )
+            for v in json.loads(value or "[]")
+        ]
+    value = value or ""
+    if attr_type == "boolean":
+        return value.lower() == "true"
+    if attr_type in ("int", "long"):
+        return int(value)
+    if attr_type in ("float", "double"):
+        return float(value)
+    return value
+
+
+def export_snapshot(store: GraphStore, path: Path) -> None:
+    """Writes the graph to a snapshot file."""
+    write_snapshot(
+        path,
+        (
+            (node.element_id, node.labels, node.properties)
+            for node in store.nodes.values()
+        ),
+        (
+            (
+                relationship.start_node.element_id,
+                relationship.type,
+                relationship.end_node.element_id,
+                relationship.properties,
+            )
+            for relationship in store.relationships.values()
+        ),
+    )
+
+
+def import_snapshots(store: GraphStore, paths: List[Path]) -> None:
+    """Reads snapshot files into the graph. The node ids of every file are offset by the nodes read before it."""
+    nodes: List[Node] = []
+    for offset, snapshot in read_snapshots(paths):
+        for table in snapshot.node_tables:
+            for _, properties in table.rows():
+                nodes.append(store.create_node(table.labels, properties))
+        for relationship_table in snapshot.relationship_tables:
+            for source, target, properties in relationship_table.rows():
+                store.create_relationship(
+                    relationship_table.type,
+                    nodes[offset + source],
+                    nodes[offset + target],
+                    properties,
+                )
+        logger.debug(f"Imported {snapshot.node_count} nodes from {snapshot.path}")
+
+
+def import_records(
+    store: GraphStore,
+    nodes: Iterable[Tuple[str, Iterable[str], Dict[str, Any]]],
+    relationships: Iterable[Tuple[str, str, str, Dict[str, Any]]],
+) -> None:
+    """Reads the nodes and relationships of another graph (e.g. Neo4j) into the graph.
+    The relationships refer to their nodes by the ids of the graph they were read from."""
+    nodes_by_id = {
+        node_id: store.create_node(labels, properties)
+        for node_id, labels, properties in nodes
+    }
+    for source, relationship_type, target, properties in relationships:
+        store.create_relationship(
+            relationship_type, nodes_by_id[source], nodes_by_id[target], properties
+        )
+
+
+def _labels_str(labels: Iterable[str]) -> str:
+    return "".join(f":{label}" for label in sorted(labels))
+
+
+def export_graphml(store: GraphStore, path: Path) -> None:
+    """Writes the graph to a GraphML file."""
+    keys: Dict[Tuple[str, str], Tuple[str, bool]] = {}
+    for element_type, elements in (
+        ("node", store.nodes.values()),
+        ("edge", store.relationships.values()),
+    ):
+        for element in elements:
+            for key, value in element.items():
+                sample = value[0] if isinstance(value, list) and value else value
+                keys.setdefault(
+                    (element_type, key),
+                    (_graphml_type(sample), isinstance(value, list)),
+                )
+    keys[("node", LABELS_KEY)] = ("string", False)
+    keys[("edge", EDGE_LABEL_KEY)] = ("string", False)
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(GRAPHML_HEADER)
+        for (element_type, key), (attr_type, attr_list) in keys.items():
+            list_attr = f' attr.list="{attr_type}"' if attr_list else ""
+            f.write(
+                f'<key id={quoteattr(key)} for="{element_type}" attr.name={quoteattr(key)} '
+                f'attr.type="{attr_type}"{list_attr}/>\n'
+            )
+        f.write('<graph id="G" edgedefault="directed">\n')
+        for node in store.nodes.values():
+            labels = _labels_str(node.labels)
+            f.write(
+                f'<node id="{node.element_id}" labels={quoteattr(labels)}>'
+                f'<data key="{LABELS_KEY}">{escape(labels)}</data>'
+            )
+            for key, value in node.items():
+                f.write(
+                    f"<data key={quoteattr(key)}>{escape(_graphml_value(value))}</data>"
+                )
+            f.write("</node>\n")
+        for relationship in store.relationships.values():
+            f.write(
+                f'<edge id="{relationship.element_id}" source="{relationship.start_node.element_id}" '
+                f'target="{relationship.end_node.element_id}" label={quoteattr(relationship.type)}>'
+                f'<data key="{EDGE_LABEL_KEY}">{escape(relationship.type)}</data>'
+            )
+            for key, value in relationship.items():
+                f.write(
+                    f"<data key={quoteattr(key)}>{escape(_graphml_value(value))}</data>"
+                )
+            f.write("</edge>\n")
+        f.write("</graph>\n</graphml>\n")
+    logger.debug(
+        f"Exported {len(store.nodes)} nodes and {len(store.relationships)} relationships to {path}"
+    )
+
+
+def import_graphml(store: GraphStore, paths: List[Path]) -> None:
+    """Reads GraphML files into the graph. The ids of every file are local to it,
+    so files of different repositories can be imported together."""
+    for path in paths:
+        keys: Dict[Tuple[str, str], Tuple[str, bool]] = {}
+        nodes: Dict[str, Node] = {}
+        for _, element in ET.iterparse(path, events=("end",)):
+            tag = element.tag.rpartition("}")[2]
+            if tag == "key":
+                keys[(element.get("for", "all"), element.get("id", ""))] = (
+                    element.get("attr.type", "string"),
+                    element.get("attr.list") is not None,
+                )
+                continue
+            if tag not in ("node", "edge"):
+                continue
+            properties = {}
+            for data in element:
+                key = data.get("key", "")
+                attr_type, attr_list = keys.get(
+                    (tag, key), keys.get(("all", key), ("string", False))
+                )
+                properties[key] = _from_graphml_value(data.text, attr_type, attr_list)
+            if tag == "node":
+                labels = element.get(LABELS_KEY) or properties.get(LABELS_KEY, "")
+                properties.pop(LABELS_KEY, None)
+                nodes[element.get("id", "")] = store.create_node(
+                    [label for label in labels.split(":") if label], properties
+                )
+            else:
+                relationship_type = element.get(EDGE_LABEL_KEY) or properties.get(
+                    EDGE_LABEL_KEY
+                )
+                properties.pop(EDGE_LABEL_KEY, None)
+                store.create_relationship(
+                    relationship_type,
+                    nodes[element.get("source", "")],
+                    nodes[element.get("target", "")],
+                    properties,
+                )
+            element.clear()
+        logger.debug(f"Imported {len(nodes)} nodes from {path}")
+
+
+def _combine(values: List[Any]) -> Any:
+    """Combines property values of merged nodes, same as `apoc.refactor.mergeNodes` with `properties: "combine"`."""
+    combined: List[Any] = []
+    for value in values:
+        for v in value if isinstance(value, list) else [value]:
+            if v not in combined:
+                combined.append(v)
+    if len(combined) == 1 and not any(isinstance(value, list) for value in values):
+        return combined[0]
+    return combined
+
+
+def merge_duplicate_commands(store: GraphStore) -> None:
+    """Merges possible duplicate command nodes after import"""
+    commands: Dict[Any, List[Node]] = {}
+    for command in store.candidates([ContentType.COMMAND]):
+        commands.setdefault(command.get("object_id"), []).append(command)
+    for duplicates in commands.values():
+        if len(duplicates) < 2:
+            continue
+        node, *others = duplicates
+        properties: Dict[str, List[Any]] = {}
+        for duplicate in duplicates:
+            for key, value in duplicate.items():
+                properties.setdefault(key, []).append(value)
+        store.set_properties(
+            node, {key: _combine(values) for key, values in properties.items()}
+        )
+        store.merge_nodes(node, others)
+
+
+def merge_duplicate_content_items(store: GraphStore) -> None:
+    """Merges possible duplicate content item nodes after import,
+    i.e., nodes which are not in the repository of one source and are in the repository of another.
+    """
+    for n in store.find_nodes([ContentType.BASE_NODE], not_in_repository=True):
+        for key in ("object_id", "name"):
+            if not n.get(key):
+                continue
+            if m := next(
+                iter(
+                    store.find_nodes(
+                        [ContentType.BASE_NODE],
+                        content_type=n.get("content_type"),
+                        not_in_repository=False,
+                        **{key: n.get(key)},
+                    )
+                ),
+                None,
+            ):
+                store.merge_nodes(m, [n])
+                break
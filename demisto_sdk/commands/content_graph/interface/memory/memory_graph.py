@@ -0,0 +1,484 @@
+import os
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from demisto_sdk.commands.common.constants import (
+    DEMISTO_SDK_GRAPH_BACKEND,
+    MarketplaceVersions,
+)
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.content_graph.common import (
+    ContentType,
+    Neo4jRelationshipResult,
+    RelationshipType,
+)
+from demisto_sdk.commands.content_graph.interface.graph import (
+    ContentGraphInterface,
+    DeprecatedItemUsage,
+    UnsupportedQueryError,
+)
+from demisto_sdk.commands.content_graph.interface.memory.import_export import (
+    export_graphml,
+    export_snapshot,
+    import_graphml,
+    import_records,
+    import_snapshots,
+    merge_duplicate_commands,
+    merge_duplicate_content_items,
+)
+from demisto_sdk.commands.content_graph.interface.memory.queries.dependencies import (
+    create_pack_dependencies,
+    get_all_level_packs_relationships,
+)
+from demisto_sdk.commands.content_graph.interface.memory.queries.nodes import (
+    _match,
+    create_nodes,
+    delete_all_graph_nodes,
+    get_content_items_relationships_to_preserve,
+    get_relationships_to_preserve,
+    get_schema,
+    remove_content_items,
+    remove_content_private_nodes,
+    remove_empty_properties,
+    remove_packs_before_creation,
+    remove_server_nodes,
+    return_content_items_preserved_relationships,
+    return_preserved_relationships,
+    update_nodes,
+)
+from demisto_sdk.commands.content_graph.interface.memory.queries.relationships import (
+    _match_relationships,
+    create_relationships,
+    delete_all_graph_relationships,
+    get_sources_by_path,
+    get_targets_by_path,
+    remove_outgoing_relationships,
+)
+from demisto_sdk.commands.content_graph.interface.memory.queries.validations import (
+    get_items_using_deprecated,
+    validate_core_packs_dependencies,
+    validate_duplicate_ids,
+    validate_fromversion,
+    validate_marketplaces,
+    validate_multiple_packs_with_same_display_name,
+    validate_multiple_script_with_same_name,
+    validate_packs_with_hidden_mandatory_dependencies,
+    validate_test_playbook_in_use,
+    validate_toversion,
+    validate_unknown_content,
+)
+from demisto_sdk.commands.content_graph.interface.memory.store import (
+    GraphStore,
+    Node,
+)
+from demisto_sdk.commands.content_graph.interface.neo4j.import_utils import (
+    GRAPHML_FILE_SUFFIX,
+    Neo4jImportHandler,
+)
+from demisto_sdk.commands.content_graph.interface.neo4j.neo4j_graph import (
+    _parse_node,
+)
+from demisto_sdk.commands.content_graph.objects.base_content import BaseNode
+from demisto_sdk.commands.content_graph.objects.integration_script import (
+    IntegrationScript,
+)
+from demisto_sdk.commands.content_graph.objects.script import Script
+from demisto_sdk.commands.content_graph.parse_manifest import GraphDiff
+from demisto_sdk.commands.content_graph.snapshot import SNAPSHOT_FILE_SUFFIX
+
+
+class MemoryContentGraphInterface(ContentGraphInterface):
+    """A content graph interface backed by an in-process graph, which requires neither Neo4j nor Docker.
+
+    The graph is shared by all the instances of the process, same as a database they all connect to,
+    and is exchanged with other processes (and with the Neo4j interface) through the graph files of the import dir.
+    """
+
+    _store = GraphStore()
+    supports_queries = False
+    # queries are run one at a time, same as transactions of a single session
+    _lock = threading.RLock()
+
+    def __init__(
+        self,
+    ) -> None:
+        self._import_handler = Neo4jImportHandler()
+        self._id_to_obj: Dict[str, BaseNode] = {}
+        self._rels_to_preserve: List[Dict[str, Any]] = []  # used for graph updates
+        self.output_path = None
+        if artifacts_folder := os.getenv("ARTIFACTS_FOLDER"):
+            self.output_path = Path(artifacts_folder) / "content_graph"
+            self.output_path.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_records(
+        cls,
+        nodes: Iterable[Tuple[str, Iterable[str], Dict[str, Any]]],
+        relationships: Iterable[Tuple[str, str, str, Dict[str, Any]]],
+    ) -> "MemoryContentGraphInterface":
+        """Returns an interface to a graph of its own, rather than the graph shared by the process,
+        which holds the nodes and relationships read from another graph (see `import_records`)."""
+        interface = cls()
+        interface._store = GraphStore()
+        import_records(interface._store, nodes, relationships)
+        return interface
+
+    def __enter__(self) -> "MemoryContentGraphInterface":
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+    @property
+    def import_path(self) -> Path:
+        return self._import_handler.import_path
+
+    def clean_import_dir(self) -> None:
+        return self._import_handler.clean_import_dir()
+
+    def move_to_import_dir(self, imported_path: Path) -> None:
+        return self._import_handler.extract_files_from_path(imported_path)
+
+    def close(self) -> None:
+        pass
+
+    def _add_nodes_to_mapping(self, nodes: Iterable[Node]) -> None:
+        """Add nodes to the content models mapping.
+        The nodes are already in this process, so they are parsed inline rather than in a pool of workers.
+
+        Args:
+            nodes (Iterable[Node]): list of nodes to add
+        """
+        for node in nodes:
+            if node.element_id not in self._id_to_obj:
+                self._id_to_obj[node.element_id] = _parse_node(
+                    node.element_id, dict(node.items())
+                )
+
+    def _query_nodes(
+        self,
+        marketplace: Optional[MarketplaceVersions],
+        content_type: ContentType,
+        ids_list: Optional[Iterable[int]],
+        **properties,
+    ) -> List[Node]:
+        with self._lock:
+            return _match(
+                self._store, marketplace, content_type, ids_list, **properties
+            )
+
+    def _query_relationships(
+        self,
+        node_ids: Iterable[str],
+        marketplace: Optional[MarketplaceVersions],
+    ) -> Dict[str, Neo4jRelationshipResult]:
+        with self._lock:
+            return _match_relationships(self._store, node_ids, marketplace)
+
+    def _query_all_level_relationships(
+        self,
+        node_ids: Iterable[str],
+        relationship_type: RelationshipType,
+        marketplace: Optional[MarketplaceVersions],
+    ) -> Dict[str, Neo4jRelationshipResult]:
+        with self._lock:
+            return get_all_level_packs_relationships(
+                self._store, relationship_type, list(node_ids), marketplace, True
+            )
+
+    def create_indexes_and_constraints(self) -> None:
+        # nodes are indexed by the store itself
+        pass
+
+    def create_nodes(self, nodes: Dict[ContentType, List[Dict[str, Any]]]) -> None:
+        logger.info("Creating graph nodes...")
+        pack_ids = [p.get("object_id") for p in nodes.get(ContentType.PACK, [])]
+        with self._lock:
+            # nodes may be created in several batches, so the preserved relationships are accumulated
+            self._rels_to_preserve.extend(
+                get_relationships_to_preserve(self._store, pack_ids)
+            )
+            remove_packs_before_creation(self._store, pack_ids)
+            create_nodes(self._store, nodes)
+            remove_empty_properties(self._store)
+
+    def get_relationships_by_path(
+        self,
+        path: Path,
+        relationship_type: RelationshipType,
+        content_type: ContentType,
+        depth: int,
+        marketplace: MarketplaceVersions,
+        retrieve_sources: bool,
+        retrieve_targets: bool,
+        mandatory_only: bool,
+        include_tests: bool,
+        include_deprecated: bool,
+        include_hidden: bool,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        args = (
+            path,
+            relationship_type,
+            content_type,
+            depth,
+            marketplace,
+            mandatory_only,
+            include_tests,
+            include_deprecated,
+            include_hidden,
+        )
+        with self._lock:
+            sources = (
+                get_sources_by_path(self._store, *args) if retrieve_sources else []
+            )
+            targets = (
+                get_targets_by_path(self._store, *args) if retrieve_targets else []
+            )
+            return sources, targets
+
+    def _get_relationship_results(
+        self, results: Dict[str, Neo4jRelationshipResult]
+    ) -> List[BaseNode]:
+        self._add_nodes_to_mapping(result.node_from for result in results.values())  # type: ignore[misc]
+        self._add_relationships_to_objects(results)
+        return [self._id_to_obj[result] for result in results]
+
+    def get_unknown_content_uses(
+        self,
+        file_paths: List[str],
+    ) -> List[BaseNode]:
+        with self._lock:
+            return self._get_relationship_results(
+                validate_unknown_content(self._store, file_paths)
+            )
+
+    def get_duplicate_pack_display_name(
+        self, file_paths: List[str]
+    ) -> List[Tuple[str, List[str]]]:
+        with self._lock:
+            return validate_multiple_packs_with_same_display_name(
+                self._store, file_paths
+            )
+
+    def get_duplicate_script_name_included_incident(
+        self, file_paths: List[str]
+    ) -> Dict[str, str]:
+        with self._lock:
+            return validate_multiple_script_with_same_name(self._store, file_paths)
+
+    def validate_duplicate_ids(
+        self, file_paths: List[str]
+    ) -> List[Tuple[BaseNode, List[BaseNode]]]:
+        with self._lock:
+            duplicates = validate_duplicate_ids(self._store, file_paths)
+            all_nodes = []
+            for content_item, dups in duplicates:
+                all_nodes.append(content_item)
+                all_nodes.extend(dups)
+            self._add_nodes_to_mapping(all_nodes)
+            return [
+                (
+                    self._id_to_obj[content_item.element_id],
+                    [self._id_to_obj[duplicate.element_id] for duplicate in dups],
+                )
+                for content_item, dups in duplicates
+            ]
+
+    def find_uses_paths_with_invalid_fromversion(
+        self, file_paths: List[str], for_supported_versions=False
+    ) -> List[BaseNode]:
+        with self._lock:
+            return self._get_relationship_results(
+                validate_fromversion(self._store, file_paths, for_supported_versions)
+            )
+
+    def find_uses_paths_with_invalid_toversion(
+        self, file_paths: List[str], for_supported_versions=False
+    ) -> List[BaseNode]:
+        with self._lock:
+            return self._get_relationship_results(
+                validate_toversion(self._store, file_paths, for_supported_versions)
+            )
+
+    def find_items_using_deprecated_items(
+        self, file_paths: List[str]
+    ) -> List[DeprecatedItemUsage]:
+        with self._lock:
+            deprecated_usage = get_items_using_deprecated(self._store, file_paths)
+            self._add_nodes_to_mapping(
+                node for _, nodes in deprecated_usage for node in nodes
+            )
+            return [
+                DeprecatedItemUsage(
+                    deprecated_item_id=dep_content,
+                    content_items_using_deprecated=[
+                        self._id_to_obj[node.element_id] for node in nodes
+                    ],
+                )
+                for dep_content, nodes in deprecated_usage
+            ]
+
+    def find_uses_paths_with_invalid_marketplaces(
+        self, pack_ids: List[str]
+    ) -> List[BaseNode]:
+        with self._lock:
+            return self._get_relationship_results(
+                validate_marketplaces(self._store, pack_ids)
+            )
+
+    def find_core_packs_depend_on_non_core_packs(
+        self,
+        pack_ids: List[str],
+        marketplace: MarketplaceVersions,
+        core_pack_list: List[str],
+    ) -> List[BaseNode]:
+        with self._lock:
+            return self._get_relationship_results(
+                validate_core_packs_dependencies(
+                    self._store, pack_ids, marketplace, core_pack_list
+                )
+            )
+
+    def find_packs_with_invalid_dependencies(
+        self, pack_ids: List[str]
+    ) -> List[BaseNode]:
+        with self._lock:
+            return self._get_relationship_results(
+                validate_packs_with_hidden_mandatory_dependencies(self._store, pack_ids)
+            )
+
+    def find_unused_test_playbook(
+        self, test_playbook_ids: List[str], test_playbooks_ids_to_skip: List[str]
+    ) -> List[BaseNode]:
+        with self._lock:
+            results = validate_test_playbook_in_use(
+                self._store, test_playbook_ids, test_playbooks_ids_to_skip
+            )
+            self._add_nodes_to_mapping(results)
+            return [self._id_to_obj[result.element_id] for result in results]
+
+    @lru_cache
+    def get_api_module_imports(self, api_module: str) -> list[IntegrationScript]:
+        try:
+            api_module_node = self.search(object_id=api_module)[0]
+        except IndexError:
+            logger.warning(f"Could not find {api_module} in graph")
+            return []
+        assert isinstance(api_module_node, Script)
+        return [c for c in api_module_node.imported_by]
+
+    def create_relationships(
+        self, relationships: Dict[RelationshipType, List[Dict[str, Any]]]
+    ) -> None:
+        logger.info("Creating graph relationships...")
+        with self._lock:
+            create_relationships(self._store, dict(relationships))
+            if self._rels_to_preserve:
+                return_preserved_relationships(self._store, self._rels_to_preserve)
+                self._rels_to_preserve = []
+
+    def update_content_items(self, graph_diff: GraphDiff) -> None:
+        logger.info("Updating graph content items...")
+        rels_to_preserve: List[Dict[str, Any]] = []
+        with self._lock:
+            if graph_diff.keys_to_remove:
+                # relationships from content items which are not reparsed are not recreated, so they are preserved
+                rels_to_preserve = get_content_items_relationships_to_preserve(
+                    self._store,
+                    graph_diff.keys_to_remove,
+                    graph_diff.keys_to_remove + graph_diff.keys_to_reset_relationships,
+                )
+                remove_content_items(self._store, graph_diff.keys_to_remove)
+            if graph_diff.nodes_to_update:
+                update_nodes(self._store, graph_diff.nodes_to_update)
+            if graph_diff.nodes_to_create:
+                create_nodes(self._store, graph_diff.nodes_to_create)
+            if graph_diff.keys_to_reset_relationships:
+                remove_outgoing_relationships(
+                    self._store, graph_diff.keys_to_reset_relationships
+                )
+            if graph_diff.relationships:
+                create_relationships(self._store, graph_diff.relationships)
+            if rels_to_preserve:
+                return_content_items_preserved_relationships(
+                    self._store, rels_to_preserve
+                )
+            remove_empty_properties(self._store)
+        self._id_to_obj = {}
+
+    def remove_non_repo_items(self) -> None:
+        with self._lock:
+            remove_content_private_nodes(self._store)
+            remove_server_nodes(self._store)
+
+    def _import_graph_files(
+        self,
+        snapshot_paths: List[Path],
+        graphml_filenames: List[str],
+        merge_content_items: bool,
+    ) -> None:
+        """Reads the graph files (the ids of every file are offset/kept local, so they don't collide),
+        and merges the duplicate nodes (commands/content items)."""
+        with self._lock:
+            import_snapshots(self._store, snapshot_paths)
+            import_graphml(
+                self._store,
+                [self.import_path / filename for filename in sorted(graphml_filenames)],
+            )
+            merge_duplicate_commands(self._store)
+            if merge_content_items:
+                merge_duplicate_content_items(self._store)
+
+    def export_graph(
+        self,
+        output_path: Optional[Path] = None,
+        override_commit: bool = True,
+        marketplace: MarketplaceVersions = MarketplaceVersions.XSOAR,
+        clean_import_dir: bool = True,
+    ) -> None:
+        if clean_import_dir:
+            self.clean_import_dir()
+        with self._lock:
+            export_snapshot(
+                self._store,
+                self.import_path / f"{self.repo_path.name}{SNAPSHOT_FILE_SUFFIX}",
+            )
+            # for SDK versions which only import GraphML files
+            export_graphml(
+                self._store,
+                self.import_path / f"{self.repo_path.name}{GRAPHML_FILE_SUFFIX}",
+            )
+        self.dump_metadata(override_commit)
+        self.dump_depends_on()
+        self.dump_parse_manifest()
+        if output_path:
+            output_path = output_path / marketplace.value
+            logger.info(f"Saving content graph in {output_path}.zip")
+            self.zip_import_dir(output_path)
+
+    def clean_graph(self):
+        with self._lock:
+            delete_all_graph_relationships(self._store)
+            delete_all_graph_nodes(self._store)
+        self._id_to_obj = {}
+
+    def create_pack_dependencies(self):
+        logger.info("Creating pack dependencies...")
+        with self._lock:
+            self._depends_on = create_pack_dependencies(self._store)
+
+    def is_alive(self):
+        # a new process starts with an empty graph, which should be imported or created
+        return bool(self._store.nodes)
+
+    def get_schema(self) -> dict:
+        with self._lock:
+            return get_schema(self._store)
+
+    def run_single_query(self, query: str, **kwargs) -> Any:
+        raise UnsupportedQueryError(
+            "Cypher queries are not supported by the in-memory content graph, "
+            f"unset {DEMISTO_SDK_GRAPH_BACKEND} to use the Neo4j content graph"
+        )
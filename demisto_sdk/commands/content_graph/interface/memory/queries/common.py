@@ -0,0 +1,117 @@
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.content_graph.common import (
+    Neo4jRelationshipResult,
+)
+from demisto_sdk.commands.content_graph.interface.memory.store import (
+    Node,
+    Relationship,
+)
+
+# The queries below follow the semantics of their Cypher equivalents under `interface/neo4j/queries`,
+# including the handling of null (missing) properties, which never satisfy a predicate.
+
+
+def versioned(version: Any) -> Optional[Tuple[int, ...]]:
+    """The equivalent of `toIntegerList(split(version, "."))`. Returns None for a missing or invalid version."""
+    if version is None:
+        return None
+    try:
+        return tuple(int(part) for part in str(version).split("."))
+    except ValueError:
+        return None
+
+
+def version_lt(a: Any, b: Any) -> bool:
+    a, b = versioned(a), versioned(b)
+    return a is not None and b is not None and a < b
+
+
+def version_le(a: Any, b: Any) -> bool:
+    a, b = versioned(a), versioned(b)
+    return a is not None and b is not None and a <= b
+
+
+def is_false(node: Any, key: str) -> bool:
+    """The equivalent of `NOT n.key`, or of matching `{key: false}`."""
+    return node.get(key) is False
+
+
+def or_(a: Optional[bool], b: Optional[bool]) -> Optional[bool]:
+    """The equivalent of the Cypher `a OR b` (a ternary logic)."""
+    if a is True or b is True:
+        return True
+    if a is None or b is None:
+        return None
+    return False
+
+
+def and_(a: Optional[bool], b: Optional[bool]) -> Optional[bool]:
+    """The equivalent of the Cypher `a AND b` (a ternary logic)."""
+    if a is False or b is False:
+        return False
+    if a is None or b is None:
+        return None
+    return True
+
+
+def intersects(arr1: Optional[Iterable], arr2: Optional[Iterable]) -> bool:
+    if arr1 is None or arr2 is None:
+        return False
+    arr2 = list(arr2)
+    return any(elem in arr2 for elem in arr1)
+
+
+def is_subset(arr1: Optional[Iterable], arr2: Optional[Iterable]) -> bool:
+    """The equivalent of `all(elem IN arr1 WHERE elem IN arr2)`."""
+    if arr1 is None or arr2 is None:
+        return False
+    arr2 = list(arr2)
+    return all(elem in arr2 for elem in arr1)
+
+
+def in_list(value: Any, values: Optional[Iterable]) -> bool:
+    """The equivalent of `value IN values`."""
+    return value is not None and values is not None and value in values
+
+
+def is_target_available(source: Node, target: Node) -> bool:
+    """Determines if a target content item is available for use by a source content item
+    (i.e. they share a marketplace and have overlapping versions).
+    """
+    return (
+        intersects(source.get("marketplaces"), target.get("marketplaces"))
+        and version_le(target.get("fromversion"), source.get("toversion"))
+        and version_le(source.get("fromversion"), target.get("toversion"))
+    )
+
+
+def matches_keys(node: Node, keys: Iterable[str]) -> bool:
+    """Whether the node path is one of the given keys or is under one of them."""
+    path = node.get("path")
+    if not isinstance(path, str):
+        return False
+    return any(path == key or path.startswith(f"{key}/") for key in keys)
+
+
+def to_relationship_results(
+    rows: Iterable[Tuple[Node, Relationship, Node]],
+) -> Dict[str, Neo4jRelationshipResult]:
+    """Groups (node_from, relationship, node_to) rows by the source node,
+    same as `RETURN node_from, collect(r) AS relationships, collect(node_to) AS nodes_to`.
+    """
+    results: Dict[str, Neo4jRelationshipResult] = {}
+    for node_from, relationship, node_to in rows:
+        result = results.setdefault(
+            node_from.element_id,
+            Neo4jRelationshipResult(
+                node_from=node_from,  # type: ignore[arg-type]
+                relationships=[],
+                nodes_to=[],
+            ),
+        )
+        result.relationships.append(relationship)  # type: ignore[arg-type]
+        result.nodes_to.append(node_to)  # type: ignore[arg-type]
+    logger.debug(f"Matched {len(results)} nodes.")
+    return results
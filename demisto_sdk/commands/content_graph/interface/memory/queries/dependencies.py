@@ -0,0 +1,234 @@
+import os
+from collections import deque
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from demisto_sdk.commands.common.constants import (
+    DEPRECATED_CONTENT_PACK,
+    GENERIC_COMMANDS_NAMES,
+    MarketplaceVersions,
+)
+from demisto_sdk.commands.common.handlers import JSON_Handler
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.content_graph.common import (
+    ContentType,
+    Neo4jRelationshipResult,
+    RelationshipType,
+)
+from demisto_sdk.commands.content_graph.interface.memory.queries.common import (
+    and_,
+    in_list,
+    intersects,
+    is_false,
+    is_target_available,
+    or_,
+)
+from demisto_sdk.commands.content_graph.interface.memory.store import (
+    GraphStore,
+    Node,
+    Relationship,
+)
+from demisto_sdk.commands.content_graph.interface.neo4j.queries.dependencies import (
+    IGNORED_PACKS_IN_DEPENDENCY_CALC,
+    MAX_DEPTH,
+)
+
+json = JSON_Handler()
+
+
+def _shortest_paths(
+    node_from: Node,
+    neighbours: Callable[[Node], List[Tuple[Relationship, Node]]],
+) -> Dict[str, Tuple[Node, List[Relationship]]]:
+    """A breadth first search of the nodes reachable from `node_from` in up to `MAX_DEPTH` hops.
+
+    Returns:
+        Dict[str, Tuple[Node, List[Relationship]]]: Every reached node (by its id),
+            with the relationships of the shortest path to it.
+    """
+    reached: Dict[str, Tuple[Node, List[Relationship]]] = {
+        node_from.element_id: (node_from, [])
+    }
+    queue = deque([node_from])
+    while queue:
+        node = queue.popleft()
+        path = reached[node.element_id][1]
+        if len(path) == MAX_DEPTH:
+            continue
+        for relationship, neighbour in neighbours(node):
+            if neighbour.element_id not in reached:
+                reached[neighbour.element_id] = (neighbour, path + [relationship])
+                queue.append(neighbour)
+    del reached[node_from.element_id]
+    return reached
+
+
+def get_all_level_packs_relationships(
+    store: GraphStore,
+    relationship_type: RelationshipType,
+    ids_list: List[str],
+    marketplace: MarketplaceVersions,
+    mandatorily: bool = False,
+    **properties,
+) -> Dict[str, Neo4jRelationshipResult]:
+    def depends_on(node: Node) -> List[Tuple[Relationship, Node]]:
+        return [
+            (r, r.end_node)
+            for r in store.outgoing(node, RelationshipType.DEPENDS_ON)
+            if is_false(r, "is_test")
+            and (not mandatorily or r.get("mandatorily") is True)
+            and in_list(marketplace, r.end_node.get("marketplaces"))
+        ]
+
+    def imported_by(node: Node) -> List[Tuple[Relationship, Node]]:
+        # search all the content items that import the 'node_from' content item
+        return [
+            (r, r.start_node) for r in store.incoming(node, RelationshipType.IMPORTS)
+        ]
+
+    results: Dict[str, Neo4jRelationshipResult] = {}
+    for node_id in ids_list:
+        node_from = store.nodes.get(node_id)
+        if not node_from:
+            continue
+        if relationship_type == RelationshipType.DEPENDS_ON:
+            if not (
+                ContentType.PACK in node_from.labels
+                and in_list(marketplace, node_from.get("marketplaces"))
+                and all(node_from.get(k) == v for k, v in properties.items())
+            ):
+                continue
+            reached = {
+                element_id: (node, path)
+                for element_id, (node, path) in _shortest_paths(
+                    node_from, depends_on
+                ).items()
+                if ContentType.PACK in node.labels
+            }
+        else:
+            reached = _shortest_paths(node_from, imported_by)
+        if reached:
+            results[node_id] = Neo4jRelationshipResult(
+                node_from=node_from,  # type: ignore[arg-type]
+                relationships=[path for _, path in reached.values()],  # type: ignore[misc]
+                nodes_to=[node for node, _ in reached.values()],  # type: ignore[misc]
+            )
+    logger.debug("Found dependencies.")
+    return results
+
+
+def create_pack_dependencies(store: GraphStore) -> dict:
+    remove_existing_depends_on_relationships(store)
+    update_uses_for_integration_commands(store)
+    delete_deprecatedcontent_relationship(store)  # TODO decide what to do with this
+    depends_on_data = create_depends_on_relationships(store)
+    return depends_on_data
+
+
+def _pack_of(store: GraphStore, node: Node) -> List[Node]:
+    return [r.end_node for r in store.outgoing(node, RelationshipType.IN_PACK)]
+
+
+def delete_deprecatedcontent_relationship(store: GraphStore) -> None:
+    """
+    This will delete any USES relationship between a content item and a content item in the deprecated content pack.
+    At the moment, we do not want to consider this pack in the dependency calculation.
+    """
+    for relationship in store.iter_relationships(RelationshipType.USES):
+        if any(
+            ContentType.PACK in pack.labels
+            and pack.get("object_id") == DEPRECATED_CONTENT_PACK
+            for pack in _pack_of(store, relationship.end_node)
+        ):
+            store.delete_relationship(relationship)
+
+
+def remove_existing_depends_on_relationships(store: GraphStore) -> None:
+    for relationship in store.iter_relationships(RelationshipType.DEPENDS_ON):
+        if relationship.get("from_metadata") is False:
+            store.delete_relationship(relationship)
+
+
+def update_uses_for_integration_commands(store: GraphStore) -> None:
+    """Creates a relationships between content items and integrations, based on the commands they use.
+    See the Neo4j query of the same name for how the mandatorily property is calculated.
+    """
+    for command in store.candidates([ContentType.COMMAND]):
+        if command.get("object_id") in GENERIC_COMMANDS_NAMES:
+            continue
+        rows = [
+            (r.start_node, r, rcmd, rcmd.start_node)
+            for r in store.incoming(command, RelationshipType.USES)
+            if ContentType.BASE_NODE in r.start_node.labels
+            for rcmd in store.incoming(command, RelationshipType.HAS_COMMAND)
+            if ContentType.INTEGRATION in rcmd.start_node.labels
+            and is_target_available(r.start_node, rcmd.start_node)
+        ]
+        command_count = len({rcmd.element_id for _, _, rcmd, _ in rows})
+        for content_item, r, _, integration in rows:
+            mandatorily = r.get("mandatorily") if command_count == 1 else False
+            relationships, created = store.merge_relationship(
+                RelationshipType.USES, content_item, integration
+            )
+            for u in relationships:
+                u.set(
+                    "mandatorily",
+                    mandatorily if created else or_(u.get("mandatorily"), mandatorily),
+                )
+
+
+def create_depends_on_relationships(store: GraphStore) -> dict:
+    outputs: Dict[str, Dict[str, list]] = {}
+    for r in store.iter_relationships(RelationshipType.USES):
+        a, b = r.start_node, r.end_node
+        for pack_a in _pack_of(store, a):
+            for pack_b in _pack_of(store, b):
+                if not (
+                    ContentType.BASE_NODE in pack_a.labels
+                    and ContentType.BASE_NODE in pack_b.labels
+                    and intersects(
+                        pack_a.get("marketplaces"), pack_b.get("marketplaces")
+                    )
+                    and pack_a is not pack_b
+                    and pack_a.get("excluded_dependencies") is not None
+                    and pack_b.get("object_id") is not None
+                    and pack_b.get("object_id")
+                    not in pack_a.get("excluded_dependencies")
+                    and pack_a.get("name") is not None
+                    and pack_a.get("name") not in IGNORED_PACKS_IN_DEPENDENCY_CALC
+                    and pack_b.get("name") is not None
+                    and pack_b.get("name") not in IGNORED_PACKS_IN_DEPENDENCY_CALC
+                ):
+                    continue
+                relationships, created = store.merge_relationship(
+                    RelationshipType.DEPENDS_ON, pack_a, pack_b
+                )
+                for dep in relationships:
+                    if created:
+                        dep.set("is_test", a.get("is_test"))
+                        dep.set("from_metadata", False)
+                        dep.set("mandatorily", r.get("mandatorily"))
+                    else:
+                        dep.set("is_test", and_(dep.get("is_test"), a.get("is_test")))
+                        if not dep.get("from_metadata"):
+                            dep.set(
+                                "mandatorily",
+                                or_(r.get("mandatorily"), dep.get("mandatorily")),
+                            )
+                outputs.setdefault(pack_a.get("object_id"), {}).setdefault(
+                    pack_b.get("object_id"), []
+                ).append(
+                    {
+                        "source": a.get("node_id"),
+                        "target": b.get("node_id"),
+                        "mandatorily": r.get("mandatorily"),
+                        "is_test": a.get("is_test"),
+                    }
+                )
+
+    if (artifacts_folder := os.getenv("ARTIFACTS_FOLDER")) and Path(
+        artifacts_folder
+    ).exists():
+        with open(f"{artifacts_folder}/depends_on.json", "w") as fp:
+            json.dump(outputs, fp, indent=4)
+    return outputs
@@ -0,0 +1,345 @@
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.content_graph.common import (
+    CONTENT_PRIVATE_ITEMS,
+    ContentType,
+    RelationshipType,
+    get_server_content_items,
+)
+from demisto_sdk.commands.content_graph.interface.memory.queries.common import (
+    matches_keys,
+)
+from demisto_sdk.commands.content_graph.interface.memory.store import (
+    GraphStore,
+    Node,
+)
+
+PRIMITIVE_TYPES = (str, bool, Path, int, float)
+
+
+def _items_in_pack(store: GraphStore, pack: Node) -> List[Node]:
+    return [r.start_node for r in store.incoming(pack, RelationshipType.IN_PACK)]
+
+
+def _commands_of(store: GraphStore, node: Node) -> List[Node]:
+    return [r.end_node for r in store.outgoing(node, RelationshipType.HAS_COMMAND)]
+
+
+def get_relationships_to_preserve(
+    store: GraphStore,
+    pack_ids: List[str],
+) -> List[Dict[str, Any]]:
+    """
+    Get the relationships to preserve before removing packs, i.e., relationships from nodes outside the packs
+    to the packs, their content items and their commands.
+    """
+    rows: Dict[str, Dict[str, Any]] = {}
+
+    def preserve(target: Node, pack: Node) -> None:
+        for relationship in store.incoming(target):
+            source = relationship.start_node
+            if relationship.element_id in rows or store.has_relationship(
+                source, pack, RelationshipType.IN_PACK
+            ):
+                continue
+            rows[relationship.element_id] = {
+                "source_id": source.element_id,
+                "source": dict(source.properties),
+                "r_type": relationship.type,
+                "r_properties": dict(relationship.properties),
+                "target": dict(target.properties),
+            }
+
+    for pack_id in pack_ids:
+        for pack in store.find_nodes(object_id=pack_id):
+            for content_item in _items_in_pack(store, pack):
+                preserve(content_item, pack)
+                for command in _commands_of(store, content_item):
+                    preserve(command, pack)
+            preserve(pack, pack)
+    return list(rows.values())
+
+
+def remove_packs_before_creation(
+    store: GraphStore,
+    pack_ids: List[str],
+) -> None:
+    packs = [
+        pack for pack_id in pack_ids for pack in store.find_nodes(object_id=pack_id)
+    ]
+    # Removes packs commands before recreating them, unless they are commands of integrations of other packs
+    commands = {
+        command.element_id: command
+        for pack in packs
+        for content_item in _items_in_pack(store, pack)
+        for command in _commands_of(store, content_item)
+    }
+    for command in commands.values():
+        if not any(
+            other_pack.get("object_id") not in pack_ids
+            for relationship in store.incoming(command, RelationshipType.HAS_COMMAND)
+            for other_pack in (
+                r.end_node
+                for r in store.outgoing(
+                    relationship.start_node, RelationshipType.IN_PACK
+                )
+            )
+        ):
+            store.delete_node(command)
+    # Removes packs and their content items before recreating them
+    for pack in packs:
+        if content_items := _items_in_pack(store, pack):
+            for content_item in content_items:
+                store.delete_node(content_item)
+            store.delete_node(pack)
+
+
+def remove_content_items(store: GraphStore, keys: List[str]) -> None:
+    """Removes content items whose path is one of the given keys (or under them),
+    and their commands which are not used by any other integration."""
+    content_items = [
+        node
+        for node in store.candidates([ContentType.BASE_NODE])
+        if matches_keys(node, keys)
+    ]
+    for content_item in content_items:
+        for command in _commands_of(store, content_item):
+            if all(
+                matches_keys(r.start_node, keys)
+                for r in store.incoming(command, RelationshipType.HAS_COMMAND)
+            ):
+                store.delete_node(command)
+    for content_item in content_items:
+        store.delete_node(content_item)
+
+
+def get_content_items_relationships_to_preserve(
+    store: GraphStore, keys: List[str], reparsed_keys: List[str]
+) -> List[Dict[str, Any]]:
+    """
+    Get the relationships to preserve before removing the content items whose path is one of the given keys,
+    i.e., relationships to them (and to their removed commands) from nodes which are not reparsed
+    """
+    rows: Dict[str, Dict[str, Any]] = {}
+
+    def preserve(target: Node) -> None:
+        for relationship in store.incoming(target):
+            source = relationship.start_node
+            if matches_keys(source, reparsed_keys):
+                continue
+            rows[relationship.element_id] = {
+                "source_id": source.element_id,
+                "source": dict(source.properties),
+                "r_type": relationship.type,
+                "r_properties": dict(relationship.properties),
+                "target": dict(target.properties),
+            }
+
+    for content_item in store.candidates([ContentType.BASE_NODE]):
+        if not matches_keys(content_item, keys):
+            continue
+        preserve(content_item)
+        for command in _commands_of(store, content_item):
+            if all(
+                matches_keys(r.start_node, keys)
+                for r in store.incoming(command, RelationshipType.HAS_COMMAND)
+            ):
+                preserve(command)
+    return list(rows.values())
+
+
+def update_nodes(store: GraphStore, data: List[Dict[str, Any]]) -> None:
+    """Overrides existing nodes, matched by their content type and path."""
+    nodes_count = 0
+    for item in data:
+        for node in store.candidates([ContentType.BASE_NODE]):
+            if node.get("content_type") == item["node"].get(
+                "content_type"
+            ) and matches_keys(node, [item["key"]]):
+                store.set_properties(node, {**item["node"], "not_in_repository": False})
+                nodes_count += 1
+    logger.debug(f"Updated {nodes_count} nodes.")
+
+
+def return_preserved_relationships(
+    store: GraphStore, rels_to_preserve: List[Dict[str, Any]]
+) -> None:
+    """We search for source nodes which are in the preserved relationships, and they are the same nodes (same object_id and content_type)"""
+    for rel_data in rels_to_preserve:
+        source = store.nodes.get(rel_data["source_id"])
+        if (
+            not source
+            or source.get("object_id") != rel_data["source"].get("object_id")
+            or source.get("content_type") != rel_data["source"].get("content_type")
+        ):
+            continue
+        for target in store.find_nodes(
+            [ContentType.BASE_NODE],
+            object_id=rel_data["target"].get("object_id"),
+            content_type=rel_data["target"].get("content_type"),
+        ):
+            store.create_relationship(
+                rel_data["r_type"], source, target, rel_data["r_properties"]
+            )
+
+
+def return_content_items_preserved_relationships(
+    store: GraphStore, rels_to_preserve: List[Dict[str, Any]]
+) -> None:
+    """Returns the preserved relationships to the recreated content items (same object_id and content_type).
+    Relationships to content items which were not recreated are returned to a node which is not in the repository,
+    same as relationships to content items which are missing when the graph is created."""
+    for rel_data in rels_to_preserve:
+        source = store.nodes.get(rel_data["source_id"])
+        if (
+            not source
+            or source.get("object_id") != rel_data["source"].get("object_id")
+            or source.get("content_type") != rel_data["source"].get("content_type")
+        ):
+            continue
+        target_data = rel_data["target"]
+        labels = [target_data.get("content_type"), ContentType.BASE_NODE]
+        identifiers = {
+            "object_id": target_data.get("object_id"),
+            "content_type": target_data.get("content_type"),
+        }
+        targets = store.find_nodes(labels, **identifiers) or [
+            store.create_node(
+                labels,
+                {
+                    **identifiers,
+                    "not_in_repository": True,
+                    "name": target_data.get("name") or target_data.get("object_id"),
+                },
+            )
+        ]
+        for target in targets:
+            store.create_relationship(
+                rel_data["r_type"], source, target, rel_data["r_properties"]
+            )
+
+
+def create_nodes(
+    store: GraphStore,
+    nodes: Dict[ContentType, List[Dict[str, Any]]],
+) -> None:
+    for content_type, data in nodes.items():
+        create_nodes_by_type(store, content_type, data)
+
+
+def remove_nodes(store: GraphStore, content_type_to_identifiers: dict) -> None:
+    for content_type, content_items_identifiers in content_type_to_identifiers.items():
+        if content_type in [ContentType.COMMAND, ContentType.SCRIPT]:
+            label = ContentType.COMMAND_OR_SCRIPT
+        else:
+            label = ContentType.BASE_NODE
+        identifiers = {c.lower() for c in content_items_identifiers}
+        for node in list(store.nodes.values()):
+            if (
+                (label in node.labels or node.get("content_type") == content_type)
+                and node.get("not_in_repository") is True
+                and any(
+                    isinstance(identifier, str) and identifier.lower() in identifiers
+                    for identifier in (node.get("object_id"), node.get("name"))
+                )
+            ):
+                store.delete_node(node)
+
+
+def remove_server_nodes(store: GraphStore) -> None:
+    remove_nodes(store, get_server_content_items())
+
+
+def remove_content_private_nodes(store: GraphStore) -> None:
+    remove_nodes(store, CONTENT_PRIVATE_ITEMS)
+
+
+def create_nodes_by_type(
+    store: GraphStore,
+    content_type: ContentType,
+    data: List[Dict[str, Any]],
+) -> None:
+    labels = content_type.labels
+    is_content_item = content_type in ContentType.content_items()
+    for node_data in data:
+        properties = {**node_data, "not_in_repository": False}
+        if is_content_item:
+            store.create_node(labels, properties)
+        elif nodes := store.find_nodes(labels, object_id=node_data.get("object_id")):
+            # override existing data
+            for node in nodes:
+                store.set_properties(node, properties)
+        else:
+            store.create_node(labels, properties)
+    logger.debug(f"Created {len(data)} nodes of type {content_type}.")
+
+
+def _matches_property(node: Node, key: str, value: Any) -> bool:
+    node_value = node.get(key)
+    if isinstance(value, PRIMITIVE_TYPES):
+        if isinstance(node_value, list):
+            return str(value) in node_value
+        return node_value is not None and node_value == value
+    if isinstance(value, Iterable):
+        return node_value in [str(v) if isinstance(v, Path) else v for v in value]
+    return False
+
+
+def _match(
+    store: GraphStore,
+    marketplace: MarketplaceVersions = None,
+    content_type: ContentType = ContentType.BASE_NODE,
+    ids_list: Optional[Iterable[str]] = None,
+    **properties,
+) -> List[Node]:
+    """Matches nodes in the graph.
+
+    Args:
+        store: The graph store.
+        marketplace: The marketplace to filter by.
+        content_type: The content type to filter by.
+        ids_list: A list of element ids to filter by.
+
+    Returns:
+        List[Node]: list of nodes.
+    """
+    if marketplace:
+        properties["marketplaces"] = marketplace.value
+    properties = {
+        k: str(v) if isinstance(v, Path) else v for k, v in properties.items()
+    }
+    ids = set(ids_list) if ids_list else None
+    return [
+        node
+        for node in store.candidates([content_type], properties)
+        if content_type in node.labels
+        and (ids is None or node.element_id in ids)
+        and all(_matches_property(node, k, v) for k, v in properties.items())
+    ]
+
+
+def get_schema(store: GraphStore) -> dict:
+    """Get the schema of the graph, i.e., the properties of every node label and relationship type."""
+    schema: Dict[str, set] = {}
+    for node in store.nodes.values():
+        for label in node.labels:
+            schema.setdefault(label, set()).update(node.keys())
+    for relationship in store.relationships.values():
+        schema.setdefault(relationship.type, set()).update(relationship.keys())
+    return {label: sorted(properties) for label, properties in schema.items()}
+
+
+def delete_all_graph_nodes(store: GraphStore) -> None:
+    store.clear()
+
+
+def remove_empty_properties(store: GraphStore) -> None:
+    """Removes string properties with empty values ("") from nodes"""
+    for node in store.nodes.values():
+        if any(value == "" for value in node.properties.values()):
+            store.set_properties(
+                node, {k: v for k, v in node.properties.items() if v != ""}
+            )
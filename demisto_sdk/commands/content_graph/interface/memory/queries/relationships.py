@@ -0,0 +1,538 @@
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.content_graph.common import (
+    ContentType,
+    Neo4jRelationshipResult,
+    RelationshipType,
+)
+from demisto_sdk.commands.content_graph.interface.memory.queries.common import (
+    in_list,
+    matches_keys,
+    or_,
+    to_relationship_results,
+)
+from demisto_sdk.commands.content_graph.interface.memory.store import (
+    GraphStore,
+    Node,
+    Relationship,
+)
+
+USES_TARGET_IDENTIFIERS = {
+    RelationshipType.USES_BY_ID: "object_id",
+    RelationshipType.USES_BY_NAME: "name",
+    RelationshipType.USES_BY_CLI_NAME: "cli_name",
+    RelationshipType.USES_COMMAND_OR_SCRIPT: "object_id",
+    RelationshipType.USES_PLAYBOOK: "name",
+}
+
+
+def match_source(store: GraphStore, rel_data: Dict[str, Any]) -> List[Node]:
+    return store.find_nodes(
+        [ContentType.BASE_NODE],
+        object_id=rel_data.get("source_id"),
+        content_type=rel_data.get("source_type"),
+        fromversion=rel_data.get("source_fromversion"),
+        marketplaces=rel_data.get("source_marketplaces"),
+    )
+
+
+def create_has_command_relationships(
+    store: GraphStore, data: List[Dict[str, Any]]
+) -> None:
+    """Creates relationships between integrations and their commands.
+    Note: two command nodes cannot have the same name.
+    """
+    for rel_data in data:
+        for integration in store.find_nodes(
+            [ContentType.INTEGRATION],
+            object_id=rel_data.get("source_id"),
+            content_type=rel_data.get("source_type"),
+            fromversion=rel_data.get("source_fromversion"),
+            marketplaces=rel_data.get("source_marketplaces"),
+        ):
+            source_marketplaces = list(rel_data.get("source_marketplaces") or [])
+            commands = store.find_nodes(
+                [ContentType.COMMAND],
+                object_id=rel_data.get("target"),
+                content_type=rel_data.get("target_type"),
+            )
+            if not commands:
+                # If created, add its name and marketplaces based on the integration's property
+                commands = [
+                    store.create_node(
+                        ContentType.COMMAND.labels,
+                        {
+                            "object_id": rel_data.get("target"),
+                            "content_type": rel_data.get("target_type"),
+                            "marketplaces": source_marketplaces,
+                            "name": rel_data.get("name"),
+                            "not_in_repository": False,
+                        },
+                    )
+                ]
+            else:
+                # Otherwize, add the integration's marketplaces to its marketplaces property
+                for command in commands:
+                    marketplaces = list(command.get("marketplaces") or [])
+                    store.update_properties(
+                        command,
+                        {
+                            "marketplaces": marketplaces
+                            + [
+                                mp
+                                for mp in source_marketplaces
+                                if mp not in marketplaces
+                            ]
+                        },
+                    )
+            for command in commands:
+                store.merge_relationship(
+                    RelationshipType.HAS_COMMAND,
+                    integration,
+                    command,
+                    {
+                        "deprecated": rel_data.get("deprecated"),
+                        "description": rel_data.get("description"),
+                        "quickaction": rel_data.get("quickaction"),
+                    },
+                )
+
+
+def create_uses_relationships(
+    store: GraphStore,
+    data: List[Dict[str, Any]],
+    target_identifier: str = "object_id",
+) -> None:
+    """Creates USES relationships between parsed nodes.
+    Note: if a target node is created, it means the node does not exist in the repository.
+    """
+    for rel_data in data:
+        target_type = rel_data.get("target_type")
+        target_id = rel_data.get("target")
+        for source in match_source(store, rel_data):
+            targets = store.find_nodes(
+                [target_type, ContentType.BASE_NODE], **{target_identifier: target_id}
+            )
+            if not targets:
+                targets = [
+                    store.create_node(
+                        [target_type, ContentType.BASE_NODE],
+                        {
+                            target_identifier: target_id,
+                            "not_in_repository": True,
+                            "object_id": target_id,
+                            "name": target_id,
+                            "cli_name": target_id,
+                            "content_type": target_type,
+                        },
+                    )
+                ]
+            # If the target node is not in the repository, we create the relationship only if there is no equivalent target in the repository
+            # If the target node is in the repository, we create the relationship anyway
+            existing_target = store.find_nodes(
+                [target_type],
+                **{target_identifier: target_id, "not_in_repository": False},
+            )
+            for target in targets:
+                if existing_target and target.get("not_in_repository") is not False:
+                    continue
+                relationships, created = store.merge_relationship(
+                    RelationshipType.USES, source, target
+                )
+                for relationship in relationships:
+                    relationship.set(
+                        "mandatorily",
+                        rel_data.get("mandatorily")
+                        if created
+                        else or_(
+                            relationship.get("mandatorily"), rel_data.get("mandatorily")
+                        ),
+                    )
+
+
+def update_alert_to_incident(store: GraphStore) -> None:
+    """Update USES relationships when the source node contains "alert" in its ID.
+    Relationships are created in our repository to items that do not yet exist with the expected names.
+    Since the item names are adjusted during upload (e.g., "incident" might be declared as "alert" in the marketplace),
+    the target node is replaced with the correct item in the repository, which has "incident" instead of "alert".
+    """
+    for relationship in list(store.iter_relationships(RelationshipType.USES)):
+        source, target = relationship.start_node, relationship.end_node
+        target_id = target.get("object_id")
+        source_marketplaces = source.get("marketplaces") or []
+        if not (
+            isinstance(target_id, str)
+            and "alert" in target_id.lower()
+            and target.get("not_in_repository") is True
+            and MarketplaceVersions.MarketplaceV2 in source_marketplaces
+            and MarketplaceVersions.XSOAR not in source_marketplaces
+        ):
+            continue
+        incident_id = target_id.lower().replace("alert", "incident")
+        targets_incident = [
+            node
+            for node in store.nodes.values()
+            if isinstance(node.get("object_id"), str)
+            and node.get("object_id").lower() == incident_id
+            and node.get("not_in_repository") is False
+            and target.get("content_type") in node.labels
+            and MarketplaceVersions.MarketplaceV2 in (node.get("marketplaces") or [])
+            and MarketplaceVersions.XSOAR in (node.get("marketplaces") or [])
+        ]
+        if not targets_incident:
+            continue
+        for target_incident in targets_incident:
+            store.create_relationship(
+                RelationshipType.USES,
+                source,
+                target_incident,
+                {"mandatorily": relationship.get("mandatorily")},
+            )
+        # delete the old relationship, and the old target node once it is not used anymore
+        store.delete_relationship(relationship)
+        if not store.incoming(target) and not store.outgoing(target):
+            store.delete_node(target)
+
+
+def create_in_pack_relationships(store: GraphStore, data: List[Dict[str, Any]]) -> None:
+    """Creates IN_PACK relationships between content items and their packs."""
+    for rel_data in data:
+        for content_item in match_source(store, rel_data):
+            for pack in store.find_nodes(
+                [ContentType.PACK], object_id=rel_data.get("target")
+            ):
+                store.merge_relationship(RelationshipType.IN_PACK, content_item, pack)
+
+
+def create_tested_by_relationships(
+    store: GraphStore, data: List[Dict[str, Any]]
+) -> None:
+    """Creates TESTED_BY relationships between content items and their tests."""
+    for rel_data in data:
+        for content_item in match_source(store, rel_data):
+            test_playbooks = store.find_nodes(
+                [ContentType.TEST_PLAYBOOK], object_id=rel_data.get("target")
+            ) or [
+                # If created, mark "not in repository" (all repository nodes were created already)
+                store.create_node(
+                    [ContentType.TEST_PLAYBOOK],
+                    {"object_id": rel_data.get("target"), "not_in_repository": True},
+                )
+            ]
+            for test_playbook in test_playbooks:
+                store.merge_relationship(
+                    RelationshipType.TESTED_BY, content_item, test_playbook
+                )
+
+
+def create_depends_on_relationships(
+    store: GraphStore, data: List[Dict[str, Any]]
+) -> None:
+    """Creates DEPENDS_ON relationships between packs, marked as "from_metadata"."""
+    for rel_data in data:
+        for source in store.find_nodes(
+            [ContentType.PACK], object_id=rel_data.get("source")
+        ):
+            for target in store.find_nodes(
+                [ContentType.PACK], object_id=rel_data.get("target")
+            ):
+                store.create_relationship(
+                    RelationshipType.DEPENDS_ON,
+                    source,
+                    target,
+                    {
+                        "mandatorily": rel_data.get("mandatorily"),
+                        "target_min_version": rel_data.get("target_min_version"),
+                        "from_metadata": True,
+                        "is_test": False,
+                    },
+                )
+
+
+def create_default_relationships(
+    store: GraphStore, relationship: RelationshipType, data: List[Dict[str, Any]]
+) -> None:
+    for rel_data in data:
+        for source in match_source(store, rel_data):
+            targets = store.find_nodes(
+                [ContentType.BASE_NODE], object_id=rel_data.get("target")
+            ) or [
+                store.create_node(
+                    [ContentType.BASE_NODE],
+                    {
+                        "not_in_repository": True,
+                        "object_id": rel_data.get("target"),
+                        "name": rel_data.get("target"),
+                    },
+                )
+            ]
+            for target in targets:
+                store.merge_relationship(relationship, source, target)
+
+
+def create_relationships(
+    store: GraphStore,
+    relationships: Dict[RelationshipType, List[Dict[str, Any]]],
+) -> None:
+    if relationships.get(RelationshipType.HAS_COMMAND):
+        data = relationships.pop(RelationshipType.HAS_COMMAND)
+        create_relationships_by_type(store, RelationshipType.HAS_COMMAND, data)
+
+    for relationship, data in relationships.items():
+        create_relationships_by_type(store, relationship, data)
+
+    update_alert_to_incident(store)
+
+
+def remove_outgoing_relationships(store: GraphStore, keys: List[str]) -> None:
+    """Removes the outgoing relationships of the given content items"""
+    for node in list(store.candidates([ContentType.BASE_NODE])):
+        if matches_keys(node, keys):
+            for relationship in store.outgoing(node):
+                store.delete_relationship(relationship)
+
+
+def create_relationships_by_type(
+    store: GraphStore,
+    relationship: RelationshipType,
+    data: List[Dict[str, Any]],
+) -> None:
+    if relationship == RelationshipType.HAS_COMMAND:
+        create_has_command_relationships(store, data)
+    elif relationship in USES_TARGET_IDENTIFIERS:
+        create_uses_relationships(
+            store, data, target_identifier=USES_TARGET_IDENTIFIERS[relationship]
+        )
+    elif relationship == RelationshipType.IN_PACK:
+        create_in_pack_relationships(store, data)
+    elif relationship == RelationshipType.TESTED_BY:
+        create_tested_by_relationships(store, data)
+    elif relationship == RelationshipType.DEPENDS_ON:
+        create_depends_on_relationships(store, data)
+    else:
+        create_default_relationships(store, relationship, data)
+    logger.debug(f"Merged relationships of type {relationship}.")
+
+
+def _match_relationships(
+    store: GraphStore,
+    ids_list: List[str],
+    marketplace: MarketplaceVersions = None,
+) -> Dict[str, Neo4jRelationshipResult]:
+    """Match the relationships (of both directions) of the given ids list.
+
+    Args:
+        store (GraphStore): The graph store.
+        ids_list (List[str]): The element ids list to filter by
+        marketplace (MarketplaceVersions, optional): The marketplace to filter by. Defaults to None.
+
+    Returns:
+        Dict[str, Neo4jRelationshipResult]: Dictionary of element ids to Neo4jRelationshipResult
+    """
+
+    def is_in_marketplace(node: Node) -> bool:
+        return not marketplace or in_list(marketplace, node.get("marketplaces"))
+
+    rows = []
+    for node_id in ids_list or []:
+        if not (node_from := store.nodes.get(node_id)) or not is_in_marketplace(
+            node_from
+        ):
+            continue
+        for relationship in store.outgoing(node_from):
+            if is_in_marketplace(relationship.end_node):
+                rows.append((node_from, relationship, relationship.end_node))
+        for relationship in store.incoming(node_from):
+            if is_in_marketplace(relationship.start_node):
+                rows.append((node_from, relationship, relationship.start_node))
+    return to_relationship_results(rows)
+
+
+def _iter_paths(
+    store: GraphStore,
+    nodes: List[Node],
+    relationships: List[Relationship],
+    relationship_type: RelationshipType,
+    depth: int,
+    reverse: bool,
+) -> Iterator[Tuple[List[Node], List[Relationship]]]:
+    """Expands the given path by a relationship type, up to the given depth, without visiting a node twice.
+    Same as `apoc.path.expandConfig` with a "NODE_PATH" uniqueness.
+    """
+    if len(relationships) >= depth:
+        return
+    current = nodes[-1]
+    for relationship in (
+        store.incoming(current, relationship_type)
+        if reverse
+        else store.outgoing(current, relationship_type)
+    ):
+        next_node = relationship.start_node if reverse else relationship.end_node
+        if any(node is next_node for node in nodes):
+            continue
+        path = (nodes + [next_node], relationships + [relationship])
+        yield path
+        yield from _iter_paths(store, *path, relationship_type, depth, reverse)
+
+
+def _node_path(node: Node) -> Dict[str, Any]:
+    return {
+        "path": node.get("path"),
+        "name": node.get("name"),
+        "object_id": node.get("object_id"),
+        "content_type": node.get("content_type"),
+    }
+
+
+def _get_relationships_by_path(
+    store: GraphStore,
+    path: Path,
+    relationship: RelationshipType,
+    content_type: ContentType,
+    depth: int,
+    marketplace: MarketplaceVersions,
+    mandatory_only: bool,
+    include_tests: bool,
+    include_deprecated: bool,
+    include_hidden: bool,
+    is_source: bool,
+) -> List[Dict[str, Any]]:
+    """Returns all paths to (for sources) or from (for targets) a given node by relationship type and depth."""
+    results: Dict[str, Dict[str, Any]] = {}
+    for start in store.find_nodes(path=str(path)):
+        for nodes, rels in _iter_paths(
+            store, [start], [], relationship, depth, reverse=is_source
+        ):
+            if content_type not in nodes[-1].labels:
+                continue
+            if is_source:
+                # the paths are expanded in reversed order, so we fix this here:
+                nodes, rels = nodes[::-1], rels[::-1]
+                node = nodes[0]
+            else:
+                node = nodes[-1]
+            mandatorily = (
+                True
+                if all(r.get("mandatorily") is True for r in rels)
+                else False
+                if any(r.get("mandatorily") is not None for r in rels)
+                else None
+            )
+            is_test = any(r.get("is_test") is True for r in rels)
+            if (
+                node.get("path") is None
+                or not all(in_list(marketplace, n.get("marketplaces")) for n in nodes)
+                or (not include_tests and is_test)
+                or (
+                    not include_deprecated
+                    and any(n.get("deprecated") is True for n in nodes)
+                )
+                or (not include_hidden and any(n.get("hidden") is True for n in nodes))
+                or (mandatory_only and mandatorily is not True)
+            ):
+                continue
+            path_nodes = [_node_path(n) for n in nodes]
+            full_path: List[Dict[str, Any]] = [path_nodes[0]]
+            for rel, path_node in zip(rels, path_nodes[1:]):
+                full_path.extend((dict(rel.properties), path_node))
+            result = results.setdefault(
+                node.element_id,
+                {
+                    "object_id": node.get("object_id"),
+                    "name": node.get("name"),
+                    "content_type": node.get("content_type"),
+                    "filepath": node.get("path"),
+                    "is_source": is_source,
+                    "paths": [],
+                    "minDepth": len(rels),
+                },
+            )
+            result["minDepth"] = min(result["minDepth"], len(rels))
+            result["paths"].append(
+                {
+                    "path": full_path,
+                    "mandatorily": mandatorily,
+                    "depth": len(rels),
+                    "is_test": is_test,
+                }
+            )
+    for result in results.values():
+        paths_mandatorily = [p["mandatorily"] for p in result["paths"]]
+        result["mandatorily"] = (
+            True
+            if any(paths_mandatorily)
+            else False
+            if all(m is not None for m in paths_mandatorily)
+            else None
+        )
+    return sorted(
+        results.values(),
+        key=lambda r: (
+            r["content_type"] is None,
+            r["content_type"] or "",
+            r["object_id"] is None,
+            r["object_id"] or "",
+        ),
+    )
+
+
+def get_sources_by_path(
+    store: GraphStore,
+    path: Path,
+    relationship: RelationshipType,
+    content_type: ContentType,
+    depth: int,
+    marketplace: MarketplaceVersions,
+    mandatory_only: bool,
+    include_tests: bool,
+    include_deprecated: bool,
+    include_hidden: bool,
+) -> List[Dict[str, Any]]:
+    return _get_relationships_by_path(
+        store,
+        path,
+        relationship,
+        content_type,
+        depth,
+        marketplace,
+        mandatory_only,
+        include_tests,
+        include_deprecated,
+        include_hidden,
+        is_source=True,
+    )
+
+
+def get_targets_by_path(
+    store: GraphStore,
+    path: Path,
+    relationship: RelationshipType,
+    content_type: ContentType,
+    depth: int,
+    marketplace: MarketplaceVersions,
+    mandatory_only: bool,
+    include_tests: bool,
+    include_deprecated: bool,
+    include_hidden: bool,
+) -> List[Dict[str, Any]]:
+    return _get_relationships_by_path(
+        store,
+        path,
+        relationship,
+        content_type,
+        depth,
+        marketplace,
+        mandatory_only,
+        include_tests,
+        include_deprecated,
+        include_hidden,
+        is_source=False,
+    )
+
+
+def delete_all_graph_relationships(store: GraphStore) -> None:
+    for relationship in list(store.relationships.values()):
+        store.delete_relationship(relationship)
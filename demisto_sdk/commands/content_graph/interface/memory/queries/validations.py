@@ -0,0 +1,402 @@
+from typing import Dict, Iterator, List, Tuple
+
+from demisto_sdk.commands.common.constants import (
+    DEFAULT_CONTENT_ITEM_FROM_VERSION,
+    GENERAL_DEFAULT_FROMVERSION,
+    MarketplaceVersions,
+)
+from demisto_sdk.commands.common.tools import replace_alert_to_incident
+from demisto_sdk.commands.content_graph.common import (
+    ContentType,
+    Neo4jRelationshipResult,
+    RelationshipType,
+)
+from demisto_sdk.commands.content_graph.interface.memory.queries.common import (
+    in_list,
+    is_false,
+    is_subset,
+    is_target_available,
+    to_relationship_results,
+    version_le,
+    version_lt,
+)
+from demisto_sdk.commands.content_graph.interface.memory.store import (
+    GraphStore,
+    Node,
+    Relationship,
+)
+
+
+def _iter_uses(
+    store: GraphStore, mandatorily_only: bool = False
+) -> Iterator[Tuple[Node, Relationship, Node]]:
+    for relationship in store.iter_relationships(RelationshipType.USES):
+        if mandatorily_only and relationship.get("mandatorily") is not True:
+            continue
+        yield relationship.start_node, relationship, relationship.end_node
+
+
+def _uses_other_version(
+    store: GraphStore,
+    source: Node,
+    target: Node,
+    is_valid_version: callable,  # type: ignore[valid-type]
+) -> bool:
+    """Whether all the other versions of the target (same id and content type) which are valid for the source
+    are mandatorily used by the source as well, i.e., the usage of the given target version should not be reported.
+    Returns False when there are no valid versions (the usage should be reported).
+    """
+    other_versions = [
+        node
+        for node in store.find_nodes(
+            object_id=target.get("object_id"), content_type=target.get("content_type")
+        )
+        if node is not target and is_valid_version(node)
+    ]
+    return bool(other_versions) and all(
+        any(
+            r.end_node is other and r.get("mandatorily") is True
+            for r in store.outgoing(source, RelationshipType.USES)
+        )
+        for other in other_versions
+    )
+
+
+def validate_unknown_content(
+    store: GraphStore, file_paths: List[str]
+) -> Dict[str, Neo4jRelationshipResult]:
+    """Returns all ids used in the provided files that are missing from the repo.
+
+    Args:
+        store: The graph store.
+        file_paths: The file paths to check
+    Return:
+        All content ids used in the provided file paths that are missing from the repo.
+    """
+    return to_relationship_results(
+        (source, r, target)
+        for source, r, target in _iter_uses(store)
+        if is_false(source, "deprecated")
+        and target.get("not_in_repository") is True
+        and (not file_paths or source.get("path") in file_paths)
+    )
+
+
+def validate_fromversion(
+    store: GraphStore, file_paths: List[str], for_supported_versions: bool
+) -> Dict[str, Neo4jRelationshipResult]:
+    """Returns all the USES relationships where the target's fromversion is higher than the source's."""
+
+    def is_reported_version(target: Node) -> bool:
+        if for_supported_versions:
+            return version_le(GENERAL_DEFAULT_FROMVERSION, target.get("fromversion"))
+        return version_lt(target.get("fromversion"), GENERAL_DEFAULT_FROMVERSION)
+
+    return to_relationship_results(
+        (source, r, target)
+        for source, r, target in _iter_uses(store, mandatorily_only=True)
+        if is_false(source, "deprecated")
+        and is_false(source, "is_test")
+        and version_lt(source.get("fromversion"), target.get("fromversion"))
+        and is_reported_version(target)
+        # skips types with no "fromversion"
+        and target.get("fromversion") != DEFAULT_CONTENT_ITEM_FROM_VERSION
+        and (
+            not file_paths
+            or source.get("path") in file_paths
+            or target.get("path") in file_paths
+        )
+        and not _uses_other_version(
+            store,
+            source,
+            target,
+            lambda other: version_le(
+                other.get("fromversion"), source.get("fromversion")
+            ),
+        )
+    )
+
+
+def validate_toversion(
+    store: GraphStore, file_paths: List[str], for_supported_versions: bool
+) -> Dict[str, Neo4jRelationshipResult]:
+    """Returns all the USES relationships where the target's toversion is lower than the source's."""
+
+    def is_reported_version(source: Node) -> bool:
+        if for_supported_versions:
+            return version_le(GENERAL_DEFAULT_FROMVERSION, source.get("toversion"))
+        return version_lt(source.get("toversion"), GENERAL_DEFAULT_FROMVERSION)
+
+    return to_relationship_results(
+        (source, r, target)
+        for source, r, target in _iter_uses(store, mandatorily_only=True)
+        if is_false(source, "deprecated")
+        and version_lt(target.get("toversion"), source.get("toversion"))
+        and is_reported_version(source)
+        and (
+            not file_paths
+            or source.get("path") in file_paths
+            or target.get("path") in file_paths
+        )
+        and not _uses_other_version(
+            store,
+            source,
+            target,
+            lambda other: version_le(source.get("toversion"), other.get("toversion")),
+        )
+    )
+
+
+def _collect_by(rows: List[Tuple[str, Node]]) -> List[Tuple[str, List[Node]]]:
+    """Groups (key, node) rows by their key, same as `RETURN key, collect(node)`."""
+    results: Dict[str, Dict[str, Node]] = {}
+    for key, node in rows:
+        results.setdefault(key, {})[node.element_id] = node
+    return [(key, list(nodes.values())) for key, nodes in results.items()]
+
+
+def get_items_using_deprecated(
+    store: GraphStore, file_paths: List[str]
+) -> List[Tuple[str, List[Node]]]:
+    return get_items_using_deprecated_commands(
+        store, file_paths
+    ) + get_items_using_deprecated_content_items(store, file_paths)
+
+
+def get_items_using_deprecated_commands(
+    store: GraphStore, file_paths: List[str]
+) -> List[Tuple[str, List[Node]]]:
+    """Returns all the items which use deprecated commands,
+    i.e., commands which are deprecated in an integration and are not implemented by any other integration."""
+    rows = []
+    for command in store.candidates([ContentType.COMMAND]):
+        has_command = [
+            r
+            for r in store.incoming(command, RelationshipType.HAS_COMMAND)
+            if ContentType.INTEGRATION in r.start_node.labels
+        ]
+        deprecated_in = {
+            r.start_node.element_id for r in has_command if r.get("deprecated") is True
+        }
+        implemented_in = {
+            r.start_node.element_id for r in has_command if is_false(r, "deprecated")
+        }
+        # the command is deprecated in an integration, and no other integration implements it
+        if not any(implemented_in <= {integration} for integration in deprecated_in):
+            continue
+        for relationship in store.incoming(command, RelationshipType.USES):
+            source = relationship.start_node
+            if (
+                is_false(source, "deprecated")
+                and is_false(source, "is_test")
+                and (not file_paths or source.get("path") in file_paths)
+            ):
+                rows.extend(
+                    (command.get("object_id"), source)
+                    for integration in deprecated_in
+                    if implemented_in <= {integration}
+                )
+    return _collect_by(rows)
+
+
+def get_items_using_deprecated_content_items(
+    store: GraphStore, file_paths: List[str]
+) -> List[Tuple[str, List[Node]]]:
+    """Returns all the items which use deprecated content items, not because of a command,
+    as commands have a dedicated query."""
+    rows = []
+    for source, _, deprecated in _iter_uses(store):
+        if not (
+            is_false(source, "deprecated")
+            and deprecated.get("deprecated") is True
+            and is_false(source, "is_test")
+            and (not file_paths or source.get("path") in file_paths)
+        ):
+            continue
+        deprecated_commands = {
+            r.end_node.element_id
+            for r in store.outgoing(deprecated, RelationshipType.HAS_COMMAND)
+        }
+        if any(
+            r.end_node.element_id in deprecated_commands
+            for r in store.outgoing(source, RelationshipType.USES)
+        ):
+            continue
+        rows.append((deprecated.get("object_id"), source))
+    return _collect_by(rows)
+
+
+def validate_marketplaces(
+    store: GraphStore, pack_ids: List[str]
+) -> Dict[str, Neo4jRelationshipResult]:
+    """Returns all the USES relationships where the target's marketplaces don't include all of the source's marketplaces."""
+
+    def pack_ids_of(node: Node) -> List[str]:
+        return [
+            r.end_node.get("object_id")
+            for r in store.outgoing(node, RelationshipType.IN_PACK)
+        ]
+
+    rows = []
+    for source, r, target in _iter_uses(store, mandatorily_only=True):
+        if not (
+            is_false(source, "deprecated")
+            and is_false(source, "is_test")
+            and not is_subset(source.get("marketplaces"), target.get("marketplaces"))
+        ):
+            continue
+        source_packs, target_packs = pack_ids_of(source), pack_ids_of(target)
+        if not source_packs or not target_packs:
+            continue
+        if pack_ids and not any(
+            pack_id in pack_ids for pack_id in source_packs + target_packs
+        ):
+            continue
+        if _uses_other_version(
+            store,
+            source,
+            target,
+            lambda other: is_subset(
+                source.get("marketplaces"), other.get("marketplaces")
+            ),
+        ):
+            continue
+        rows.append((source, r, target))
+    return to_relationship_results(rows)
+
+
+def validate_multiple_packs_with_same_display_name(
+    store: GraphStore, file_paths: List[str]
+) -> List[Tuple[str, List[str]]]:
+    """Returns all the packs that have the same name but different id"""
+    packs = store.candidates([ContentType.PACK])
+    results: Dict[str, List[str]] = {}
+    for a in packs:
+        if a.get("name") is None or (file_paths and a.get("path") not in file_paths):
+            continue
+        for b in packs:
+            if a is not b and a.get("name") == b.get("name"):
+                results.setdefault(a.get("object_id"), []).append(b.get("object_id"))
+    return list(results.items())
+
+
+def validate_multiple_script_with_same_name(
+    store: GraphStore, file_paths: List[str]
+) -> Dict[str, str]:
+    """Returns the scripts whose name with "alert" replaced by "incident" is a name of another script."""
+    scripts = store.candidates([ContentType.SCRIPT])
+    content_item_names_and_paths = {
+        # replace the name of the script.
+        replace_alert_to_incident(script.get("name")): script.get("path")
+        for script in scripts
+        if isinstance(script.get("name"), str)
+        and "alert" in script.get("name").lower()
+        and in_list(MarketplaceVersions.MarketplaceV2, script.get("marketplaces"))
+        and (not file_paths or script.get("path") in file_paths)
+    }
+    return {
+        script.get("name"): content_item_names_and_paths[script.get("name")]
+        for script in scripts
+        if script.get("name") in content_item_names_and_paths
+        and script.get("skip_prepare") is not None
+        and "script-name-incident-to-alert" not in script.get("skip_prepare")
+        and in_list(MarketplaceVersions.MarketplaceV2, script.get("marketplaces"))
+    }
+
+
+def validate_core_packs_dependencies(
+    store: GraphStore,
+    pack_ids: List[str],
+    marketplace: MarketplaceVersions,
+    core_pack_list: List[str],
+) -> Dict[str, Neo4jRelationshipResult]:
+    """Returns DEPENDS_ON relationships to packs which are not core packs"""
+    return to_relationship_results(
+        (pack1, r, r.end_node)
+        for pack_id in pack_ids
+        for pack1 in store.find_nodes(object_id=pack_id)
+        for r in store.outgoing(pack1, RelationshipType.DEPENDS_ON)
+        if r.get("mandatorily") is True
+        and is_false(r, "is_test")
+        and r.end_node.get("object_id") not in core_pack_list
+        and in_list(marketplace, pack1.get("marketplaces"))
+        and in_list(marketplace, r.end_node.get("marketplaces"))
+    )
+
+
+def validate_packs_with_hidden_mandatory_dependencies(
+    store: GraphStore,
+    pack_ids: List[str],
+) -> Dict[str, Neo4jRelationshipResult]:
+    """
+    Identifies non-hidden packs that have mandatory dependencies on hidden packs.
+    Excludes test relationships and deprecated packs.
+    Args:
+        store (GraphStore): The graph store.
+        pack_ids (List[str]): List of pack IDs to check.
+
+    Returns:
+        Dict[str, Neo4jRelationshipResult]: Dictionary of packs with hidden dependencies.
+    """
+    return to_relationship_results(
+        (pack, r, r.end_node)
+        for pack in store.candidates([ContentType.PACK])
+        if is_false(pack, "hidden")
+        for r in store.outgoing(pack, RelationshipType.DEPENDS_ON)
+        if ContentType.PACK in r.end_node.labels
+        and r.end_node.get("hidden") is True
+        and r.get("mandatorily") is True
+        and is_false(r, "is_test")
+        and (
+            not pack_ids
+            or pack.get("object_id") in pack_ids
+            or r.end_node.get("object_id") in pack_ids
+        )
+    )
+
+
+def validate_duplicate_ids(
+    store: GraphStore, file_paths: List[str]
+) -> List[Tuple[Node, List[Node]]]:
+    """Returns duplicate content items with same id"""
+    results = []
+    for content_item in list(store.nodes.values()):
+        if file_paths and content_item.get("path") not in file_paths:
+            continue
+        duplicates = [
+            node
+            for node in store.find_nodes(
+                object_id=content_item.get("object_id"),
+                content_type=content_item.get("content_type"),
+            )
+            if node is not content_item and is_target_available(content_item, node)
+        ]
+        if duplicates:
+            results.append((content_item, duplicates))
+    return results
+
+
+def validate_test_playbook_in_use(
+    store: GraphStore, test_playbook_ids: List[str], test_playbooks_ids_to_skip
+) -> List[Node]:
+    """Returns the test playbooks of xsoar supported packs which do not test any content item"""
+    return [
+        test_playbook
+        for test_playbook in store.candidates([ContentType.TEST_PLAYBOOK])
+        if ContentType.TEST_PLAYBOOK in test_playbook.labels
+        and (
+            not test_playbook_ids or test_playbook.get("object_id") in test_playbook_ids
+        )
+        and not store.incoming(test_playbook, RelationshipType.TESTED_BY)
+        and is_false(test_playbook, "deprecated")
+        and test_playbook.get("object_id") not in test_playbooks_ids_to_skip
+        and any(
+            ContentType.PACK in pack.labels
+            and pack.get("support") == "xsoar"
+            and is_false(pack, "deprecated")
+            for pack in (
+                r.end_node
+                for r in store.outgoing(test_playbook, RelationshipType.IN_PACK)
+            )
+        )
+    ]
@@ -0,0 +1,301 @@
+import itertools
+from collections import defaultdict
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    KeysView,
+    List,
+    Optional,
+    Tuple,
+)
+
+# Properties which nodes are looked up by, so they are indexed
+INDEXED_PROPERTIES = ("object_id", "name", "cli_name", "path")
+
+
+def _without_nulls(properties: Dict[str, Any]) -> Dict[str, Any]:
+    # Same as in Neo4j, setting a property to null removes it
+    return {key: value for key, value in properties.items() if value is not None}
+
+
+class Node:
+    """A node of the in-memory graph, which exposes the same interface as `neo4j.graph.Node`."""
+
+    __slots__ = ("element_id", "labels", "properties")
+
+    def __init__(self, element_id: str, labels: Iterable[str], properties: dict):
+        self.element_id = element_id
+        self.labels = frozenset(labels)
+        self.properties = properties
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.properties.get(key, default)
+
+    def keys(self) -> KeysView[str]:
+        return self.properties.keys()
+
+    def items(self):
+        return self.properties.items()
+
+    def __getitem__(self, key: str) -> Any:
+        return self.properties[key]
+
+    def __repr__(self) -> str:
+        return f"<Node element_id={self.element_id!r} labels={set(self.labels)!r}>"
+
+
+class Relationship:
+    """A relationship of the in-memory graph, which exposes the same interface as `neo4j.graph.Relationship`."""
+
+    __slots__ = ("element_id", "type", "start_node", "end_node", "properties")
+
+    def __init__(
+        self,
+        element_id: str,
+        type: str,
+        start_node: Node,
+        end_node: Node,
+        properties: dict,
+    ):
+        self.element_id = element_id
+        self.type = type
+        self.start_node = start_node
+        self.end_node = end_node
+        self.properties = properties
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.properties.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        if value is None:
+            self.properties.pop(key, None)
+        else:
+            self.properties[key] = value
+
+    def keys(self) -> KeysView[str]:
+        return self.properties.keys()
+
+    def items(self):
+        return self.properties.items()
+
+    def __getitem__(self, key: str) -> Any:
+        return self.properties[key]
+
+    def __repr__(self) -> str:
+        return (
+            f"<Relationship element_id={self.element_id!r} type={self.type!r} "
+            f"start={self.start_node.element_id!r} end={self.end_node.element_id!r}>"
+        )
+
+
+class GraphStore:
+    """An in-process labeled property graph.
+
+    Nodes are indexed by their labels and by `INDEXED_PROPERTIES`,
+    and relationships are kept in an adjacency index of the outgoing and incoming relationships of every node.
+    Nodes and relationships are kept in insertion order, so query results are deterministic.
+    """
+
+    def __init__(self) -> None:
+        self.nodes: Dict[str, Node] = {}
+        self.relationships: Dict[str, Relationship] = {}
+        self._outgoing: DefaultDict[str, Dict[str, Relationship]] = defaultdict(dict)
+        self._incoming: DefaultDict[str, Dict[str, Relationship]] = defaultdict(dict)
+        self._labels: DefaultDict[str, Dict[str, Node]] = defaultdict(dict)
+        self._index: Dict[str, DefaultDict[str, Dict[str, Node]]] = {
+            prop: defaultdict(dict) for prop in INDEXED_PROPERTIES
+        }
+        self._ids = itertools.count()
+
+    def clear(self) -> None:
+        self.__init__()  # type: ignore[misc]
+
+    def _index_node(self, node: Node) -> None:
+        for label in node.labels:
+            self._labels[label][node.element_id] = node
+        for prop, index in self._index.items():
+            if isinstance(value := node.properties.get(prop), str):
+                index[value][node.element_id] = node
+
+    def _unindex_node(self, node: Node) -> None:
+        for label in node.labels:
+            self._labels[label].pop(node.element_id, None)
+        for prop, index in self._index.items():
+            if isinstance(value := node.properties.get(prop), str):
+                index[value].pop(node.element_id, None)
+                if not index[value]:
+                    del index[value]
+
+    def create_node(self, labels: Iterable[str], properties: Dict[str, Any]) -> Node:
+        node = Node(f"n{next(self._ids)}", labels, _without_nulls(properties))
+        self.nodes[node.element_id] = node
+        self._index_node(node)
+        return node
+
+    def set_properties(self, node: Node, properties: Dict[str, Any]) -> None:
+        """Overrides all the node properties, same as `SET n = properties`."""
+        self._unindex_node(node)
+        node.properties = _without_nulls(properties)
+        self._index_node(node)
+
+    def update_properties(self, node: Node, properties: Dict[str, Any]) -> None:
+        """Updates the given node properties, same as `SET n += properties`."""
+        self.set_properties(node, {**node.properties, **properties})
+
+    def add_labels(self, node: Node, labels: Iterable[str]) -> None:
+        self._unindex_node(node)
+        node.labels = node.labels.union(labels)
+        self._index_node(node)
+
+    def delete_node(self, node: Node) -> None:
+        """Deletes a node together with its relationships, same as `DETACH DELETE n`."""
+        if node.element_id not in self.nodes:
+            return
+        for relationship in self.outgoing(node) + self.incoming(node):
+            self.delete_relationship(relationship)
+        self._unindex_node(node)
+        del self.nodes[node.element_id]
+        self._outgoing.pop(node.element_id, None)
+        self._incoming.pop(node.element_id, None)
+
+    def merge_nodes(self, node: Node, others: Iterable[Node]) -> None:
+        """Moves the relationships of the other nodes to the given node and deletes them,
+        then merges relationships of the same type between the same nodes, same as `apoc.refactor.mergeNodes`.
+        Merging the properties is up to the caller.
+        """
+        for other in others:
+            if other is node:
+                continue
+            self.add_labels(node, other.labels)
+            for relationship in self.outgoing(other):
+                end_node = (
+                    node if relationship.end_node is other else relationship.end_node
+                )
+                self.create_relationship(
+                    relationship.type, node, end_node, relationship.properties
+                )
+            for relationship in self.incoming(other):
+                if relationship.start_node is not other:
+                    self.create_relationship(
+                        relationship.type,
+                        relationship.start_node,
+                        node,
+                        relationship.properties,
+                    )
+            self.delete_node(other)
+        seen: Dict[Tuple[str, str, str], Relationship] = {}
+        for relationship in self.outgoing(node) + self.incoming(node):
+            key = (
+                relationship.type,
+                relationship.start_node.element_id,
+                relationship.end_node.element_id,
+            )
+            if relationship.element_id in {r.element_id for r in seen.values()}:
+                continue
+            if (merged := seen.get(key)) is None:
+                seen[key] = relationship
+                continue
+            for prop, value in relationship.items():
+                merged.properties.setdefault(prop, value)
+            self.delete_relationship(relationship)
+
+    def create_relationship(
+        self,
+        type: str,
+        start_node: Node,
+        end_node: Node,
+        properties: Optional[Dict[str, Any]] = None,
+    ) -> Relationship:
+        relationship = Relationship(
+            f"e{next(self._ids)}",
+            type,
+            start_node,
+            end_node,
+            _without_nulls(properties or {}),
+        )
+        self.relationships[relationship.element_id] = relationship
+        self._outgoing[start_node.element_id][relationship.element_id] = relationship
+        self._incoming[end_node.element_id][relationship.element_id] = relationship
+        return relationship
+
+    def delete_relationship(self, relationship: Relationship) -> None:
+        if self.relationships.pop(relationship.element_id, None) is None:
+            return
+        self._outgoing[relationship.start_node.element_id].pop(
+            relationship.element_id, None
+        )
+        self._incoming[relationship.end_node.element_id].pop(
+            relationship.element_id, None
+        )
+
+    def merge_relationship(
+        self,
+        type: str,
+        start_node: Node,
+        end_node: Node,
+        properties: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Relationship], bool]:
+        """Gets or creates a relationship, same as `MERGE (start)-[r:type {properties}]->(end)`.
+
+        Returns:
+            Tuple[List[Relationship], bool]: The matching relationships, and whether the relationship was created.
+        """
+        properties = properties or {}
+        relationships = [
+            relationship
+            for relationship in self.outgoing(start_node, type)
+            if relationship.end_node is end_node
+            and all(relationship.get(key) == value for key, value in properties.items())
+        ]
+        if relationships:
+            return relationships, False
+        return [self.create_relationship(type, start_node, end_node, properties)], True
+
+    def outgoing(self, node: Node, type: Optional[str] = None) -> List[Relationship]:
+        relationships = self._outgoing.get(node.element_id, {}).values()
+        return [r for r in relationships if type is None or r.type == type]
+
+    def incoming(self, node: Node, type: Optional[str] = None) -> List[Relationship]:
+        relationships = self._incoming.get(node.element_id, {}).values()
+        return [r for r in relationships if type is None or r.type == type]
+
+    def has_relationship(self, start_node: Node, end_node: Node, type: str) -> bool:
+        return any(r.end_node is end_node for r in self.outgoing(start_node, type))
+
+    def iter_relationships(self, type: Optional[str] = None) -> Iterator[Relationship]:
+        return (
+            r
+            for r in list(self.relationships.values())
+            if type is None or r.type == type
+        )
+
+    def candidates(
+        self, labels: Iterable[str] = (), properties: Optional[Dict[str, Any]] = None
+    ) -> Iterable[Node]:
+        """Returns the smallest indexed set of nodes which may match the given labels and properties."""
+        buckets: List[Iterable[Node]] = [
+            self._index[prop].get(value, {}).values()
+            for prop, value in (properties or {}).items()
+            if prop in self._index and isinstance(value, str)
+        ]
+        buckets.extend(self._labels.get(label, {}).values() for label in labels)
+        if not buckets:
+            return list(self.nodes.values())
+        return list(min(buckets, key=len))  # type: ignore[arg-type]
+
+    def find_nodes(self, labels: Iterable[str] = (), **properties) -> List[Node]:
+        """Returns the nodes with all the given labels and properties, same as `MATCH (n:labels {properties})`.
+        Same as in Neo4j, a null property value never matches.
+        """
+        labels = tuple(labels)
+        if any(value is None for value in properties.values()):
+            return []
+        return [
+            node
+            for node in self.candidates(labels, properties)
+            if node.labels.issuperset(labels)
+            and all(node.properties.get(k) == v for k, v in properties.items())
+        ]
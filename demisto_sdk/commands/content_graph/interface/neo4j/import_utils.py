@@ -1,13 +1,50 @@
-import xml.etree.ElementTree as ET
+import re
+from multiprocessing import Pool
 from pathlib import Path
 from typing import List, Optional, Set
 from zipfile import ZipFile
 
+from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.singleton import SingletonMeta
 from demisto_sdk.commands.content_graph.neo4j_service import get_neo4j_import_path
+from demisto_sdk.commands.content_graph.snapshot import get_snapshot_paths
 
 GRAPHML_FILE_SUFFIX = ".graphml"
+ID_REWRITE_CHUNK_SIZE = 1024 * 1024
+GRAPH_ELEMENT_TAG = re.compile(rb"<(?:node|edge)\s[^>]*>")
+GRAPH_ELEMENT_ID = re.compile(rb'\b(id|source|target)="([ne])([^"]*)"')
+
+
+def set_unique_ids(source: str, prefix: str) -> None:
+    """Prefixes the node and edge ids of a GraphML file (e.g., `n12` -> `n{prefix}12`).
+
+    The file is rewritten in a single streaming pass with constant memory use:
+    only the `id`, `source` and `target` attributes of the `node` and `edge` tags are changed,
+    and the rest of the file is copied as is.
+    """
+    prefix_bytes = prefix.encode()
+
+    def prefix_id(match: re.Match) -> bytes:
+        return match[1] + b'="' + match[2] + prefix_bytes + match[3] + b'"'
+
+    def rewrite_tag(match: re.Match) -> bytes:
+        return GRAPH_ELEMENT_ID.sub(prefix_id, match[0])
+
+    path = Path(source)
+    rewritten_path = path.with_name(f"{path.name}.tmp")
+    with open(path, "rb") as src, open(rewritten_path, "wb") as dst:
+        pending = b""
+        while chunk := src.read(ID_REWRITE_CHUNK_SIZE):
+            pending += chunk
+            # a tag may be split between chunks, so an unclosed tag is kept for the next chunk
+            split = pending.rfind(b"<")
+            if split == -1 or pending.find(b">", split) != -1:
+                split = len(pending)
+            dst.write(GRAPH_ELEMENT_TAG.sub(rewrite_tag, pending[:split]))
+            pending = pending[split:]
+        dst.write(GRAPH_ELEMENT_TAG.sub(rewrite_tag, pending))
+    rewritten_path.replace(path)
 
 
 class Neo4jImportHandler(metaclass=SingletonMeta):
@@ -35,40 +72,29 @@ class Neo4jImportHandler(metaclass=SingletonMeta):
             Path(file).unlink()
 
     def get_graphml_filenames(self) -> List[str]:
+        """Returns the GraphML files to import. A graph is exported as both a snapshot and a GraphML file
+        (for SDK versions which only import GraphML files), so the GraphML files which have a snapshot are skipped.
+        """
+        snapshot_names = {path.stem for path in self.get_snapshot_paths()}
         return [
             file.name
             for file in self.import_path.iterdir()
-            if file.suffix == GRAPHML_FILE_SUFFIX
+            if file.suffix == GRAPHML_FILE_SUFFIX and file.stem not in snapshot_names
         ]
 
+    def get_snapshot_paths(self) -> List[Path]:
+        return get_snapshot_paths(self.import_path)
+
     def ensure_data_uniqueness(self) -> None:
-        if len(sources := self._get_import_sources()) > 1:
-            for idx, source in enumerate(sources, 1):
-                self._set_unique_ids_for_source(source, str(idx))
+        if len(sources := sorted(self._get_import_sources())) > 1:
+            with Pool(processes=min(len(sources), cpu_count())) as pool:
+                pool.starmap(
+                    set_unique_ids,
+                    ((source, str(idx)) for idx, source in enumerate(sources, 1)),
+                )
 
     def _get_import_sources(self) -> Set[str]:
-        sources: Set[str] = set()
-        for filename in self.import_path.iterdir():
-            if filename.suffix == GRAPHML_FILE_SUFFIX:
-                sources.add(filename.as_posix())
-        return sources
-
-    def _set_unique_ids_for_source(self, source: str, prefix: str) -> None:
-        xml_namespace: str = "http://graphml.graphdrawing.org/xmlns"
-        ET.register_namespace("", xml_namespace)
-        # Load the graphml file
-        tree: ET.ElementTree = ET.parse(source)
-        root: ET.Element = tree.getroot()
-
-        # Set the prefix for each node
-        for node in root.findall(f".//{{{xml_namespace}}}node"):
-            node.attrib["id"] = f"n{prefix}{node.attrib['id'][1:]}"
-
-        # Set the prefix for each edge
-        for edge in root.findall(f".//{{{xml_namespace}}}edge"):
-            edge.attrib["id"] = f"e{prefix}{edge.attrib['id'][1:]}"
-            edge.attrib["source"] = f"n{prefix}{edge.attrib['source'][1:]}"
-            edge.attrib["target"] = f"n{prefix}{edge.attrib['target'][1:]}"
-
-        # Write the updated graphml file
-        tree.write(source)
+        return {
+            (self.import_path / filename).as_posix()
+            for filename in self.get_graphml_filenames()
+        }
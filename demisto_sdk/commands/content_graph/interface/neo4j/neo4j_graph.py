@@ -1,17 +1,31 @@
 import os
-from functools import lru_cache
-from multiprocessing import Pool
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
+from more_itertools import chunked
 from neo4j import Driver, GraphDatabase, Session, graph
 
 import demisto_sdk.commands.content_graph.neo4j_service as neo4j_service
-from demisto_sdk.commands.common.constants import MarketplaceVersions
-from demisto_sdk.commands.common.cpu_count import cpu_count
+from demisto_sdk.commands.common.constants import (
+    DEMISTO_SDK_GRAPH_NODES_CHUNK_SIZE,
+    DEMISTO_SDK_GRAPH_RELATIONSHIPS_CHUNK_SIZE,
+    MarketplaceVersions,
+)
 from demisto_sdk.commands.common.logger import logger
-from demisto_sdk.commands.common.tools import download_content_graph
+from demisto_sdk.commands.common.parallel import parallel_map
 from demisto_sdk.commands.content_graph.common import (
     NEO4J_DATABASE_URL,
     NEO4J_PASSWORD,
@@ -36,10 +50,17 @@ from demisto_sdk.commands.content_graph.interface.neo4j.queries.dependencies imp
     get_all_level_packs_relationships,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.import_export import (
+    create_snapshot_id_index,
+    create_snapshot_nodes,
+    create_snapshot_relationships,
+    drop_snapshot_id_index,
     export_graphml,
+    get_all_nodes,
+    get_all_relationships,
     import_graphml,
     merge_duplicate_commands,
     merge_duplicate_content_items,
+    remove_snapshot_ids,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.indexes import (
     create_indexes,
@@ -48,20 +69,27 @@ from demisto_sdk.commands.content_graph.interface.neo4j.queries.nodes import (
     _match,
     create_nodes,
     delete_all_graph_nodes,
+    get_content_items_relationships_to_preserve,
     get_relationships_to_preserve,
     get_schema,
+    remove_content_items,
     remove_content_private_nodes,
     remove_empty_properties,
     remove_packs_before_creation,
     remove_server_nodes,
+    return_content_items_preserved_relationships,
     return_preserved_relationships,
+    update_nodes,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.relationships import (
     _match_relationships,
     create_relationships,
+    create_relationships_by_type,
     delete_all_graph_relationships,
     get_sources_by_path,
     get_targets_by_path,
+    remove_outgoing_relationships,
+    update_alert_to_incident,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.validations import (
     get_items_using_deprecated,
@@ -81,13 +109,79 @@ from demisto_sdk.commands.content_graph.objects.base_content import (
     BaseNode,
     UnknownContent,
 )
-from demisto_sdk.commands.content_graph.objects.integration import Integration
 from demisto_sdk.commands.content_graph.objects.integration_script import (
     IntegrationScript,
 )
-from demisto_sdk.commands.content_graph.objects.pack import Pack
-from demisto_sdk.commands.content_graph.objects.relationship import RelationshipData
 from demisto_sdk.commands.content_graph.objects.script import Script
+from demisto_sdk.commands.content_graph.parse_manifest import GraphDiff
+from demisto_sdk.commands.content_graph.snapshot import (
+    SNAPSHOT_FILE_SUFFIX,
+    read_snapshots,
+    write_snapshot,
+)
+
+DEFAULT_NODES_CHUNK_SIZE = 10000
+DEFAULT_RELATIONSHIPS_CHUNK_SIZE = 10000
+# Relationships which merge their target nodes are heavier, so they are written in smaller chunks
+RELATIONSHIPS_CHUNK_SIZES: Dict[str, int] = {
+    RelationshipType.HAS_COMMAND: 5000,
+    RelationshipType.USES_BY_ID: 5000,
+    RelationshipType.USES_BY_NAME: 5000,
+    RelationshipType.USES_BY_CLI_NAME: 5000,
+    RelationshipType.USES_COMMAND_OR_SCRIPT: 5000,
+    RelationshipType.USES_PLAYBOOK: 5000,
+}
+# Relationship types whose queries only match existing nodes and never merge a node, so they can be created concurrently.
+# All the other types may merge the same placeholder nodes of items which are not in the repository
+# (e.g., TESTED_BY merges a TestPlaybook and the default query merges a BaseNode with the same object id),
+# so they are created one after the other.
+INDEPENDENT_RELATIONSHIP_TYPES = (
+    RelationshipType.IN_PACK,
+    RelationshipType.DEPENDS_ON,
+)
+
+PARALLEL_PARSE_NODES_THRESHOLD = 200
+
+
+def _get_chunk_size(env_var: str, default: int) -> int:
+    if value := os.getenv(env_var):
+        try:
+            return int(value)
+        except ValueError:
+            logger.warning(
+                f"non-integer value for {env_var} ({value}). Defaulting to {default}."
+            )
+    return default
+
+
+def get_nodes_chunk_size() -> int:
+    return _get_chunk_size(DEMISTO_SDK_GRAPH_NODES_CHUNK_SIZE, DEFAULT_NODES_CHUNK_SIZE)
+
+
+def get_relationships_chunk_size(relationship: str) -> int:
+    """Returns the chunk size of a relationship type, or the default chunk size of a type this SDK version does not know.
+    Can be set for a single type by DEMISTO_SDK_GRAPH_RELATIONSHIPS_CHUNK_SIZE_<TYPE> (e.g., ..._CHUNK_SIZE_IN_PACK),
+    or for all types by DEMISTO_SDK_GRAPH_RELATIONSHIPS_CHUNK_SIZE.
+    """
+    return _get_chunk_size(
+        f"{DEMISTO_SDK_GRAPH_RELATIONSHIPS_CHUNK_SIZE}_{relationship}",
+        _get_chunk_size(
+            DEMISTO_SDK_GRAPH_RELATIONSHIPS_CHUNK_SIZE,
+            RELATIONSHIPS_CHUNK_SIZES.get(
+                relationship, DEFAULT_RELATIONSHIPS_CHUNK_SIZE
+            ),
+        ),
+    )
+
+
+def _log_throughput(
+    entity: str, count: int, start_time: float, chunk_size: int
+) -> None:
+    took = time.perf_counter() - start_time
+    logger.debug(
+        f"Created {count} {entity} in {took:.2f} seconds "
+        f"({count / took if took else count:.0f} per second, chunk size: {chunk_size})"
+    )
 
 
 def _parse_node(element_id: str, node: dict) -> BaseNode:
@@ -110,6 +204,9 @@ def _parse_node(element_id: str, node: dict) -> BaseNode:
             raise NoModelException(f"No model for {content_type}")
         obj = model.parse_obj(node)
     obj.database_id = element_id
+    # parsing may leave empty relationship sets behind,
+    # which would be dropped when the object is pickled back from a worker process
+    obj.relationships_data = defaultdict(set)
     return obj
 
 
@@ -117,7 +214,25 @@ class NoModelException(Exception):
     pass
 
 
+ValidationQuery = TypeVar("ValidationQuery", bound=Callable[..., Any])
+
+
+def _use_validation_snapshot(func: ValidationQuery) -> ValidationQuery:
+    """Runs a validation query against the validation snapshot of the interface instead, when one was prefetched."""
+
+    @wraps(func)
+    def wrapper(self: "Neo4jContentGraphInterface", *args, **kwargs):
+        if self._validation_snapshot is not None:
+            return getattr(self._validation_snapshot, func.__name__)(*args, **kwargs)
+        return func(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
 class Neo4jContentGraphInterface(ContentGraphInterface):
+    # An in-memory copy of the graph which the validation queries run against, see `prefetch_validations`
+    _validation_snapshot: Optional[ContentGraphInterface] = None
+
     def __init__(
         self,
     ) -> None:
@@ -138,7 +253,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         return self
 
     def __exit__(self, *args) -> None:
-        self.driver.close()
+        self.close()
 
     def _init_driver(self):
         self.driver: Driver = GraphDatabase.driver(
@@ -157,132 +272,29 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         return self._import_handler.extract_files_from_path(imported_path)
 
     def close(self) -> None:
+        self._validation_snapshot = None
         self.driver.close()
 
-    def _add_relationships_to_objects(
-        self,
-        session: Session,
-        result: Dict[str, Neo4jRelationshipResult],
-        marketplace: Optional[MarketplaceVersions] = None,
-    ):
-        """This adds relationships to given object
-
-        Args:
-            session (Session): Neo4j session
-            result (List[Neo4jResult]): Result from neo4j query
-
-        Returns:
-            List[BaseNode]: The objects to return with relationships
-        """
-        content_item_nodes: Set[str] = set()
-        packs: List[Pack] = []
-        nodes_to = []
-        for res in result.values():
-            nodes_to.extend(res.nodes_to)
-        self._add_nodes_to_mapping(nodes_to)
-        for id, res in result.items():
-            obj = self._id_to_obj[id]
-            self._add_relationships(obj, res.relationships, res.nodes_to)
-            if isinstance(obj, Pack) and not obj.content_items:
-                packs.append(obj)
-                content_item_nodes.update(
-                    node.element_id
-                    for node, rel in zip(res.nodes_to, res.relationships)
-                    if rel.type == RelationshipType.IN_PACK
-                )
-
-            if isinstance(obj, Integration) and not obj.commands:
-                obj.set_commands()  # type: ignore[union-attr]
-
-        if content_item_nodes:
-            content_items_result = session.execute_read(
-                _match_relationships, content_item_nodes, marketplace
-            )
-            self._add_relationships_to_objects(
-                session, content_items_result, marketplace
-            )
-
-        # we need to set content items only after they are fully loaded
-        for pack in packs:
-            pack.set_content_items()
-
-    def _add_relationships(
-        self,
-        obj: BaseNode,
-        relationships: List[graph.Relationship],
-        nodes_to: List[graph.Node],
-    ) -> None:
-        """
-        Adds relationship to content object
-
-        Args:
-            obj (BaseNode): Object to add relationship to
-            node_from (graph.Node): The source node
-            relationships (List[graph.Relationship]): The list of relationships from the source
-            nodes_to (List[graph.Node]): The list of nodes of the target
+    def prefetch_validations(self) -> None:
+        """Reads the whole graph in two queries into an in-memory snapshot.
+        Until the interface is closed, the validation queries run against the snapshot
+        (with the same queries the in-memory interface implements) instead of sending a query each,
+        so they do not load the nodes and relationships of their results one query after the other.
         """
-        for node_to, rel in zip(nodes_to, relationships):
-            if not rel.start_node or not rel.end_node:
-                raise ValueError("Relationships must have start and end nodes")
-            obj.add_relationship(
-                RelationshipType(rel.type),
-                RelationshipData(
-                    relationship_type=rel.type,
-                    source_id=rel.start_node.element_id,
-                    target_id=rel.end_node.element_id,
-                    content_item_to=self._id_to_obj[node_to.element_id],
-                    is_direct=True,
-                    **rel,
-                ),
-            )
-
-    def _add_all_level_relationships(
-        self,
-        session: Session,
-        node_ids: Iterable[str],
-        relationship_type: RelationshipType,
-        marketplace: MarketplaceVersions = None,
-    ):
-        """Helper method to add all level dependencies
+        # imported here, since the in-memory interface imports this module
+        from demisto_sdk.commands.content_graph.interface.memory.memory_graph import (
+            MemoryContentGraphInterface,
+        )
 
-        Args:
-            session (Session): neo4j session
-            marketplace (MarketplaceVersions): Marketplace version to check for dependencies
-            pack_nodes (List[graph.Node]): List of the pack nodes
-        """
-        relationships: Dict[str, Neo4jRelationshipResult] = session.execute_read(
-            get_all_level_packs_relationships,
-            relationship_type,
-            node_ids,
-            marketplace,
-            True,
+        with self.driver.session() as session:
+            nodes = session.execute_read(get_all_nodes)
+            relationships = session.execute_read(get_all_relationships)
+        self._validation_snapshot = MemoryContentGraphInterface.from_records(
+            nodes, relationships
+        )
+        logger.debug(
+            f"Prefetched {len(nodes)} nodes and {len(relationships)} relationships for the validations"
         )
-        nodes_to = []
-        for content_item_relationship in relationships.values():
-            nodes_to.extend(content_item_relationship.nodes_to)
-        self._add_nodes_to_mapping(nodes_to)
-
-        for content_item_id, content_item_relationship in relationships.items():
-            obj = self._id_to_obj[content_item_id]
-            for node in content_item_relationship.nodes_to:
-                target = self._id_to_obj[node.element_id]
-                source_id = content_item_id
-                target_id = node.element_id
-                if relationship_type == RelationshipType.IMPORTS:
-                    # the import relationship is from the integration to the content item
-                    source_id = node.element_id
-                    target_id = content_item_id
-                obj.add_relationship(
-                    relationship_type,
-                    RelationshipData(
-                        relationship_type=relationship_type,
-                        source_id=source_id,
-                        target_id=target_id,
-                        content_item_to=target,
-                        mandatorily=True,
-                        is_direct=False,
-                    ),
-                )
 
     def _add_nodes_to_mapping(self, nodes: Iterable[graph.Node]) -> None:
         """Add nodes to the content models mapping
@@ -297,61 +309,50 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             logger.debug(
                 "No nodes to parse packs because all of them in mapping",
             )
-            logger.debug("{}", f"{self._id_to_obj=}")  # noqa: PLE1205
             return
-        with Pool(processes=cpu_count()) as pool:
-            results = pool.starmap(
-                _parse_node, ((node.element_id, dict(node.items())) for node in nodes)
-            )
-            for result in results:
-                assert result.database_id is not None
-                self._id_to_obj[result.database_id] = result
+        results = parallel_map(
+            lambda node: _parse_node(node.element_id, dict(node.items())),
+            nodes,
+            PARALLEL_PARSE_NODES_THRESHOLD,
+        )
+        for result in results:
+            assert result.database_id is not None
+            self._id_to_obj[result.database_id] = result
 
-    def _search(
+    def _query_nodes(
         self,
-        marketplace: MarketplaceVersions = None,
-        content_type: ContentType = ContentType.BASE_NODE,
-        ids_list: Optional[Iterable[int]] = None,
-        all_level_dependencies: bool = False,
-        all_level_imports: bool = False,
+        marketplace: Optional[MarketplaceVersions],
+        content_type: ContentType,
+        ids_list: Optional[Iterable[int]],
         **properties,
-    ) -> List[BaseNode]:
-        """
-        This is the implementation for the search function.
-
-        """
+    ) -> List[graph.Node]:
         with self.driver.session() as session:
-            results: List[graph.Node] = session.execute_read(
+            return session.execute_read(
                 _match, marketplace, content_type, ids_list, **properties
             )
-            self._add_nodes_to_mapping(results)
 
-            nodes_without_relationships = {
-                result.element_id
-                for result in results
-                if not self._id_to_obj[result.element_id].relationships_data
-            }
+    def _query_relationships(
+        self,
+        node_ids: Iterable[str],
+        marketplace: Optional[MarketplaceVersions],
+    ) -> Dict[str, Neo4jRelationshipResult]:
+        with self.driver.session() as session:
+            return session.execute_read(_match_relationships, node_ids, marketplace)
 
-            relationships: Dict[str, Neo4jRelationshipResult] = session.execute_read(
-                _match_relationships, nodes_without_relationships, marketplace
+    def _query_all_level_relationships(
+        self,
+        node_ids: Iterable[str],
+        relationship_type: RelationshipType,
+        marketplace: Optional[MarketplaceVersions],
+    ) -> Dict[str, Neo4jRelationshipResult]:
+        with self.driver.session() as session:
+            return session.execute_read(
+                get_all_level_packs_relationships,
+                relationship_type,
+                node_ids,
+                marketplace,
+                True,
             )
-            self._add_relationships_to_objects(session, relationships, marketplace)
-
-            pack_nodes = {
-                result.element_id
-                for result in results
-                if isinstance(self._id_to_obj[result.element_id], Pack)
-            }
-            nodes = {result.element_id for result in results}
-            if all_level_imports:
-                self._add_all_level_relationships(
-                    session, nodes, RelationshipType.IMPORTS
-                )
-            if all_level_dependencies and pack_nodes and marketplace:
-                self._add_all_level_relationships(
-                    session, pack_nodes, RelationshipType.DEPENDS_ON, marketplace
-                )
-            return [self._id_to_obj[result.element_id] for result in results]
 
     def create_indexes_and_constraints(self) -> None:
         logger.debug("Creating graph indexes and constraints...")
@@ -363,11 +364,19 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         logger.info("Creating graph nodes...")
         pack_ids = [p.get("object_id") for p in nodes.get(ContentType.PACK, [])]
         with self.driver.session() as session:
-            self._rels_to_preserve = session.execute_read(
-                get_relationships_to_preserve, pack_ids
+            # nodes may be created in several batches, so the preserved relationships are accumulated
+            self._rels_to_preserve.extend(
+                session.execute_read(get_relationships_to_preserve, pack_ids)
             )
             session.execute_write(remove_packs_before_creation, pack_ids)
-            session.execute_write(create_nodes, nodes)
+            chunk_size = get_nodes_chunk_size()
+            for content_type, data in nodes.items():
+                start_time = time.perf_counter()
+                for chunk in chunked(data, chunk_size):
+                    session.execute_write(create_nodes, {content_type: chunk})
+                _log_throughput(
+                    f"{content_type} nodes", len(data), start_time, chunk_size
+                )
             session.execute_write(remove_empty_properties)
 
     def get_relationships_by_path(
@@ -419,6 +428,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             )
             return sources, targets
 
+    @_use_validation_snapshot
     def get_unknown_content_uses(
         self,
         file_paths: List[str],
@@ -432,6 +442,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             self._add_relationships_to_objects(session, results)
             return [self._id_to_obj[result] for result in results]
 
+    @_use_validation_snapshot
     def get_duplicate_pack_display_name(
         self, file_paths: List[str]
     ) -> List[Tuple[str, List[str]]]:
@@ -441,6 +452,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             )
             return results
 
+    @_use_validation_snapshot
     def get_duplicate_script_name_included_incident(
         self, file_paths: List[str]
     ) -> Dict[str, str]:
@@ -449,6 +461,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
                 validate_multiple_script_with_same_name, file_paths
             )
 
+    @_use_validation_snapshot
     def validate_duplicate_ids(
         self, file_paths: List[str]
     ) -> List[Tuple[BaseNode, List[BaseNode]]]:
@@ -465,6 +478,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             duplicate_models.append((self._id_to_obj[content_item.element_id], dups))
         return duplicate_models
 
+    @_use_validation_snapshot
     def find_uses_paths_with_invalid_fromversion(
         self, file_paths: List[str], for_supported_versions=False
     ) -> List[BaseNode]:
@@ -485,6 +499,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             self._add_relationships_to_objects(session, results)
             return [self._id_to_obj[result] for result in results]
 
+    @_use_validation_snapshot
     def find_uses_paths_with_invalid_toversion(
         self, file_paths: List[str], for_supported_versions=False
     ) -> List[BaseNode]:
@@ -505,6 +520,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             self._add_relationships_to_objects(session, results)
             return [self._id_to_obj[result] for result in results]
 
+    @_use_validation_snapshot
     def find_items_using_deprecated_items(
         self, file_paths: List[str]
     ) -> List[DeprecatedItemUsage]:
@@ -532,6 +548,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             for dep_content, nodes in deprecated_usage
         ]
 
+    @_use_validation_snapshot
     def find_uses_paths_with_invalid_marketplaces(
         self, pack_ids: List[str]
     ) -> List[BaseNode]:
@@ -552,6 +569,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             self._add_relationships_to_objects(session, results)
             return [self._id_to_obj[result] for result in results]
 
+    @_use_validation_snapshot
     def find_core_packs_depend_on_non_core_packs(
         self,
         pack_ids: List[str],
@@ -575,6 +593,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             self._add_relationships_to_objects(session, results)
             return [self._id_to_obj[result] for result in results]
 
+    @_use_validation_snapshot
     def find_packs_with_invalid_dependencies(
         self, pack_ids: List[str]
     ) -> List[BaseNode]:
@@ -595,6 +614,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             self._add_relationships_to_objects(session, results)
             return [self._id_to_obj[result] for result in results]
 
+    @_use_validation_snapshot
     def find_unused_test_playbook(
         self, test_playbook_ids: List[str], test_playbooks_ids_to_skip: List[str]
     ) -> List[BaseNode]:
@@ -633,13 +653,90 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
     def create_relationships(
         self, relationships: Dict[RelationshipType, List[Dict[str, Any]]]
     ) -> None:
+        """Creates the relationships in chunks, where every chunk is written in its own transaction,
+        which the driver retries on transient errors (e.g., deadlocks between concurrent sessions).
+
+        Commands are created first, since other relationships may target them.
+        Then, every independent relationship type is created in its own session concurrently,
+        while all the other types are created one after the other in a single session.
+        """
         logger.info("Creating graph relationships...")
+        relationships = {
+            relationship: data for relationship, data in relationships.items() if data
+        }
+        if has_command := relationships.pop(RelationshipType.HAS_COMMAND, None):
+            self._create_relationships_sequentially(
+                [(RelationshipType.HAS_COMMAND, has_command)]
+            )
+        lanes = [
+            [(relationship, relationships.pop(relationship))]
+            for relationship in INDEPENDENT_RELATIONSHIP_TYPES
+            if relationship in relationships
+        ]
+        if relationships:
+            lanes.append(list(relationships.items()))
+        if lanes:
+            with ThreadPoolExecutor(max_workers=len(lanes)) as executor:
+                for future in [
+                    executor.submit(self._create_relationships_sequentially, lane)
+                    for lane in lanes
+                ]:
+                    future.result()
+
         with self.driver.session() as session:
-            session.execute_write(create_relationships, relationships, timeout=120)
+            session.execute_write(update_alert_to_incident)
             if self._rels_to_preserve:
                 session.execute_write(
                     return_preserved_relationships, self._rels_to_preserve
                 )
+                self._rels_to_preserve = []
+
+    def _create_relationships_sequentially(
+        self, relationships: List[Tuple[RelationshipType, List[Dict[str, Any]]]]
+    ) -> None:
+        with self.driver.session() as session:
+            for relationship, data in relationships:
+                chunk_size = get_relationships_chunk_size(relationship)
+                start_time = time.perf_counter()
+                for chunk in chunked(data, chunk_size):
+                    session.execute_write(
+                        create_relationships_by_type, relationship, chunk
+                    )
+                _log_throughput(
+                    f"{relationship} relationships", len(data), start_time, chunk_size
+                )
+
+    def update_content_items(self, graph_diff: GraphDiff) -> None:
+        logger.info("Updating graph content items...")
+        rels_to_preserve: List[Dict[str, Any]] = []
+        with self.driver.session() as session:
+            if graph_diff.keys_to_remove:
+                # relationships from content items which are not reparsed are not recreated, so they are preserved
+                rels_to_preserve = session.execute_read(
+                    get_content_items_relationships_to_preserve,
+                    graph_diff.keys_to_remove,
+                    graph_diff.keys_to_remove + graph_diff.keys_to_reset_relationships,
+                )
+                session.execute_write(remove_content_items, graph_diff.keys_to_remove)
+            if graph_diff.nodes_to_update:
+                session.execute_write(update_nodes, graph_diff.nodes_to_update)
+            if graph_diff.nodes_to_create:
+                session.execute_write(create_nodes, graph_diff.nodes_to_create)
+            if graph_diff.keys_to_reset_relationships:
+                session.execute_write(
+                    remove_outgoing_relationships,
+                    graph_diff.keys_to_reset_relationships,
+                )
+            if graph_diff.relationships:
+                session.execute_write(
+                    create_relationships, graph_diff.relationships, timeout=120
+                )
+            if rels_to_preserve:
+                session.execute_write(
+                    return_content_items_preserved_relationships, rels_to_preserve
+                )
+            session.execute_write(remove_empty_properties)
+        self._id_to_obj = {}
 
     def remove_non_repo_items(self) -> None:
         with self.driver.session() as session:
@@ -648,65 +745,78 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             session.execute_write(remove_content_private_nodes)
             session.execute_write(remove_server_nodes)
 
-    def import_graph(
+    def _import_graph_files(
         self,
-        imported_path: Optional[Path] = None,
-        download: bool = False,
-        fail_on_error: bool = False,
-    ) -> bool:
-        """Imports GraphML files to neo4j, by:
+        snapshot_paths: List[Path],
+        graphml_filenames: List[str],
+        merge_content_items: bool,
+    ) -> None:
+        """Imports the graph files to neo4j, by:
         1. Preparing the GraphML files for import
         2. Dropping the constraints (we temporarily allow creating duplicate nodes from different repos)
-        3. Import the GraphML files
+        3. Import the GraphML files, and bulk-ingest the snapshot files (their node ids are offset per file)
         4. Merging duplicate nodes (conmmands/content items)
         5. Recreating the constraints
-        6. Remove empty properties
-
-        Args:
-            external_import_paths (List[Path]): A list of external repositories' import paths.
-            imported_path (Path): The path to import the graph from.
-            download (bool): Wheter download the graph from bucket or not.
-            fail_on_error (bool): Whether to raise exception on error or not.
-
-        Returns:
-            bool: Whether the import was successful or not
         """
-        if imported_path:
-            logger.info(f"Importing graph from {imported_path}")
-            self.clean_import_dir()
-
-        if download:
-            logger.info("Importing graph from bucket")
-            self.clean_import_dir()
-            try:
-                with NamedTemporaryFile() as temp_file:
-                    official_content_graph = download_content_graph(
-                        Path(temp_file.name),
-                    )
-                    self.move_to_import_dir(official_content_graph)
-            except Exception:
-                logger.error("Failed to download content graph from bucket")
-                if fail_on_error:
-                    raise
-                return False
-
-        logger.info("Importing graph from GraphML files...")
-        self._import_handler.extract_files_from_path(imported_path)
         self._import_handler.ensure_data_uniqueness()
-        graphml_filenames = self._import_handler.get_graphml_filenames()
-        if not graphml_filenames:
-            # no ml files found in the import dir, nothing to import
-            return False
         with self.driver.session() as session:
             session.execute_write(drop_constraints)
-            session.execute_write(import_graphml, graphml_filenames)
+            if graphml_filenames:
+                session.execute_write(import_graphml, graphml_filenames)
+            if snapshot_paths:
+                self._import_snapshots(session, snapshot_paths)
             session.execute_write(merge_duplicate_commands)
             session.execute_write(create_constraints)
-            if len(graphml_filenames) > 1:
+            if merge_content_items:
                 session.execute_write(merge_duplicate_content_items)
-        has_infra_graph_been_changed = self._has_infra_graph_been_changed()
-        self._id_to_obj = {}
-        return not has_infra_graph_been_changed
+
+    def _import_snapshots(self, session: Session, snapshot_paths: List[Path]) -> None:
+        """Bulk-ingests the snapshot files in chunks. The node ids of every file are offset by the nodes imported before it,
+        and are kept on the nodes until all the relationships are created."""
+        session.execute_write(create_snapshot_id_index)
+        # the snapshot ids are removed even if the import fails, so they are not left on the imported nodes
+        try:
+            nodes_chunk_size = get_nodes_chunk_size()
+            for offset, snapshot in read_snapshots(snapshot_paths):
+                start_time = time.perf_counter()
+                for table in snapshot.node_tables:
+                    rows = (
+                        {"id": offset + node_id, "properties": properties}
+                        for node_id, properties in table.rows()
+                    )
+                    for chunk in chunked(rows, nodes_chunk_size):
+                        session.execute_write(
+                            create_snapshot_nodes, table.labels, chunk
+                        )
+                _log_throughput(
+                    "nodes", snapshot.node_count, start_time, nodes_chunk_size
+                )
+                for relationship_table in snapshot.relationship_tables:
+                    start_time = time.perf_counter()
+                    chunk_size = get_relationships_chunk_size(relationship_table.type)
+                    rows = (
+                        {
+                            "source": offset + source,
+                            "target": offset + target,
+                            "properties": properties,
+                        }
+                        for source, target, properties in relationship_table.rows()
+                    )
+                    for chunk in chunked(rows, chunk_size):
+                        session.execute_write(
+                            create_snapshot_relationships,
+                            relationship_table.type,
+                            chunk,
+                        )
+                    _log_throughput(
+                        f"{relationship_table.type} relationships",
+                        relationship_table.count,
+                        start_time,
+                        chunk_size,
+                    )
+        finally:
+            session.execute_write(remove_snapshot_ids)
+            session.execute_write(drop_snapshot_id_index)
 
     def export_graph(
         self,
@@ -718,9 +828,16 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         if clean_import_dir:
             self.clean_import_dir()
         with self.driver.session() as session:
+            write_snapshot(
+                self.import_path / f"{self.repo_path.name}{SNAPSHOT_FILE_SUFFIX}",
+                session.execute_read(get_all_nodes),
+                session.execute_read(get_all_relationships),
+            )
+            # for SDK versions which only import GraphML files
             session.execute_write(export_graphml, self.repo_path.name)
         self.dump_metadata(override_commit)
         self.dump_depends_on()
+        self.dump_parse_manifest()
         if output_path:
             output_path = output_path / marketplace.value
             logger.info(f"Saving content graph in {output_path}.zip")
@@ -732,41 +849,6 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             session.execute_write(delete_all_graph_nodes)
         self._id_to_obj = {}
 
-    def search(
-        self,
-        marketplace: Union[MarketplaceVersions, str] = None,
-        content_type: ContentType = ContentType.BASE_NODE,
-        ids_list: Optional[Iterable[int]] = None,
-        all_level_dependencies: bool = False,
-        all_level_imports: bool = False,
-        **properties,
-    ) -> List[BaseNode]:
-        """
-        This searches the database for content items and returns a list of them, including their relationships
-
-        Args:
-            marketplace (MarketplaceVersions, optional): Marketplace to search by. Defaults to None.
-            content_type (ContentType): The content_type to filter. Defaults to ContentType.BASE_NODE.
-            ids_list (Optional[Iterable[int]], optional): A list of unique IDs to filter. Defaults to None.
-            all_level_dependencies (bool, optional): Whether to return all level dependencies. Defaults to False.
-            **properties: A key, value filter for the search. For example: `search(object_id="QRadar")`.
-
-        Returns:
-            List[BaseNode]: The search results
-        """
-        if isinstance(marketplace, str):
-            marketplace = MarketplaceVersions(marketplace)
-
-        super().search()
-        return self._search(
-            marketplace,
-            content_type,
-            ids_list,
-            all_level_dependencies,
-            all_level_imports,
-            **properties,
-        )
-
     def create_pack_dependencies(self):
         logger.info("Creating pack dependencies...")
         with self.driver.session() as session:
@@ -1,5 +1,5 @@
 from time import sleep
-from typing import List
+from typing import Any, Dict, List, Tuple
 
 from neo4j import Transaction
 
@@ -19,6 +19,81 @@ def export_graphml(tx: Transaction, repo_name: str) -> None:
     run_query(tx, query)
 
 
+# Snapshot nodes are labeled and identified temporarily during the import, so the relationships can match them
+SNAPSHOT_NODE_LABEL = "SnapshotNode"
+SNAPSHOT_ID_PROPERTY = "_snapshot_id"
+SNAPSHOT_ID_INDEX = "snapshot_id_index"
+
+
+def get_all_nodes(tx: Transaction) -> List[Tuple[str, List[str], Dict[str, Any]]]:
+    return [
+        (record["id"], record["labels"], record["properties"])
+        for record in run_query(
+            tx,
+            "MATCH (n) RETURN elementId(n) AS id, labels(n) AS labels, properties(n) AS properties",
+        )
+    ]
+
+
+def get_all_relationships(
+    tx: Transaction,
+) -> List[Tuple[str, str, str, Dict[str, Any]]]:
+    return [
+        (record["source"], record["type"], record["target"], record["properties"])
+        for record in run_query(
+            tx,
+            """MATCH (source)-[r]->(target)
+RETURN elementId(source) AS source, type(r) AS type, elementId(target) AS target, properties(r) AS properties""",
+        )
+    ]
+
+
+def create_snapshot_id_index(tx: Transaction) -> None:
+    run_query(
+        tx,
+        f"CREATE INDEX {SNAPSHOT_ID_INDEX} IF NOT EXISTS FOR (n:{SNAPSHOT_NODE_LABEL}) ON (n.{SNAPSHOT_ID_PROPERTY})",
+    )
+
+
+def drop_snapshot_id_index(tx: Transaction) -> None:
+    run_query(tx, f"DROP INDEX {SNAPSHOT_ID_INDEX} IF EXISTS")
+
+
+def create_snapshot_nodes(
+    tx: Transaction, labels: List[str], rows: List[Dict[str, Any]]
+) -> None:
+    labels_str = "".join(f":`{label}`" for label in [SNAPSHOT_NODE_LABEL, *labels])
+    run_query(
+        tx,
+        f"""UNWIND $rows AS row
+CREATE (n{labels_str} {{{SNAPSHOT_ID_PROPERTY}: row.id}})
+SET n += row.properties""",
+        rows=rows,
+    )
+
+
+def create_snapshot_relationships(
+    tx: Transaction, relationship_type: str, rows: List[Dict[str, Any]]
+) -> None:
+    run_query(
+        tx,
+        f"""UNWIND $rows AS row
+MATCH (source:{SNAPSHOT_NODE_LABEL}{{{SNAPSHOT_ID_PROPERTY}: row.source}})
+MATCH (target:{SNAPSHOT_NODE_LABEL}{{{SNAPSHOT_ID_PROPERTY}: row.target}})
+CREATE (source)-[r:`{relationship_type}`]->(target)
+SET r = row.properties""",
+        rows=rows,
+    )
+
+
+def remove_snapshot_ids(tx: Transaction) -> None:
+    run_query(
+        tx,
+        f"""MATCH (n:{SNAPSHOT_NODE_LABEL})
+REMOVE n:{SNAPSHOT_NODE_LABEL}, n.{SNAPSHOT_ID_PROPERTY}""",
+    )
+
+
 def merge_duplicate_commands(tx: Transaction) -> None:
     run_query(
         tx,
@@ -42,6 +42,15 @@ SET n = node_data,  // override existing data
 RETURN count(n) AS nodes_created"""
 
 
+UPDATE_NODES_BY_KEY = """// Overrides existing nodes, matched by their content type and path
+UNWIND $data AS item
+MATCH (n:{base_node}{{content_type: item.node.content_type}})
+WHERE n.path = item.key OR n.path STARTS WITH item.key + "/"
+SET n = item.node,
+    n.not_in_repository = false
+RETURN count(n) AS nodes_updated"""
+
+
 REMOVE_NODES_BY_TYPE = """// Removes parsed nodes of type {content_type} (according to constants)
 MATCH (a)
 WHERE (a:{label} OR a.content_type = "{content_type}")
@@ -114,6 +123,58 @@ DETACH DELETE n, p"""
     run_query(tx, query)
 
 
+def remove_content_items(tx: Transaction, keys: List[str]) -> None:
+    """Removes content items whose path is one of the given keys (or under them),
+    and their commands which are not used by any other integration."""
+    query = f"""// Removes commands of the given content items which are not used by other integrations
+MATCH (n:{ContentType.BASE_NODE})-[:{RelationshipType.HAS_COMMAND}]->(c)
+WHERE any(key IN $keys WHERE n.path = key OR n.path STARTS WITH key + "/")
+OPTIONAL MATCH (c)<-[:{RelationshipType.HAS_COMMAND}]-(other)
+WHERE NOT any(key IN $keys WHERE other.path = key OR other.path STARTS WITH key + "/")
+WITH DISTINCT c, other
+WHERE other IS NULL
+DETACH DELETE c"""
+    run_query(tx, query, keys=keys)
+    query = f"""// Removes the given content items
+MATCH (n:{ContentType.BASE_NODE})
+WHERE any(key IN $keys WHERE n.path = key OR n.path STARTS WITH key + "/")
+DETACH DELETE n"""
+    run_query(tx, query, keys=keys)
+
+
+def get_content_items_relationships_to_preserve(
+    tx: Transaction, keys: List[str], reparsed_keys: List[str]
+) -> List[Dict[str, Any]]:
+    """
+    Get the relationships to preserve before removing the content items whose path is one of the given keys,
+    i.e., relationships to them (and to their removed commands) from nodes which are not reparsed
+    """
+    query = f"""// Gets the relationships to preserve before removing content items
+MATCH (s)-[r]->(t:{ContentType.BASE_NODE})
+WHERE any(key IN $keys WHERE t.path = key OR t.path STARTS WITH key + "/")
+AND (s.path IS NULL OR NOT any(key IN $reparsed_keys WHERE s.path = key OR s.path STARTS WITH key + "/"))
+RETURN elementId(s) as source_id, s as source, type(r) as r_type, properties(r) as r_properties, t as target
+
+UNION
+
+MATCH (s)-[r]->(t)<-[:{RelationshipType.HAS_COMMAND}]-(n:{ContentType.BASE_NODE})
+WHERE any(key IN $keys WHERE n.path = key OR n.path STARTS WITH key + "/")
+AND (s.path IS NULL OR NOT any(key IN $reparsed_keys WHERE s.path = key OR s.path STARTS WITH key + "/"))
+AND NOT exists {{
+    MATCH (t)<-[:{RelationshipType.HAS_COMMAND}]-(other)
+    WHERE NOT any(key IN $keys WHERE other.path = key OR other.path STARTS WITH key + "/")
+}}
+RETURN elementId(s) as source_id, s as source, type(r) as r_type, properties(r) as r_properties, t as target"""
+    return run_query(tx, query, keys=keys, reparsed_keys=reparsed_keys).data()
+
+
+def update_nodes(tx: Transaction, data: List[Dict[str, Any]]) -> None:
+    query = UPDATE_NODES_BY_KEY.format(base_node=ContentType.BASE_NODE)
+    result = run_query(tx, query, data=data).single()
+    nodes_count: int = result["nodes_updated"]
+    logger.debug(f"Updated {nodes_count} nodes.")
+
+
 def return_preserved_relationships(
     tx: Transaction, rels_to_preserve: List[Dict[str, Any]]
 ) -> None:
@@ -133,6 +194,32 @@ RETURN rel"""
     run_query(tx, query, rels_data=rels_to_preserve)
 
 
+def return_content_items_preserved_relationships(
+    tx: Transaction, rels_to_preserve: List[Dict[str, Any]]
+) -> None:
+    """Returns the preserved relationships to the recreated content items (same object_id and content_type).
+    Relationships to content items which were not recreated are returned to a node which is not in the repository,
+    same as relationships to content items which are missing when the graph is created."""
+    query = f"""// Returns the preserved relationships of removed content items
+UNWIND $rels_data AS rel_data
+MATCH (s) WHERE elementId(s) = rel_data.source_id AND s.object_id = rel_data.source.object_id AND s.content_type = rel_data.source.content_type
+CALL apoc.merge.node(
+    [rel_data.target.content_type, "{ContentType.BASE_NODE}"],
+    {{
+        object_id: rel_data.target.object_id,
+        content_type: rel_data.target.content_type
+    }},
+    {{
+        not_in_repository: true,
+        name: coalesce(rel_data.target.name, rel_data.target.object_id)
+    }}
+) YIELD node as t
+CALL apoc.create.relationship(s, rel_data.r_type, rel_data.r_properties, t)
+YIELD rel
+RETURN rel"""
+    run_query(tx, query, rels_data=rels_to_preserve)
+
+
 def create_nodes(
     tx: Transaction,
     nodes: Dict[ContentType, List[Dict[str, Any]]],
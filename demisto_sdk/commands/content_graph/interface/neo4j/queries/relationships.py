@@ -226,9 +226,21 @@ def create_relationships(
     for relationship, data in relationships.items():
         create_relationships_by_type(tx, relationship, data)
 
+    update_alert_to_incident(tx)
+
+
+def update_alert_to_incident(tx: Transaction) -> None:
     run_query(tx, update_alert_to_incident_relationships())
 
 
+def remove_outgoing_relationships(tx: Transaction, keys: List[str]) -> None:
+    query = f"""// Removes the outgoing relationships of the given content items
+MATCH (n:{ContentType.BASE_NODE})-[r]->()
+WHERE any(key IN $keys WHERE n.path = key OR n.path STARTS WITH key + "/")
+DELETE r"""
+    run_query(tx, query, keys=keys)
+
+
 def create_relationships_by_type(
     tx: Transaction,
     relationship: RelationshipType,
@@ -221,6 +221,21 @@ class BaseContent(BaseNode):
             data (dict): the data dict.
             predefined_keys_to_keep (Optional[Tuple[str]], optional): keys to keep even if they're not defined.
         """
+        self._update_data(data, predefined_keys_to_keep, fields_to_exclude)
+        write_dict(path, data, indent=4)
+
+    def _update_data(
+        self,
+        data: dict,
+        predefined_keys_to_keep: Optional[Tuple[str, ...]] = None,
+        fields_to_exclude: List[str] = [],
+    ):
+        """Set the class vars into the dict data, without saving it.
+
+        Args:
+            data (dict): the data dict.
+            predefined_keys_to_keep (Optional[Tuple[str]], optional): keys to keep even if they're not defined.
+        """
         for key, val in self.field_mapping.items():
             attr = getattr(self, key)
             if key == "docker_image":
@@ -240,11 +255,26 @@ class BaseContent(BaseNode):
                     attr.remove(MarketplaceVersions.XSOAR_ON_PREM)
             if attr or (predefined_keys_to_keep and val in predefined_keys_to_keep):
                 set_value(data, val, attr)
-        write_dict(path, data, indent=4)
 
     def __hash__(self):
         return hash(self.path)
 
+    def copy_as_old_version(self) -> "BaseContent":
+        """Copies the content object, to be used as its old_base_content_object when it has no other previous version.
+
+        Unlike a deep copy, the copy shares the values of the fields (and the relationships) with the content object,
+        so it costs a single dict rather than a second copy of the whole object.
+        Fields which are set on either of the objects afterwards are not shared, values which are changed in place are.
+
+        Returns:
+            BaseContent: The copy.
+        """
+        # not `copy()`, which drops the excluded fields and copies the rest of the values
+        return self.construct(
+            _fields_set=set(self.__fields_set__),
+            **{**self.__dict__, "old_base_content_object": None},
+        )
+
     def save(self):
         raise NotImplementedError
 
@@ -217,8 +217,8 @@ class BasePlaybook(ContentItem, content_type=ContentType.PLAYBOOK):  # type: ign
         return client.import_playbook
 
     def save(self):
-        super().save(fields_to_exclude=["tasks"])
         data = self.data
+        self._update_data(data, fields_to_exclude=["tasks"])
         data["tasks"] = {
             task_id: task_config.to_raw_dict
             for task_id, task_config in self.tasks.items()
@@ -209,8 +209,8 @@ class Integration(IntegrationScript, content_type=ContentType.INTEGRATION):  # t
         return False
 
     def save(self):
-        super().save(fields_to_exclude=["params"])
         data = self.data
+        self._update_data(data, fields_to_exclude=["params"])
         data["script"]["commands"] = [command.to_raw_dict for command in self.commands]
         data["configuration"] = [param.dict(exclude_none=True) for param in self.params]
         write_dict(self.path, data, indent=4)
@@ -26,6 +26,15 @@ def from_path(path: Path = CONTENT_PATH, packs_to_parse: Optional[Tuple[str]] =
     This function is outside of the class for better caching.
     The class function uses this function so the behavior is the same.
     """
+    return parse_repository(path, packs_to_parse)
+
+
+def parse_repository(
+    path: Path = CONTENT_PATH, packs_to_parse: Optional[Tuple[str, ...]] = None
+):
+    """
+    Returns a ContentDTO object with the packs of the content repository, without caching it.
+    """
     repo_parser = RepositoryParser(path)
     packs = tuple(repo_parser.iter_packs(packs_to_parse))
     with tqdm.tqdm(
@@ -45,11 +54,21 @@ class ContentDTO(BaseModel):
 
     @staticmethod
     def from_path(
-        path: Path = CONTENT_PATH, packs_to_parse: Optional[Tuple[str, ...]] = None
+        path: Path = CONTENT_PATH,
+        packs_to_parse: Optional[Tuple[str, ...]] = None,
+        use_cache: bool = True,
     ):
         """
         Returns a ContentDTO object with all the packs of the content repository.
+
+        Args:
+            path (Path): The repository path.
+            packs_to_parse (Optional[Tuple[str, ...]]): The packs to parse. If not provided, parses all packs.
+            use_cache (bool): Whether to cache the result. Should be False when parsing the repository in batches,
+                so parsed batches are not held in memory.
         """
+        if not use_cache:
+            return parse_repository(path, packs_to_parse)
         return from_path(path, packs_to_parse)
 
     def dump(
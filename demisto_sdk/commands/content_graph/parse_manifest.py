@@ -0,0 +1,318 @@
+from hashlib import sha1
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from demisto_sdk.commands.common.handlers import JSON_Handler
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tools import sha1_dir, sha1_file
+from demisto_sdk.commands.content_graph.common import (
+    PACK_METADATA_FILENAME,
+    ContentType,
+    Nodes,
+    Relationships,
+)
+
+json = JSON_Handler()
+
+PARSE_MANIFEST_FILE_NAME = "parse_manifest.json"
+
+
+def hash_path(path: Path) -> str:
+    """Returns the content hash of a content item path (a unified file or a package directory)."""
+    return sha1_dir(path) if path.is_dir() else sha1_file(path)
+
+
+def digest(data: Any) -> str:
+    """Returns a stable digest of a JSON-serializable object."""
+    return sha1(
+        json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def relationships_digest(relationships: Relationships) -> str:
+    return digest(
+        {
+            str(relationship_type): sorted(
+                json.dumps(rel, sort_keys=True, default=str) for rel in data
+            )
+            for relationship_type, data in relationships.items()
+            if data
+        }
+    )
+
+
+def iter_content_item_paths(pack_path: Path) -> Iterator[Path]:
+    """Iterates the paths which are parsed as content items, in the same way as `PackParser.parse_pack_folders`."""
+    for folder_path in ContentType.pack_folders(pack_path):
+        yield from folder_path.iterdir()
+
+
+def hash_pack_files(pack_path: Path) -> str:
+    """Returns a hash of all the pack files which are not part of any content item (metadata, readme, release notes, etc.)."""
+    content_item_folders = {
+        folder.relative_to(pack_path).parts[0]
+        for folder in ContentType.pack_folders(pack_path)
+    }
+    hash_ = sha1()
+    for path in sorted(pack_path.iterdir(), key=lambda p: str(p).lower()):
+        if path.name in content_item_folders or path.name == "__pycache__":
+            continue
+        hash_.update(path.name.encode())
+        hash_.update((hash_path(path)).encode())
+    return hash_.hexdigest()
+
+
+def manifest_key(path: Path, pack_path: Path) -> str:
+    """Returns the path relative to the repository root (e.g. `Packs/MyPack/Scripts/MyScript`), same as the node path."""
+    return path.relative_to(pack_path.parent.parent).as_posix()
+
+
+class ContentItemEntry(NamedTuple):
+    """The parsed state of a single content item path.
+
+    Attributes:
+        hash (str): The content hash of the path.
+        node_id (Optional[str]): The node ID of the parsed content item, None if the path is not a content item.
+        node_digest (Optional[str]): A digest of the node properties.
+        relationships_digest (Optional[str]): A digest of the outgoing relationships of the content item.
+    """
+
+    hash: str
+    node_id: Optional[str] = None
+    node_digest: Optional[str] = None
+    relationships_digest: Optional[str] = None
+
+
+class PackEntry(NamedTuple):
+    metadata_hash: str
+    files_hash: str
+    items: Dict[str, ContentItemEntry]
+
+
+class PackDiff(NamedTuple):
+    """The content item level changes of a pack compared to the manifest.
+
+    Attributes:
+        pack_path (Path): The pack path.
+        changed (List[Path]): Content item paths whose content hash changed.
+        added (List[Path]): Content item paths which are not in the manifest.
+        removed (List[str]): Manifest keys of content items which were removed from the pack.
+        pack_files_changed (bool): Whether pack level files (not metadata) were changed.
+    """
+
+    pack_path: Path
+    changed: List[Path]
+    added: List[Path]
+    removed: List[str]
+    pack_files_changed: bool
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.changed or self.added or self.removed or self.pack_files_changed
+        )
+
+
+class GraphDiff:
+    """The smallest set of graph changes needed to apply content item level changes.
+
+    Content item nodes are identified by their manifest key, i.e., a node whose path is the key or is under it.
+
+    Attributes:
+        keys_to_remove (List[str]): Content items to delete from the graph.
+        nodes_to_update (List[Dict[str, Any]]): Existing nodes to override, as `{"key": ..., "node": ...}` items.
+        nodes_to_create (Nodes): New nodes to create.
+        keys_to_reset_relationships (List[str]): Content items whose outgoing relationships are recreated.
+        relationships (Relationships): The relationships to create.
+    """
+
+    def __init__(self) -> None:
+        self.keys_to_remove: List[str] = []
+        self.nodes_to_update: List[Dict[str, Any]] = []
+        self.nodes_to_create: Nodes = Nodes()
+        self.keys_to_reset_relationships: List[str] = []
+        self.relationships: Relationships = Relationships()
+
+    @property
+    def is_empty(self) -> bool:
+        return not any(
+            (
+                self.keys_to_remove,
+                self.nodes_to_update,
+                self.nodes_to_create,
+                self.keys_to_reset_relationships,
+                self.relationships,
+            )
+        )
+
+
+class ParseManifest:
+    """A persistent mapping between every parsed path and its content hash, used for incremental graph updates.
+
+    The manifest is exported together with the graph, so any imported graph carries the state it was parsed from.
+    """
+
+    def __init__(
+        self,
+        parser_hash: Optional[str] = None,
+        packs: Optional[Dict[str, PackEntry]] = None,
+    ) -> None:
+        self.parser_hash = parser_hash
+        self.packs: Dict[str, PackEntry] = packs or {}
+
+    @classmethod
+    def load(cls, directory: Path) -> Optional["ParseManifest"]:
+        path = directory / PARSE_MANIFEST_FILE_NAME
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text())
+            return cls(
+                parser_hash=data.get("parser_hash"),
+                packs={
+                    pack_id: PackEntry(
+                        metadata_hash=pack["metadata_hash"],
+                        files_hash=pack["files_hash"],
+                        items={
+                            key: ContentItemEntry(**item)
+                            for key, item in pack["items"].items()
+                        },
+                    )
+                    for pack_id, pack in data.get("packs", {}).items()
+                },
+            )
+        except Exception as e:
+            logger.debug(f"Could not load the parse manifest from {path}: {e}")
+            return None
+
+    def dump(self, directory: Path) -> None:
+        data = {
+            "parser_hash": self.parser_hash,
+            "packs": {
+                pack_id: {
+                    "metadata_hash": pack.metadata_hash,
+                    "files_hash": pack.files_hash,
+                    "items": {key: item._asdict() for key, item in pack.items.items()},
+                }
+                for pack_id, pack in self.packs.items()
+            },
+        }
+        (directory / PARSE_MANIFEST_FILE_NAME).write_text(json.dumps(data))
+
+    def is_compatible(self, parser_hash: Optional[str]) -> bool:
+        return bool(self.parser_hash) and self.parser_hash == parser_hash
+
+    def get_item(self, pack_id: str, key: str) -> Optional[ContentItemEntry]:
+        if pack := self.packs.get(pack_id):
+            return pack.items.get(key)
+        return None
+
+    def diff_pack(self, pack_path: Path) -> Optional[PackDiff]:
+        """Compares the current state of a pack with the manifest.
+
+        Returns:
+            Optional[PackDiff]: The content item level changes,
+                or None if the pack must be fully parsed (unknown pack or its metadata has changed).
+        """
+        pack = self.packs.get(pack_path.name)
+        metadata_path = pack_path / PACK_METADATA_FILENAME
+        if not pack or not metadata_path.exists():
+            return None
+        if sha1_file(metadata_path) != pack.metadata_hash:
+            return None
+
+        changed: List[Path] = []
+        added: List[Path] = []
+        current_keys = set()
+        for path in iter_content_item_paths(pack_path):
+            key = manifest_key(path, pack_path)
+            current_keys.add(key)
+            if not (entry := pack.items.get(key)):
+                added.append(path)
+            elif entry.hash != hash_path(path):
+                changed.append(path)
+        return PackDiff(
+            pack_path=pack_path,
+            changed=changed,
+            added=added,
+            removed=sorted(set(pack.items) - current_keys),
+            pack_files_changed=hash_pack_files(pack_path) != pack.files_hash,
+        )
+
+    def set_pack(self, pack_path: Path, items: Dict[str, ContentItemEntry]) -> None:
+        metadata_path = pack_path / PACK_METADATA_FILENAME
+        self.packs[pack_path.name] = PackEntry(
+            metadata_hash=sha1_file(metadata_path) if metadata_path.is_file() else "",
+            files_hash=hash_pack_files(pack_path),
+            items=items,
+        )
+
+    def remove_pack(self, pack_id: str) -> None:
+        self.packs.pop(pack_id, None)
+
+
+def build_pack_entries(
+    pack_path: Path,
+    nodes: List[Dict[str, Any]],
+    relationships: Relationships,
+) -> Dict[str, ContentItemEntry]:
+    """Builds the manifest entries of a fully parsed pack.
+
+    Args:
+        pack_path (Path): The pack path.
+        nodes (List[Dict[str, Any]]): The content item nodes of the pack.
+        relationships (Relationships): All the relationships of the pack.
+
+    Returns:
+        Dict[str, ContentItemEntry]: A mapping between a manifest key and its entry.
+    """
+    relationships_by_source: Dict[Tuple[Any, Any, Any], Relationships] = {}
+    for relationship_type, data in relationships.items():
+        for rel in data:
+            source_key = (
+                rel.get("source_type"),
+                rel.get("source_id"),
+                rel.get("source_fromversion"),
+            )
+            relationships_by_source.setdefault(source_key, Relationships()).setdefault(
+                relationship_type, []
+            ).append(rel)
+
+    node_by_key = {}
+    for node in nodes:
+        if not (node_path := node.get("path")):
+            continue
+        node_path = Path(node_path)
+        for key in (node_path.as_posix(), node_path.parent.as_posix()):
+            node_by_key.setdefault(key, node)
+
+    entries: Dict[str, ContentItemEntry] = {}
+    for path in iter_content_item_paths(pack_path):
+        key = manifest_key(path, pack_path)
+        if not (node := node_by_key.get(key)):
+            entries[key] = ContentItemEntry(hash=hash_path(path))
+            continue
+        entries[key] = content_item_entry(
+            path,
+            node,
+            relationships_by_source.get(
+                (
+                    node.get("content_type"),
+                    node.get("object_id"),
+                    node.get("fromversion"),
+                ),
+                Relationships(),
+            ),
+        )
+    return entries
+
+
+def content_item_entry(
+    path: Path, node: Dict[str, Any], relationships: Relationships
+) -> ContentItemEntry:
+    return ContentItemEntry(
+        hash=hash_path(path),
+        node_id=node.get("node_id"),
+        node_digest=digest(node),
+        relationships_digest=relationships_digest(relationships),
+    )
@@ -0,0 +1,229 @@
+import os
+import pickle
+import tempfile
+from functools import lru_cache
+from hashlib import sha1
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+from demisto_sdk.commands.common.constants import (
+    CACHE_DIR,
+    DEMISTO_SDK_GRAPH_PARSER_CACHE,
+    DEMISTO_SDK_GRAPH_PARSER_CACHE_DIR,
+    DEMISTO_SDK_GRAPH_PARSER_CACHE_SIZE,
+    MarketplaceVersions,
+)
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.string_to_bool import string_to_bool
+from demisto_sdk.commands.common.tools import sha1_update_from_dir
+from demisto_sdk.commands.content_graph.parse_manifest import hash_path
+from demisto_sdk.commands.content_graph.parsers.content_item import (
+    ContentItemParser,
+)
+
+PARSER_CACHE_DIR = CACHE_DIR / "content_graph" / "parsers"
+DEFAULT_PARSER_CACHE_SIZE_MB = 1024
+PARSER_CACHE_ENTRY_SUFFIX = ".pickle"
+
+# A cached parser is only valid for the exact parsing and strict validation code it was created with.
+PARSER_VERSION_DIRS = (
+    Path(__file__).parent / "parsers",
+    Path(__file__).parent / "strict_objects",
+)
+
+
+@lru_cache
+def get_parser_version() -> str:
+    """Returns a hash of the parsers and strict objects code, same as `ContentGraphInterface._get_latest_content_parser_hash`
+    with the strict objects added, since the cached parsers hold their structure errors as well."""
+    hash_ = sha1()
+    for directory in PARSER_VERSION_DIRS:
+        hash_ = sha1_update_from_dir(directory, hash_)
+    return hash_.hexdigest()
+
+
+class ParserCacheStats(NamedTuple):
+    path: Path
+    entries: int
+    size: int
+    max_size: int
+
+
+class ParserCache:
+    """A persistent on-disk cache of content item parsers.
+
+    Every entry is a pickled `ContentItemParser`, keyed by the content hash of the item path and the parser version,
+    so a warm run skips loading the files and running the strict validation of unchanged content items.
+    The cache size is bounded, and the least recently used entries are evicted first.
+
+    The cache can be configured by the following environment variables:
+        - DEMISTO_SDK_GRAPH_PARSER_CACHE: Set to false to disable the cache.
+        - DEMISTO_SDK_GRAPH_PARSER_CACHE_DIR: The cache directory.
+        - DEMISTO_SDK_GRAPH_PARSER_CACHE_SIZE: The maximum cache size in MB.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_size: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        self.path = path or Path(
+            os.getenv(DEMISTO_SDK_GRAPH_PARSER_CACHE_DIR) or PARSER_CACHE_DIR
+        )
+        self.max_size = max_size if max_size is not None else self._get_max_size()
+        self.enabled = (
+            enabled
+            if enabled is not None
+            else string_to_bool(os.getenv(DEMISTO_SDK_GRAPH_PARSER_CACHE), True)
+        )
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _get_max_size() -> int:
+        if env_var := os.getenv(DEMISTO_SDK_GRAPH_PARSER_CACHE_SIZE):
+            try:
+                return int(env_var) * 1024 * 1024
+            except (TypeError, ValueError):
+                logger.warning(
+                    f"non-integer parser cache size value ({env_var}). Defaulting to {DEFAULT_PARSER_CACHE_SIZE_MB}MB."
+                )
+        return DEFAULT_PARSER_CACHE_SIZE_MB * 1024 * 1024
+
+    @staticmethod
+    def get_key(
+        path: Path,
+        pack_marketplaces: List[MarketplaceVersions],
+        pack_supported_modules: List[str],
+    ) -> str:
+        """Returns the cache key of a content item path.
+
+        The pack marketplaces and supported modules are part of the key since they are the parser's inputs.
+        """
+        return sha1(
+            "|".join(
+                (
+                    get_parser_version(),
+                    str(path.absolute()),
+                    hash_path(path),
+                    ",".join(sorted(pack_marketplaces)),
+                    ",".join(sorted(pack_supported_modules)),
+                )
+            ).encode()
+        ).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / f"{key}{PARSER_CACHE_ENTRY_SUFFIX}"
+
+    def _iter_entries(self) -> List[Path]:
+        if not self.path.exists():
+            return []
+        return list(self.path.glob(f"*{PARSER_CACHE_ENTRY_SUFFIX}"))
+
+    def get(self, key: str) -> Optional[ContentItemParser]:
+        entry_path = self._entry_path(key)
+        try:
+            parser = pickle.loads(entry_path.read_bytes())
+            # Update the modification time, which is used for the LRU eviction
+            os.utime(entry_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Could not load the parser cache entry {entry_path}: {e}")
+            entry_path.unlink(missing_ok=True)
+            return None
+        return parser
+
+    def set(self, key: str, parser: ContentItemParser) -> None:
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first, since multiple processes may write to the cache at the same time
+            with tempfile.NamedTemporaryFile(
+                dir=self.path, suffix=".tmp", delete=False
+            ) as f:
+                pickle.dump(parser, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f.name, self._entry_path(key))
+        except Exception as e:
+            logger.debug(
+                f"Could not write the parser cache entry of {parser.path}: {e}"
+            )
+
+    def parse(
+        self,
+        path: Path,
+        pack_marketplaces: List[MarketplaceVersions],
+        pack_supported_modules: List[str],
+    ) -> ContentItemParser:
+        """Returns the parser of a content item from the cache, or parses it and stores it in the cache.
+
+        Args:
+            path (Path): The content item path.
+            pack_marketplaces (List[MarketplaceVersions]): The pack marketplaces.
+            pack_supported_modules (List[str]): The pack supported modules.
+
+        Returns:
+            ContentItemParser: The content item parser.
+        """
+        if not self.enabled:
+            return ContentItemParser.from_path(
+                path, pack_marketplaces, pack_supported_modules
+            )
+        key = self.get_key(path, pack_marketplaces, pack_supported_modules)
+        if parser := self.get(key):
+            self.hits += 1
+            return parser
+        self.misses += 1
+        parser = ContentItemParser.from_path(
+            path, pack_marketplaces, pack_supported_modules
+        )
+        self.set(key, parser)
+        return parser
+
+    def evict(self) -> int:
+        """Removes the least recently used entries until the cache size is within its bound.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        entries = []
+        total_size = 0
+        for entry_path in self._iter_entries():
+            try:
+                stat = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+            total_size += stat.st_size
+        removed = 0
+        for _, size, entry_path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            entry_path.unlink(missing_ok=True)
+            total_size -= size
+            removed += 1
+        if removed:
+            logger.debug(f"Evicted {removed} entries from the parser cache")
+        return removed
+
+    def stats(self) -> ParserCacheStats:
+        entries = self._iter_entries()
+        return ParserCacheStats(
+            path=self.path,
+            entries=len(entries),
+            size=sum(entry.stat().st_size for entry in entries),
+            max_size=self.max_size,
+        )
+
+    def clear(self) -> int:
+        """Removes all the cache entries.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        entries = self._iter_entries()
+        for entry_path in entries:
+            entry_path.unlink(missing_ok=True)
+        for tmp_path in self.path.glob("*.tmp") if self.path.exists() else []:
+            tmp_path.unlink(missing_ok=True)
+        return len(entries)
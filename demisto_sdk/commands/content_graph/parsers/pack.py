@@ -32,6 +32,7 @@ from demisto_sdk.commands.content_graph.common import (
     Relationships,
     RelationshipType,
 )
+from demisto_sdk.commands.content_graph.parser_cache import ParserCache
 from demisto_sdk.commands.content_graph.parsers.base_content import BaseContentParser
 from demisto_sdk.commands.content_graph.parsers.content_item import (
     ContentItemParser,
@@ -327,32 +328,77 @@ class PackParser(BaseContentParser, PackMetadataParser):
                 mandatorily=True,
             )
 
+    def iter_content_item_paths(self) -> Iterator[Path]:
+        """Iterates the paths of all the potential content items of the pack."""
+        for folder_path in ContentType.pack_folders(self.path):
+            yield from folder_path.iterdir()
+
     def parse_pack_folders(self) -> None:
         """Parses all pack content items by iterating its folders."""
-        for folder_path in ContentType.pack_folders(self.path):
-            for (
-                content_item_path
-            ) in folder_path.iterdir():  # todo: consider multiprocessing
-                self.parse_content_item(content_item_path)
+        parser_cache = ParserCache()
+        for content_item_path in self.iter_content_item_paths():
+            self.parse_content_item(content_item_path, parser_cache)
+        if parser_cache.enabled:
+            logger.debug(
+                f"Parser cache of {self.node_id}: {parser_cache.hits} hits, {parser_cache.misses} misses"
+            )
 
-    def parse_content_item(self, content_item_path: Path) -> None:
+    def parse_content_item(
+        self, content_item_path: Path, parser_cache: Optional[ParserCache] = None
+    ) -> None:
         """Potentially parses a single content item.
 
         Args:
             content_item_path (Path): The content item path.
+            parser_cache (Optional[ParserCache]): The parser cache to load the content item parser from, if given.
+        """
+        if content_item := self.parse_content_item_path(
+            content_item_path, self.marketplaces, self.supportedModules, parser_cache
+        ):
+            self.add_content_item(content_item)
+
+    @staticmethod
+    def parse_content_item_path(
+        content_item_path: Path,
+        pack_marketplaces: List[MarketplaceVersions],
+        pack_supported_modules: List[str],
+        parser_cache: Optional[ParserCache] = None,
+    ) -> Optional[ContentItemParser]:
+        """Potentially parses a single content item, without adding it to the pack.
+
+        Args:
+            content_item_path (Path): The content item path.
+            pack_marketplaces (List[MarketplaceVersions]): The pack marketplaces.
+            pack_supported_modules (List[str]): The pack supported modules.
+            parser_cache (Optional[ParserCache]): The parser cache to load the content item parser from, if given.
+
+        Returns:
+            Optional[ContentItemParser]: The content item parser, or None if the path is not a content item.
         """
         try:
-            content_item = ContentItemParser.from_path(
-                content_item_path, self.marketplaces, self.supportedModules
+            if parser_cache:
+                return parser_cache.parse(
+                    content_item_path, pack_marketplaces, pack_supported_modules
+                )
+            return ContentItemParser.from_path(
+                content_item_path, pack_marketplaces, pack_supported_modules
             )
-            content_item.add_to_pack(self.object_id)
-            self.content_items.append(content_item)
-            self.relationships.update(content_item.relationships)
         except NotAContentItemException:
             logger.debug(f"Skipping {content_item_path} - not a content item")
         except InvalidContentItemException:
             logger.error(f"{content_item_path} - invalid content item")
             raise
+        return None
+
+    def add_content_item(self, content_item: ContentItemParser) -> None:
+        """Adds a parsed content item to the pack.
+
+        Args:
+            content_item (ContentItemParser): The content item parser.
+        """
+        content_item.add_to_pack(self.object_id)
+        self.content_items.append(content_item)
+        self.relationships.update(content_item.relationships)
 
     @property
     def deprecated(self) -> bool:
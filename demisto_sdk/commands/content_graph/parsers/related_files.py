@@ -53,8 +53,30 @@ class RelatedFile(ABC):
         self.prev_ver = prev_ver
         self.main_file_path: Path = main_file_path
         self.git_sha = git_sha
-        self.exist: bool = False
-        self.file_path: Path = self.find_the_right_path(self.get_optional_paths())
+        # The path is only looked for when it is first used, since checking whether the optional paths exist
+        # may take a git call for each of them
+        self._file_path: Optional[Path] = None
+        self._exist: bool = False
+
+    @property
+    def file_path(self) -> Path:
+        if self._file_path is None:
+            self._file_path = self.find_the_right_path(self.get_optional_paths())
+        return self._file_path
+
+    @file_path.setter
+    def file_path(self, file_path: Path):
+        self._file_path = file_path
+
+    @property
+    def exist(self) -> bool:
+        self.file_path
+        return self._exist
+
+    @exist.setter
+    def exist(self, exist: bool):
+        self.file_path
+        self._exist = exist
 
     @property
     def git_status(self) -> Union[GitStatuses, None]:
@@ -70,7 +92,7 @@ class RelatedFile(ABC):
     def find_the_right_path(self, file_paths: List[Path]) -> Path:
         for path in file_paths:
             if self.is_file_exist(path, self.git_sha):
-                self.exist = True
+                self._exist = True
                 return path
         return file_paths[-1]
 
@@ -80,6 +102,10 @@ class RelatedFile(ABC):
     def file_content(self) -> Any:
         raise NotImplementedError
 
+    def prefetch(self) -> None:
+        """Loads the file ahead of its first use (see `ValidationEngine`). Only finds the file path by default."""
+        self.file_path
+
     def is_file_exist(self, file_path: Path, git_sha: Optional[str]) -> bool:
         if git_sha:
             # Checking if file exist in remote branch/sha.
@@ -124,6 +150,10 @@ class TextFiles(RelatedFile):
         self.file_content_str = content
         TextFile.write(content, self.file_path)
 
+    def prefetch(self) -> None:
+        if self.exist:
+            self.file_content
+
 
 class RNRelatedFile(TextFiles):
     file_type = RelatedFileType.RELEASE_NOTE
@@ -212,6 +242,9 @@ class JsonFiles(RelatedFile):
             logger.debug(f"Failed to get related text file, error: {e}")
         return None
 
+    def prefetch(self) -> None:
+        self.file_content
+
 
 class VersionConfigRelatedFile(JsonFiles):
     def __init__(
@@ -1,19 +1,33 @@
 import multiprocessing
 import traceback
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Iterator, List, Optional, Tuple
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 from tqdm import tqdm
 
-from demisto_sdk.commands.common.constants import PACKS_FOLDER
+from demisto_sdk.commands.common.constants import PACKS_FOLDER, MarketplaceVersions
 from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.content_graph.parser_cache import ParserCache
 from demisto_sdk.commands.content_graph.parsers.content_item import (
+    ContentItemParser,
     NotAContentItemException,
 )
 from demisto_sdk.commands.content_graph.parsers.pack import PackParser
 
 IGNORED_PACKS_FOR_PARSING = ["NonSupported"]
+MAX_CONTENT_ITEMS_CHUNK_SIZE = 16
+
+
+class ContentItemTask(NamedTuple):
+    """A single content item to parse, with the pack context needed to parse it."""
+
+    pack_id: str
+    index: int
+    path: Path
+    pack_marketplaces: List[MarketplaceVersions]
+    pack_supported_modules: List[str]
 
 
 class RepositoryParser:
@@ -39,32 +53,120 @@ class RepositoryParser:
         packs_to_parse: Optional[Tuple[Path, ...]] = None,
         progress_bar: Optional[tqdm] = None,
     ):
+        """Parses the repository packs.
+
+        The pack metadata is parsed first, then the content items of all packs are parsed as independent tasks
+        in a single pool, so a large pack is spread across all the workers instead of being parsed by a single one.
+        Once all the content items of a pack are parsed, they are added to the pack in their original order.
+
+        Args:
+            packs_to_parse (Optional[Tuple[Path, ...]]): The paths of the packs to parse. If not provided, parses all packs.
+            progress_bar (Optional[tqdm]): A progress bar to update for every parsed pack.
+        """
         if not packs_to_parse:
             # if no packs to parse were provided, parse all packs
             packs_to_parse = tuple(self.iter_packs())
         try:
             logger.debug("Parsing packs...")
             with multiprocessing.Pool(processes=cpu_count()) as pool:
+                packs: Dict[str, PackParser] = {}
+                tasks: List[ContentItemTask] = []
                 for pack in pool.imap_unordered(
                     RepositoryParser.parse_pack, packs_to_parse
                 ):
-                    if pack:
-                        self.packs.append(pack)
-                        if progress_bar:
-                            progress_bar.update(1)
+                    if not pack:
+                        continue
+                    packs[pack.object_id] = pack
+                    tasks.extend(
+                        ContentItemTask(
+                            pack.object_id,
+                            index,
+                            content_item_path,
+                            pack.marketplaces,
+                            pack.supportedModules,
+                        )
+                        for index, content_item_path in enumerate(
+                            pack.iter_content_item_paths()
+                        )
+                    )
+
+                remaining_items = Counter(task.pack_id for task in tasks)
+                for pack_id in packs.keys() - remaining_items.keys():
+                    self.add_pack(packs[pack_id], [], progress_bar)
+
+                logger.debug(f"Parsing {len(tasks)} content items...")
+                parsed_items: Dict[str, List[Tuple[int, ContentItemParser]]] = (
+                    defaultdict(list)
+                )
+                for pack_id, index, content_item in pool.imap_unordered(
+                    RepositoryParser.parse_content_item,
+                    tasks,
+                    chunksize=self.get_chunksize(len(tasks)),
+                ):
+                    if content_item:
+                        parsed_items[pack_id].append((index, content_item))
+                    remaining_items[pack_id] -= 1
+                    if not remaining_items[pack_id]:
+                        self.add_pack(
+                            packs[pack_id], parsed_items.pop(pack_id, []), progress_bar
+                        )
         except Exception as e:
             logger.error(e)
             logger.error(traceback.format_exc())
             raise
+        parser_cache = ParserCache()
+        if parser_cache.enabled:
+            parser_cache.evict()
+
+    def add_pack(
+        self,
+        pack: PackParser,
+        content_items: List[Tuple[int, ContentItemParser]],
+        progress_bar: Optional[tqdm] = None,
+    ) -> None:
+        """Adds a pack with its parsed content items to the repository.
+
+        Args:
+            pack (PackParser): The pack parser, without content items.
+            content_items (List[Tuple[int, ContentItemParser]]): The parsed content items with their original index.
+            progress_bar (Optional[tqdm]): A progress bar to update.
+        """
+        for _, content_item in sorted(content_items, key=lambda item: item[0]):
+            pack.add_content_item(content_item)
+        self.packs.append(pack)
+        if progress_bar:
+            progress_bar.update(1)
+
+    @staticmethod
+    def get_chunksize(tasks_count: int) -> int:
+        """Returns a chunk size small enough to keep all the workers busy until the last task."""
+        return max(
+            1, min(MAX_CONTENT_ITEMS_CHUNK_SIZE, tasks_count // (cpu_count() * 4))
+        )
 
     @staticmethod
     def parse_pack(pack_path: Path) -> Optional[PackParser]:
         try:
-            return PackParser(pack_path)
+            return PackParser(pack_path, metadata_only=True)
         except (NotAContentItemException, FileNotFoundError):
             logger.warning(f"Pack {pack_path.name} is not a valid pack. Skipping")
             return None
 
+    @staticmethod
+    def parse_content_item(
+        task: ContentItemTask,
+    ) -> Tuple[str, int, Optional[ContentItemParser]]:
+        return (
+            task.pack_id,
+            task.index,
+            PackParser.parse_content_item_path(
+                task.path,
+                task.pack_marketplaces,
+                task.pack_supported_modules,
+                ParserCache(),
+            ),
+        )
+
     @staticmethod
     def should_parse_pack(path: Path) -> bool:
         return (
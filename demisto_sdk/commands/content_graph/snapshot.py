@@ -0,0 +1,382 @@
+"""A columnar, memory-mappable file format for content graph snapshots.
+
+A snapshot file holds the whole graph of a single repository:
+- A node table for every set of labels (i.e., every content type). The nodes of a table have consecutive ids,
+  starting at the `first_id` of the table, so a node id is never stored.
+- An edge list for every relationship type, holding the source and target node ids of every relationship.
+- Every node/relationship property is stored in its own column, as a packed array for booleans and numbers,
+  and as an offsets array and a UTF-8 blob for strings (and JSON encoded values for lists).
+
+File layout:
+    MAGIC (8 bytes) | header length (8 bytes, little endian) | header (JSON) | data sections (8 bytes aligned)
+
+The header describes the tables and the offset (relative to the start of the data) and length of every section,
+so a table or a column is decoded straight from the memory-mapped file, without reading the rest of it.
+Node ids are local to a file, so the snapshots of several repositories are loaded together by offsetting the
+ids of every file by the number of nodes loaded before it.
+"""
+
+import mmap
+import sys
+from array import array
+from enum import Enum
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+)
+
+from demisto_sdk.commands.common.handlers import JSON_Handler
+from demisto_sdk.commands.common.logger import logger
+
+json = JSON_Handler()
+
+SNAPSHOT_FILE_SUFFIX = ".graphsnap"
+SNAPSHOT_VERSION = 1
+MAGIC = b"DSGRAPH\x00"
+ALIGNMENT = 8
+
+BOOL = "bool"
+INT = "int"
+FLOAT = "float"
+STR = "str"
+JSON = "json"
+
+# The array type codes of the packed columns
+ARRAY_TYPECODES = {BOOL: "b", INT: "q", FLOAT: "d"}
+OFFSETS_TYPECODE = "Q"
+NODE_IDS_TYPECODE = "I"
+
+NodeRecord = Tuple[Hashable, Iterable[str], Dict[str, Any]]
+RelationshipRecord = Tuple[Hashable, str, Hashable, Dict[str, Any]]
+
+
+class SnapshotFormatError(Exception):
+    pass
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (list, tuple, set)):
+        return [_plain(v) for v in value]
+    if isinstance(value, Path):
+        return value.as_posix()
+    return value
+
+
+def _column_type(values: Iterable[Any]) -> str:
+    types = {type(value) for value in values if value is not None}
+    if not types:
+        return STR
+    if types == {bool}:
+        return BOOL
+    if types == {int}:
+        return INT
+    if types == {float}:
+        return FLOAT
+    if types == {str}:
+        return STR
+    return JSON
+
+
+def _aligned(length: int) -> int:
+    return length + (-length % ALIGNMENT)
+
+
+def _encode_column(values: List[Any]) -> Tuple[str, List[bytes]]:
+    """Encodes a column to its type and its data sections (mask first)."""
+    column_type = _column_type(values)
+    mask = bytes(value is not None for value in values)
+    if column_type in ARRAY_TYPECODES:
+        packed = array(
+            ARRAY_TYPECODES[column_type],
+            (value if value is not None else 0 for value in values),
+        )
+        return column_type, [mask, packed.tobytes()]
+    offsets = array(OFFSETS_TYPECODE, [0])
+    blob = bytearray()
+    for value in values:
+        if value is not None:
+            blob += (value if column_type == STR else json.dumps(value)).encode("utf-8")
+        offsets.append(len(blob))
+    return column_type, [mask, offsets.tobytes(), bytes(blob)]
+
+
+def _build_header_sections(
+    columns: Dict[str, List[Any]], sections: List[bytes]
+) -> Dict[str, Dict[str, Any]]:
+    descriptors = {}
+    for name, values in columns.items():
+        column_type, data = _encode_column(values)
+        descriptors[name] = {"type": column_type, "sections": len(data)}
+        sections.extend(data)
+    return descriptors
+
+
+def write_snapshot(
+    path: Path,
+    nodes: Iterable[NodeRecord],
+    relationships: Iterable[RelationshipRecord],
+) -> None:
+    """Writes a graph snapshot file.
+
+    Args:
+        path (Path): The snapshot file path.
+        nodes (Iterable[NodeRecord]): (node key, labels, properties) records. The key is any hashable which identifies the node.
+        relationships (Iterable[RelationshipRecord]): (source node key, relationship type, target node key, properties) records.
+    """
+    node_tables: Dict[Tuple[str, ...], List[Tuple[Hashable, Dict[str, Any]]]] = {}
+    for key, labels, properties in nodes:
+        node_tables.setdefault(tuple(sorted(labels)), []).append((key, properties))
+
+    node_ids: Dict[Hashable, int] = {}
+    header: Dict[str, Any] = {
+        "version": SNAPSHOT_VERSION,
+        "byteorder": sys.byteorder,
+        "node_tables": [],
+        "relationship_tables": [],
+    }
+    sections: List[bytes] = []
+    for labels, rows in node_tables.items():
+        first_id = len(node_ids)
+        columns: Dict[str, List[Any]] = {}
+        for row_id, (key, properties) in enumerate(rows):
+            node_ids[key] = first_id + row_id
+            for name, value in properties.items():
+                columns.setdefault(name, [None] * len(rows))[row_id] = _plain(value)
+        header["node_tables"].append(
+            {
+                "labels": list(labels),
+                "first_id": first_id,
+                "count": len(rows),
+                "columns": _build_header_sections(columns, sections),
+            }
+        )
+
+    relationship_tables: Dict[str, List[Tuple[int, int, Dict[str, Any]]]] = {}
+    for source, relationship_type, target, properties in relationships:
+        relationship_tables.setdefault(str(_plain(relationship_type)), []).append(
+            (node_ids[source], node_ids[target], properties)
+        )
+    for relationship_type, edges in relationship_tables.items():
+        columns = {}
+        for row_id, (_, _, properties) in enumerate(edges):
+            for name, value in properties.items():
+                columns.setdefault(name, [None] * len(edges))[row_id] = _plain(value)
+        sections.append(array(NODE_IDS_TYPECODE, (e[0] for e in edges)).tobytes())
+        sections.append(array(NODE_IDS_TYPECODE, (e[1] for e in edges)).tobytes())
+        header["relationship_tables"].append(
+            {
+                "type": relationship_type,
+                "count": len(edges),
+                "columns": _build_header_sections(columns, sections),
+            }
+        )
+    header["node_count"] = len(node_ids)
+
+    offset = 0
+    header["sections"] = []
+    for data in sections:
+        header["sections"].append({"offset": offset, "length": len(data)})
+        offset += _aligned(len(data))
+    header_bytes = json.dumps(header).encode("utf-8")
+    header_bytes += b" " * (_aligned(len(header_bytes)) - len(header_bytes))
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(len(header_bytes).to_bytes(8, "little"))
+        f.write(header_bytes)
+        for data in sections:
+            f.write(data)
+            f.write(b"\x00" * (_aligned(len(data)) - len(data)))
+    logger.debug(
+        f"Wrote a graph snapshot of {len(node_ids)} nodes and "
+        f"{sum(len(edges) for edges in relationship_tables.values())} relationships to {path}"
+    )
+
+
+class _Column:
+    def __init__(self, snapshot: "GraphSnapshot", descriptor: dict, first_section: int):
+        self.type = descriptor["type"]
+        self._snapshot = snapshot
+        self._first_section = first_section
+
+    def decode(self, count: int) -> List[Any]:
+        mask = self._snapshot._section(self._first_section)
+        if self.type in ARRAY_TYPECODES:
+            values = self._snapshot._array(
+                self._first_section + 1, ARRAY_TYPECODES[self.type]
+            )
+            if self.type == BOOL:
+                return [bool(v) if m else None for m, v in zip(mask, values)]
+            return [v if m else None for m, v in zip(mask, values)]
+        offsets = self._snapshot._array(self._first_section + 1, OFFSETS_TYPECODE)
+        blob = self._snapshot._section(self._first_section + 2)
+        result: List[Any] = []
+        for i in range(count):
+            if not mask[i]:
+                result.append(None)
+                continue
+            value = str(blob[offsets[i] : offsets[i + 1]], "utf-8")
+            result.append(value if self.type == STR else json.loads(value))
+        return result
+
+
+class _Table:
+    def __init__(self, snapshot: "GraphSnapshot", descriptor: dict, first_section: int):
+        self.count: int = descriptor["count"]
+        self._snapshot = snapshot
+        self.columns: Dict[str, _Column] = {}
+        for name, column in descriptor["columns"].items():
+            self.columns[name] = _Column(snapshot, column, first_section)
+            first_section += column["sections"]
+        self.sections_count = first_section
+
+    def column(self, name: str) -> List[Any]:
+        if name not in self.columns:
+            return [None] * self.count
+        return self.columns[name].decode(self.count)
+
+    def properties(self) -> Iterator[Dict[str, Any]]:
+        """Yields the properties of every row, without the missing (null) ones."""
+        names = list(self.columns)
+        columns = [self.column(name) for name in names]
+        for values in zip(*columns) if columns else ((),) * self.count:
+            yield {
+                name: value for name, value in zip(names, values) if value is not None
+            }
+
+
+class NodeTable(_Table):
+    def __init__(self, snapshot: "GraphSnapshot", descriptor: dict, first_section: int):
+        super().__init__(snapshot, descriptor, first_section)
+        self.labels: List[str] = descriptor["labels"]
+        self.first_id: int = descriptor["first_id"]
+
+    def rows(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yields (node id, properties) rows."""
+        return enumerate(self.properties(), self.first_id)
+
+
+class RelationshipTable(_Table):
+    def __init__(self, snapshot: "GraphSnapshot", descriptor: dict, first_section: int):
+        self._edges_section = first_section
+        super().__init__(snapshot, descriptor, first_section + 2)
+        self.type: str = descriptor["type"]
+
+    @property
+    def sources(self) -> List[int]:
+        return self._snapshot._array(self._edges_section, NODE_IDS_TYPECODE)
+
+    @property
+    def targets(self) -> List[int]:
+        return self._snapshot._array(self._edges_section + 1, NODE_IDS_TYPECODE)
+
+    def rows(self) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+        """Yields (source node id, target node id, properties) rows."""
+        return zip(self.sources, self.targets, self.properties())
+
+
+class GraphSnapshot:
+    """A read-only view of a graph snapshot file, which is memory-mapped rather than read.
+
+    Should be used as a context manager, so the file is unmapped when done.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # an empty file can't be mapped
+            self._file.close()
+            raise SnapshotFormatError(f"{path} is not a graph snapshot")
+        self._view = memoryview(self._mmap)
+        try:
+            self._read_header()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_header(self) -> None:
+        if self._view[: len(MAGIC)] != MAGIC:
+            raise SnapshotFormatError(f"{self.path} is not a graph snapshot")
+        header_start = len(MAGIC) + 8
+        header_length = int.from_bytes(self._view[len(MAGIC) : header_start], "little")
+        self.header = json.loads(
+            str(self._view[header_start : header_start + header_length], "utf-8")
+        )
+        if self.header.get("version") != SNAPSHOT_VERSION:
+            raise SnapshotFormatError(
+                f"Unsupported graph snapshot version {self.header.get('version')} in {self.path}"
+            )
+        self._data_start = header_start + header_length
+        self._sections: List[Dict[str, int]] = self.header["sections"]
+        self._swap_bytes = self.header["byteorder"] != sys.byteorder
+
+        self.node_tables: List[NodeTable] = []
+        self.relationship_tables: List[RelationshipTable] = []
+        section = 0
+        for descriptor in self.header["node_tables"]:
+            table = NodeTable(self, descriptor, section)
+            self.node_tables.append(table)
+            section = table.sections_count
+        for descriptor in self.header["relationship_tables"]:
+            relationship_table = RelationshipTable(self, descriptor, section)
+            self.relationship_tables.append(relationship_table)
+            section = relationship_table.sections_count
+
+    @property
+    def node_count(self) -> int:
+        return self.header["node_count"]
+
+    def _section(self, index: int) -> memoryview:
+        section = self._sections[index]
+        start = self._data_start + section["offset"]
+        return self._view[start : start + section["length"]]
+
+    def _array(self, index: int, typecode: str) -> List[Any]:
+        section = self._section(index)
+        if not self._swap_bytes:
+            return section.cast(typecode).tolist()
+        values = array(typecode, section)
+        values.byteswap()
+        return values.tolist()
+
+    def close(self) -> None:
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "GraphSnapshot":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+def read_snapshots(
+    paths: Iterable[Path],
+) -> Iterator[Tuple[int, GraphSnapshot]]:
+    """Opens the snapshots of several repositories one after the other.
+
+    Yields:
+        Tuple[int, GraphSnapshot]: The id offset of the snapshot and the snapshot.
+            The node ids of the snapshot should be offset by it, so the ids of all the snapshots are unique.
+    """
+    offset = 0
+    for path in paths:
+        with GraphSnapshot(path) as snapshot:
+            yield offset, snapshot
+            offset += snapshot.node_count
+
+
+def get_snapshot_paths(directory: Path) -> List[Path]:
+    return sorted(
+        path for path in directory.iterdir() if path.suffix == SNAPSHOT_FILE_SUFFIX
+    )
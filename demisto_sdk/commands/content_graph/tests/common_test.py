@@ -8,6 +8,9 @@ from ruamel.yaml.scalarstring import (  # noqa: TID251 - only importing FoldedSc
 from demisto_sdk.commands.content_graph.common import (
     ContentType,
     MarketplaceVersions,
+    Relationship,
+    Relationships,
+    RelationshipType,
     replace_marketplace_references,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.common import (
@@ -337,3 +340,57 @@ def test_replace_marketplace_references__error_handling():
     mock_logger.error.assert_called_once_with(
         "Error processing data for replacing incorrect marketplace at path 'example/path': Test exception"
     )
+
+
+def test_relationships_update_does_not_revalidate(mocker):
+    """
+    Given:
+        - A Relationships object with a validated relationship.
+    When:
+        - Merging it into another Relationships object.
+    Then:
+        - Make sure the relationship is not validated again, and the same data is merged.
+    """
+    relationships = Relationships()
+    relationships.add(
+        RelationshipType.USES_BY_ID,
+        source_id="MyScript",
+        source_type=ContentType.SCRIPT,
+        target="OtherScript",
+        target_type=ContentType.BASE_SCRIPT,
+        mandatorily=True,
+    )
+    parse_obj = mocker.spy(Relationship, "parse_obj")
+
+    merged = Relationships()
+    merged.update(relationships)
+
+    assert parse_obj.call_count == 0
+    assert merged == relationships
+    assert (
+        merged[RelationshipType.USES_BY_ID][0]
+        is relationships[RelationshipType.USES_BY_ID][0]
+    )
+
+
+def test_relationships_update_validates_untrusted_data():
+    """
+    Given:
+        - A plain dict of relationships data, with a None value.
+    When:
+        - Merging it into a Relationships object.
+    Then:
+        - Make sure the data is validated, and the None value is excluded.
+    """
+    merged = Relationships()
+    merged.update(
+        {
+            RelationshipType.IN_PACK: [
+                {"source_id": "MyScript", "target": "MyPack", "mandatorily": None}
+            ]
+        }
+    )
+
+    assert merged[RelationshipType.IN_PACK] == [
+        {"source_id": "MyScript", "target": "MyPack"}
+    ]
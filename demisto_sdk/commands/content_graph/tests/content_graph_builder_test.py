@@ -0,0 +1,91 @@
+from pathlib import Path
+
+from demisto_sdk.commands.content_graph import content_graph_builder
+from demisto_sdk.commands.content_graph.common import ContentType
+from demisto_sdk.commands.content_graph.content_graph_builder import (
+    ContentGraphBuilder,
+)
+from demisto_sdk.commands.content_graph.objects import repository
+from TestSuite.repo import Repo
+
+
+def test_create_graph_in_batches(mocker, graph_repo: Repo):
+    """
+    Given:
+        - A repository with three packs, and a batch size of two packs.
+    When:
+        - Creating the content graph.
+    Then:
+        - Make sure the packs are parsed and their nodes are written in two batches.
+        - Make sure the relationships are written only after all the nodes were written.
+        - Make sure no batch is cached in memory.
+    """
+    for name in ("PackA", "PackB", "PackC"):
+        graph_repo.create_pack(name).create_script(f"{name}Script")
+    content_graph = mocker.MagicMock()
+    content_graph.repo_path = Path(graph_repo.path)
+    content_graph.parse_manifest = None
+    mocker.patch.object(content_graph_builder, "PACKS_PER_BATCH", 2)
+    repository.from_path.cache_clear()
+    original_parse_repository = repository.parse_repository
+    parse_repository = mocker.patch.object(
+        repository,
+        "parse_repository",
+        side_effect=lambda path, packs: original_parse_repository(
+            content_graph.repo_path, packs
+        ),
+    )
+
+    ContentGraphBuilder(content_graph).create_graph()
+
+    assert [len(call.args[1]) for call in parse_repository.call_args_list] == [2, 1]
+    assert repository.from_path.cache_info().currsize == 0
+    method_calls = [
+        call[0]
+        for call in content_graph.method_calls
+        if call[0] in ("create_nodes", "create_relationships")
+    ]
+    assert method_calls == [
+        "create_nodes",
+        "create_nodes",
+        "create_relationships",
+        "create_relationships",
+    ]
+    packs = [
+        node["object_id"]
+        for call in content_graph.create_nodes.call_args_list
+        for node in call.args[0][ContentType.PACK]
+    ]
+    assert sorted(packs) == ["PackA", "PackB", "PackC"]
+    assert all(
+        call.args[0] for call in content_graph.create_relationships.call_args_list
+    )
+
+
+def test_create_graph_single_batch(mocker, graph_repo: Repo):
+    """
+    Given:
+        - A repository with fewer packs than the batch size.
+    When:
+        - Creating the content graph.
+    Then:
+        - Make sure the whole repository is parsed at once.
+    """
+    graph_repo.create_pack("MyPack").create_script("MyScript")
+    content_graph = mocker.MagicMock()
+    content_graph.repo_path = Path(graph_repo.path)
+    content_graph.parse_manifest = None
+    builder = ContentGraphBuilder(content_graph)
+    create_content_dto = mocker.patch.object(
+        builder,
+        "_create_content_dto",
+        side_effect=lambda packs: repository.parse_repository(
+            content_graph.repo_path, packs
+        ),
+    )
+
+    builder.create_graph()
+
+    create_content_dto.assert_called_once_with(None)
+    assert content_graph.create_nodes.call_count == 1
+    assert content_graph.create_relationships.call_count == 1
@@ -15,6 +15,9 @@ from demisto_sdk.commands.content_graph.common import (
     Relationships,
     RelationshipType,
 )
+from demisto_sdk.commands.content_graph.interface.neo4j.import_utils import (
+    GRAPHML_FILE_SUFFIX,
+)
 from demisto_sdk.commands.content_graph.objects import IncidentField, Layout, Mapper
 from demisto_sdk.commands.content_graph.objects.classifier import Classifier
 from demisto_sdk.commands.content_graph.objects.content_item import ContentItem
@@ -29,6 +32,8 @@ from demisto_sdk.commands.content_graph.objects.repository import ContentDTO
 from demisto_sdk.commands.content_graph.objects.script import Script
 from demisto_sdk.commands.content_graph.objects.test_playbook import TestPlaybook
 from demisto_sdk.commands.content_graph.objects.widget import Widget
+from demisto_sdk.commands.content_graph.parse_manifest import PARSE_MANIFEST_FILE_NAME
+from demisto_sdk.commands.content_graph.snapshot import SNAPSHOT_FILE_SUFFIX
 from demisto_sdk.commands.content_graph.tests.test_tools import load_json
 from TestSuite.repo import Repo
 from TestSuite.test_tools import ChangeCWD
@@ -579,9 +584,15 @@ class TestCreateContentGraph:
             extracted_files = list(tmp_path.glob("extracted/*"))
             assert extracted_files
             assert all(
-                file.suffix == ".graphml" or file.name == "metadata.json"
+                file.suffix in (SNAPSHOT_FILE_SUFFIX, GRAPHML_FILE_SUFFIX)
+                or file.name in ("metadata.json", PARSE_MANIFEST_FILE_NAME)
                 for file in extracted_files
             )
+            # the GraphML file is exported for SDK versions which only import GraphML files
+            assert {file.suffix for file in extracted_files} >= {
+                SNAPSHOT_FILE_SUFFIX,
+                GRAPHML_FILE_SUFFIX,
+            }
 
     def test_create_content_graph_relationships(self, graph_repo: Repo):
         """
@@ -831,7 +842,8 @@ class TestCreateContentGraph:
         When:
             - Running create_content_graph().
         Then:
-            - Make sure the relationship's is_test is not null.
+            - Make sure the relationship's is_test is not null
+              (queried directly only by the interfaces which support queries).
         """
         graph_repo.create_pack("NonCorePack")
         graph_repo.create_pack("Core").set_data(
@@ -842,6 +854,14 @@ class TestCreateContentGraph:
 
         interface = graph_repo.create_graph()
 
+        [core] = interface.search(object_id="Core", content_type=ContentType.PACK)
+        assert [
+            (dependency.content_item_to.object_id, dependency.is_test)
+            for dependency in core.depends_on
+        ] == [("NonCorePack", False)]
+
+        if not interface.supports_queries:
+            return
         where_test_null = "WHERE r.is_test IS NULL"
         query = "MATCH p=()-[r:DEPENDS_ON]->() {where} RETURN p"
         data = interface.run_single_query(query.format(where=""))[0]["p"]
@@ -0,0 +1,64 @@
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from zipfile import ZipFile
+
+import pytest
+
+from demisto_sdk.commands.content_graph.interface.neo4j import import_utils
+from demisto_sdk.commands.content_graph.tests.test_tools import TEST_DATA_PATH
+
+XML_NAMESPACE = "{http://graphml.graphdrawing.org/xmlns}"
+
+
+def graph_elements(path: Path):
+    root = ET.parse(path).getroot()
+    return (
+        [
+            (node.attrib, [(d.attrib, d.text) for d in node])
+            for node in root.iter(f"{XML_NAMESPACE}node")
+        ],
+        [
+            (edge.attrib, [(d.attrib, d.text) for d in edge])
+            for edge in root.iter(f"{XML_NAMESPACE}edge")
+        ],
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1024 * 1024])
+def test_set_unique_ids(tmp_path: Path, monkeypatch, chunk_size: int):
+    """
+    Given:
+        - A GraphML file exported by Neo4j.
+    When:
+        - Setting unique ids for it, in chunks which split its tags and in a single chunk.
+    Then:
+        - Make sure the node, edge, source and target ids are prefixed.
+        - Make sure nothing else is changed.
+    """
+    monkeypatch.setattr(import_utils, "ID_REWRITE_CHUNK_SIZE", chunk_size)
+    with ZipFile(
+        TEST_DATA_PATH / "mock_import_files_multiple_repos__valid" / "valid_graph.zip"
+    ) as zip_obj:
+        zip_obj.extractall(tmp_path)
+    source = next(tmp_path.glob("*.graphml"))
+    nodes, edges = graph_elements(source)
+
+    import_utils.set_unique_ids(source.as_posix(), "2")
+
+    prefixed_nodes, prefixed_edges = graph_elements(source)
+    assert prefixed_nodes == [
+        ({**attrib, "id": f"n2{attrib['id'][1:]}"}, data) for attrib, data in nodes
+    ]
+    assert prefixed_edges == [
+        (
+            {
+                **attrib,
+                "id": f"e2{attrib['id'][1:]}",
+                "source": f"n2{attrib['source'][1:]}",
+                "target": f"n2{attrib['target'][1:]}",
+            },
+            data,
+        )
+        for attrib, data in edges
+    ]
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,342 @@
+from pathlib import Path
+from zipfile import ZipFile
+
+import pytest
+
+from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.content_graph.common import ContentType, RelationshipType
+from demisto_sdk.commands.content_graph.interface.graph import UnsupportedQueryError
+from demisto_sdk.commands.content_graph.interface.memory.import_export import (
+    export_graphml,
+    export_snapshot,
+    import_graphml,
+    import_snapshots,
+    merge_duplicate_commands,
+    merge_duplicate_content_items,
+)
+from demisto_sdk.commands.content_graph.interface.memory.memory_graph import (
+    MemoryContentGraphInterface,
+)
+from demisto_sdk.commands.content_graph.interface.memory.queries.dependencies import (
+    create_pack_dependencies,
+)
+from demisto_sdk.commands.content_graph.interface.memory.queries.nodes import (
+    _match,
+)
+from demisto_sdk.commands.content_graph.interface.memory.queries.relationships import (
+    create_relationships,
+)
+from demisto_sdk.commands.content_graph.interface.memory.store import GraphStore
+from demisto_sdk.commands.content_graph.interface.neo4j.import_utils import (
+    Neo4jImportHandler,
+)
+from demisto_sdk.commands.content_graph.tests.test_tools import TEST_DATA_PATH
+
+
+def create_pack(store: GraphStore, pack_id: str, **properties):
+    return store.create_node(
+        ContentType.PACK.labels,
+        {
+            "object_id": pack_id,
+            "name": pack_id,
+            "content_type": ContentType.PACK,
+            "marketplaces": [MarketplaceVersions.XSOAR.value],
+            "excluded_dependencies": [],
+            "not_in_repository": False,
+            **properties,
+        },
+    )
+
+
+def create_script(store: GraphStore, script_id: str, **properties):
+    return store.create_node(
+        ContentType.SCRIPT.labels,
+        {
+            "object_id": script_id,
+            "name": script_id,
+            "content_type": ContentType.SCRIPT,
+            "marketplaces": [MarketplaceVersions.XSOAR.value],
+            "fromversion": "5.0.0",
+            "toversion": "99.99.99",
+            "is_test": False,
+            "deprecated": False,
+            "not_in_repository": False,
+            **properties,
+        },
+    )
+
+
+def in_pack(script_id: str, pack_id: str) -> dict:
+    return {
+        "source_id": script_id,
+        "source_type": ContentType.SCRIPT,
+        "source_fromversion": "5.0.0",
+        "source_marketplaces": [MarketplaceVersions.XSOAR.value],
+        "target": pack_id,
+    }
+
+
+class TestGraphStore:
+    def test_find_nodes_ignores_nulls(self):
+        """
+        Given:
+            - A graph with a single script.
+        When:
+            - Searching nodes by a null property value.
+        Then:
+            - Make sure nothing is matched, same as in Neo4j.
+        """
+        store = GraphStore()
+        create_script(store, "Script")
+        assert store.find_nodes(object_id="Script")
+        assert not store.find_nodes(object_id=None)
+
+    def test_delete_node_removes_relationships(self):
+        """
+        Given:
+            - A script in a pack.
+        When:
+            - Deleting the script.
+        Then:
+            - Make sure its relationships are deleted as well.
+        """
+        store = GraphStore()
+        pack = create_pack(store, "Pack")
+        script = create_script(store, "Script")
+        store.create_relationship(RelationshipType.IN_PACK, script, pack)
+        store.delete_node(script)
+        assert not store.relationships
+        assert not store.incoming(pack)
+
+
+class TestMemoryQueries:
+    def test_create_uses_relationships_to_unknown_content(self):
+        """
+        Given:
+            - A script which uses a script that is not in the repository.
+        When:
+            - Creating the USES relationships.
+        Then:
+            - Make sure a placeholder node is created for the missing script.
+        """
+        store = GraphStore()
+        create_pack(store, "Pack")
+        create_script(store, "Script")
+        create_relationships(
+            store,
+            {
+                RelationshipType.IN_PACK: [in_pack("Script", "Pack")],
+                RelationshipType.USES_BY_ID: [
+                    {
+                        **in_pack("Script", "Unknown"),
+                        "target_type": ContentType.SCRIPT,
+                        "mandatorily": True,
+                    }
+                ],
+            },
+        )
+        unknown = store.find_nodes(object_id="Unknown")
+        assert len(unknown) == 1
+        assert unknown[0].get("not_in_repository") is True
+        assert [r.get("mandatorily") for r in store.incoming(unknown[0])] == [True]
+
+    def test_create_pack_dependencies(self):
+        """
+        Given:
+            - A script in Pack1 which mandatorily uses a script in Pack2.
+        When:
+            - Creating the pack dependencies.
+        Then:
+            - Make sure a mandatory DEPENDS_ON relationship is created between the packs.
+        """
+        store = GraphStore()
+        pack1 = create_pack(store, "Pack1")
+        pack2 = create_pack(store, "Pack2")
+        create_script(store, "Script1")
+        create_script(store, "Script2")
+        create_relationships(
+            store,
+            {
+                RelationshipType.IN_PACK: [
+                    in_pack("Script1", "Pack1"),
+                    in_pack("Script2", "Pack2"),
+                ],
+                RelationshipType.USES_BY_ID: [
+                    {
+                        **in_pack("Script1", "Script2"),
+                        "target_type": ContentType.SCRIPT,
+                        "mandatorily": True,
+                    }
+                ],
+            },
+        )
+        create_pack_dependencies(store)
+        depends_on = store.outgoing(pack1, RelationshipType.DEPENDS_ON)
+        assert len(depends_on) == 1
+        assert depends_on[0].end_node is pack2
+        assert depends_on[0].get("mandatorily") is True
+        assert depends_on[0].get("is_test") is False
+
+    def test_match_by_marketplace(self):
+        """
+        Given:
+            - Two scripts, one of them is in the marketplacev2 marketplace only.
+        When:
+            - Matching the scripts of the xsoar marketplace.
+        Then:
+            - Make sure only the xsoar script is matched.
+        """
+        store = GraphStore()
+        create_script(store, "Script1")
+        create_script(
+            store, "Script2", marketplaces=[MarketplaceVersions.MarketplaceV2.value]
+        )
+        assert [
+            node.get("object_id")
+            for node in _match(store, MarketplaceVersions.XSOAR, ContentType.SCRIPT)
+        ] == ["Script1"]
+
+
+class TestImportExport:
+    def test_export_and_import(self, tmp_path: Path):
+        """
+        Given:
+            - A graph with typed properties (lists, booleans, strings).
+        When:
+            - Exporting the graph to a snapshot file and importing it to a new graph.
+        Then:
+            - Make sure the nodes, labels, properties and relationships are the same.
+        """
+        store = GraphStore()
+        pack = create_pack(store, "Pack", hidden=True)
+        script = create_script(store, "Script", tags=["a", "b & c"])
+        store.create_relationship(
+            RelationshipType.USES, script, pack, {"mandatorily": False}
+        )
+        export_snapshot(store, tmp_path / "content.graphsnap")
+
+        imported = GraphStore()
+        import_snapshots(imported, [tmp_path / "content.graphsnap"])
+        assert {
+            n.get("object_id"): (n.labels, n.properties)
+            for n in imported.nodes.values()
+        } == {
+            n.get("object_id"): (n.labels, n.properties) for n in store.nodes.values()
+        }
+        [relationship] = imported.relationships.values()
+        assert relationship.type == RelationshipType.USES
+        assert relationship.properties == {"mandatorily": False}
+        assert relationship.start_node.get("object_id") == "Script"
+
+    def test_import_neo4j_export(self, tmp_path: Path):
+        """
+        Given:
+            - GraphML files of two repositories, which were exported by Neo4j.
+        When:
+            - Importing them and merging the duplicate commands.
+        Then:
+            - Make sure the nodes of both repositories are imported and the commands are merged.
+        """
+        with ZipFile(
+            TEST_DATA_PATH
+            / "mock_import_files_multiple_repos__valid"
+            / "valid_graph.zip"
+        ) as zip_obj:
+            zip_obj.extractall(tmp_path)
+        store = GraphStore()
+        import_graphml(store, sorted(tmp_path.glob("*.graphml")))
+        merge_duplicate_commands(store)
+
+        assert {
+            node.get("object_id") for node in store.candidates([ContentType.PACK])
+        } == {"SamplePack", "SamplePack4"}
+        [command] = store.find_nodes([ContentType.COMMAND])
+        assert len(store.incoming(command, RelationshipType.HAS_COMMAND)) == 2
+
+    def test_graphml_of_snapshot_is_not_imported(self, mocker, tmp_path: Path):
+        """
+        Given:
+            - A repository exported as both a snapshot and a GraphML file (for SDK versions which only import GraphML).
+            - A repository exported as a GraphML file only.
+        When:
+            - Getting the GraphML files to import.
+        Then:
+            - Make sure only the GraphML file of the repository without a snapshot is imported,
+              so the first repository is not imported twice.
+        """
+        repo1 = GraphStore()
+        create_script(repo1, "Script1")
+        export_snapshot(repo1, tmp_path / "repo1.graphsnap")
+        export_graphml(repo1, tmp_path / "repo1.graphml")
+        repo2 = GraphStore()
+        create_script(repo2, "Script2")
+        export_graphml(repo2, tmp_path / "repo2.graphml")
+        import_handler = Neo4jImportHandler()
+        mocker.patch.object(import_handler, "import_path", tmp_path)
+
+        assert import_handler.get_snapshot_paths() == [tmp_path / "repo1.graphsnap"]
+        assert import_handler.get_graphml_filenames() == ["repo2.graphml"]
+
+        store = GraphStore()
+        import_snapshots(store, import_handler.get_snapshot_paths())
+        import_graphml(
+            store,
+            [tmp_path / name for name in import_handler.get_graphml_filenames()],
+        )
+        assert sorted(
+            node.get("object_id") for node in store.find_nodes([ContentType.SCRIPT])
+        ) == ["Script1", "Script2"]
+
+    def test_merge_duplicate_content_items(self, tmp_path: Path):
+        """
+        Given:
+            - Two repositories, the first uses a script which is in the second.
+        When:
+            - Importing both and merging the duplicate content items.
+        Then:
+            - Make sure the placeholder script is merged into the script of the second repository.
+        """
+        repo1 = GraphStore()
+        script = create_script(repo1, "Script1")
+        placeholder = repo1.create_node(
+            ContentType.SCRIPT.labels,
+            {
+                "object_id": "Script2",
+                "content_type": ContentType.SCRIPT,
+                "not_in_repository": True,
+            },
+        )
+        repo1.create_relationship(RelationshipType.USES, script, placeholder)
+        export_snapshot(repo1, tmp_path / "repo1.graphsnap")
+        repo2 = GraphStore()
+        create_script(repo2, "Script2")
+        export_snapshot(repo2, tmp_path / "repo2.graphsnap")
+
+        store = GraphStore()
+        import_snapshots(
+            store, [tmp_path / "repo1.graphsnap", tmp_path / "repo2.graphsnap"]
+        )
+        merge_duplicate_content_items(store)
+
+        assert not store.find_nodes(not_in_repository=True)
+        [script2] = store.find_nodes(object_id="Script2")
+        assert script2.get("fromversion") == "5.0.0"
+        [uses] = store.incoming(script2, RelationshipType.USES)
+        assert uses.start_node.get("object_id") == "Script1"
+
+
+class TestMemoryContentGraphInterface:
+    def test_run_single_query_is_unsupported(self):
+        """
+        Given:
+            - An in-memory content graph.
+        When:
+            - Running a Cypher query.
+        Then:
+            - Make sure the interface reports it does not support queries, and raises an UnsupportedQueryError.
+        """
+        interface = MemoryContentGraphInterface.from_records([], [])
+
+        assert not interface.supports_queries
+        with pytest.raises(UnsupportedQueryError):
+            interface.run_single_query("MATCH (n) RETURN n")
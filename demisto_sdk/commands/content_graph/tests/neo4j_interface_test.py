@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import List
 
 import pytest
@@ -72,3 +73,234 @@ class TestNeo4jQueries:
             )
             == "{object_id: rel_data.source_id, content_type: rel_data.source_type}"
         )
+
+
+class TestNeo4jWrites:
+    @staticmethod
+    def mock_interface(mocker):
+        from demisto_sdk.commands.content_graph.interface.neo4j.neo4j_graph import (
+            Neo4jContentGraphInterface,
+        )
+
+        interface = Neo4jContentGraphInterface.__new__(Neo4jContentGraphInterface)
+        interface.driver = mocker.MagicMock()
+        interface._rels_to_preserve = []
+        return interface
+
+    @staticmethod
+    def relationships_data(count: int) -> List[dict]:
+        return [{"source_id": f"Script{i}", "target": "MyPack"} for i in range(count)]
+
+    def test_create_relationships_in_chunks(self, mocker, monkeypatch):
+        """
+        Given:
+            - Relationships of several types, and a chunk size of 2 relationships for IN_PACK.
+        When:
+            - Creating the relationships.
+        Then:
+            - Make sure every IN_PACK chunk is written in its own transaction.
+            - Make sure commands are created before all the other types, and the alert to incident query runs last.
+        """
+        from demisto_sdk.commands.content_graph.common import RelationshipType
+        from demisto_sdk.commands.content_graph.interface.neo4j.neo4j_graph import (
+            create_relationships_by_type,
+            update_alert_to_incident,
+        )
+
+        monkeypatch.setenv("DEMISTO_SDK_GRAPH_RELATIONSHIPS_CHUNK_SIZE_IN_PACK", "2")
+        interface = self.mock_interface(mocker)
+        session = interface.driver.session.return_value.__enter__.return_value
+
+        interface.create_relationships(
+            {
+                RelationshipType.IN_PACK: self.relationships_data(5),
+                RelationshipType.USES_BY_ID: self.relationships_data(3),
+                RelationshipType.HAS_COMMAND: self.relationships_data(1),
+                RelationshipType.TESTED_BY: [],
+            }
+        )
+
+        calls = [call.args for call in session.execute_write.call_args_list]
+        written = [
+            (args[1], len(args[2]))
+            for args in calls
+            if args[0] == create_relationships_by_type
+        ]
+        assert written[0] == (RelationshipType.HAS_COMMAND, 1)
+        assert sorted(written[1:]) == sorted(
+            [
+                (RelationshipType.IN_PACK, 2),
+                (RelationshipType.IN_PACK, 2),
+                (RelationshipType.IN_PACK, 1),
+                (RelationshipType.USES_BY_ID, 3),
+            ]
+        )
+        assert calls[-1] == (update_alert_to_incident,)
+
+    def test_get_relationships_chunk_size(self, monkeypatch):
+        """
+        Given:
+            - A chunk size for all relationship types, and a chunk size for IN_PACK.
+        When:
+            - Getting the chunk sizes of IN_PACK, USES_BY_ID and a type this SDK version does not know.
+        Then:
+            - Make sure the specific chunk size takes precedence.
+            - Make sure the unknown type gets the default chunk size.
+        """
+        from demisto_sdk.commands.content_graph.common import RelationshipType
+        from demisto_sdk.commands.content_graph.interface.neo4j.neo4j_graph import (
+            get_relationships_chunk_size,
+        )
+
+        monkeypatch.setenv("DEMISTO_SDK_GRAPH_RELATIONSHIPS_CHUNK_SIZE", "100")
+        monkeypatch.setenv("DEMISTO_SDK_GRAPH_RELATIONSHIPS_CHUNK_SIZE_IN_PACK", "10")
+
+        assert get_relationships_chunk_size(RelationshipType.IN_PACK) == 10
+        assert get_relationships_chunk_size(RelationshipType.USES_BY_ID) == 100
+        assert get_relationships_chunk_size("UNKNOWN_TYPE") == 100
+
+        monkeypatch.delenv("DEMISTO_SDK_GRAPH_RELATIONSHIPS_CHUNK_SIZE")
+        assert get_relationships_chunk_size("UNKNOWN_TYPE") == 10000
+
+    def test_import_snapshots_failure(self, mocker):
+        """
+        Given:
+            - A snapshot file which fails to be read.
+        When:
+            - Importing the snapshot files.
+        Then:
+            - Make sure the import fails, and the snapshot ids and their index are removed anyway.
+        """
+        from demisto_sdk.commands.content_graph.interface.neo4j import neo4j_graph
+
+        mocker.patch.object(
+            neo4j_graph, "read_snapshots", side_effect=ValueError("bad snapshot")
+        )
+        interface = self.mock_interface(mocker)
+        session = mocker.MagicMock()
+
+        with pytest.raises(ValueError):
+            interface._import_snapshots(session, [Path("bad.snapshot")])
+
+        assert [call.args[0] for call in session.execute_write.call_args_list] == [
+            neo4j_graph.create_snapshot_id_index,
+            neo4j_graph.remove_snapshot_ids,
+            neo4j_graph.drop_snapshot_id_index,
+        ]
+
+
+class TestNeo4jNodesParsing:
+    @staticmethod
+    def nodes(mocker, count: int) -> list:
+        nodes = []
+        for i in range(count):
+            node = mocker.MagicMock()
+            node.element_id = f"n{i}"
+            node.items.return_value = {
+                "object_id": f"Script{i}",
+                "name": f"Script{i}",
+                "content_type": "Script",
+                "not_in_repository": True,
+            }.items()
+            nodes.append(node)
+        return nodes
+
+    def test_parse_nodes_inline(self, mocker):
+        """
+        Given:
+            - Less nodes than the parallel parsing threshold.
+        When:
+            - Adding the nodes to the content models mapping.
+        Then:
+            - Make sure the nodes are parsed without forking worker processes.
+        """
+        from demisto_sdk.commands.common import parallel
+
+        fork_pool = mocker.spy(parallel, "fork_pool")
+        interface = TestNeo4jWrites.mock_interface(mocker)
+        interface._id_to_obj = {}
+
+        interface._add_nodes_to_mapping(self.nodes(mocker, 3))
+
+        assert not fork_pool.called
+        assert interface._id_to_obj["n2"].object_id == "Script2"
+        assert not interface._id_to_obj["n2"].relationships_data
+
+    def test_parse_nodes_in_workers(self, mocker, monkeypatch):
+        """
+        Given:
+            - More nodes than the parallel parsing threshold.
+        When:
+            - Adding the nodes to the content models mapping.
+        Then:
+            - Make sure the nodes are parsed in worker processes, same as when they are parsed inline.
+        """
+        from demisto_sdk.commands.common import parallel
+        from demisto_sdk.commands.content_graph.interface.neo4j import neo4j_graph
+
+        monkeypatch.setattr(neo4j_graph, "PARALLEL_PARSE_NODES_THRESHOLD", 2)
+        mocker.patch.object(parallel, "cpu_count", return_value=2)
+        fork_pool = mocker.spy(parallel, "fork_pool")
+        interface = TestNeo4jWrites.mock_interface(mocker)
+        interface._id_to_obj = {}
+
+        interface._add_nodes_to_mapping(self.nodes(mocker, 6))
+
+        assert fork_pool.called
+        assert sorted(interface._id_to_obj) == [f"n{i}" for i in range(6)]
+        assert interface._id_to_obj["n2"].object_id == "Script2"
+        assert not interface._id_to_obj["n2"].relationships_data
+
+
+class TestNeo4jValidationSnapshot:
+    def test_validation_queries_use_prefetched_snapshot(self, mocker):
+        """
+        Given:
+            - A graph with two packs with the same display name, and a relationship between them.
+        When:
+            - Prefetching the graph for the validations, and running a validation query before and after closing it.
+        Then:
+            - Make sure the graph is read in two queries, and the validation query runs against the snapshot.
+            - Make sure the validation query is sent to the database once the interface is closed.
+        """
+        from demisto_sdk.commands.content_graph.common import RelationshipType
+        from demisto_sdk.commands.content_graph.interface.neo4j.neo4j_graph import (
+            get_all_nodes,
+            get_all_relationships,
+            validate_multiple_packs_with_same_display_name,
+        )
+
+        interface = TestNeo4jWrites.mock_interface(mocker)
+        session = interface.driver.session.return_value.__enter__.return_value
+        records = {
+            get_all_nodes: [
+                (
+                    f"4:db:{pack_id}",
+                    ContentType.PACK.labels,
+                    {"object_id": pack_id, "name": "Same Name", "path": pack_id},
+                )
+                for pack_id in ("PackA", "PackB")
+            ],
+            get_all_relationships: [
+                ("4:db:PackA", RelationshipType.DEPENDS_ON, "4:db:PackB", {})
+            ],
+        }
+        session.execute_read.side_effect = lambda query, *args: records[query]
+
+        interface.prefetch_validations()
+        assert interface.get_duplicate_pack_display_name([]) == [
+            ("PackA", ["PackB"]),
+            ("PackB", ["PackA"]),
+        ]
+        assert interface.get_duplicate_pack_display_name(["PackB"]) == [
+            ("PackB", ["PackA"])
+        ]
+        assert session.execute_read.call_count == 2
+
+        session.execute_read.side_effect = None
+        interface.close()
+        interface.get_duplicate_pack_display_name([])
+        assert session.execute_read.call_args.args == (
+            validate_multiple_packs_with_same_display_name,
+            [],
+        )
@@ -0,0 +1,252 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+from demisto_sdk.commands.common.parsed_file_cache import parsed_file_cache
+from demisto_sdk.commands.content_graph.common import ContentType
+from demisto_sdk.commands.content_graph.content_graph_builder import (
+    ContentGraphBuilder,
+)
+from demisto_sdk.commands.content_graph.interface.memory.memory_graph import (
+    MemoryContentGraphInterface,
+)
+from demisto_sdk.commands.content_graph.objects import repository
+from demisto_sdk.commands.content_graph.parse_manifest import (
+    ContentItemEntry,
+    ParseManifest,
+    hash_path,
+    iter_content_item_paths,
+    manifest_key,
+)
+from TestSuite.repo import Repo
+
+PARSER_HASH = "parser_hash"
+
+
+def mock_graph_interface(mocker, repo: Repo):
+    content_graph = mocker.MagicMock()
+    content_graph.repo_path = Path(repo.path)
+    content_graph.parse_manifest = None
+    content_graph._get_latest_content_parser_hash.return_value = PARSER_HASH
+    return content_graph
+
+
+def mock_builder(mocker, content_graph) -> ContentGraphBuilder:
+    repository.from_path.cache_clear()
+    parsed_file_cache.clear()
+    builder = ContentGraphBuilder(content_graph)
+    mocker.patch.object(
+        builder,
+        "_create_content_dto",
+        side_effect=lambda packs: repository.from_path(content_graph.repo_path, packs),
+    )
+    return builder
+
+
+def test_diff_pack(graph_repo: Repo):
+    """
+    Given:
+        - A parse manifest of a pack with two scripts.
+    When:
+        - Modifying one script, deleting the other and adding a playbook.
+    Then:
+        - Make sure the diff contains exactly the modified, removed and added content items.
+    """
+    pack = graph_repo.create_pack("MyPack")
+    modified = pack.create_script("Modified")
+    removed = pack.create_script("Removed")
+    pack_path = Path(pack.path)
+
+    manifest = ParseManifest(PARSER_HASH)
+    manifest.set_pack(
+        pack_path,
+        {
+            manifest_key(path, pack_path): ContentItemEntry(hash=hash_path(path))
+            for path in iter_content_item_paths(pack_path)
+        },
+    )
+    assert manifest.diff_pack(pack_path).is_empty
+
+    modified.yml.update({"comment": "a new comment"})
+    shutil.rmtree(removed.path)
+    pack.create_playbook("Added")
+
+    diff = manifest.diff_pack(pack_path)
+    assert [p.name for p in diff.changed] == ["Modified"]
+    assert "Added.yml" in [p.name for p in diff.added]
+    assert diff.removed == ["Packs/MyPack/Scripts/Removed"]
+    assert not diff.pack_files_changed
+
+
+def test_diff_pack_metadata_changed(graph_repo: Repo):
+    """
+    Given:
+        - A parse manifest of a pack.
+    When:
+        - Modifying the pack metadata.
+    Then:
+        - Make sure the pack should be parsed fully.
+    """
+    pack = graph_repo.create_pack("MyPack")
+    pack_path = Path(pack.path)
+    manifest = ParseManifest(PARSER_HASH)
+    manifest.set_pack(pack_path, {})
+
+    pack.pack_metadata.update({"description": "a new description"})
+
+    assert manifest.diff_pack(pack_path) is None
+
+
+def test_dump_and_load(tmp_path: Path, graph_repo: Repo):
+    """
+    Given:
+        - A parse manifest.
+    When:
+        - Dumping it to a directory and loading it back.
+    Then:
+        - Make sure the loaded manifest is identical.
+    """
+    pack = graph_repo.create_pack("MyPack")
+    pack.create_script("MyScript")
+    pack_path = Path(pack.path)
+    manifest = ParseManifest(PARSER_HASH)
+    manifest.set_pack(
+        pack_path,
+        {
+            "Packs/MyPack/Scripts/MyScript": ContentItemEntry(
+                hash="1", node_id="Script:MyScript", node_digest="2"
+            )
+        },
+    )
+    manifest.dump(tmp_path)
+
+    loaded = ParseManifest.load(tmp_path)
+
+    assert loaded.is_compatible(PARSER_HASH)
+    assert loaded.packs == manifest.packs
+
+
+def test_update_graph_incrementally(mocker, graph_repo: Repo):
+    """
+    Given:
+        - A graph created from a pack with two scripts.
+    When:
+        - Modifying the description of one script and updating the graph.
+    Then:
+        - Make sure the pack is not parsed fully.
+        - Make sure only the modified script node is updated, and no relationships are recreated.
+    """
+    pack = graph_repo.create_pack("MyPack")
+    modified = pack.create_script("Modified")
+    pack.create_script("NotModified")
+    content_graph = mock_graph_interface(mocker, graph_repo)
+    builder = mock_builder(mocker, content_graph)
+    builder.create_graph()
+    assert content_graph.create_nodes.call_count == 1
+
+    modified.yml.update({"comment": "a new comment"})
+    mock_builder(mocker, content_graph).update_graph(("MyPack",))
+
+    assert content_graph.create_nodes.call_count == 1
+    graph_diff = content_graph.update_content_items.call_args[0][0]
+    assert [item["key"] for item in graph_diff.nodes_to_update] == [
+        "Packs/MyPack/Scripts/Modified"
+    ]
+    assert graph_diff.nodes_to_update[0]["node"]["description"] == "a new comment"
+    assert not graph_diff.keys_to_remove
+    assert not graph_diff.nodes_to_create
+    assert not graph_diff.keys_to_reset_relationships
+
+
+def test_update_graph_added_content_item(mocker, graph_repo: Repo):
+    """
+    Given:
+        - A graph created from a pack with a script.
+    When:
+        - Adding a playbook to the pack and updating the graph.
+    Then:
+        - Make sure only the new playbook node and its relationships are created.
+    """
+    pack = graph_repo.create_pack("MyPack")
+    pack.create_script("MyScript")
+    content_graph = mock_graph_interface(mocker, graph_repo)
+    mock_builder(mocker, content_graph).create_graph()
+
+    pack.create_playbook("MyPlaybook")
+    mock_builder(mocker, content_graph).update_graph(("MyPack",))
+
+    graph_diff = content_graph.update_content_items.call_args[0][0]
+    assert list(graph_diff.nodes_to_create.keys()) == [ContentType.PLAYBOOK]
+    assert not graph_diff.nodes_to_update
+    assert graph_diff.relationships
+
+
+def test_update_graph_without_manifest(mocker, graph_repo: Repo):
+    """
+    Given:
+        - A graph without a parse manifest.
+    When:
+        - Updating the graph.
+    Then:
+        - Make sure the pack is parsed fully and a manifest is created.
+    """
+    graph_repo.create_pack("MyPack").create_script("MyScript")
+    content_graph = mock_graph_interface(mocker, graph_repo)
+
+    mock_builder(mocker, content_graph).update_graph(("MyPack",))
+
+    content_graph.update_content_items.assert_not_called()
+    assert content_graph.create_nodes.call_count == 1
+    assert "MyPack" in content_graph.parse_manifest.packs
+
+
+@pytest.mark.parametrize("change", ["removed", "renamed"])
+def test_update_graph_preserves_relationships_from_other_packs(
+    mocker, graph_repo: Repo, change: str
+):
+    """
+    Given:
+        - A graph created from two packs, where a playbook of PackB uses a script of PackA.
+    When:
+        - Removing or renaming the script and updating the graph with the changes of PackA only.
+    Then:
+        - Make sure the script is removed from the graph incrementally.
+        - Make sure the playbook still uses the script, which is now not in the repository (reported by GR103).
+    """
+    script = graph_repo.create_pack("PackA").create_script("AScript")
+    graph_repo.create_pack("PackB").create_playbook("BPlaybook").add_default_task(
+        task_script_name="AScript"
+    )
+    content_graph = MemoryContentGraphInterface.from_records([], [])
+    content_graph.repo_path = Path(graph_repo.path)
+    mocker.patch.object(
+        content_graph, "_get_latest_content_parser_hash", return_value=PARSER_HASH
+    )
+
+    def used_content_items(playbooks) -> dict:
+        # content items which are not in the repository are parsed as unknown content
+        return {
+            uses.content_item_to.object_id: getattr(
+                uses.content_item_to, "not_in_repository", False
+            )
+            for playbook in playbooks
+            for uses in playbook.uses
+        }
+
+    mock_builder(mocker, content_graph).create_graph()
+    playbooks = content_graph.search(content_type=ContentType.PLAYBOOK)
+    assert used_content_items(playbooks)["AScript"] is False
+
+    if change == "removed":
+        shutil.rmtree(script.path)
+    else:
+        script.yml.update({"commonfields": {"id": "NewScript"}, "name": "NewScript"})
+    update_content_items = mocker.spy(content_graph, "update_content_items")
+    mock_builder(mocker, content_graph).update_graph(("PackA",))
+
+    graph_diff = update_content_items.call_args[0][0]
+    assert graph_diff.keys_to_remove == ["Packs/PackA/Scripts/AScript"]
+    playbooks = content_graph.get_unknown_content_uses([])
+    assert [playbook.path.parts[:2] for playbook in playbooks] == [("Packs", "PackB")]
+    assert used_content_items(playbooks)["AScript"] is True
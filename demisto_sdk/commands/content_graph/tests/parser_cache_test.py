@@ -0,0 +1,131 @@
+import os
+from pathlib import Path
+
+from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.common.parsed_file_cache import parsed_file_cache
+from demisto_sdk.commands.content_graph.parser_cache import ParserCache
+from demisto_sdk.commands.content_graph.parsers.content_item import (
+    ContentItemParser,
+)
+from demisto_sdk.commands.content_graph.parsers.pack import PackParser
+from TestSuite.repo import Repo
+
+MARKETPLACES = [MarketplaceVersions.XSOAR]
+
+
+def test_parse_warm_run_skips_parsing(mocker, tmp_path: Path, graph_repo: Repo):
+    """
+    Given:
+        - A script and an empty parser cache.
+    When:
+        - Parsing the script twice.
+    Then:
+        - Make sure the script is parsed only once, and the second parser is loaded from the cache.
+    """
+    script = graph_repo.create_pack("MyPack").create_script("MyScript")
+    script_path = Path(script.path)
+    cache = ParserCache(path=tmp_path, enabled=True)
+    from_path = mocker.spy(ContentItemParser, "from_path")
+
+    parser = cache.parse(script_path, MARKETPLACES, [])
+    cached_parser = cache.parse(script_path, MARKETPLACES, [])
+
+    assert from_path.call_count == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cached_parser.object_id == parser.object_id == "MyScript"
+    assert cached_parser.structure_errors == parser.structure_errors
+    assert cached_parser.relationships == parser.relationships
+
+
+def test_parse_modified_content_item(tmp_path: Path, graph_repo: Repo):
+    """
+    Given:
+        - A script which is stored in the parser cache.
+    When:
+        - Modifying the script and parsing it again.
+    Then:
+        - Make sure the script is parsed again and the cache holds an entry per version.
+    """
+    script = graph_repo.create_pack("MyPack").create_script("MyScript")
+    script_path = Path(script.path)
+    cache = ParserCache(path=tmp_path, enabled=True)
+    cache.parse(script_path, MARKETPLACES, [])
+
+    script.yml.update({"comment": "a new comment"})
+    parsed_file_cache.clear()
+    parser = cache.parse(script_path, MARKETPLACES, [])
+
+    assert cache.misses == 2
+    assert parser.description == "a new comment"
+    assert cache.stats().entries == 2
+
+
+def test_evict_least_recently_used(tmp_path: Path, graph_repo: Repo):
+    """
+    Given:
+        - A parser cache with two entries, where the first one was used most recently.
+    When:
+        - Evicting the cache with a bound which fits a single entry.
+    Then:
+        - Make sure only the least recently used entry is removed.
+    """
+    pack = graph_repo.create_pack("MyPack")
+    recent, old = (
+        Path(pack.create_script("Recent").path),
+        Path(pack.create_script("Old").path),
+    )
+    cache = ParserCache(path=tmp_path, enabled=True)
+    cache.parse(recent, MARKETPLACES, [])
+    cache.parse(old, MARKETPLACES, [])
+    recent_key = cache.get_key(recent, MARKETPLACES, [])
+    old_key = cache.get_key(old, MARKETPLACES, [])
+    os.utime(cache._entry_path(old_key), (0, 0))
+    cache.max_size = cache._entry_path(recent_key).stat().st_size
+
+    assert cache.evict() == 1
+    assert cache.get(recent_key)
+    assert not cache.get(old_key)
+
+
+def test_clear(tmp_path: Path, graph_repo: Repo):
+    """
+    Given:
+        - A parser cache with an entry.
+    When:
+        - Clearing the cache.
+    Then:
+        - Make sure the cache is empty.
+    """
+    script = graph_repo.create_pack("MyPack").create_script("MyScript")
+    cache = ParserCache(path=tmp_path, enabled=True)
+    cache.parse(Path(script.path), MARKETPLACES, [])
+
+    assert cache.clear() == 1
+    assert cache.stats().entries == 0
+
+
+def test_pack_parser_uses_cache(mocker, tmp_path: Path, graph_repo: Repo):
+    """
+    Given:
+        - A pack with a script and an enabled parser cache.
+    When:
+        - Parsing the pack twice.
+    Then:
+        - Make sure the script is parsed only once, and both pack parsers hold the same content items.
+    """
+    pack = graph_repo.create_pack("MyPack")
+    pack.create_script("MyScript")
+    mocker.patch(
+        "demisto_sdk.commands.content_graph.parsers.pack.ParserCache",
+        side_effect=lambda: ParserCache(path=tmp_path, enabled=True),
+    )
+    from_path = mocker.spy(ContentItemParser, "from_path")
+
+    first = PackParser(Path(pack.path))
+    second = PackParser(Path(pack.path))
+
+    assert from_path.call_count == 1
+    assert [item.node_id for item in second.content_items.script] == [
+        item.node_id for item in first.content_items.script
+    ]
+    assert second.relationships == first.relationships
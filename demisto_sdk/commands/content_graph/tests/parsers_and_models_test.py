@@ -1906,6 +1906,44 @@ class TestParsersAndModels:
         pack_ids = {pack.object_id for pack in model.packs}
         assert pack_ids == {"sample1", "sample2"}
 
+    def test_repo_parser_parallel_content_items(self, mocker, repo: Repo):
+        """
+        Given:
+            - A repository with a large pack and a pack without content items.
+        When:
+            - Parsing the repository, where the content items of all packs are parsed as separate tasks.
+        Then:
+            - Verify every pack holds exactly its content items and relationships, in the same order as parsing the pack directly.
+        """
+        from demisto_sdk.commands.content_graph.parsers.repository import (
+            RepositoryParser,
+        )
+
+        large_pack = repo.create_pack("LargePack")
+        for i in range(10):
+            large_pack.create_script(f"Script{i}")
+            large_pack.create_playbook(f"Playbook{i}")
+        repo.create_pack("EmptyPack")
+        mocker.patch.object(PackParser, "parse_ignored_errors", return_value={})
+
+        parser = RepositoryParser(Path(repo.path))
+        parser.parse()
+
+        packs = {pack.object_id: pack for pack in parser.packs}
+        assert set(packs) == {"LargePack", "EmptyPack"}
+        assert not any(packs["EmptyPack"].content_items.iter_lists())
+        expected_pack = PackParser(Path(large_pack.path))
+        assert [
+            item.node_id
+            for items in packs["LargePack"].content_items.iter_lists()
+            for item in items
+        ] == [
+            item.node_id
+            for items in expected_pack.content_items.iter_lists()
+            for item in items
+        ]
+        assert packs["LargePack"].relationships == expected_pack.relationships
+
     def test_lazy_properties_in_the_model(self, mocker, pack):
         """
         Given:
@@ -0,0 +1,114 @@
+from pathlib import Path
+
+import pytest
+
+from demisto_sdk.commands.content_graph.common import ContentType, RelationshipType
+from demisto_sdk.commands.content_graph.snapshot import (
+    GraphSnapshot,
+    SnapshotFormatError,
+    read_snapshots,
+    write_snapshot,
+)
+
+NODES = [
+    (
+        "script",
+        ContentType.SCRIPT.labels,
+        {
+            "object_id": "SampleScript",
+            "content_type": ContentType.SCRIPT,
+            "marketplaces": ["xsoar", "marketplacev2"],
+            "deprecated": False,
+            "docker_image": None,
+            "description": "Uses ünïcode & <markup>",
+            "score": 1,
+        },
+    ),
+    (
+        "pack",
+        ContentType.PACK.labels,
+        {"object_id": "SamplePack", "content_type": ContentType.PACK, "version": 2},
+    ),
+    (
+        "script2",
+        ContentType.SCRIPT.labels,
+        {
+            "object_id": "SampleScript2",
+            "content_type": ContentType.SCRIPT,
+            "score": 1.5,
+        },
+    ),
+]
+RELATIONSHIPS = [
+    ("script", RelationshipType.IN_PACK, "pack", {}),
+    ("script2", RelationshipType.IN_PACK, "pack", {}),
+    ("script", RelationshipType.USES, "script2", {"mandatorily": True}),
+]
+
+
+def test_snapshot_round_trip(tmp_path: Path):
+    """
+    Given:
+        - Nodes of two content types and relationships of two types, with typed properties.
+    When:
+        - Writing them to a snapshot file and reading it.
+    Then:
+        - Make sure there is a node table per content type and an edge list per relationship type.
+        - Make sure the properties keep their types (also in a column of both ints and floats)
+          and null properties are dropped.
+    """
+    path = tmp_path / "content.graphsnap"
+    write_snapshot(path, NODES, RELATIONSHIPS)
+
+    with GraphSnapshot(path) as snapshot:
+        assert snapshot.node_count == 3
+        scripts, packs = snapshot.node_tables
+        assert set(scripts.labels) == set(ContentType.SCRIPT.labels)
+        assert scripts.column("object_id") == ["SampleScript", "SampleScript2"]
+        script_id, script = next(scripts.rows())
+        assert script == {
+            "object_id": "SampleScript",
+            "content_type": "Script",
+            "marketplaces": ["xsoar", "marketplacev2"],
+            "deprecated": False,
+            "description": "Uses ünïcode & <markup>",
+            "score": 1,
+        }
+        assert [type(score) for score in scripts.column("score")] == [int, float]
+        pack_id, pack = next(packs.rows())
+        assert pack["version"] == 2
+
+        in_pack, uses = snapshot.relationship_tables
+        assert in_pack.type == RelationshipType.IN_PACK
+        assert in_pack.targets == [pack_id, pack_id]
+        assert list(uses.rows()) == [(script_id, 1, {"mandatorily": True})]
+
+
+def test_read_snapshots_offsets_node_ids(tmp_path: Path):
+    """
+    Given:
+        - Snapshot files of two repositories.
+    When:
+        - Reading them together.
+    Then:
+        - Make sure the ids of the second snapshot are offset by the node count of the first one.
+    """
+    paths = [tmp_path / "repo1.graphsnap", tmp_path / "repo2.graphsnap"]
+    for path in paths:
+        write_snapshot(path, NODES, RELATIONSHIPS)
+    assert [offset for offset, _ in read_snapshots(paths)] == [0, 3]
+
+
+def test_invalid_snapshot(tmp_path: Path):
+    """
+    Given:
+        - A file which is not a snapshot.
+    When:
+        - Opening it as a snapshot.
+    Then:
+        - Make sure a SnapshotFormatError is raised.
+    """
+    path = tmp_path / "content.graphsnap"
+    path.write_text("<graphml/>")
+    with pytest.raises(SnapshotFormatError):
+        GraphSnapshot(path)
@@ -17,10 +17,15 @@ from demisto_sdk.commands.content_graph.common import ContentType, RelationshipT
 from demisto_sdk.commands.content_graph.interface import (
     ContentGraphInterface,
 )
+from demisto_sdk.commands.content_graph.interface.neo4j.import_utils import (
+    GRAPHML_FILE_SUFFIX,
+)
 from demisto_sdk.commands.content_graph.objects.content_item import ContentItem
 from demisto_sdk.commands.content_graph.objects.integration import Integration
 from demisto_sdk.commands.content_graph.objects.pack import Pack
 from demisto_sdk.commands.content_graph.objects.repository import ContentDTO, from_path
+from demisto_sdk.commands.content_graph.parse_manifest import PARSE_MANIFEST_FILE_NAME
+from demisto_sdk.commands.content_graph.snapshot import SNAPSHOT_FILE_SUFFIX
 from demisto_sdk.commands.content_graph.tests.create_content_graph_test import (
     find_model_for_id,
     mock_classifier,
@@ -703,9 +708,10 @@ class TestUpdateContentGraph:
             extracted_files = list(tmp_path.glob("extracted/*"))
             assert extracted_files
             assert all(
-                file.suffix == ".graphml"
+                file.suffix in (SNAPSHOT_FILE_SUFFIX, GRAPHML_FILE_SUFFIX)
                 or file.name == "metadata.json"
                 or file.name == "depends_on.json"
+                or file.name == PARSE_MANIFEST_FILE_NAME
                 for file in extracted_files
             )
 
@@ -803,9 +809,10 @@ class TestUpdateContentGraph:
             extracted_files = list(tmp_path.glob("extracted/*"))
             assert extracted_files
             assert all(
-                file.suffix == ".graphml"
+                file.suffix in (SNAPSHOT_FILE_SUFFIX, GRAPHML_FILE_SUFFIX)
                 or file.name == "metadata.json"
                 or file.name == "depends_on.json"
+                or file.name == PARSE_MANIFEST_FILE_NAME
                 for file in extracted_files
             )
 
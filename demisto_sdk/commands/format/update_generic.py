@@ -1,8 +1,7 @@
 import os
 import re
-from copy import deepcopy
 from pathlib import Path
-from typing import Any, Dict, Optional, Set, Union
+from typing import Any, Dict, Mapping, Optional, Sequence, Set, Union
 
 import dictdiffer
 
@@ -12,6 +11,7 @@ from demisto_sdk.commands.common.constants import (
     VALID_SENTENCE_SUFFIX,
     VERSION_5_5_0,
 )
+from demisto_sdk.commands.common.frozen_document import thaw
 from demisto_sdk.commands.common.handlers import YAML_Handler
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import (
@@ -106,9 +106,14 @@ class BaseUpdate:
                 "Please provide <source path>, <optional - destination path>."
             )
         try:
-            self.data, self.file_type = get_dict_from_file(
-                self.source_file, clear_cache=clear_cache, keep_order=True
+            data, self.file_type = get_dict_from_file(
+                self.source_file,
+                clear_cache=clear_cache,
+                keep_order=True,
+                read_only=True,
             )
+            # the file is changed by the formatters, rather than the cached file
+            self.data = thaw(data)
         except Exception:
             raise Exception(f"Provided file {self.source_file} is not a valid file.")
         self.from_version_key = self.set_from_version_key_name()
@@ -165,15 +170,15 @@ class BaseUpdate:
                 self.extended_schema.get("mapping", {}), self.data
             )
 
-    def get_schema(self) -> dict:
+    def get_schema(self) -> Mapping:
         try:
-            return get_yaml(self.schema_path)
+            return get_yaml(self.schema_path, read_only=True)
         except FileNotFoundError:
             return {}
 
     @staticmethod
     def recursive_extend_schema(
-        current_schema: Union[str, bool, list, dict], full_schema: dict
+        current_schema: Union[str, bool, Sequence, Mapping], full_schema: Mapping
     ) -> Union[str, bool, list, dict]:
         """
         Parses partial schemas into one schema.
@@ -192,13 +197,13 @@ class BaseUpdate:
         if isinstance(current_schema, str) or isinstance(current_schema, bool):
             return current_schema
         # If the current schema is a list - we will return the extended schema of each of it's elements
-        if isinstance(current_schema, list):
+        if isinstance(current_schema, Sequence):
             return [
                 BaseUpdate.recursive_extend_schema(value, full_schema)
                 for value in current_schema
             ]
         # If the current schema is a dict this is the main condition we will handle
-        if isinstance(current_schema, dict):
+        if isinstance(current_schema, Mapping):
             modified_schema = {}
             for key, value in current_schema.items():
                 # There is no need to add the sub-schemas themselves, as we want to drop them
@@ -206,14 +211,15 @@ class BaseUpdate:
                     continue
                 # If this is a reference to a sub-schema - we will replace the reference with the original.
                 if isinstance(value, str) and key == "include":
-                    extended_schema: dict = full_schema.get(f"schema;{value}")  # type: ignore
+                    extended_schema: Mapping = full_schema.get(f"schema;{value}")  # type: ignore
                     if extended_schema is None:
                         logger.info(
                             f"<yellow>Could not find sub-schema for {value}</yellow>"
                         )
-                    # sometimes the sub-schema can have it's own sub-schemas so we need to unify that too
+                    # sometimes the sub-schema can have it's own sub-schemas so we need to unify that too,
+                    # the unified schema is built from new dicts and lists, so the sub-schema is not copied
                     return BaseUpdate.recursive_extend_schema(
-                        deepcopy(extended_schema), full_schema
+                        extended_schema, full_schema
                     )
                 else:
                     # This is the mapping case in which we can let the recursive method do it's thing on the values
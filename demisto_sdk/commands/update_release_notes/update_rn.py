@@ -39,8 +39,10 @@ from demisto_sdk.commands.common.content.objects.pack_objects.abstract_pack_obje
 from demisto_sdk.commands.common.content.objects_factory import (
     TYPE_CONVERSION_BY_FileType,
 )
+from demisto_sdk.commands.common.frozen_document import thaw
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.parsed_file_cache import parsed_file_cache
 from demisto_sdk.commands.common.tools import (
     find_type,
     get_api_module_dependencies_from_graph,
@@ -969,7 +971,8 @@ class UpdateRN:
         The pack metadata dictionary
         """
         try:
-            data_dictionary = get_json(self.metadata_path, cache_clear=True)
+            # a copy of the cached metadata, which is changed when bumping the version
+            data_dictionary = thaw(get_json(self.metadata_path, read_only=True))
         except FileNotFoundError as e:
             raise FileNotFoundError(
                 f"The metadata file of pack {self.pack} was not found. Please verify the pack name is correct, and that the file exists."
@@ -1062,6 +1065,7 @@ class UpdateRN:
                 logger.info(
                     f"<green>Updated pack metadata version at path : {self.metadata_path}</green>"
                 )
+            parsed_file_cache.invalidate(Path(self.metadata_path))
             try:
                 run_command(f"git add {self.metadata_path}", exit_on_error=False)
             except RuntimeError:
@@ -0,0 +1,343 @@
+"""A benchmark of the validate command on synthetic content repositories.
+
+Creates a repository with the TestSuite for every given number of packs, and runs the ValidateManager on it in every
+given mode: all files (-a), the files changed in git (-g) and specific files (-i, the changed packs).
+Every run is measured in a process of its own, which reports its wall time, content objects per second, peak RSS
+(of the process and its workers) and the CPU time of every validator. The measurements are written as JSON.
+The validators which query the content graph or the docker hub are skipped, unless --include-external is given.
+
+Two measurement files can be compared, which fails when a run or a validator is slower than the baseline by more than
+the given threshold.
+
+Usage:
+    python demisto_sdk/commands/validate/benchmarks/validate_benchmark.py run [--packs 10 100 1000] [--modes all git specific]
+        [--rounds N] [--output PATH] [--include-external]
+    python demisto_sdk/commands/validate/benchmarks/validate_benchmark.py compare BASELINE CURRENT [--threshold 0.2]
+"""
+
+import argparse
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from demisto_sdk.commands.common.constants import (
+    DEMISTO_GIT_PRIMARY_BRANCH,
+    DEMISTO_GIT_UPSTREAM,
+    ExecutionMode,
+)
+from demisto_sdk.commands.common.cpu_count import cpu_count
+from demisto_sdk.commands.common.handlers import JSON_Handler
+
+if TYPE_CHECKING:
+    from TestSuite.repo import Repo
+
+json = JSON_Handler()
+
+MODES = {
+    "all": ExecutionMode.ALL_FILES,
+    "git": ExecutionMode.USE_GIT,
+    "specific": ExecutionMode.SPECIFIC_FILES,
+}
+DEFAULT_PACKS = [10, 100, 1000]
+# The part of the packs which are changed for the git and specific files modes
+CHANGED_PACKS_RATIO = 0.1
+BENCHMARK_BRANCH = "validate-benchmark"
+# Validators which took less CPU time than this (in seconds) are not compared, since their time is mostly noise
+MIN_COMPARED_CPU_TIME = 0.05
+
+
+def create_repo(path: Path, packs: int) -> Tuple["Repo", List[Path]]:
+    """Creates a content repository with an integration, a script and a playbook in every pack,
+    commits it to the primary branch, and changes the scripts of some of the packs in a branch.
+
+    Args:
+        path (Path): The repository path.
+        packs (int): The number of packs.
+
+    Returns:
+        Tuple[Repo, List[Path]]: The repository, which is removed when it is deleted, and the paths of the changed packs.
+    """
+    # TestSuite imports the content paths, which are resolved by the working directory
+    from TestSuite.repo import Repo
+
+    repo = Repo(path, init_git=False)
+    changed_packs = []
+    for index in range(packs):
+        name = f"BenchmarkPack{index}"
+        pack = repo.create_pack(name)
+        pack.create_integration(f"{name}Integration")
+        pack.create_script(f"{name}Script")
+        pack.create_playbook(f"{name}Playbook").create_default_playbook(
+            name=f"{name}Playbook"
+        )
+        if index < max(1, int(packs * CHANGED_PACKS_RATIO)):
+            changed_packs.append(pack)
+    repo.init_git()
+    git = repo.git_util.repo.git  # type: ignore[union-attr]
+    # The content path is only resolved in a repository with a content remote
+    git.remote("set-url", DEMISTO_GIT_UPSTREAM, str(path / "content.git"))
+    # The changes are compared to the primary branch of the remote, as if it was fetched
+    git.update_ref(
+        f"refs/remotes/{DEMISTO_GIT_UPSTREAM}/{DEMISTO_GIT_PRIMARY_BRANCH}",
+        DEMISTO_GIT_PRIMARY_BRANCH,
+    )
+    git.checkout("-b", BENCHMARK_BRANCH)
+    for pack in changed_packs:
+        pack.scripts[0].yml.update({"comment": "changed by the validate benchmark"})
+    repo.git_util.commit_files("Change scripts")  # type: ignore[union-attr]
+    return repo, [Path(pack.path) for pack in changed_packs]
+
+
+def measure(
+    mode: str, file_paths: List[str], result_path: Path, include_external: bool
+) -> None:
+    """Runs the validations once and writes the measurement as JSON. Runs in the repository directory.
+
+    Args:
+        mode (str): The execution mode name.
+        file_paths (List[str]): The paths to validate in the specific files mode.
+        result_path (Path): The path to write the measurement to.
+        include_external (bool): Whether to run the validators which query the content graph or the docker hub.
+    """
+    from demisto_sdk.commands.validate.config_reader import ConfigReader
+    from demisto_sdk.commands.validate.initializer import Initializer
+    from demisto_sdk.commands.validate.validate_manager import ValidateManager
+    from demisto_sdk.commands.validate.validation_engine import Lane, get_lane
+    from demisto_sdk.commands.validate.validation_results import ResultWriter
+    from demisto_sdk.commands.validate.validators.base_validator import (
+        get_all_validators,
+    )
+
+    execution_mode = MODES[mode]
+    start = time.perf_counter()
+    file_path = (
+        ",".join(file_paths) if execution_mode == ExecutionMode.SPECIFIC_FILES else None
+    )
+    validate_manager = ValidateManager(
+        file_path=file_path,
+        initializer=Initializer(
+            prev_ver=DEMISTO_GIT_PRIMARY_BRANCH,
+            file_path=file_path,
+            execution_mode=execution_mode,
+        ),
+        validation_results=ResultWriter(),
+        config_reader=ConfigReader(),
+        ignore=[]
+        if include_external
+        else [
+            validator.error_code
+            for validator in get_all_validators()
+            if get_lane(validator) != Lane.WORKERS
+        ],
+    )
+    exit_code = validate_manager.run_validations()
+    wall_time = time.perf_counter() - start
+    objects = len(validate_manager.objects_to_run)
+    peak_rss_kb = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    result_path.write_text(
+        json.dumps(
+            {
+                "exit_code": exit_code,
+                "wall_time": wall_time,
+                "objects": objects,
+                "objects_per_second": objects / wall_time,
+                "peak_rss_mb": peak_rss_kb / 1024,
+                "validators": validate_manager.validation_engine.cpu_times  # type: ignore[union-attr]
+                if validate_manager.validation_engine
+                else {},
+            }
+        )
+    )
+
+
+def run_measure_process(
+    repo_path: Path, mode: str, file_paths: List[Path], include_external: bool
+) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as result_dir:
+        result_path = Path(result_dir) / "result.json"
+        process = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "measure",
+                mode,
+                str(result_path),
+                *map(str, file_paths),
+                *(["--include-external"] if include_external else []),
+            ],
+            cwd=repo_path,
+            env={
+                **os.environ,
+                "DEMISTO_SDK_CONTENT_PATH": str(repo_path),
+                "DEMISTO_SDK_IGNORE_CONTENT_WARNING": "true",
+                "DEMISTO_SDK_VALIDATE_CACHE": "false",
+            },
+            capture_output=True,
+            text=True,
+        )
+        if process.returncode or not result_path.exists():
+            raise RuntimeError(
+                f"The {mode} mode run failed with exit code {process.returncode}:\n{process.stderr[-5000:]}"
+            )
+        return json.loads(result_path.read_text())
+
+
+def best_of(measurements: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Returns the measurement with the shortest wall time, with the shortest CPU time of every validator."""
+    best = dict(min(measurements, key=lambda measurement: measurement["wall_time"]))
+    best["validators"] = {
+        error_code: min(
+            measurement["validators"].get(error_code, cpu_time)
+            for measurement in measurements
+        )
+        for error_code, cpu_time in best["validators"].items()
+    }
+    return best
+
+
+def run_benchmark(
+    packs: List[int], modes: List[str], rounds: int, include_external: bool
+) -> Dict[str, Any]:
+    try:
+        sdk_version = version("demisto-sdk")
+    except PackageNotFoundError:
+        sdk_version = ""
+    runs = []
+    for pack_count in packs:
+        with tempfile.TemporaryDirectory() as repo_dir:
+            repo_path = Path(repo_dir).resolve()
+            start = time.perf_counter()
+            repo, changed_packs = create_repo(repo_path, pack_count)
+            print(  # noqa: T201
+                f"Created a repository of {pack_count} packs in {time.perf_counter() - start:.1f}s"
+            )
+            for mode in modes:
+                measurement = best_of(
+                    [
+                        run_measure_process(
+                            repo_path, mode, changed_packs, include_external
+                        )
+                        for _ in range(rounds)
+                    ]
+                )
+                print(  # noqa: T201
+                    f"{pack_count} packs, {mode}: {measurement['wall_time']:.2f}s, "
+                    f"{measurement['objects']} objects ({measurement['objects_per_second']:.1f}/s), "
+                    f"peak RSS {measurement['peak_rss_mb']:.0f}MB"
+                )
+                runs.append({"packs": pack_count, "mode": mode, **measurement})
+            del repo
+    return {
+        "sdk_version": sdk_version,
+        "python_version": platform.python_version(),
+        "cpu_count": cpu_count(),
+        "rounds": rounds,
+        "include_external": include_external,
+        "runs": runs,
+    }
+
+
+def compare_benchmarks(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> List[str]:
+    """Compares two benchmark measurements.
+
+    Args:
+        baseline (Dict[str, Any]): The baseline measurements.
+        current (Dict[str, Any]): The current measurements.
+        threshold (float): The allowed slowdown ratio, e.g. 0.2 for 20%.
+
+    Returns:
+        List[str]: The regressions, of the wall time and peak RSS of every run and the CPU time of every validator,
+            for the runs which are in both measurements.
+    """
+    baseline_runs = {(run["packs"], run["mode"]): run for run in baseline["runs"]}
+    regressions = []
+    for run in current["runs"]:
+        if not (baseline_run := baseline_runs.get((run["packs"], run["mode"]))):
+            continue
+        name = f"{run['packs']} packs, {run['mode']}"
+        for metric in ("wall_time", "peak_rss_mb"):
+            if run[metric] > baseline_run[metric] * (1 + threshold):
+                regressions.append(
+                    f"{name}: {metric} {baseline_run[metric]:.2f} -> {run[metric]:.2f}"
+                )
+        for error_code, cpu_time in sorted(run["validators"].items()):
+            baseline_cpu_time = baseline_run["validators"].get(error_code)
+            if (
+                baseline_cpu_time is not None
+                and cpu_time >= MIN_COMPARED_CPU_TIME
+                and cpu_time > baseline_cpu_time * (1 + threshold)
+            ):
+                regressions.append(
+                    f"{name}: {error_code} CPU time {baseline_cpu_time:.3f}s -> {cpu_time:.3f}s"
+                )
+    return regressions
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = arg_parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="Run the benchmark.")
+    run_parser.add_argument("--packs", type=int, nargs="+", default=DEFAULT_PACKS)
+    run_parser.add_argument(
+        "--modes", nargs="+", choices=list(MODES), default=list(MODES)
+    )
+    run_parser.add_argument("--rounds", type=int, default=1)
+    run_parser.add_argument("--output", type=Path)
+    run_parser.add_argument(
+        "--include-external",
+        action="store_true",
+        help="Run the validators which query the content graph or the docker hub as well.",
+    )
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare a benchmark to a baseline."
+    )
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=0.2)
+    # Runs the validations in the repository directory, see `run_measure_process`
+    measure_parser = subparsers.add_parser("measure")
+    measure_parser.add_argument("mode", choices=list(MODES))
+    measure_parser.add_argument("result_path", type=Path)
+    measure_parser.add_argument("file_paths", nargs="*")
+    measure_parser.add_argument("--include-external", action="store_true")
+    args = arg_parser.parse_args()
+
+    if args.command == "measure":
+        measure(args.mode, args.file_paths, args.result_path, args.include_external)
+    elif args.command == "run":
+        benchmark = run_benchmark(
+            args.packs, args.modes, args.rounds, args.include_external
+        )
+        if args.output:
+            args.output.write_text(json.dumps(benchmark, indent=4))
+        else:
+            print(json.dumps(benchmark, indent=4))  # noqa: T201
+    else:
+        regressions = compare_benchmarks(
+            json.loads(args.baseline.read_text()),
+            json.loads(args.current.read_text()),
+            args.threshold,
+        )
+        for regression in regressions:
+            print(regression)  # noqa: T201
+        if regressions:
+            sys.exit(1)
+        print("No regressions found.")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.parallel import parallel_map
+from demisto_sdk.commands.content_graph.objects.base_content import BaseContent
+from demisto_sdk.commands.validate.validators.base_validator import FixResult
+
+PARALLEL_SAVE_THRESHOLD = 20
+
+
+def _save(content_object: BaseContent) -> Optional[str]:
+    """Saves a content object, and returns the error if it could not be saved."""
+    try:
+        content_object.save()
+    except Exception as e:
+        return str(e)
+    return None
+
+
+class FixTransaction:
+    """Accumulates the fixes of a validate run by content object, and saves every fixed content object once,
+    after all the fixers have changed it, rather than once per fix.
+
+    The fields every fixer touched (the `related_field` of its validator) are recorded by the content object path,
+    so they can be reported once the fixes are saved.
+    """
+
+    def __init__(self):
+        self.fixed_objects: Dict[Path, BaseContent] = {}
+        # The error codes of the fixers which touched every field, by the path of the content object
+        self.touched_fields: Dict[Path, Dict[str, Set[str]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
+
+    def add(self, fixing_result: FixResult) -> None:
+        content_object = fixing_result.content_object
+        self.fixed_objects.setdefault(content_object.path, content_object)
+        error_code = fixing_result.validator.error_code
+        for field in fixing_result.validator.related_field.split(","):
+            self.touched_fields[content_object.path][field.strip() or "unknown"].add(
+                error_code
+            )
+
+    def commit(self) -> Dict[Path, str]:
+        """Saves the fixed content objects, each in a single write. Many content objects are saved in parallel.
+
+        Returns:
+            Dict[Path, str]: The errors of the content objects which could not be saved, by their paths.
+        """
+        content_objects = list(self.fixed_objects.values())
+        errors = parallel_map(_save, content_objects, PARALLEL_SAVE_THRESHOLD)
+        failures = {
+            content_object.path: error
+            for content_object, error in zip(content_objects, errors)
+            if error is not None
+        }
+        for path, error in failures.items():
+            logger.error(f"Could not save the fixes of {path}: {error}")
+        return failures
+
+    def report(self) -> str:
+        """Returns which fixers touched which fields of every fixed content object."""
+        return "\n".join(
+            f"{path}: "
+            + ", ".join(
+                f"{field} ({', '.join(sorted(error_codes))})"
+                for field, error_codes in sorted(fields.items())
+            )
+            for path, fields in sorted(self.touched_fields.items())
+        )
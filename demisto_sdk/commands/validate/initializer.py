@@ -29,12 +29,14 @@ from demisto_sdk.commands.common.constants import (
 from demisto_sdk.commands.common.content import Content
 from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.parallel import parallel_map
 from demisto_sdk.commands.common.tools import (
     detect_file_level,
     find_type_by_path,
     get_file_by_status,
     get_relative_path_from_packs_dir,
     is_external_repo,
+    prefetch_remote_files,
     specify_files_from_directory,
 )
 from demisto_sdk.commands.content_graph.objects.base_content import BaseContent
@@ -46,6 +48,64 @@ from demisto_sdk.commands.content_graph.parsers.content_item import (
     InvalidContentItemException,
     NotAContentItemException,
 )
+from demisto_sdk.commands.validate.profiler import ValidationProfiler
+
+PARALLEL_PARSING_THRESHOLD = 20
+
+# A path to parse: the path, the path in the previous version (which differs for renamed files) and its git status
+GitPathToParse = Tuple[Path, Path, Optional[GitStatuses]]
+
+
+def has_previous_version(file_path: Path, git_status: Optional[GitStatuses]) -> bool:
+    return git_status in (GitStatuses.MODIFIED, GitStatuses.RENAMED) or (
+        not git_status  # Always collect the origin version of the metadata.
+        and find_type_by_path(file_path) == FileType.METADATA
+    )
+
+
+def git_path_to_basecontent(
+    file_path: Path,
+    old_path: Path,
+    git_status: Optional[GitStatuses],
+    prev_ver: Optional[str],
+    current_git_sha: Optional[str],
+) -> Tuple[Optional[BaseContent], Optional[type]]:
+    """Converts the given path to a BaseContent, along with the version of it in prev_ver.
+
+    Args:
+        file_path (Path): The path of the content item.
+        old_path (Path): The path of the content item in prev_ver.
+        git_status (Optional[GitStatuses]): The git status of the content item.
+        prev_ver (Optional[str]): The branch or commit to take the previous version of the content item from.
+        current_git_sha (Optional[str]): The current branch or commit.
+
+    Returns:
+        Tuple[Optional[BaseContent], Optional[type]]: The BaseContent, or the type of the exception the parsing failed with.
+    """
+    try:
+        obj = BaseContent.from_path(file_path, raise_on_exception=True)
+    except (NotAContentItemException, InvalidContentItemException) as e:
+        return None, type(e)
+    if not obj:
+        return None, InvalidContentItemException
+    obj.git_sha = current_git_sha
+    obj.git_status = git_status
+    # Check if the file exists
+    if has_previous_version(file_path, git_status):
+        try:
+            obj.old_base_content_object = BaseContent.from_path(
+                old_path, git_sha=prev_ver, raise_on_exception=True
+            )
+        except (NotAContentItemException, InvalidContentItemException):
+            logger.debug(
+                f"Could not parse the old_base_content_object for {obj.path}, setting a copy of the object as the old_base_content_object."
+            )
+            obj.old_base_content_object = obj.copy_as_old_version()
+    else:
+        obj.old_base_content_object = obj.copy_as_old_version()
+    if obj.old_base_content_object:
+        obj.old_base_content_object.git_sha = prev_ver
+    return obj, None
 
 
 class Initializer:
@@ -60,12 +120,14 @@ class Initializer:
         prev_ver=None,
         file_path=None,
         execution_mode: Optional[ExecutionMode] = None,
+        profiler: Optional[ValidationProfiler] = None,
     ):
         self.staged = staged
         self.file_path = file_path
         self.committed_only = committed_only
         self.prev_ver = prev_ver
         self.execution_mode = execution_mode
+        self.profiler = profiler or ValidationProfiler()
 
     def validate_git_installed(self):
         """Initialize git util."""
@@ -355,19 +417,23 @@ class Initializer:
                 non_content_items,
             ) = self.get_files_using_git()
         elif self.execution_mode == ExecutionMode.SPECIFIC_FILES:
-            (
-                content_objects_to_run,
-                invalid_content_items,
-                non_content_items,
-            ) = self.paths_to_basecontent_set(
-                set(self.load_files(self.file_path.split(",")))
-            )
+            with self.profiler.phase("parsing") as phase:
+                (
+                    content_objects_to_run,
+                    invalid_content_items,
+                    non_content_items,
+                ) = self.paths_to_basecontent_set(
+                    set(self.load_files(self.file_path.split(",")))
+                )
+                phase.items = len(content_objects_to_run)
         elif self.execution_mode == ExecutionMode.ALL_FILES:
             logger.info("Running validation on all files.")
-            content_dto = ContentDTO.from_path()
-            if not isinstance(content_dto, ContentDTO):
-                raise Exception("no content found")
-            content_objects_to_run = set(content_dto.packs)
+            with self.profiler.phase("parsing") as phase:
+                content_dto = ContentDTO.from_path()
+                if not isinstance(content_dto, ContentDTO):
+                    raise Exception("no content found")
+                content_objects_to_run = set(content_dto.packs)
+                phase.items = len(content_objects_to_run)
         else:
             self.execution_mode = ExecutionMode.USE_GIT
             self.committed_only = True
@@ -416,17 +482,24 @@ class Initializer:
         Returns:
             Tuple[Set[BaseContent], Set[Path], Set[Path]]: The sets of all the successful casts, the sets of all failed casts, and the set of non content items.
         """
-        self.validate_git_installed()
-        self.set_prev_ver()
-        self.setup_git_params()
-        self.print_git_config()
+        with self.profiler.phase("git collection") as phase:
+            self.validate_git_installed()
+            self.set_prev_ver()
+            self.setup_git_params()
+            self.print_git_config()
 
-        (
-            modified_files,
-            added_files,
-            renamed_files,
-            deleted_files,
-        ) = self.collect_files_to_run(self.file_path)
+            (
+                modified_files,
+                added_files,
+                renamed_files,
+                deleted_files,
+            ) = self.collect_files_to_run(self.file_path)
+            phase.items = (
+                len(modified_files)
+                + len(added_files)
+                + len(renamed_files)
+                + len(deleted_files)
+            )
         file_by_status_dict: Dict[Path, GitStatuses] = {
             file: GitStatuses.MODIFIED for file in modified_files
         }
@@ -458,13 +531,15 @@ class Initializer:
         # Parsing the files.
         basecontent_with_path_set: Set[BaseContent] = set()
         invalid_content_items: Set[Path] = set()
-        (
-            basecontent_with_path_set,
-            invalid_content_items,
-            non_content_items,
-        ) = self.git_paths_to_basecontent_set(
-            statuses_dict_with_renamed_files_tuple, prev_ver=self.prev_ver
-        )
+        with self.profiler.phase("parsing") as phase:
+            (
+                basecontent_with_path_set,
+                invalid_content_items,
+                non_content_items,
+            ) = self.git_paths_to_basecontent_set(
+                statuses_dict_with_renamed_files_tuple, prev_ver=self.prev_ver
+            )
+            phase.items = len(basecontent_with_path_set)
         return basecontent_with_path_set, invalid_content_items, non_content_items
 
     def paths_to_basecontent_set(
@@ -518,45 +593,44 @@ class Initializer:
         non_content_items: Set[Path] = set()
         git_util = GitUtil.from_content_path()
         current_git_sha = git_util.get_current_git_branch_or_hash()
+        paths_to_parse: List[GitPathToParse] = []
         for file_path, git_status in statuses_dict.items():
             if git_status == GitStatuses.DELETED:
                 continue
-            try:
-                old_path = file_path
-                if isinstance(file_path, tuple):
-                    file_path, old_path = file_path
-                obj = BaseContent.from_path(file_path, raise_on_exception=True)
-                if obj:
-                    obj.git_sha = current_git_sha
-                    obj.git_status = git_status
-                    # Check if the file exists
-                    if (
-                        git_status in (GitStatuses.MODIFIED, GitStatuses.RENAMED)
-                        or (
-                            not git_status  # Always collect the origin version of the metadata.
-                            and find_type_by_path(file_path) == FileType.METADATA
-                        )
-                    ):
-                        try:
-                            obj.old_base_content_object = BaseContent.from_path(
-                                old_path, git_sha=prev_ver, raise_on_exception=True
-                            )
-                        except (NotAContentItemException, InvalidContentItemException):
-                            logger.debug(
-                                f"Could not parse the old_base_content_object for {obj.path}, setting a copy of the object as the old_base_content_object."
-                            )
-                            obj.old_base_content_object = obj.copy(deep=True)
-                    else:
-                        obj.old_base_content_object = obj.copy(deep=True)
-                    if obj.old_base_content_object:
-                        obj.old_base_content_object.git_sha = prev_ver
-                    basecontent_with_path_set.add(obj)
-                elif obj is None:
-                    invalid_content_items.add(file_path)
-            except NotAContentItemException:
-                non_content_items.add(file_path)  # type: ignore[arg-type]
-            except InvalidContentItemException:
-                invalid_content_items.add(file_path)  # type: ignore[arg-type]
+            old_path = file_path
+            if isinstance(file_path, tuple):
+                file_path, old_path = file_path
+            paths_to_parse.append((file_path, old_path, git_status))  # type: ignore[arg-type]
+        if prev_ver:
+            # the previous versions are read in a single git call, instead of a call for each
+            prefetch_remote_files(
+                [
+                    old_path
+                    for file_path, old_path, git_status in paths_to_parse
+                    if has_previous_version(file_path, git_status)
+                ],
+                tag=prev_ver,
+            )
+        args = [
+            (file_path, old_path, git_status, prev_ver, current_git_sha)
+            for file_path, old_path, git_status in paths_to_parse
+        ]
+        try:
+            # the workers are forked, so they share the prefetched previous versions
+            results = parallel_map(
+                lambda arg: git_path_to_basecontent(*arg),
+                args,
+                PARALLEL_PARSING_THRESHOLD,
+            )
+        finally:
+            GitUtil.clear_prefetched_files()
+        for (file_path, _, _), (obj, exception_type) in zip(paths_to_parse, results):
+            if obj:
+                basecontent_with_path_set.add(obj)
+            elif exception_type is NotAContentItemException:
+                non_content_items.add(file_path)
+            else:
+                invalid_content_items.add(file_path)
         return basecontent_with_path_set, invalid_content_items, non_content_items
 
     @staticmethod
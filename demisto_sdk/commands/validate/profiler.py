@@ -0,0 +1,124 @@
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List
+
+from tabulate import tabulate
+
+PROFILE_FILE_NAME = "validate_profile.json"
+
+# The profiled methods of every validator
+SHOULD_RUN = "should_run"
+OBTAIN_INVALID_CONTENT_ITEMS = "obtain_invalid_content_items"
+
+
+@dataclass
+class ProfileEntry:
+    """The wall time in seconds, the number of calls and the number of content items of a profiled phase or method."""
+
+    wall_time: float = 0.0
+    calls: int = 0
+    items: int = 0
+
+    def add(self, wall_time: float, items: int = 0, calls: int = 1) -> None:
+        self.wall_time += wall_time
+        self.items += items
+        self.calls += calls
+
+
+class ValidationProfiler:
+    """Records where the time of a validate run goes.
+
+    The initialization phases (git collection, parsing, graph update, etc.) are recorded by their names,
+    and the `should_run` and `obtain_invalid_content_items` methods of every validator by its error code.
+    For `should_run`, the calls are the content objects the validator was checked against and the items are the ones
+    it should run on. For `obtain_invalid_content_items`, the items are the content objects the validator ran on.
+
+    A disabled profiler (the default) records nothing, so it can be passed around unconditionally.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.phases: Dict[str, ProfileEntry] = {}
+        self.validators: Dict[str, Dict[str, ProfileEntry]] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[ProfileEntry]:
+        """Records the wall time of a phase. The number of items it handled can be set on the yielded entry.
+
+        Args:
+            name (str): The phase name.
+        """
+        if not self.enabled:
+            yield ProfileEntry()
+            return
+        entry = ProfileEntry()
+        start = time.perf_counter()
+        try:
+            yield entry
+        finally:
+            self.phases.setdefault(name, ProfileEntry()).add(
+                time.perf_counter() - start, items=entry.items
+            )
+
+    def record(
+        self,
+        error_code: str,
+        method: str,
+        wall_time: float,
+        items: int = 0,
+        calls: int = 1,
+    ) -> None:
+        """Records calls of a validator method.
+
+        Args:
+            error_code (str): The validator error code.
+            method (str): The method name.
+            wall_time (float): The wall time of the calls in seconds.
+            items (int): The number of content items of the calls.
+            calls (int): The number of calls.
+        """
+        if self.enabled:
+            self.validators.setdefault(error_code, {}).setdefault(
+                method, ProfileEntry()
+            ).add(wall_time, items=items, calls=calls)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "phases": {name: asdict(entry) for name, entry in self.phases.items()},
+            "validators": {
+                error_code: {method: asdict(entry) for method, entry in methods.items()}
+                for error_code, methods in self.validators.items()
+            },
+        }
+
+    def to_table(self) -> str:
+        """Returns the phases and the validators methods as tables, sorted by their wall time."""
+        phase_rows: List[List[Any]] = [
+            [name, round(entry.wall_time, 4), entry.calls, entry.items]
+            for name, entry in sorted(
+                self.phases.items(), key=lambda item: -item[1].wall_time
+            )
+        ]
+        validator_rows: List[List[Any]] = [
+            [error_code, method, round(entry.wall_time, 4), entry.calls, entry.items]
+            for error_code, method, entry in sorted(
+                (
+                    (error_code, method, entry)
+                    for error_code, methods in self.validators.items()
+                    for method, entry in methods.items()
+                ),
+                key=lambda row: -row[2].wall_time,
+            )
+        ]
+        return "\n\n".join(
+            (
+                tabulate(
+                    phase_rows, headers=["Phase", "Wall time (s)", "Calls", "Items"]
+                ),
+                tabulate(
+                    validator_rows,
+                    headers=["Validator", "Method", "Wall time (s)", "Calls", "Items"],
+                ),
+            )
+        )
@@ -0,0 +1,324 @@
+import glob
+import os
+import tempfile
+from functools import lru_cache
+from hashlib import sha1
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from demisto_sdk.commands.common.constants import (
+    CACHE_DIR,
+    DEMISTO_GIT_UPSTREAM,
+    DEMISTO_SDK_VALIDATE_CACHE,
+    DEMISTO_SDK_VALIDATE_CACHE_DIR,
+    DEMISTO_SDK_VALIDATE_CACHE_SIZE,
+    MARKETPLACE_TO_CORE_PACKS_FILE,
+    PACKS_PACK_IGNORE_FILE_NAME,
+    PACKS_PACK_META_FILE_NAME,
+    ExecutionMode,
+)
+from demisto_sdk.commands.common.git_util import GitUtil
+from demisto_sdk.commands.common.handlers import JSON_Handler
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.string_to_bool import string_to_bool
+from demisto_sdk.commands.common.tools import (
+    find_pack_folder,
+    get_content_path,
+    sha1_file,
+    sha1_update_from_dir,
+)
+from demisto_sdk.commands.content_graph.objects.base_content import BaseContent
+from demisto_sdk.commands.content_graph.parse_manifest import digest, hash_path
+from demisto_sdk.commands.content_graph.parser_cache import get_parser_version
+from demisto_sdk.commands.validate.config_reader import ConfiguredValidations
+
+json = JSON_Handler()
+
+VALIDATE_CACHE_DIR = CACHE_DIR / "validate"
+DEFAULT_VALIDATE_CACHE_SIZE_MB = 256
+VALIDATE_CACHE_ENTRY_SUFFIX = ".json"
+
+# A cached outcome is only valid for the exact validators and content objects code it was created with.
+VALIDATOR_VERSION_DIRS = (
+    Path(__file__).parent / "validators",
+    Path(__file__).parents[1] / "content_graph" / "objects",
+)
+
+# The repository config files some validators read, e.g. the approved categories, tags and use cases of the packs.
+REPO_CONFIG_FILES = (
+    "Config/approved_categories.json",
+    "Config/approved_tags.json",
+    "Config/approved_usecases.json",
+    *sorted(set(MARKETPLACE_TO_CORE_PACKS_FILE.values())),
+)
+
+# The outcome of a validator on a content object: the message and path of each of its results,
+# an empty list when the content object is valid.
+Outcome = List[List[Optional[str]]]
+
+
+@lru_cache
+def get_validators_version() -> str:
+    """Returns a hash of the SDK version, the validators and content objects code, and the parsers version."""
+    try:
+        sdk_version = version("demisto-sdk")
+    except PackageNotFoundError:
+        sdk_version = ""
+    hash_ = sha1(f"{sdk_version}|{get_parser_version()}".encode())
+    for directory in VALIDATOR_VERSION_DIRS:
+        hash_ = sha1_update_from_dir(directory, hash_)
+    return hash_.hexdigest()
+
+
+def hash_repo_config_files() -> List[str]:
+    """Returns the hashes of the repository config files, resolved the same way the validators read them."""
+    hashes = []
+    content_path: Optional[Path] = None
+    for file_name in REPO_CONFIG_FILES:
+        path = Path(file_name)
+        if not path.is_file():
+            if content_path is None:
+                content_path = get_content_path()
+            path = content_path / file_name
+        if path.is_file():
+            hashes.append(f"{file_name}:{sha1_file(path)}")
+    return hashes
+
+
+def hash_content_object_files(path: Path) -> List[str]:
+    """Returns the hashes of the files a content object is validated by.
+
+    These are the files of the content object and its related files (the whole package directory
+    of a content item which has one, otherwise the files named after it), and the metadata and ignore files of its pack.
+    A pack is validated by all of its files.
+
+    Args:
+        path (Path): The content object path.
+
+    Returns:
+        List[str]: The hashes of the files.
+    """
+    if path.is_dir():
+        return [hash_path(path)]
+    if not path.is_file():
+        raise FileNotFoundError(path)
+    try:
+        pack_path: Optional[Path] = find_pack_folder(path)
+    except ValueError:
+        pack_path = None
+    if pack_path and len(path.relative_to(pack_path).parts) > 2:
+        hashes = [hash_path(path.parent)]
+    else:
+        hashes = [
+            f"{related_path.name}:{sha1_file(related_path)}"
+            for related_path in sorted(path.parent.glob(f"{glob.escape(path.stem)}*"))
+            if related_path.is_file()
+        ]
+    if pack_path:
+        for file_name in (PACKS_PACK_META_FILE_NAME, PACKS_PACK_IGNORE_FILE_NAME):
+            if (pack_path / file_name).is_file():
+                hashes.append(f"{file_name}:{sha1_file(pack_path / file_name)}")
+    return hashes
+
+
+class ResultCacheStats(NamedTuple):
+    path: Path
+    entries: int
+    size: int
+    max_size: int
+
+
+class ResultCache:
+    """A persistent on-disk cache of the validators outcomes.
+
+    Every entry holds the outcomes of the validators on a content object by their error codes,
+    keyed by the content hash of the content object and its related files, its git status and previous version,
+    the configured validations, the validators version and the repository config files,
+    so a repeated run only runs the validators on the content objects which were changed since.
+    Only the outcomes of validators which validate every content object on its own should be stored,
+    see `ValidationEngine`.
+    The cache size is bounded, and the least recently used entries are evicted first.
+
+    The cache can be configured by the following environment variables:
+        - DEMISTO_SDK_VALIDATE_CACHE: Set to false to disable the cache.
+        - DEMISTO_SDK_VALIDATE_CACHE_DIR: The cache directory.
+        - DEMISTO_SDK_VALIDATE_CACHE_SIZE: The maximum cache size in MB.
+    """
+
+    def __init__(
+        self,
+        configured_validations: Optional[ConfiguredValidations] = None,
+        execution_mode: Optional[ExecutionMode] = None,
+        prev_ver: Optional[str] = None,
+        path: Optional[Path] = None,
+        max_size: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        """
+        Args:
+            configured_validations (Optional[ConfiguredValidations]): The configured validations of the run.
+            execution_mode (Optional[ExecutionMode]): The execution mode of the run.
+            prev_ver (Optional[str]): The branch or commit the changed content objects are compared to.
+            path (Optional[Path]): The cache directory.
+            max_size (Optional[int]): The maximum cache size in bytes.
+            enabled (Optional[bool]): Whether the cache is enabled.
+        """
+        self.path = path or Path(
+            os.getenv(DEMISTO_SDK_VALIDATE_CACHE_DIR) or VALIDATE_CACHE_DIR
+        )
+        self.max_size = max_size if max_size is not None else self._get_max_size()
+        self.enabled = (
+            enabled
+            if enabled is not None
+            else string_to_bool(os.getenv(DEMISTO_SDK_VALIDATE_CACHE), True)
+        )
+        self.context = digest(
+            [
+                get_validators_version(),
+                configured_validations._asdict() if configured_validations else None,
+                execution_mode,
+                hash_repo_config_files(),
+            ]
+        )
+        self.prev_ver_commit = self._resolve_commit(prev_ver) if prev_ver else None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _get_max_size() -> int:
+        if env_var := os.getenv(DEMISTO_SDK_VALIDATE_CACHE_SIZE):
+            try:
+                return int(env_var) * 1024 * 1024
+            except (TypeError, ValueError):
+                logger.warning(
+                    f"non-integer validate cache size value ({env_var}). Defaulting to {DEFAULT_VALIDATE_CACHE_SIZE_MB}MB."
+                )
+        return DEFAULT_VALIDATE_CACHE_SIZE_MB * 1024 * 1024
+
+    @staticmethod
+    def _resolve_commit(prev_ver: str) -> Optional[str]:
+        """Returns the commit hash of prev_ver, since the branch it names may move between runs."""
+        try:
+            repo = GitUtil.from_content_path().repo
+        except Exception as e:
+            logger.debug(f"Could not resolve the commit of {prev_ver}: {e}")
+            return None
+        for rev in (prev_ver, prev_ver.replace(f"{DEMISTO_GIT_UPSTREAM}/", "", 1)):
+            try:
+                return repo.commit(rev).hexsha
+            except Exception:
+                continue
+        logger.debug(f"Could not resolve the commit of {prev_ver}")
+        return None
+
+    def get_key(self, content_object: BaseContent) -> Optional[str]:
+        """Returns the cache key of a content object.
+
+        Args:
+            content_object (BaseContent): The content object.
+
+        Returns:
+            Optional[str]: The cache key, or None if the outcomes on the content object can not be cached,
+                when its files can not be read, or when it was changed and its previous version can not be resolved.
+        """
+        parts = [
+            self.context,
+            str(content_object.path.absolute()),
+            str(content_object.git_status),
+        ]
+        if self.prev_ver_commit:
+            parts.append(self.prev_ver_commit)
+            if old_content_object := content_object.old_base_content_object:
+                parts.append(str(old_content_object.path))
+        elif content_object.git_status:
+            return None
+        try:
+            parts.extend(hash_content_object_files(content_object.path))
+        except OSError as e:
+            logger.debug(f"Could not hash the files of {content_object.path}: {e}")
+            return None
+        return sha1("|".join(parts).encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / f"{key}{VALIDATE_CACHE_ENTRY_SUFFIX}"
+
+    def _iter_entries(self) -> List[Path]:
+        if not self.path.exists():
+            return []
+        return list(self.path.glob(f"*{VALIDATE_CACHE_ENTRY_SUFFIX}"))
+
+    def get(self, key: str) -> Dict[str, Outcome]:
+        """Returns the cached outcomes of a content object by the validators error codes."""
+        entry_path = self._entry_path(key)
+        try:
+            outcomes = json.loads(entry_path.read_text())
+            # Update the modification time, which is used for the LRU eviction
+            os.utime(entry_path)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.debug(f"Could not load the validate cache entry {entry_path}: {e}")
+            entry_path.unlink(missing_ok=True)
+            return {}
+        return outcomes
+
+    def set(self, key: str, outcomes: Dict[str, Outcome]) -> None:
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first, since multiple processes may write to the cache at the same time
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.path, suffix=".tmp", delete=False
+            ) as f:
+                f.write(json.dumps(outcomes))
+            os.replace(f.name, self._entry_path(key))
+        except Exception as e:
+            logger.debug(f"Could not write the validate cache entry {key}: {e}")
+
+    def evict(self) -> int:
+        """Removes the least recently used entries until the cache size is within its bound.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        entries = []
+        total_size = 0
+        for entry_path in self._iter_entries():
+            try:
+                stat = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+            total_size += stat.st_size
+        removed = 0
+        for _, size, entry_path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            entry_path.unlink(missing_ok=True)
+            total_size -= size
+            removed += 1
+        if removed:
+            logger.debug(f"Evicted {removed} entries from the validate cache")
+        return removed
+
+    def stats(self) -> ResultCacheStats:
+        entries = self._iter_entries()
+        return ResultCacheStats(
+            path=self.path,
+            entries=len(entries),
+            size=sum(entry.stat().st_size for entry in entries),
+            max_size=self.max_size,
+        )
+
+    def clear(self) -> int:
+        """Removes all the cache entries.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        entries = self._iter_entries()
+        for entry_path in entries:
+            entry_path.unlink(missing_ok=True)
+        for tmp_path in self.path.glob("*.tmp") if self.path.exists() else []:
+            tmp_path.unlink(missing_ok=True)
+        return len(entries)
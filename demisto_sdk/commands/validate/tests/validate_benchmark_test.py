@@ -0,0 +1,53 @@
+from demisto_sdk.commands.validate.benchmarks.validate_benchmark import (
+    best_of,
+    compare_benchmarks,
+)
+
+
+def benchmark(wall_time: float, peak_rss_mb: float, **validators: float) -> dict:
+    return {
+        "runs": [
+            {
+                "packs": 10,
+                "mode": "all",
+                "wall_time": wall_time,
+                "peak_rss_mb": peak_rss_mb,
+                "validators": validators,
+            }
+        ]
+    }
+
+
+def test_best_of():
+    """
+    Given:
+        - Two measurements of a run.
+    When:
+        - Taking the best of them.
+    Then:
+        - Make sure the measurement with the shortest wall time is taken, with the shortest CPU time of every validator.
+    """
+    [slow] = benchmark(2, 100, BA101=0.5, BA102=1)["runs"]
+    [fast] = benchmark(1, 200, BA101=1, BA102=0.5)["runs"]
+    assert best_of([slow, fast]) == {
+        **fast,
+        "validators": {"BA101": 0.5, "BA102": 0.5},
+    }
+
+
+def test_compare_benchmarks():
+    """
+    Given:
+        - A baseline benchmark and a benchmark with a slower run, a slower validator and a slower validator which is fast.
+    When:
+        - Comparing them with a 20% threshold.
+    Then:
+        - Make sure the slower run and the slower validator are regressions, and the rest are not.
+    """
+    baseline = benchmark(10, 100, BA101=1, BA102=1, BA103=0.01)
+    current = benchmark(12.5, 110, BA101=1.5, BA102=1.1, BA103=0.03)
+    assert compare_benchmarks(baseline, current, threshold=0.2) == [
+        "10 packs, all: wall_time 10.00 -> 12.50",
+        "10 packs, all: BA101 CPU time 1.000s -> 1.500s",
+    ]
+    assert not compare_benchmarks(baseline, baseline, threshold=0.2)
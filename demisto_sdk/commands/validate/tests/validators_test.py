@@ -9,6 +9,7 @@ import toml
 from more_itertools import map_reduce
 from pytest_mock import MockerFixture
 
+from demisto_sdk.commands.common import parallel as parallel_module
 from demisto_sdk.commands.common.constants import (
     INTEGRATIONS_DIR,
     ExecutionMode,
@@ -19,21 +20,43 @@ from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.content_graph.common import ContentType
+from demisto_sdk.commands.content_graph.objects import content_item
+from demisto_sdk.commands.content_graph.objects import integration as integration_module
+from demisto_sdk.commands.content_graph.objects import pack as pack_module
 from demisto_sdk.commands.content_graph.objects.base_content import BaseContent
 from demisto_sdk.commands.content_graph.objects.integration import Integration
 from demisto_sdk.commands.content_graph.objects.script import Script
+from demisto_sdk.commands.content_graph.parsers.related_files import RelatedFileType
 from demisto_sdk.commands.content_graph.tests.test_tools import load_yaml
+from demisto_sdk.commands.validate import initializer as initializer_module
+from demisto_sdk.commands.validate import validation_engine
 from demisto_sdk.commands.validate.config_reader import (
     ConfigReader,
     ConfiguredValidations,
 )
+from demisto_sdk.commands.validate.fix_transaction import FixTransaction
 from demisto_sdk.commands.validate.initializer import Initializer
+from demisto_sdk.commands.validate.profiler import (
+    OBTAIN_INVALID_CONTENT_ITEMS,
+    PROFILE_FILE_NAME,
+    SHOULD_RUN,
+    ValidationProfiler,
+)
+from demisto_sdk.commands.validate.result_cache import ResultCache
 from demisto_sdk.commands.validate.tests.test_tools import (
     create_integration_object,
     create_pack_object,
     create_script_object,
 )
 from demisto_sdk.commands.validate.validate_manager import ValidateManager
+from demisto_sdk.commands.validate.validation_engine import (
+    DispatchIndex,
+    Lane,
+    ValidationEngine,
+    get_lane,
+    get_related_files_plan,
+    is_cacheable,
+)
 from demisto_sdk.commands.validate.validation_results import ResultWriter
 from demisto_sdk.commands.validate.validators.BA_validators.BA101_id_should_equal_name import (
     IDNameValidator,
@@ -54,9 +77,18 @@ from demisto_sdk.commands.validate.validators.BC_validators.BC100_breaking_backw
 from demisto_sdk.commands.validate.validators.DO_validators.DO106_docker_image_is_latest_tag import (
     DockerImageTagIsNotOutdated,
 )
+from demisto_sdk.commands.validate.validators.DS_validators.DS104_no_description_file import (
+    NoDescriptionFileValidator,
+)
 from demisto_sdk.commands.validate.validators.GR_validators.GR100_uses_items_not_in_market_place_all_files import (
     MarketplacesFieldValidatorAllFiles,
 )
+from demisto_sdk.commands.validate.validators.GR_validators.GR100_uses_items_not_in_market_place_list_files import (
+    MarketplacesFieldValidatorListFiles,
+)
+from demisto_sdk.commands.validate.validators.PA_validators.PA103_is_valid_categories import (
+    IsValidCategoriesValidator,
+)
 from demisto_sdk.commands.validate.validators.PA_validators.PA108_pack_metadata_name_not_valid import (
     PackMetadataNameValidator,
 )
@@ -480,6 +512,40 @@ def test_post_results(
         assert code in " ".join({log.message for log in errors})
 
 
+def test_post_results_saves_every_fixed_object_once(mocker):
+    """
+    Given:
+        - An integration fixed by two fixers, which changed its name and its subtype.
+    When:
+        - Calling the post_results function.
+    Then:
+        - Make sure the integration file is written once, with both fixes.
+        - Make sure the fields each fixer touched are reported.
+    """
+    integration = create_integration_object()
+    mocker.patch(
+        "demisto_sdk.commands.validate.validators.base_validator.CONTENT_PATH",
+        integration.path.parents[4],
+    )
+    integration.name = "fixed_name"
+    integration.subtype = "python2"
+    result_writer = ResultWriter()
+    result_writer.fixing_results = [
+        FixResult(validator=validator, message="fixed", content_object=integration)
+        for validator in (IDNameValidator(), BreakingBackwardsSubtypeValidator())
+    ]
+    write_dict = mocker.spy(integration_module, "write_dict")
+    fix_transaction = mocker.spy(FixTransaction, "report")
+    assert result_writer.post_results(ConfiguredValidations()) == 1
+    assert write_dict.call_count == 1
+    data = load_yaml(integration.path)
+    assert data["name"] == "fixed_name"
+    assert data["script"]["subtype"] == "python2"
+    assert fix_transaction.spy_return == (
+        f"{integration.path}: name (BA101), subtype (BC100)"
+    )
+
+
 @pytest.mark.parametrize(
     "failing_error_codes, warning_error_codes, config_file_content, exit_code, expected_msg",
     [
@@ -600,6 +666,64 @@ def test_should_run_api_module():
     )
 
 
+@pytest.mark.parametrize(
+    "execution_mode", [ExecutionMode.USE_GIT, ExecutionMode.ALL_FILES]
+)
+def test_dispatch_index(mocker, execution_mode):
+    """
+    Given:
+        - All the validators.
+        - Content objects of several types, git statuses and deprecation, two of them ignore validations,
+          another is an APIModule and another has a support level which ignores a validation.
+    When:
+        - Getting the validators which should run on each content object from the dispatch index.
+    Then:
+        - Make sure they are the same validators should_run returns True for.
+    """
+    validators = get_all_validators()
+    configured_validations = ConfiguredValidations(
+        ignorable_errors=["BA101", "DO106", "IN100"],
+        support_level_dict={"community": {"ignore": ["SC100"]}},
+    )
+    deprecated_script = create_script_object(paths=["deprecated"], values=[True])
+    deprecated_script.git_status = GitStatuses.MODIFIED
+    ignoring_script = create_script_object()
+    ignoring_script.pack = create_pack_object()
+    ignoring_script.pack.ignored_errors_dict = {
+        f"file:{ignoring_script.path.name}": {"ignore": "BA101,DO106"}
+    }
+    api_module = create_script_object()
+    api_module.path = api_module.path.parent / "testAPIModule.yml"
+    api_module.git_status = GitStatuses.ADDED
+    community_script = create_script_object()
+    community_script.support = "community"
+    pack = create_pack_object()
+    pack.ignored_errors_dict = {"file:pack_metadata.json": {"ignore": "BA101"}}
+    content_objects = [
+        create_integration_object(),
+        pack,
+        deprecated_script,
+        ignoring_script,
+        api_module,
+        community_script,
+    ]
+    content_path = pack.path.parents[1]
+    mocker.patch.object(content_item, "CONTENT_PATH", content_path)
+    mocker.patch.object(pack_module, "CONTENT_PATH", content_path)
+    dispatch_index = DispatchIndex(validators, configured_validations, execution_mode)
+    for content_object in content_objects:
+        assert dispatch_index.get_validators(content_object) == [
+            index
+            for index, validator in enumerate(validators)
+            if validator.should_run(
+                content_object,
+                configured_validations.ignorable_errors,
+                configured_validations.support_level_dict,
+                execution_mode,
+            )
+        ]
+
+
 def test_object_collection_with_readme_path(repo):
     """
     Given:
@@ -646,6 +770,71 @@ def test_object_collection_with_pack_path(repo):
     assert obj_types == {ContentType.INTEGRATION, ContentType.PACK}
 
 
+def test_git_paths_to_basecontent_set_parallel(mocker, repo):
+    """
+    Given:
+    - Paths of added scripts, of a file which is not a content item and of a file which does not exist.
+    When:
+    - Calling the git_paths_to_basecontent_set with enough paths to parse them in worker processes,
+      and with too few paths for that.
+    Then:
+    - Make sure the results are the same.
+    - Make sure the file which is not a content item and the missing file are returned as invalid and non content items.
+    """
+    pack = repo.create_pack("pack_no_1")
+    statuses_dict = {
+        Path(pack.create_script(f"script_{i}").yml.path): GitStatuses.ADDED
+        for i in range(3)
+    }
+    statuses_dict[Path(pack.path) / "README.md"] = GitStatuses.MODIFIED
+    statuses_dict[Path(pack.path) / "Scripts" / "missing" / "missing.yml"] = None
+    mocker.patch.object(parallel_module, "cpu_count", return_value=2)
+    initializer = Initializer()
+
+    mocker.patch.object(initializer_module, "PARALLEL_PARSING_THRESHOLD", 1)
+    parallel_results = initializer.git_paths_to_basecontent_set(statuses_dict)
+    mocker.patch.object(initializer_module, "PARALLEL_PARSING_THRESHOLD", 100)
+    results = initializer.git_paths_to_basecontent_set(statuses_dict)
+
+    assert parallel_results == results
+    assert {obj.path for obj in parallel_results[0]} == set(list(statuses_dict)[:3])
+    assert all(
+        obj.git_status == GitStatuses.ADDED
+        and obj.old_base_content_object.path == obj.path
+        for obj in parallel_results[0]
+    )
+    assert parallel_results[1:] == (
+        {Path(pack.path) / "README.md"},
+        {Path(pack.path) / "Scripts" / "missing" / "missing.yml"},
+    )
+
+
+def test_git_paths_to_basecontent_set_old_version_of_added_file(repo):
+    """
+    Given:
+    - The path of an added script.
+    When:
+    - Calling the git_paths_to_basecontent_set.
+    Then:
+    - Make sure the old_base_content_object is a copy of the script which shares its values, with the previous git sha.
+    - Make sure setting a field of the script does not change the old_base_content_object.
+    """
+    pack = repo.create_pack("pack_no_1")
+    script_path = Path(pack.create_script("script").yml.path)
+    [script], _, _ = Initializer().git_paths_to_basecontent_set(
+        {script_path: GitStatuses.ADDED}, prev_ver="master"
+    )
+    old_script = script.old_base_content_object
+    assert old_script is not script
+    assert old_script.git_sha == "master"
+    assert old_script.old_base_content_object is None
+    assert old_script.marketplaces is script.marketplaces
+    assert old_script.relationships_data is script.relationships_data
+
+    script.fromversion = "99.99.99"
+    assert old_script.fromversion != "99.99.99"
+
+
 def test_load_files_with_pack_path(repo):
     """
     Given:
@@ -969,3 +1158,354 @@ def test_config_reader_ignore_all_flag(
     assert results.ignorable_errors == expected_results.ignorable_errors
     assert results.warning == expected_results.warning
     assert results.support_level_dict == expected_results.support_level_dict
+
+
+def test_validation_engine_parallel(mocker):
+    """
+    Given:
+        - Scripts, two of them with a name which is different from their id.
+        - A validator which runs on every item, a graph validator and a docker hub validator.
+    When:
+        - Running the validators with the validation engine in parallel, and one after the other.
+    Then:
+        - Make sure every validator is scheduled in its lane.
+        - Make sure the results are the same, in the same order, and refer to the same content objects.
+        - Make sure the CPU time of every validator is recorded.
+    """
+    mocker.patch.object(validation_engine, "PARALLEL_OBJECTS_THRESHOLD", 1)
+    mocker.patch.object(parallel_module, "cpu_count", return_value=2)
+    scripts = [create_script_object() for _ in range(2)] + [
+        create_script_object(paths=["name"], values=[f"other_name_{i}"])
+        for i in range(2)
+    ]
+    validators = [
+        IDNameAllStatusesValidator(),
+        MarketplacesFieldValidatorAllFiles(),
+        DockerImageTagIsNotOutdated(),
+    ]
+    mocker.patch.object(
+        MarketplacesFieldValidatorAllFiles,
+        "obtain_invalid_content_items",
+        side_effect=lambda content_items: [
+            ValidationResult(
+                validator=validators[1], message="graph", content_object=scripts[0]
+            )
+        ],
+    )
+    mocker.patch.object(
+        DockerImageTagIsNotOutdated, "obtain_invalid_content_items", return_value=[]
+    )
+    assert [get_lane(validator) for validator in validators] == [
+        Lane.WORKERS,
+        Lane.GRAPH,
+        Lane.DOCKERHUB,
+    ]
+    configured_validations = ConfiguredValidations(
+        select=["BA101", "GR100", "DO106"],
+        warning=[],
+        ignorable_errors=[],
+        support_level_dict={},
+    )
+
+    def run(parallel: bool):
+        engine = ValidationEngine(
+            validators,
+            scripts,
+            configured_validations,
+            ExecutionMode.ALL_FILES,
+            parallel,
+        )
+        assert engine.parallel == parallel
+        results = [
+            (validator, [(r.content_object, r.message) for r in results])
+            for validator, results in engine.run()
+        ]
+        assert set(engine.cpu_times) == {"BA101", "GR100", "DO106"}
+        return results
+
+    parallel_results = run(parallel=True)
+    assert parallel_results == run(parallel=False)
+    assert [len(results) for _, results in parallel_results] == [2, 1, 0]
+    assert [content_object.path for content_object, _ in parallel_results[0][1]] == [
+        scripts[2].path,
+        scripts[3].path,
+    ]
+
+
+def test_validation_engine_redispatch_fixed_objects():
+    """
+    Given:
+        - A deprecated script, and two validators which do not run on deprecated content items.
+    When:
+        - Running the validators one after the other, and un-deprecating the script (as a fix would) after the first
+          one ran.
+    Then:
+        - Make sure the script is not dispatched to the first validator.
+        - Make sure the script is dispatched again to the second validator once it is marked as fixed.
+    """
+    script = create_script_object(paths=["deprecated"], values=[True])
+    engine = ValidationEngine(
+        [IDNameAllStatusesValidator(), IDNameAllStatusesValidator()],
+        [script],
+        ConfiguredValidations(
+            select=["BA101"],
+            warning=[],
+            ignorable_errors=[],
+            support_level_dict={},
+        ),
+        ExecutionMode.SPECIFIC_FILES,
+        parallel=False,
+    )
+    runs = engine.run()
+    next(runs)
+    assert engine.objects_by_validator == [[], []]
+    script.deprecated = False
+    engine.mark_fixed([script])
+    next(runs)
+    assert engine.objects_by_validator[1] == [script]
+    assert not engine.fixed_objects
+
+
+def test_validation_engine_result_cache(mocker, tmp_path: Path):
+    """
+    Given:
+        - Two scripts, one of them with a name which is different from its id, and an empty result cache.
+    When:
+        - Running a validator with the validation engine twice.
+        - Changing the README of the other script and running it again.
+    Then:
+        - Make sure the second run takes the outcomes from the cache, with the same results.
+        - Make sure the third run only runs the validator on the changed script.
+        - Make sure graph validators are not cached.
+    """
+    scripts = [
+        create_script_object(),
+        create_script_object(paths=["name"], values=["other_name"]),
+    ]
+    validator = IDNameAllStatusesValidator()
+    configured_validations = ConfiguredValidations(select=["BA101"])
+    obtain_invalid_content_items = mocker.spy(
+        IDNameAllStatusesValidator, "obtain_invalid_content_items"
+    )
+
+    def run():
+        engine = ValidationEngine(
+            [validator],
+            scripts,
+            configured_validations,
+            ExecutionMode.ALL_FILES,
+            result_cache=ResultCache(
+                configured_validations,
+                ExecutionMode.ALL_FILES,
+                path=tmp_path,
+                enabled=True,
+            ),
+        )
+        results = [
+            (result.content_object.path, result.message)
+            for _, results in engine.run()
+            for result in results
+        ]
+        return results, engine.result_cache
+
+    results, result_cache = run()
+    assert [path for path, _ in results] == [scripts[1].path]
+    assert (result_cache.hits, result_cache.misses) == (0, 2)
+    assert result_cache.stats().entries == 2
+
+    assert run()[0] == results
+    assert obtain_invalid_content_items.call_count == 1
+
+    (scripts[0].path.parent / "README.md").write_text("changed")
+    cached_results, result_cache = run()
+    assert cached_results == results
+    assert (result_cache.hits, result_cache.misses) == (1, 1)
+    assert obtain_invalid_content_items.call_args[0][1] == [scripts[0]]
+
+    assert not is_cacheable(MarketplacesFieldValidatorAllFiles())
+
+
+def test_validation_engine_result_cache_repo_config(
+    mocker, monkeypatch, tmp_path: Path
+):
+    """
+    Given:
+        - A pack with an approved category, and an empty result cache.
+    When:
+        - Running PA103 with the validation engine, removing the category from the approved categories config file
+          and running it again.
+    Then:
+        - Make sure the second run does not take the outcome from the cache, and the pack is invalid.
+    """
+    pack = create_pack_object(paths=["categories"], values=[["Utilities"]])
+    config_path = tmp_path / "Config" / "approved_categories.json"
+    config_path.parent.mkdir()
+    config_path.write_text(json.dumps({"approved_list": ["Utilities"]}))
+    monkeypatch.chdir(tmp_path)
+    mocker.patch(
+        "demisto_sdk.commands.common.tools.is_external_repository", return_value=False
+    )
+    validator = IsValidCategoriesValidator()
+    configured_validations = ConfiguredValidations(select=["PA103"])
+    obtain_invalid_content_items = mocker.spy(
+        IsValidCategoriesValidator, "obtain_invalid_content_items"
+    )
+
+    def run():
+        engine = ValidationEngine(
+            [validator],
+            [pack],
+            configured_validations,
+            ExecutionMode.ALL_FILES,
+            result_cache=ResultCache(
+                configured_validations,
+                ExecutionMode.ALL_FILES,
+                path=tmp_path / "cache",
+                enabled=True,
+            ),
+        )
+        return [result for _, results in engine.run() for result in results]
+
+    assert not run()
+    config_path.write_text(json.dumps({"approved_list": ["Other"]}))
+    assert [result.content_object for result in run()] == [pack]
+    assert obtain_invalid_content_items.call_count == 2
+
+
+def test_result_cache_key(tmp_path: Path):
+    """
+    Given:
+        - A script.
+    When:
+        - Getting its result cache key before and after changing its pack metadata, and when it is modified.
+    Then:
+        - Make sure the key changes with the pack metadata.
+        - Make sure there is no key for a modified script when the previous version is unknown.
+    """
+    script = create_script_object()
+    result_cache = ResultCache(path=tmp_path, enabled=True)
+    key = result_cache.get_key(script)
+    assert key == result_cache.get_key(script)
+
+    pack_metadata_path = script.path.parents[2] / "pack_metadata.json"
+    pack_metadata_path.write_text(pack_metadata_path.read_text() + "\n")
+    assert result_cache.get_key(script) not in (None, key)
+
+    script.git_status = GitStatuses.MODIFIED
+    assert result_cache.get_key(script) is None
+
+
+def test_validation_profile(tmp_path: Path):
+    """
+    Given:
+        - Two scripts, one of them with a name which is different from its id, and an enabled profiler.
+    When:
+        - Running a validator with the validation engine, and posting the results.
+    Then:
+        - Make sure the should_run checks and the obtain_invalid_content_items call of the validator are recorded.
+        - Make sure the dispatch phase is recorded.
+        - Make sure the profile is written next to the json outputs file when the results are posted.
+    """
+    scripts = [
+        create_script_object(),
+        create_script_object(paths=["name"], values=["other_name"]),
+    ]
+    configured_validations = ConfiguredValidations(select=["BA101"])
+    profiler = ValidationProfiler(enabled=True)
+    engine = ValidationEngine(
+        [IDNameAllStatusesValidator()],
+        scripts,
+        configured_validations,
+        ExecutionMode.ALL_FILES,
+        profiler=profiler,
+    )
+    assert [len(results) for _, results in engine.run()] == [1]
+
+    validator_profile = profiler.validators["BA101"]
+    assert (
+        validator_profile[SHOULD_RUN].calls,
+        validator_profile[SHOULD_RUN].items,
+    ) == (2, 2)
+    assert (
+        validator_profile[OBTAIN_INVALID_CONTENT_ITEMS].calls,
+        validator_profile[OBTAIN_INVALID_CONTENT_ITEMS].items,
+    ) == (1, 2)
+    assert profiler.phases["dispatch"].items == 2
+    assert "BA101" in profiler.to_table()
+
+    ResultWriter(json_file_path=str(tmp_path), profiler=profiler).post_results(
+        configured_validations
+    )
+    profile = json.loads((tmp_path / PROFILE_FILE_NAME).read_text())
+    assert profile["validators"]["BA101"][OBTAIN_INVALID_CONTENT_ITEMS]["items"] == 2
+    assert set(profile["phases"]) == {"dispatch"}
+
+
+@pytest.mark.parametrize(
+    "execution_mode, validator, prefetched",
+    [
+        (ExecutionMode.ALL_FILES, MarketplacesFieldValidatorAllFiles(), True),
+        (ExecutionMode.SPECIFIC_FILES, MarketplacesFieldValidatorListFiles(), False),
+    ],
+)
+def test_validation_engine_graph_prefetch(
+    mocker, execution_mode: ExecutionMode, validator, prefetched: bool
+):
+    """
+    Given:
+        - Two scripts and a graph validator, with all the files and with specific files.
+    When:
+        - Running the validator with the validation engine.
+    Then:
+        - Make sure the graph is prefetched once before the validator runs when validating all the files,
+          and is not prefetched for a small number of specific files.
+    """
+    graph_interface = mocker.MagicMock()
+    graph_interface.find_uses_paths_with_invalid_marketplaces.return_value = []
+    mocker.patch.object(BaseValidator, "graph_interface", graph_interface)
+    engine = ValidationEngine(
+        [validator, validator],
+        [create_script_object() for _ in range(2)],
+        ConfiguredValidations(select=["GR100"]),
+        execution_mode,
+    )
+    assert [results for _, results in engine.run()] == [[], []]
+    assert graph_interface.prefetch_validations.call_count == int(prefetched)
+    assert graph_interface.find_uses_paths_with_invalid_marketplaces.call_count == 2
+
+
+def test_validation_engine_related_files_prefetch(mocker):
+    """
+    Given:
+        - Two integrations and a script, a validator of the integrations description file and a validator of the name.
+    When:
+        - Creating the content objects.
+        - Running the validators with the validation engine.
+    Then:
+        - Make sure the description file path is not looked for when the content objects are created.
+        - Make sure only the description files of the integrations are in the related files plan,
+          and they are loaded before the validators run.
+    """
+    mocker.patch.object(validation_engine, "RELATED_FILES_PREFETCH_THRESHOLD", 1)
+    integrations = [
+        create_integration_object(description_content=f"description {i}")
+        for i in range(2)
+    ]
+    script = create_script_object()
+    assert all(
+        integration.description_file._file_path is None for integration in integrations
+    )
+    validators = [NoDescriptionFileValidator(), IDNameAllStatusesValidator()]
+    engine = ValidationEngine(
+        validators,
+        [*integrations, script],
+        ConfiguredValidations(select=["DS104", "BA101"]),
+        ExecutionMode.SPECIFIC_FILES,
+    )
+    assert [results for _, results in engine.run()] == [[], []]
+    assert get_related_files_plan(validators, engine.objects_by_validator) == {
+        RelatedFileType.DESCRIPTION_File: integrations
+    }
+    assert [
+        integration.description_file.file_content_str for integration in integrations
+    ] == ["description 0", "description 1"]
@@ -1,7 +1,6 @@
 from pathlib import Path
 from typing import List, Optional, Set
 
-from demisto_sdk.commands.common.constants import ExecutionMode
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.content_graph.objects.base_content import BaseContent
 from demisto_sdk.commands.validate.config_reader import (
@@ -9,6 +8,9 @@ from demisto_sdk.commands.validate.config_reader import (
     ConfiguredValidations,
 )
 from demisto_sdk.commands.validate.initializer import Initializer
+from demisto_sdk.commands.validate.profiler import ValidationProfiler
+from demisto_sdk.commands.validate.result_cache import ResultCache
+from demisto_sdk.commands.validate.validation_engine import ValidationEngine
 from demisto_sdk.commands.validate.validation_results import (
     ResultWriter,
 )
@@ -16,7 +18,6 @@ from demisto_sdk.commands.validate.validators.base_validator import (
     BaseValidator,
     InvalidContentItemResult,
     ValidationCaughtExceptionResult,
-    ValidationResult,
     get_all_validators,
 )
 
@@ -31,9 +32,14 @@ class ValidateManager:
         allow_autofix=False,
         ignore_support_level=False,
         ignore: Optional[List[str]] = None,
+        use_cache: bool = False,
+        profiler: Optional[ValidationProfiler] = None,
     ):
         self.ignore_support_level = ignore_support_level
+        # fixes change the content objects after they were hashed, so their outcomes are not cached
+        self.use_cache = use_cache and not allow_autofix
         self.file_path = file_path
+        self.profiler = profiler or ValidationProfiler()
         self.allow_autofix = allow_autofix
         self.validation_results = validation_results
         self.config_reader = config_reader
@@ -51,6 +57,7 @@ class ValidateManager:
             codes_to_ignore=ignore,
         )
         self.validators = self.filter_validators()
+        self.validation_engine: Optional[ValidationEngine] = None
 
     def run_validations(self) -> int:
         """
@@ -61,34 +68,27 @@ class ValidateManager:
             int: the exit code to obtained from the calculations of post_results.
         """
         logger.info("Starting validate items.")
-        for validator in self.validators:
-            logger.debug(f"Starting execution for {validator.error_code} validator.")
-            if filtered_content_objects_for_validator := list(
-                filter(
-                    lambda content_object: validator.should_run(
-                        content_item=content_object,
-                        ignorable_errors=self.configured_validations.ignorable_errors,
-                        support_level_dict=self.configured_validations.support_level_dict,
-                        running_execution_mode=self.initializer.execution_mode,
-                    ),
-                    self.objects_to_run,
-                )
-            ):
-                validation_results: List[ValidationResult] = (
-                    validator.obtain_invalid_content_items(
-                        filtered_content_objects_for_validator
-                    )
-                )  # type: ignore
-                if (
-                    validator.expected_execution_mode == [ExecutionMode.ALL_FILES]
-                    and self.initializer.execution_mode == ExecutionMode.ALL_FILES
-                ):
-                    validation_results = [
-                        validation_result
-                        for validation_result in validation_results
-                        if validation_result.content_object
-                        in filtered_content_objects_for_validator
-                    ]
+        self.validation_engine = ValidationEngine(
+            validators=self.validators,
+            objects_to_run=list(self.objects_to_run),
+            configured_validations=self.configured_validations,
+            execution_mode=self.initializer.execution_mode,
+            # fixes change the content objects, which the following validators should see
+            parallel=not (
+                self.allow_autofix
+                and any(validator.is_auto_fixable for validator in self.validators)
+            ),
+            result_cache=ResultCache(
+                configured_validations=self.configured_validations,
+                execution_mode=self.initializer.execution_mode,
+                prev_ver=self.initializer.prev_ver,
+            )
+            if self.use_cache
+            else None,
+            profiler=self.profiler,
+        )
+        for validator, validation_results in self.validation_engine.run():
+            if validation_results:
                 try:
                     if self.allow_autofix and validator.is_auto_fixable:
                         for validation_result in validation_results:
@@ -96,6 +96,10 @@ class ValidateManager:
                                 self.validation_results.append_fix_results(
                                     validator.fix(validation_result.content_object)  # type: ignore
                                 )
+                                # the fix may change which of the following validators should run on the object
+                                self.validation_engine.mark_fixed(
+                                    [validation_result.content_object]
+                                )
                             except Exception:
                                 logger.error(
                                     f"Could not fix {validation_result.validator.error_code} error for content item {str(validation_result.content_object.path)}"
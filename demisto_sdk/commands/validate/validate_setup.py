@@ -18,6 +18,8 @@ from demisto_sdk.commands.common.tools import (
 from demisto_sdk.commands.validate.config_reader import ConfigReader
 from demisto_sdk.commands.validate.initializer import Initializer
 from demisto_sdk.commands.validate.old_validate_manager import OldValidateManager
+from demisto_sdk.commands.validate.profiler import ValidationProfiler
+from demisto_sdk.commands.validate.result_cache import ResultCache
 from demisto_sdk.commands.validate.validate_manager import ValidateManager
 from demisto_sdk.commands.validate.validation_results import ResultWriter
 from demisto_sdk.utils.utils import update_command_args_from_config_file
@@ -158,6 +160,21 @@ def validate(
     ignore: list[str] = typer.Option(
         None, help="An error code to not run. Can be repeated."
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Run all the validations, without using the cached results of previous runs.",
+    ),
+    clear_cache: bool = typer.Option(
+        False,
+        "--clear-cache",
+        help="Remove the cached results of previous runs before validating.",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Record the time every validation and initialization phase took, and post it with the results.",
+    ),
     console_log_threshold: str = typer.Option(
         None,
         "--console-log-threshold",
@@ -246,7 +263,15 @@ def determine_execution_mode(file_path, validate_all, use_git, post_commit):
 
 def warn_on_ignored_flags(run_new_validate, run_old_validate, params):
     if not run_new_validate:
-        for flag in ["fix", "ignore_support_level", "config_path", "category_to_run"]:
+        for flag in [
+            "fix",
+            "ignore_support_level",
+            "config_path",
+            "category_to_run",
+            "no_cache",
+            "clear_cache",
+            "profile",
+        ]:
             if params.get(flag):
                 logger.warning(
                     f"Flag '{flag.replace('_', '-')}' is ignored when skipping new validation."
@@ -313,7 +338,13 @@ def run_old_validation(file_path, is_external_repo, run_with_mp, **kwargs):
 
 
 def run_new_validation(file_path, execution_mode, **kwargs):
-    validation_results = ResultWriter(json_file_path=kwargs.get("json_file"))
+    if kwargs.get("clear_cache"):
+        removed = ResultCache().clear()
+        logger.info(f"Removed {removed} entries from the validate cache.")
+    profiler = ValidationProfiler(enabled=bool(kwargs.get("profile")))
+    validation_results = ResultWriter(
+        json_file_path=kwargs.get("json_file"), profiler=profiler
+    )
     config_reader = ConfigReader(
         path=kwargs.get("config_path"),
         category=kwargs.get("category_to_run"),
@@ -326,6 +357,7 @@ def run_new_validation(file_path, execution_mode, **kwargs):
         prev_ver=kwargs["prev_ver"],
         file_path=file_path,
         execution_mode=execution_mode,
+        profiler=profiler,
     )
     validator_v2 = ValidateManager(
         file_path=file_path,
@@ -335,5 +367,7 @@ def run_new_validation(file_path, execution_mode, **kwargs):
         allow_autofix=kwargs["fix"],
         ignore_support_level=kwargs["ignore_support_level"],
         ignore=kwargs["ignore"],
+        use_cache=not kwargs.get("no_cache"),
+        profiler=profiler,
     )
     return validator_v2.run_validations()
@@ -0,0 +1,757 @@
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
+from multiprocessing.pool import AsyncResult
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from demisto_sdk.commands.common.constants import ExecutionMode, GitStatuses
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.parallel import fork_pool, get_fork_workers
+from demisto_sdk.commands.content_graph.objects.base_content import BaseContent
+from demisto_sdk.commands.content_graph.objects.content_item import ContentItem
+from demisto_sdk.commands.content_graph.parsers.related_files import (
+    RelatedFile,
+    RelatedFileType,
+)
+from demisto_sdk.commands.validate.config_reader import ConfiguredValidations
+from demisto_sdk.commands.validate.profiler import (
+    OBTAIN_INVALID_CONTENT_ITEMS,
+    SHOULD_RUN,
+    ValidationProfiler,
+)
+from demisto_sdk.commands.validate.result_cache import Outcome, ResultCache
+from demisto_sdk.commands.validate.validators.base_validator import (
+    BaseValidator,
+    ValidationResult,
+    is_error_ignored,
+    should_run_on_execution_mode,
+)
+from demisto_sdk.commands.validate.validators.DO_validators.docker_validator import (
+    DockerValidator,
+)
+
+PARALLEL_OBJECTS_THRESHOLD = 50
+
+# From this number of content objects, their related files are loaded before the validators run, several at a time.
+# Below it, each related file is loaded when a validator first uses it.
+RELATED_FILES_PREFETCH_THRESHOLD = 50
+RELATED_FILES_PREFETCH_WORKERS = 8
+
+# From this number of content objects, reading the whole graph once is cheaper than running every graph validation query
+# on the paths of the content objects, since these queries (and the nodes and relationships of their results)
+# cover most of the graph anyway. Validating all the files always covers the whole graph.
+GRAPH_SNAPSHOT_OBJECTS_THRESHOLD = 500
+
+# A result sent back from a worker process. The content object is sent as its index when it is one of the objects to run on,
+# so it is not pickled back.
+WorkerResult = Tuple[Union[int, BaseContent], str, Optional[Path]]
+
+# The state of the running validation, which the worker processes inherit when they are forked
+_worker_state: Dict[str, Any] = {}
+
+
+class Lane(str, Enum):
+    WORKERS = "workers"
+    GRAPH = "graph"
+    DOCKERHUB = "dockerhub"
+
+
+def get_lane(validator: BaseValidator) -> Lane:
+    """Returns the lane the validator is scheduled in.
+    Validators which query the graph or the docker hub share a connection (and a rate limit),
+    so each of these kinds runs in a single lane of its own. All the other validators run in worker processes.
+    """
+    if validator.uses_graph:
+        return Lane.GRAPH
+    if isinstance(validator, DockerValidator):
+        return Lane.DOCKERHUB
+    return Lane.WORKERS
+
+
+def is_cacheable(validator: BaseValidator) -> bool:
+    """Returns whether the outcomes of the validator can be stored in the result cache.
+    Validators which query the graph or the docker hub depend on more than the files of the content objects,
+    and validators which run on all the files only are given the whole repository at once.
+    """
+    return get_lane(
+        validator
+    ) == Lane.WORKERS and validator.expected_execution_mode != [ExecutionMode.ALL_FILES]
+
+
+def get_related_files_plan(
+    validators: List[BaseValidator], objects_by_validator: List[List[BaseContent]]
+) -> Dict[RelatedFileType, List[BaseContent]]:
+    """Returns the content objects whose related files of every type are used by the validators which run on them,
+    according to the `related_file_type` the validators declare.
+
+    Args:
+        validators (List[BaseValidator]): The validators.
+        objects_by_validator (List[List[BaseContent]]): The content objects each validator runs on, in their order.
+
+    Returns:
+        Dict[RelatedFileType, List[BaseContent]]: The content objects by the related file type to load for them.
+    """
+    plan: Dict[RelatedFileType, Dict[int, BaseContent]] = defaultdict(dict)
+    for validator, content_objects in zip(validators, objects_by_validator):
+        for related_file_type in validator.related_file_type or []:
+            plan[related_file_type].update(
+                (id(content_object), content_object)
+                for content_object in content_objects
+            )
+    return {
+        related_file_type: list(content_objects.values())
+        for related_file_type, content_objects in plan.items()
+    }
+
+
+def _prefetch_related_file(
+    content_object: BaseContent, related_file_type: RelatedFileType
+) -> bool:
+    related_file = getattr(content_object, related_file_type.value, None)
+    if not isinstance(related_file, RelatedFile):
+        return False
+    try:
+        related_file.prefetch()
+    except Exception as e:
+        logger.debug(
+            f"Could not prefetch the {related_file_type.value} of {content_object.path}: {e}"
+        )
+        return False
+    return True
+
+
+def prefetch_related_files(plan: Dict[RelatedFileType, List[BaseContent]]) -> int:
+    """Loads the related files of the plan (see `get_related_files_plan`).
+    Local files are loaded several at a time. Files read from git are loaded one after the other,
+    since the git repository object is not thread safe.
+
+    Args:
+        plan (Dict[RelatedFileType, List[BaseContent]]): The content objects by the related file type to load for them.
+
+    Returns:
+        int: The number of loaded related files.
+    """
+    local_files = []
+    git_files = []
+    for related_file_type, content_objects in plan.items():
+        for content_object in content_objects:
+            (git_files if content_object.git_sha else local_files).append(
+                (content_object, related_file_type)
+            )
+    with ThreadPoolExecutor(max_workers=RELATED_FILES_PREFETCH_WORKERS) as executor:
+        loaded = sum(
+            executor.map(lambda args: _prefetch_related_file(*args), local_files)
+        )
+    loaded += sum(_prefetch_related_file(*args) for args in git_files)
+    return loaded
+
+
+# The attributes of a content object which decide which validators should run on it, regardless of the ignored errors
+DispatchKey = Tuple[Type[BaseContent], Optional[GitStatuses], bool]
+
+
+class DispatchIndex:
+    """Decides which validators should run on which content objects, the same as `BaseValidator.should_run`,
+    without checking every validator against every content object.
+
+    The validators which do not run in the execution mode are dropped once, and the ones which run on
+    a content type, git status and deprecation combination are computed once per combination.
+    Ignored errors are only resolved for content objects with candidate validators which may be ignored,
+    once per content object, and the support level ignore lists once per support level.
+    """
+
+    def __init__(
+        self,
+        validators: List[BaseValidator],
+        configured_validations: ConfiguredValidations,
+        execution_mode: Optional[ExecutionMode],
+        profiler: Optional[ValidationProfiler] = None,
+    ):
+        """
+        Args:
+            validators (List[BaseValidator]): The validators to dispatch to.
+            configured_validations (ConfiguredValidations): The configured validations.
+            execution_mode (Optional[ExecutionMode]): The execution mode.
+            profiler (Optional[ValidationProfiler]): The profiler to record the should_run checks in.
+        """
+        self.validators = validators
+        self.profiler = profiler or ValidationProfiler()
+        self.configured_validations = configured_validations
+        self.execution_mode = execution_mode
+        self.ignorable_errors = frozenset(configured_validations.ignorable_errors)
+        self.validator_indices = [
+            index
+            for index, validator in enumerate(validators)
+            if should_run_on_execution_mode(
+                validator.expected_execution_mode, execution_mode
+            )
+        ]
+        self.content_types = {
+            index: validators[index].get_content_types()
+            for index in self.validator_indices
+        }
+        # validators which override should_run are asked directly, after the index conditions match
+        self.overriding_should_run = {
+            index
+            for index in self.validator_indices
+            if type(validators[index]).should_run is not BaseValidator.should_run
+        }
+        self._candidates: Dict[DispatchKey, List[int]] = {}
+        self._support_level_ignores: Dict[str, FrozenSet[str]] = {}
+
+    def _get_candidates(self, content_object: BaseContent) -> List[int]:
+        key: DispatchKey = (
+            type(content_object),
+            content_object.git_status,
+            bool(content_object.deprecated),
+        )
+        if key not in self._candidates:
+            content_type, git_status, deprecated = key
+            self._candidates[key] = [
+                index
+                for index in self.validator_indices
+                if issubclass(content_type, self.content_types[index])
+                and (self.validators[index].run_on_deprecated or not deprecated)
+                and (
+                    not self.validators[index].expected_git_statuses
+                    or git_status in self.validators[index].expected_git_statuses  # type: ignore[operator]
+                )
+            ]
+        return self._candidates[key]
+
+    def _get_support_level_ignores(self, support_level: str) -> FrozenSet[str]:
+        if support_level not in self._support_level_ignores:
+            self._support_level_ignores[support_level] = frozenset(
+                self.configured_validations.support_level_dict.get(
+                    support_level, {}
+                ).get("ignore", [])
+            )
+        return self._support_level_ignores[support_level]
+
+    def get_validators(self, content_object: BaseContent) -> List[int]:
+        """Returns the indices of the validators which should run on the content object.
+
+        Args:
+            content_object (BaseContent): The content object.
+
+        Returns:
+            List[int]: The indices of the validators, in their order.
+        """
+        support_level_ignores = (
+            self._get_support_level_ignores(content_object.support)
+            if isinstance(content_object, ContentItem)
+            else frozenset()
+        )
+        ignored_errors: Optional[FrozenSet[str]] = None
+        applicable = []
+        profile = self.profiler.enabled
+        for index in self._get_candidates(content_object):
+            validator = self.validators[index]
+            start = time.perf_counter() if profile else 0.0
+            should_run = False
+            try:
+                if validator.error_code in support_level_ignores:
+                    continue
+                if validator.error_code in self.ignorable_errors:
+                    if validator.related_file_type:
+                        if is_error_ignored(
+                            validator.error_code,
+                            self.configured_validations.ignorable_errors,
+                            content_object,
+                            validator.related_file_type,
+                        ):
+                            continue
+                    else:
+                        if ignored_errors is None:
+                            ignored_errors = frozenset(content_object.ignored_errors)
+                        if validator.error_code in ignored_errors:
+                            continue
+                if index in self.overriding_should_run and not validator.should_run(
+                    content_item=content_object,
+                    ignorable_errors=self.configured_validations.ignorable_errors,
+                    support_level_dict=self.configured_validations.support_level_dict,
+                    running_execution_mode=self.execution_mode,
+                ):
+                    continue
+                should_run = True
+                applicable.append(index)
+            finally:
+                if profile:
+                    self.profiler.record(
+                        validator.error_code,
+                        SHOULD_RUN,
+                        time.perf_counter() - start,
+                        items=int(should_run),
+                    )
+        return applicable
+
+    def dispatch(
+        self, objects_to_run: Sequence[BaseContent]
+    ) -> List[List[BaseContent]]:
+        """Groups the content objects by the validators which should run on them.
+
+        Args:
+            objects_to_run (Sequence[BaseContent]): The content objects.
+
+        Returns:
+            List[List[BaseContent]]: The content objects each validator should run on, in their order.
+        """
+        objects_by_validator: List[List[BaseContent]] = [[] for _ in self.validators]
+        for content_object in objects_to_run:
+            for index in self.get_validators(content_object):
+                objects_by_validator[index].append(content_object)
+        return objects_by_validator
+
+
+def obtain_validator_results(
+    validator: BaseValidator,
+    content_objects: List[BaseContent],
+    execution_mode: Optional[ExecutionMode],
+) -> List[ValidationResult]:
+    """Runs a validator on the content objects it should run on.
+
+    Args:
+        validator (BaseValidator): The validator.
+        content_objects (List[BaseContent]): The content objects the validator should run on (see `DispatchIndex`).
+        execution_mode (Optional[ExecutionMode]): The execution mode.
+
+    Returns:
+        List[ValidationResult]: The validation results.
+    """
+    logger.debug(f"Starting execution for {validator.error_code} validator.")
+    if not content_objects:
+        return []
+    validation_results: List[ValidationResult] = validator.obtain_invalid_content_items(
+        content_objects
+    )  # type: ignore
+    if (
+        validator.expected_execution_mode == [ExecutionMode.ALL_FILES]
+        and execution_mode == ExecutionMode.ALL_FILES
+    ):
+        filtered_content_objects = set(content_objects)
+        validation_results = [
+            validation_result
+            for validation_result in validation_results
+            if validation_result.content_object in filtered_content_objects
+        ]
+    return validation_results
+
+
+def _to_worker_content_object(content_object: BaseContent) -> Union[int, BaseContent]:
+    # the validation results hold copies of the content objects, so they are matched by their path
+    index = _worker_state["object_indices"].get(content_object.path)
+    if index is not None and _worker_state["objects_to_run"][index] == content_object:
+        return index
+    return content_object
+
+
+def _run_validator_in_worker(
+    validator_index: int,
+) -> Tuple[float, float, List[WorkerResult]]:
+    validator = _worker_state["validators"][validator_index]
+    start = time.thread_time()
+    wall_start = time.perf_counter()
+    validation_results = obtain_validator_results(
+        validator,
+        _worker_state["objects_by_validator"][validator_index],
+        _worker_state["execution_mode"],
+    )
+    wall_time = time.perf_counter() - wall_start
+    cpu_time = time.thread_time() - start
+    return (
+        cpu_time,
+        wall_time,
+        [
+            (
+                _to_worker_content_object(result.content_object),
+                result.message,
+                result.path,
+            )
+            for result in validation_results
+        ],
+    )
+
+
+class ValidationEngine:
+    """Runs the validators on the content objects.
+
+    The validators are scheduled in lanes (see `get_lane`): the graph and the docker hub lanes run in threads of their own,
+    and the rest of the validators are spread across a pool of worker processes,
+    which are forked after the content objects are loaded, so the objects are not sent to them.
+    The results are merged back in the order of the validators, so the output is the same as running them one by one.
+    The graph validation queries of large runs run against a snapshot of the graph, which is prefetched once for all of them.
+    The related files the validators of large runs use are loaded before they run (see `get_related_files_plan`).
+
+    When a result cache is given, the cacheable validators (see `is_cacheable`) only run on the content objects
+    they have no cached outcome for, and their outcomes on these are stored after the run.
+
+    The validators are dispatched to the content objects once, before any of them runs. When the validators run
+    one after the other (e.g., to fix the content objects), the content objects a validator fixed should be passed to
+    `mark_fixed`, so they are dispatched again to the following validators, same as checking their `should_run`
+    after the fix.
+    """
+
+    def __init__(
+        self,
+        validators: List[BaseValidator],
+        objects_to_run: Sequence[BaseContent],
+        configured_validations: ConfiguredValidations,
+        execution_mode: Optional[ExecutionMode],
+        parallel: bool = True,
+        result_cache: Optional[ResultCache] = None,
+        profiler: Optional[ValidationProfiler] = None,
+    ):
+        """
+        Args:
+            validators (List[BaseValidator]): The validators to run.
+            objects_to_run (Sequence[BaseContent]): The content objects to run the validators on.
+            configured_validations (ConfiguredValidations): The configured validations.
+            execution_mode (Optional[ExecutionMode]): The execution mode.
+            parallel (bool): Whether to run the validators in parallel, or one after the other when each is consumed.
+            result_cache (Optional[ResultCache]): The cache to load the validators outcomes from and store them in.
+            profiler (Optional[ValidationProfiler]): The profiler to record the validators calls in.
+        """
+        self.validators = validators
+        self.objects_to_run = list(objects_to_run)
+        self.configured_validations = configured_validations
+        self.execution_mode = execution_mode
+        self.workers = (
+            get_fork_workers(len(self.objects_to_run), PARALLEL_OBJECTS_THRESHOLD)
+            if parallel
+            else 0
+        )
+        self.parallel = bool(self.workers)
+        self.result_cache = (
+            result_cache if result_cache and result_cache.enabled else None
+        )
+        # The content objects of every cacheable validator, before the ones with cached outcomes were taken out
+        self.cacheable_objects: Dict[int, List[BaseContent]] = {}
+        # The cache key and the outcomes of every content object, by its path
+        self.cache_entries: Dict[Path, Tuple[Optional[str], Dict[str, Outcome]]] = {}
+        self.updated_cache_keys: Set[str] = set()
+        # The CPU time every validator took to run, by its error code
+        self.cpu_times: Dict[str, float] = {}
+        self.profiler = profiler or ValidationProfiler()
+        self.graph_prefetched = False
+        # The content objects which were fixed since the last validator was dispatched to
+        self.fixed_objects: List[BaseContent] = []
+
+    def _record_obtain(self, validator_index: int, wall_time: float) -> None:
+        content_objects = self.objects_by_validator[validator_index]
+        self.profiler.record(
+            self.validators[validator_index].error_code,
+            OBTAIN_INVALID_CONTENT_ITEMS,
+            wall_time,
+            items=len(content_objects),
+            calls=int(bool(content_objects)),
+        )
+
+    def _obtain(self, validator_index: int) -> List[ValidationResult]:
+        validator = self.validators[validator_index]
+        if validator.uses_graph and self.objects_by_validator[validator_index]:
+            self._prepare_graph(validator)
+        start = time.thread_time()
+        wall_start = time.perf_counter()
+        validation_results = obtain_validator_results(
+            validator,
+            self.objects_by_validator[validator_index],
+            self.execution_mode,
+        )
+        self._record_obtain(validator_index, time.perf_counter() - wall_start)
+        self.cpu_times[validator.error_code] = time.thread_time() - start
+        return validation_results
+
+    def _prepare_graph(self, validator: BaseValidator) -> None:
+        """Prepares the graph before a graph validator runs.
+        The validation queries of large runs are run against a snapshot of the graph, which is prefetched once
+        for all of them (see `ContentGraphInterface.prefetch_validations`).
+        """
+        if self.profiler.enabled and not BaseValidator.graph_interface:
+            # the graph is created and updated by the first validator which queries it,
+            # so it is profiled as a phase of its own instead of as a part of that validator
+            with self.profiler.phase("graph update"):
+                validator.graph
+        if (
+            self.graph_prefetched
+            or not validator.uses_graph_snapshot
+            or (
+                self.execution_mode != ExecutionMode.ALL_FILES
+                and len(self.objects_to_run) < GRAPH_SNAPSHOT_OBJECTS_THRESHOLD
+            )
+        ):
+            return
+        self.graph_prefetched = True
+        with self.profiler.phase("graph prefetch"):
+            try:
+                validator.graph.prefetch_validations()
+            except Exception as e:
+                logger.warning(
+                    f"Could not prefetch the graph, the graph validations will query it instead: {e}"
+                )
+
+    def _prefetch_related_files(self) -> None:
+        """Loads the related files the validators use before they run, so the worker processes inherit them."""
+        if len(self.objects_to_run) < RELATED_FILES_PREFETCH_THRESHOLD:
+            return
+        with self.profiler.phase("related files prefetch") as phase:
+            phase.items = prefetch_related_files(
+                get_related_files_plan(self.validators, self.objects_by_validator)
+            )
+
+    def _run_lane(
+        self, validator_indices: List[int]
+    ) -> Dict[int, List[ValidationResult]]:
+        return {index: self._obtain(index) for index in validator_indices}
+
+    def _from_worker_results(
+        self, validator: BaseValidator, worker_results: List[WorkerResult]
+    ) -> List[ValidationResult]:
+        return [
+            ValidationResult.construct(
+                validator=validator,
+                message=message,
+                content_object=self.objects_to_run[content_object]
+                if isinstance(content_object, int)
+                else content_object,
+                path=path,
+            )
+            for content_object, message, path in worker_results
+        ]
+
+    def _get_cache_entry(
+        self, content_object: BaseContent, result_cache: ResultCache
+    ) -> Tuple[Optional[str], Dict[str, Outcome]]:
+        if content_object.path not in self.cache_entries:
+            key = result_cache.get_key(content_object)
+            self.cache_entries[content_object.path] = (
+                key,
+                result_cache.get(key) if key else {},
+            )
+        return self.cache_entries[content_object.path]
+
+    def _take_out_cached_objects(self, result_cache: ResultCache) -> None:
+        """Takes the content objects which have a cached outcome out of the content objects of every cacheable validator."""
+        for index, validator in enumerate(self.validators):
+            content_objects = self.objects_by_validator[index]
+            if not content_objects or not is_cacheable(validator):
+                continue
+            self.cacheable_objects[index] = content_objects
+            self.objects_by_validator[index] = [
+                content_object
+                for content_object in content_objects
+                if validator.error_code
+                not in self._get_cache_entry(content_object, result_cache)[1]
+            ]
+            misses = len(self.objects_by_validator[index])
+            result_cache.hits += len(content_objects) - misses
+            result_cache.misses += misses
+
+    def _merge_cached_results(
+        self, index: int, validation_results: List[ValidationResult]
+    ) -> List[ValidationResult]:
+        """Merges the results of a cacheable validator with its cached results, in the order of the content objects,
+        and updates the cached outcomes with its results.
+        The outcomes are not updated when the validator had results for content objects it did not run on.
+        """
+        validator = self.validators[index]
+        run_paths = {
+            content_object.path for content_object in self.objects_by_validator[index]
+        }
+        results_by_path: Dict[Path, List[ValidationResult]] = defaultdict(list)
+        for validation_result in validation_results:
+            results_by_path[validation_result.content_object.path].append(
+                validation_result
+            )
+        update_outcomes = run_paths.issuperset(results_by_path)
+        merged_results: List[ValidationResult] = []
+        for content_object in self.cacheable_objects[index]:
+            key, outcomes = self.cache_entries[content_object.path]
+            if content_object.path not in run_paths:
+                merged_results.extend(
+                    ValidationResult.construct(
+                        validator=validator,
+                        message=message,
+                        content_object=content_object,
+                        path=Path(path) if path else None,
+                    )
+                    for message, path in outcomes[validator.error_code]
+                )
+                continue
+            object_results = results_by_path.pop(content_object.path, [])
+            merged_results.extend(object_results)
+            if update_outcomes and key:
+                outcomes[validator.error_code] = [
+                    [
+                        validation_result.message,
+                        str(validation_result.path) if validation_result.path else None,
+                    ]
+                    for validation_result in object_results
+                ]
+                self.updated_cache_keys.add(key)
+        for object_results in results_by_path.values():
+            merged_results.extend(object_results)
+        return merged_results
+
+    def _store_cached_outcomes(self, result_cache: ResultCache) -> None:
+        for key, outcomes in self.cache_entries.values():
+            if key in self.updated_cache_keys:
+                result_cache.set(key, outcomes)
+        result_cache.evict()
+        logger.debug(
+            f"Validate cache: {result_cache.hits} hits, {result_cache.misses} misses"
+        )
+
+    def run(self) -> Iterator[Tuple[BaseValidator, List[ValidationResult]]]:
+        """Runs the validators.
+
+        Yields:
+            Tuple[BaseValidator, List[ValidationResult]]: Every validator and its results, in the order of the validators.
+        """
+        with self.profiler.phase("dispatch") as phase:
+            phase.items = len(self.objects_to_run)
+            self.dispatch_index = DispatchIndex(
+                self.validators,
+                self.configured_validations,
+                self.execution_mode,
+                profiler=self.profiler,
+            )
+            self.objects_by_validator = self.dispatch_index.dispatch(
+                self.objects_to_run
+            )
+        if not self.result_cache:
+            self._prefetch_related_files()
+            yield from self._run_validators()
+            return
+        with self.profiler.phase("result cache lookup") as phase:
+            phase.items = len(self.objects_to_run)
+            self._take_out_cached_objects(self.result_cache)
+        self._prefetch_related_files()
+        for index, (validator, validation_results) in enumerate(self._run_validators()):
+            if index in self.cacheable_objects:
+                validation_results = self._merge_cached_results(
+                    index, validation_results
+                )
+            yield validator, validation_results
+        with self.profiler.phase("result cache store") as phase:
+            phase.items = len(self.updated_cache_keys)
+            self._store_cached_outcomes(self.result_cache)
+
+    def mark_fixed(self, content_objects: Iterable[BaseContent]) -> None:
+        """Marks content objects which were changed by a fix, so the validators which did not run yet are dispatched
+        to them again. Only applies when the validators run one after the other (not in parallel).
+
+        Args:
+            content_objects (Iterable[BaseContent]): The fixed content objects.
+        """
+        self.fixed_objects.extend(content_objects)
+
+    def _redispatch_fixed_objects(self, first_index: int) -> None:
+        """Dispatches the fixed content objects again to the validators from the given index on,
+        since a fix may change which validators should run on them (e.g., when it changes their deprecation).
+        """
+        if not self.fixed_objects:
+            return
+        fixed = {
+            id(content_object): content_object for content_object in self.fixed_objects
+        }
+        self.fixed_objects = []
+        validators_by_object = {
+            object_id: set(self.dispatch_index.get_validators(content_object))
+            for object_id, content_object in fixed.items()
+        }
+        positions = {
+            id(content_object): position
+            for position, content_object in enumerate(self.objects_to_run)
+        }
+        for index in range(first_index, len(self.validators)):
+            content_objects = [
+                content_object
+                for content_object in self.objects_by_validator[index]
+                if id(content_object) not in fixed
+            ]
+            content_objects.extend(
+                content_object
+                for object_id, content_object in fixed.items()
+                if index in validators_by_object[object_id]
+            )
+            # in the order of the content objects, same as the first dispatch
+            content_objects.sort(
+                key=lambda content_object: positions.get(
+                    id(content_object), len(positions)
+                )
+            )
+            self.objects_by_validator[index] = content_objects
+
+    def _run_validators(
+        self,
+    ) -> Iterator[Tuple[BaseValidator, List[ValidationResult]]]:
+        if not self.parallel:
+            for index, validator in enumerate(self.validators):
+                self._redispatch_fixed_objects(index)
+                yield validator, self._obtain(index)
+            return
+
+        lanes: Dict[Lane, List[int]] = {lane: [] for lane in Lane}
+        for index, validator in enumerate(self.validators):
+            lanes[get_lane(validator)].append(index)
+        logger.debug(
+            f"Running {len(self.validators)} validators on {len(self.objects_to_run)} content objects "
+            f"with {self.workers} workers ({', '.join(f'{lane.value}: {len(indices)}' for lane, indices in lanes.items())})"
+        )
+        _worker_state.update(
+            validators=self.validators,
+            objects_to_run=self.objects_to_run,
+            objects_by_validator=self.objects_by_validator,
+            object_indices={
+                content_object.path: index
+                for index, content_object in enumerate(self.objects_to_run)
+            },
+            execution_mode=self.execution_mode,
+        )
+        try:
+            # the workers are forked before any other thread is started
+            with (
+                fork_pool(self.workers) as pool,
+                ThreadPoolExecutor(max_workers=2) as executor,
+            ):
+                worker_results: Dict[int, AsyncResult] = {
+                    index: pool.apply_async(_run_validator_in_worker, (index,))
+                    for index in lanes[Lane.WORKERS]
+                }
+                lane_results: List[Future] = [
+                    executor.submit(self._run_lane, lanes[lane])
+                    for lane in (Lane.GRAPH, Lane.DOCKERHUB)
+                ]
+                results: Dict[int, List[ValidationResult]] = {}
+                for future in lane_results:
+                    results.update(future.result())
+                for index, validator in enumerate(self.validators):
+                    if index in worker_results:
+                        cpu_time, wall_time, validator_results = worker_results[
+                            index
+                        ].get()
+                        self.cpu_times[validator.error_code] = cpu_time
+                        self._record_obtain(index, wall_time)
+                        yield (
+                            validator,
+                            self._from_worker_results(validator, validator_results),
+                        )
+                    else:
+                        yield validator, results[index]
+        finally:
+            _worker_state.clear()
@@ -4,8 +4,12 @@ from typing import List, Optional, Set, Tuple
 
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.logger import logger
-from demisto_sdk.commands.content_graph.objects.base_content import BaseContent
 from demisto_sdk.commands.validate.config_reader import ConfiguredValidations
+from demisto_sdk.commands.validate.fix_transaction import FixTransaction
+from demisto_sdk.commands.validate.profiler import (
+    PROFILE_FILE_NAME,
+    ValidationProfiler,
+)
 from demisto_sdk.commands.validate.validators.base_validator import (
     FixResult,
     InvalidContentItemResult,
@@ -24,12 +28,15 @@ class ResultWriter:
     def __init__(
         self,
         json_file_path: Optional[str] = None,
+        profiler: Optional[ValidationProfiler] = None,
     ):
         """
             The ResultWriter init method.
         Args:
             json_file_path Optional[str]: The json path to write the outputs into.
+            profiler Optional[ValidationProfiler]: The profiler of the run, posted with the results when it is enabled.
         """
+        self.profiler = profiler or ValidationProfiler()
         self.validation_results: List[ValidationResult] = []
         self.fixing_results: List[FixResult] = []
         self.invalid_content_item_results: List[InvalidContentItemResult] = []
@@ -84,14 +91,14 @@ class ResultWriter:
         Returns:
             int: The exit code number - 1 if the validations failed, otherwise return 0
         """
-        fixed_objects_set: Set[BaseContent] = set()
+        fix_transaction = FixTransaction()
         if self.json_file_path:
             self.write_results_to_json_file()
         exit_code, failing_error_codes, warning_error_codes = (
             self.post_validation_results(config_file_content, self.validation_results)
         )
         for fixing_result in self.fixing_results:
-            fixed_objects_set.add(fixing_result.content_object)
+            fix_transaction.add(fixing_result)
             if fixing_result.validator.error_code not in config_file_content.warning:
                 exit_code = 1
             logger.warning(f"{fixing_result.format_readable_message}")
@@ -106,8 +113,12 @@ class ResultWriter:
         self.summarize_validation_results(
             failing_error_codes, warning_error_codes, config_file_content, exit_code
         )
-        for fixed_object in fixed_objects_set:
-            fixed_object.save()
+        if fix_transaction.fixed_objects:
+            if fix_transaction.commit():
+                exit_code = 1
+            logger.info(f"Fixed fields:\n{fix_transaction.report()}")
+        if self.profiler.enabled:
+            self.write_profile()
         return exit_code
 
     def summarize_validation_results(
@@ -225,6 +236,24 @@ class ResultWriter:
         with open(self.json_file_path, "w") as outfile:
             outfile.write(json_object)
 
+    def write_profile(self):
+        """
+        Logging the profile of the run as a table,
+        and writing it into a json file next to the json outputs file, or in the artifacts folder if there is none.
+        """
+        logger.info(f"Validate profile:\n{self.profiler.to_table()}")
+        if self.json_file_path:
+            profile_path = Path(self.json_file_path).parent / PROFILE_FILE_NAME
+        elif (artifacts_folder := os.getenv("ARTIFACTS_FOLDER")) and Path(
+            artifacts_folder
+        ).exists():
+            profile_path = Path(artifacts_folder) / PROFILE_FILE_NAME
+        else:
+            return
+        logger.info(f"Writing the validate profile to a json file at {profile_path}.")
+        with open(profile_path, "w") as outfile:
+            outfile.write(json.dumps(self.profiler.to_dict(), indent=4))
+
     def append_validation_results(self, validation_result: ValidationResult):
         """Append an item to the validation results list.
 
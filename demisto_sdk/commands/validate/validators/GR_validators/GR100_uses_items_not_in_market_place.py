@@ -86,6 +86,8 @@ class MarketplacesFieldValidator(BaseValidator[ContentTypes], ABC):
     )
 
     related_field = "marketplaces"
+    uses_graph = True
+    uses_graph_snapshot = True
     is_auto_fixable = False
 
     def obtain_invalid_content_items_using_graph(
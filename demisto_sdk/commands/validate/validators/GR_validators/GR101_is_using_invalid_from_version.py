@@ -90,6 +90,8 @@ class IsUsingInvalidFromVersionValidator(BaseValidator[ContentTypes], ABC):
     )
 
     is_auto_fixable = False
+    uses_graph = True
+    uses_graph_snapshot = True
 
     def obtain_invalid_content_items_using_graph(
         self, content_items: Iterable[ContentTypes], validate_all_files: bool = False
@@ -89,6 +89,8 @@ class IsUsingInvalidToVersionValidator(BaseValidator[ContentTypes], ABC):
         " {2} whose to_version is lower than {3}, making them incompatible"
     )
     is_auto_fixable = False
+    uses_graph = True
+    uses_graph_snapshot = True
 
     def obtain_invalid_content_items_using_graph(
         self, content_items: Iterable[ContentTypes], validate_all_files: bool = False
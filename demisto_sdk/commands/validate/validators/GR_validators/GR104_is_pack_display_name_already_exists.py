@@ -23,6 +23,8 @@ class IsPackDisplayNameAlreadyExistsValidator(BaseValidator[ContentTypes], ABC):
         "Pack '{content_id}' has a duplicate display_name as: {pack_display_id}."
     )
     related_field = ""
+    uses_graph = True
+    uses_graph_snapshot = True
     is_auto_fixable = False
 
     def obtain_invalid_content_items_using_graph(
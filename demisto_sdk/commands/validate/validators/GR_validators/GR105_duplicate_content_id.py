@@ -84,6 +84,8 @@ class DuplicateContentIdValidator(BaseValidator[ContentTypes], ABC):
     rationale = "Duplicate IDs can cause conflicts and confusion."
     error_message = "Duplicate ID '{}' found in {}"
     related_field = "id"
+    uses_graph = True
+    uses_graph_snapshot = True
     is_auto_fixable = False
 
     def obtain_invalid_content_items_using_graph(
@@ -26,6 +26,8 @@ class IsTestPlaybookInUseValidator(BaseValidator[ContentTypes], ABC):
     )
     error_message = "Test playbook '{}' is not linked to any content item. Make sure at least one integration, script or playbook mentions the test-playbook ID under the `tests:` key."
     related_field = "tests"
+    uses_graph = True
+    uses_graph_snapshot = True
     is_auto_fixable = False
 
     def obtain_invalid_content_items_using_graph(
@@ -88,6 +88,8 @@ class IsDeprecatedContentItemInUsageValidator(BaseValidator[ContentTypes], ABC):
     rationale = "Using deprecated content items can lead to unexpected behavior and should be avoided."
     error_message = "The item '{item_id}' is using the following deprecated items: {deprecated_items}"
     related_field = "deprecated"
+    uses_graph = True
+    uses_graph_snapshot = True
     is_auto_fixable = False
 
     def obtain_invalid_content_items_using_graph(
@@ -19,6 +19,8 @@ class IsInvalidPacksDependenciesValidator(BaseValidator[ContentTypes], ABC):
     rationale = "Hidden packs are not available to install in the marketplace."
     error_message = "Pack {dependent_pack} has hidden pack(s) {hidden_packs} in its mandatory dependencies"
     related_field = "dependencies"
+    uses_graph = True
+    uses_graph_snapshot = True
     is_auto_fixable = False
 
     def obtain_invalid_content_items_using_graph(
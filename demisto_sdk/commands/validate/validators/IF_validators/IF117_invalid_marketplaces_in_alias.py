@@ -28,6 +28,7 @@ class IsValidAliasMarketplaceValidator(BaseValidator[ContentTypes]):
         "the value of the 'marketplaces' key in these fields should be ['xsoar']."
     )
     related_field = "Aliases"
+    uses_graph = True
 
     def obtain_invalid_content_items(
         self, content_items: Iterable[ContentTypes]
@@ -25,6 +25,7 @@ class IsValidDynamicSectionValidator(BaseValidator[ContentTypes]):
         "The tab {0} contains the following script that not exists in the repo: {1}."
     )
     related_field = "tabs.sections.query"
+    uses_graph = True
 
     def obtain_invalid_content_items(
         self, content_items: Iterable[ContentTypes]
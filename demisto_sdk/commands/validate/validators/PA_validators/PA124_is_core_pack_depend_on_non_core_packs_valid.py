@@ -19,6 +19,8 @@ class IsCorePackDependOnNonCorePacksValidator(BaseValidator[ContentTypes], ABC):
     rationale = "Core packs should be self-contained."
     error_message = "The core pack {core_pack} cannot depend on non-core pack(s): {dependencies_packs}."
     related_field = "dependencies"
+    uses_graph = True
+    uses_graph_snapshot = True
     is_auto_fixable = False
 
     def obtain_invalid_content_items_using_graph(
@@ -22,6 +22,7 @@ class IsSilentPlaybookRelationshipsValidator(BaseValidator[ContentTypes]):
         "The {} is silent, but does not correspond to a silent {} in the pack."
     )
     related_field = "issilent"
+    uses_graph = True
     is_auto_fixable = False
 
     def obtain_invalid_content_items(
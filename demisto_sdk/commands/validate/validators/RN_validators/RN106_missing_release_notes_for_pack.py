@@ -34,6 +34,7 @@ class IsMissingReleaseNotes(BaseValidator[ContentTypes]):
         "found here: https://xsoar.pan.dev/docs/integrations/changelog for more information."
     )
     related_field = "release notes"
+    uses_graph = True
     is_auto_fixable = False
     related_file_type = [RelatedFileType.RELEASE_NOTE]
     valid_packs: list[str] = []
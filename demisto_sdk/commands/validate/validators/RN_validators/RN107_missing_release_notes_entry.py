@@ -36,6 +36,7 @@ class IsMissingReleaseNoteEntries(BaseValidator[ContentTypes]):
         "https://xsoar.pan.dev/docs/integrations/changelog#excluding-items"
     )
     related_field = "release notes"
+    uses_graph = True
     is_auto_fixable = False
     related_file_type = [RelatedFileType.RELEASE_NOTE]
     pack_to_rn_headers: dict[str, dict[str, list]] = {}
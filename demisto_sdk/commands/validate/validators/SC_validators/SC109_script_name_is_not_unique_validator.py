@@ -28,6 +28,8 @@ class DuplicatedScriptNameValidator(BaseValidator[ContentTypes], ABC):
         "it will not be possible to create a script with the name `getAlert`)"
     )
     related_field = "name"
+    uses_graph = True
+    uses_graph_snapshot = True
     is_auto_fixable = False
 
     def obtain_invalid_content_items_using_graph(
@@ -85,6 +85,9 @@ class BaseValidator(ABC, BaseModel, Generic[ContentTypes]):
     is_auto_fixable: (ClassVar[bool]): Whether the validation has a fix or not.
     graph_interface: (ClassVar[ContentGraphInterface]): The graph interface.
     dockerhub_api_client (ClassVar[DockerHubClient): the docker hub api client.
+    uses_graph: (ClassVar[bool]): Whether the validation queries the content graph or not.
+    uses_graph_snapshot: (ClassVar[bool]): Whether the validation only runs graph validation queries,
+        which can run against a prefetched snapshot of the graph (see `ContentGraphInterface.prefetch_validations`).
     """
 
     error_code: ClassVar[str]
@@ -99,6 +102,8 @@ class BaseValidator(ABC, BaseModel, Generic[ContentTypes]):
     graph_interface: ClassVar[ContentGraphInterface] = None
     related_file_type: ClassVar[Optional[List[RelatedFileType]]] = None
     expected_execution_mode: ClassVar[Optional[List[ExecutionMode]]] = None
+    uses_graph: ClassVar[bool] = False
+    uses_graph_snapshot: ClassVar[bool] = False
 
     def get_content_types(self):
         args = (get_args(self.__orig_bases__[0]) or get_args(self.__orig_bases__[1]))[0]  # type: ignore